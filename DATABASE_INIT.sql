@@ -20,6 +20,7 @@ CREATE TABLE IF NOT EXISTS usuarios (
     senha VARCHAR(255) NOT NULL,
     tipo ENUM('admin', 'medico', 'paciente', 'secretaria') NOT NULL DEFAULT 'paciente',
     ativo BOOLEAN DEFAULT TRUE,
+    versao INT NOT NULL DEFAULT 1,
     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -45,6 +46,7 @@ CREATE TABLE IF NOT EXISTS pacientes (
     cep VARCHAR(9),
     condicoes_medicas TEXT,
     alergias TEXT,
+    versao INT NOT NULL DEFAULT 1,
     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -74,6 +76,7 @@ CREATE TABLE IF NOT EXISTS profissionais (
     horario_fim TIME,
     dias_atendimento VARCHAR(100),
     biografia TEXT,
+    versao INT NOT NULL DEFAULT 1,
     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -103,6 +106,7 @@ CREATE TABLE IF NOT EXISTS medicamentos (
     estoque INT DEFAULT 0,
     descricao TEXT,
     contraindicacoes TEXT,
+    versao INT NOT NULL DEFAULT 1,
     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -111,10 +115,42 @@ CREATE TABLE IF NOT EXISTS medicamentos (
     INDEX idx_lote (lote)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- ============================================================================
+-- TABELA: consulta_series
+-- Descrição: Regras de recorrência de séries de consultas (ex.: fisioterapia)
+-- Relacionamento: FK para pacientes, profissionais
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS consulta_series (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    paciente_id INT NOT NULL,
+    profissional_id INT NULL,
+    inicio DATETIME NOT NULL,
+    frequencia ENUM('diaria', 'semanal') NOT NULL DEFAULT 'semanal',
+    intervalo INT NOT NULL DEFAULT 1,
+    dias_semana VARCHAR(100),
+    ocorrencias INT NOT NULL,
+    duracao_minutos INT DEFAULT 30,
+    motivo VARCHAR(500),
+    observacoes TEXT,
+    tipo_consulta ENUM('presencial', 'telemedicina') NOT NULL DEFAULT 'presencial',
+    link_video VARCHAR(500),
+    versao INT NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    
+    CONSTRAINT fk_consulta_series_pacientes FOREIGN KEY (paciente_id) 
+        REFERENCES pacientes(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    CONSTRAINT fk_consulta_series_profissionais FOREIGN KEY (profissional_id) 
+        REFERENCES profissionais(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    
+    INDEX idx_paciente_id (paciente_id),
+    INDEX idx_profissional_id (profissional_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
 -- ============================================================================
 -- TABELA: consultas
 -- Descrição: Agendamentos e registros de consultas/atendimentos
--- Relacionamento: FK para pacientes, profissionais
+-- Relacionamento: FK para pacientes, profissionais, consulta_series
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS consultas (
     id INT PRIMARY KEY AUTO_INCREMENT,
@@ -128,7 +164,9 @@ CREATE TABLE IF NOT EXISTS consultas (
     diagnostico TEXT,
     observacoes TEXT,
     link_video VARCHAR(500),
-    status ENUM('agendada', 'realizada', 'cancelada', 'nao_compareceu') NOT NULL DEFAULT 'agendada',
+    status ENUM('agendada', 'em_atendimento', 'realizada', 'cancelada', 'nao_compareceu') NOT NULL DEFAULT 'agendada',
+    serie_id INT NULL,
+    versao INT NOT NULL DEFAULT 1,
     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -136,11 +174,15 @@ CREATE TABLE IF NOT EXISTS consultas (
         REFERENCES pacientes(id) ON DELETE CASCADE ON UPDATE CASCADE,
     CONSTRAINT fk_consultas_profissionais FOREIGN KEY (profissional_id) 
         REFERENCES profissionais(id) ON DELETE CASCADE ON UPDATE CASCADE,
+    CONSTRAINT fk_consultas_series FOREIGN KEY (serie_id) 
+        REFERENCES consulta_series(id) ON DELETE SET NULL ON UPDATE CASCADE,
     
     INDEX idx_paciente_id (paciente_id),
-    INDEX idx_profissional_id (profissional_id),
+    -- Agenda e checagem de conflitos: faixa de datas de um profissional
+    INDEX idx_profissional_data_hora (profissional_id, data_hora),
     INDEX idx_data_hora (data_hora),
     INDEX idx_status (status),
+    INDEX idx_serie_id (serie_id),
     INDEX idx_tipo (tipo)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -162,6 +204,7 @@ CREATE TABLE IF NOT EXISTS prescricoes (
     instrucoes_uso TEXT,
     observacoes TEXT,
     ativa BOOLEAN DEFAULT TRUE,
+    versao INT NOT NULL DEFAULT 1,
     criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -13,7 +13,7 @@ if __name__ == "__main__":
     # Get configuration from environment
     host = os.getenv("APP_HOST", "0.0.0.0")
     port = int(os.getenv("APP_PORT", 5000))
-    debug = os.getenv("FLASK_DEBUG", "True").lower() == "true"
+    debug = os.getenv("FLASK_DEBUG", str(app.config["DEBUG"])).lower() == "true"
 
-    # Run app
+    # Run development server (production: gunicorn -c gunicorn.conf.py)
     app.run(host=host, port=port, debug=debug)
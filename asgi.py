@@ -0,0 +1,10 @@
+"""ASGI entry point for the optional asyncio serving mode.
+
+Run with: uvicorn asgi:app --workers 2
+"""
+
+import os
+
+from src.asgi import create_asgi_app
+
+app = create_asgi_app(os.getenv("FLASK_ENV", "production"))
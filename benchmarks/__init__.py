@@ -0,0 +1 @@
+"""Offline benchmark suite for SGHSS hot paths."""
@@ -0,0 +1,326 @@
+"""Command line entry point: ``python -m benchmarks <command>``.
+
+Commands: run, compare, loadtest, replay, startup, statements.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from .harness import (
+    DEFAULT_BASELINE,
+    RESULTS_DIR,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from .load_client import compare_latency
+
+LOAD_KINDS = ("loadtest", "replay")
+
+
+def _load_suites() -> None:
+    """Import benchmark modules so they register themselves."""
+    from . import bench_requests, bench_serialization, bench_validation  # noqa: F401
+
+
+def _cmd_run(args) -> int:
+    os.environ.setdefault("FLASK_ENV", "testing")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    logging.disable(logging.INFO)
+    _load_suites()
+
+    document = run_benchmarks(args.filter, repeat=args.repeat, min_time=args.min_time)
+    output = args.output or os.path.join(RESULTS_DIR, "latest.json")
+    save_results(document, output)
+    print(f"\nResults saved to {output}")
+    if args.save_baseline:
+        save_results(document, DEFAULT_BASELINE)
+        print(f"Baseline saved to {DEFAULT_BASELINE}")
+    return 0
+
+
+def _cmd_compare(args) -> int:
+    current = load_results(args.current)
+    if current.get("kind") in LOAD_KINDS:
+        return _compare_load(args, current)
+    baseline = load_results(args.baseline)
+    rows = compare_results(baseline, current, threshold=args.threshold)
+
+    regressions = 0
+    for row in rows:
+        marker = {"regression": "!!", "improvement": "++"}.get(row["status"], "  ")
+        print(
+            f"{marker} {row['name']:<45} {row['baseline_us']:>12.2f} -> "
+            f"{row['current_us']:>12.2f} us  ({row['ratio']:.2f}x)"
+        )
+        regressions += row["status"] == "regression"
+
+    print(f"\n{regressions} regression(s) above {args.threshold:.0%} threshold")
+    return 1 if regressions else 0
+
+
+def _load_results_path(kind: str, name: str) -> str:
+    return os.path.join(RESULTS_DIR, f"{kind}-{name}.json")
+
+
+def _compare_load(args, current: dict) -> int:
+    baseline_path = args.baseline
+    if baseline_path == DEFAULT_BASELINE:
+        baseline_path = _load_results_path(current["kind"], "baseline")
+    baseline = load_results(baseline_path)
+    rows = compare_latency(baseline, current, threshold=args.threshold)
+
+    regressions = 0
+    for row in rows:
+        marker = {"regression": "!!", "improvement": "++"}.get(row["status"], "  ")
+        print(
+            f"{marker} {row['name']:<45} p95 {row['baseline']:>9.2f} -> "
+            f"{row['current']:>9.2f} ms  ({row['ratio']:.2f}x)"
+        )
+        regressions += row["status"] == "regression"
+
+    print(f"\n{regressions} regression(s) above {args.threshold:.0%} threshold")
+    return 1 if regressions else 0
+
+
+def _cmd_loadtest(args) -> int:
+    from .load_client import HttpClient
+    from .loadtest import (
+        DEFAULT_COLLECTION,
+        LoadTest,
+        authenticate,
+        build_scenarios,
+        load_collection,
+    )
+
+    weights = {}
+    for item in args.weight or []:
+        name, _, value = item.partition("=")
+        weights[name] = float(value)
+
+    templates = load_collection(args.collection or DEFAULT_COLLECTION)
+    scenarios = build_scenarios(templates, weights)
+    if args.list:
+        for scenario in scenarios:
+            steps = ", ".join(step.endpoint for step in scenario.steps)
+            print(f"{scenario.name:<25} weight {scenario.weight:>5g}  {steps}")
+        return 0
+
+    client = HttpClient(args.url, timeout=args.timeout)
+    token = authenticate(client, templates, args.email, args.senha)
+    print(
+        f"Running {len(scenarios)} scenarios against {args.url} "
+        f"for {args.duration:g}s with {args.concurrency} threads...",
+        flush=True,
+    )
+    document = LoadTest(
+        client,
+        scenarios,
+        token=token,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        seed=args.seed,
+    ).run()
+
+    for name, summary in sorted(document["results"].items()):
+        print(
+            f"{name:<45} {summary['count']:>7} req {summary['rps']:>8.1f} req/s  "
+            f"p50 {summary['p50_ms']:>8.2f}  p95 {summary['p95_ms']:>8.2f}  "
+            f"p99 {summary['p99_ms']:>8.2f} ms  {summary['errors']} err"
+        )
+    total = document["total"]
+    print(
+        f"\nTotal: {total['count']} requests, {total['rps']:.1f} req/s, "
+        f"p95 {total['p95_ms']:.2f} ms, {total['errors']} errors"
+    )
+
+    _save_load_results(args, document)
+    return 0
+
+
+def _save_load_results(args, document: dict) -> None:
+    output = args.output or _load_results_path(document["kind"], "latest")
+    save_results(document, output)
+    print(f"Results saved to {output}")
+    if args.save_baseline:
+        baseline = _load_results_path(document["kind"], "baseline")
+        save_results(document, baseline)
+        print(f"Baseline saved to {baseline}")
+
+
+def _cmd_replay(args) -> int:
+    from .load_client import HttpClient
+    from .replay import Replayer, breakdown, read_access_log
+
+    records = read_access_log(args.log, include_writes=args.include_writes, limit=args.limit)
+    client = HttpClient(args.url, timeout=args.timeout)
+
+    token = args.token
+    if not token and args.senha:
+        status, _, data = client.request(
+            "POST", "/api/auth/login", body={"email": args.email, "senha": args.senha}
+        )
+        token = ((data or {}).get("data") or {}).get("token")
+        if status != 200 or not token:
+            print(f"Login failed with status {status}")
+            return 1
+
+    span = (records[-1]["t"] - records[0]["t"]) / args.speed if records else 0
+    print(f"Replaying {len(records)} requests at {args.speed:g}x (~{span:.0f}s)...", flush=True)
+    document = Replayer(
+        client,
+        records,
+        token=token,
+        speed=args.speed,
+        concurrency=args.concurrency,
+        window=args.window,
+    ).run()
+
+    total = document["total"]
+    print(
+        f"Total: {total['count']} requests, {total['rps']:.1f} req/s, "
+        f"p95 {total['p95_ms']:.2f} ms, {total['errors']} errors\n"
+    )
+    for line in breakdown(document):
+        print(line)
+    print()
+    _save_load_results(args, document)
+    return 0
+
+
+def _cmd_startup(args) -> int:
+    from .startup import import_profile, measure_cold_start
+
+    document = measure_cold_start(repeat=args.repeat)
+    for name, timing in document["results"].items():
+        print(f"{name:<30} {timing['median_us'] / 1000:>10.1f} ms (median of {timing['rounds']})")
+    print(f"Modules loaded after first request: {document['metadata']['modules_loaded']}")
+
+    print("\nSlowest imports of src (self time):")
+    for row in import_profile(top=args.top):
+        print(
+            f"  {row['module']:<55} {row['self_us'] / 1000:>8.1f} ms "
+            f"(cumulative {row['cumulative_us'] / 1000:.1f} ms)"
+        )
+
+    output = args.output or os.path.join(RESULTS_DIR, "startup-latest.json")
+    save_results(document, output)
+    print(f"\nResults saved to {output}")
+    return 0
+
+
+def _cmd_statements(args) -> int:
+    from src.config import get_config
+
+    from .statements import measure_statement_cache, savings
+
+    db_config = dict(get_config(args.env).DB_CONFIG)
+    target = f"{db_config['host']}:{db_config['port']}/{db_config['database']}"
+    print(f"Measuring {target}...", flush=True)
+    document = measure_statement_cache(
+        db_config, calls=args.calls, repeat=args.repeat, selected=args.filter
+    )
+    for row in savings(document):
+        print(
+            f"{row['case']:<28} {row['metric']:<12} {row['plain_us']:>10.1f} -> "
+            f"{row['prepared_us']:>10.1f} us/call  ({row['saving']:+.0%} saved)"
+        )
+
+    output = args.output or os.path.join(RESULTS_DIR, "statements-latest.json")
+    save_results(document, output)
+    print(f"\nResults saved to {output}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run benchmarks and save results as JSON.")
+    run.add_argument("-k", "--filter", action="append", help="Only run names containing this.")
+    run.add_argument("-o", "--output", help="Results file (default: results/latest.json).")
+    run.add_argument("--repeat", type=int, default=5, help="Rounds per benchmark.")
+    run.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per round.")
+    run.add_argument("--save-baseline", action="store_true", help="Also store as baseline.")
+    run.set_defaults(func=_cmd_run)
+
+    compare = commands.add_parser("compare", help="Flag regressions against a baseline.")
+    compare.add_argument("current", nargs="?", default=os.path.join(RESULTS_DIR, "latest.json"))
+    compare.add_argument("--baseline", default=DEFAULT_BASELINE)
+    compare.add_argument("--threshold", type=float, default=0.10)
+    compare.set_defaults(func=_cmd_compare)
+
+    loadtest = commands.add_parser(
+        "loadtest", help="Replay the Postman collection concurrently against a running app."
+    )
+    loadtest.add_argument("--url", default="http://localhost:5000", help="Target base URL.")
+    loadtest.add_argument("--collection", default=None, help="Postman collection file.")
+    loadtest.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+    loadtest.add_argument("--concurrency", type=int, default=8, help="Worker threads.")
+    loadtest.add_argument("--email", default=os.getenv("LOADTEST_EMAIL", "admin@sghss.com"))
+    loadtest.add_argument("--senha", default=os.getenv("LOADTEST_SENHA", ""))
+    loadtest.add_argument(
+        "--weight",
+        action="append",
+        help="Scenario weight as NAME=W (e.g. consultas:read=20 or write=0).",
+    )
+    loadtest.add_argument("--seed", type=int, default=42, help="Seed for scenario selection.")
+    loadtest.add_argument("--timeout", type=float, default=10.0, help="Request timeout.")
+    loadtest.add_argument("--list", action="store_true", help="List scenarios and exit.")
+    loadtest.add_argument(
+        "-o", "--output", help="Results file (default: results/loadtest-latest.json)."
+    )
+    loadtest.add_argument("--save-baseline", action="store_true", help="Also store as baseline.")
+    loadtest.set_defaults(func=_cmd_loadtest)
+
+    replay = commands.add_parser(
+        "replay", help="Re-issue a recorded access log against a running app."
+    )
+    replay.add_argument("log", help="NDJSON access log (ACCESS_LOG_PATH).")
+    replay.add_argument("--url", default="http://localhost:5000", help="Target base URL.")
+    replay.add_argument("--speed", type=float, default=1.0, help="Speed multiplier (1, 2, 5...).")
+    replay.add_argument("--include-writes", action="store_true", help="Also replay writes.")
+    replay.add_argument("--limit", type=int, help="Replay only the first N records.")
+    replay.add_argument("--concurrency", type=int, default=64, help="Maximum in-flight requests.")
+    replay.add_argument("--window", type=float, default=10.0, help="Report window in seconds.")
+    replay.add_argument("--token", help="JWT used for every request.")
+    replay.add_argument("--email", default=os.getenv("LOADTEST_EMAIL", "admin@sghss.com"))
+    replay.add_argument("--senha", default=os.getenv("LOADTEST_SENHA", ""))
+    replay.add_argument("--timeout", type=float, default=10.0, help="Request timeout.")
+    replay.add_argument(
+        "-o", "--output", help="Results file (default: results/replay-latest.json)."
+    )
+    replay.add_argument("--save-baseline", action="store_true", help="Also store as baseline.")
+    replay.set_defaults(func=_cmd_replay)
+
+    startup = commands.add_parser("startup", help="Measure import time and cold start.")
+    startup.add_argument("--repeat", type=int, default=5, help="Fresh interpreters launched.")
+    startup.add_argument("--top", type=int, default=15, help="Slowest imports listed.")
+    startup.add_argument(
+        "-o", "--output", help="Results file (default: results/startup-latest.json)."
+    )
+    startup.set_defaults(func=_cmd_startup)
+
+    statements = commands.add_parser(
+        "statements", help="Compare client and server CPU of prepared and plain statements."
+    )
+    statements.add_argument(
+        "-k", "--filter", action="append", help="Only run cases containing this."
+    )
+    statements.add_argument("--env", default="production", help="Config whose DB_CONFIG is used.")
+    statements.add_argument("--calls", type=int, default=2000, help="Service calls per round.")
+    statements.add_argument("--repeat", type=int, default=5, help="Rounds per case.")
+    statements.add_argument(
+        "-o", "--output", help="Results file (default: results/statements-latest.json)."
+    )
+    statements.set_defaults(func=_cmd_statements)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
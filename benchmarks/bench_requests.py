@@ -0,0 +1,61 @@
+"""Benchmarks for full requests through the Flask test client."""
+
+from .fixtures import load_rows, sample_rows
+from .harness import benchmark
+
+_client = None
+_headers = None
+
+
+def _get_client():
+    """Create the app once on in-memory SQLite loaded with canned rows."""
+    global _client, _headers
+    if _client is None:
+        from flask_jwt_extended import create_access_token
+
+        from src import create_app
+        from src.config.database import get_db_manager
+
+        app = create_app("testing")
+        load_rows(get_db_manager(), sample_rows(100))
+
+        with app.app_context():
+            token = create_access_token(identity="1", additional_claims={"tipo": "admin"})
+        _client = app.test_client()
+        _headers = {"Authorization": f"Bearer {token}"}
+    return _client, _headers
+
+
+def _request_benchmark(name: str, method: str, path: str, json: dict = None):
+    """Register a benchmark issuing one request per call."""
+
+    @benchmark(f"request.{name}", group="requests")
+    def setup():
+        client, headers = _get_client()
+
+        def run():
+            response = client.open(path, method=method, headers=headers, json=json)
+            if response.status_code >= 500:
+                raise RuntimeError(f"{method} {path} failed: {response.status_code}")
+            return response
+
+        return run
+
+
+_request_benchmark("health", "GET", "/api/auth/health")
+_request_benchmark("pacientes.list", "GET", "/api/pacientes?per_page=20")
+_request_benchmark("pacientes.get", "GET", "/api/pacientes/1")
+_request_benchmark("consultas.list", "GET", "/api/consultas?per_page=20")
+_request_benchmark("consultas.get", "GET", "/api/consultas/1")
+_request_benchmark("medicamentos.list", "GET", "/api/medicamentos?per_page=20")
+_request_benchmark(
+    "consultas.create",
+    "POST",
+    "/api/consultas",
+    json={
+        "paciente_id": 1,
+        "profissional_id": 1,
+        "data": "2025-11-13 10:00:00",
+        "motivo": "Consulta de rotina",
+    },
+)
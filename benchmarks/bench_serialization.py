@@ -0,0 +1,103 @@
+"""Benchmarks for mappers, model serialization and response formatting."""
+
+from flask import Flask
+
+from .fixtures import sample_rows
+from .harness import benchmark
+
+ROWS = sample_rows(1)
+
+
+def _mapper_benchmark(service_path: str, class_name: str, mapper: str, table: str):
+    """Register a benchmark for a service ``_map_to_*`` static method."""
+
+    @benchmark(f"mapper.{mapper}", group="mappers")
+    def setup():
+        module = __import__(service_path, fromlist=[class_name])
+        map_row = getattr(getattr(module, class_name), mapper)
+        row = ROWS[table][0]
+        return lambda: map_row(row)
+
+
+_mapper_benchmark("src.services.usuario_service", "UsuarioService", "_map_to_usuario", "usuarios")
+_mapper_benchmark("src.services.paciente_service", "PacienteService", "_map_to_paciente", "pacientes")
+_mapper_benchmark(
+    "src.services.profissional_service", "ProfissionalService", "_map_to_profissional", "profissionais"
+)
+_mapper_benchmark("src.services.consulta_service", "ConsultaService", "_map_to_consulta", "consultas")
+_mapper_benchmark(
+    "src.services.medicamento_service", "MedicamentoService", "_map_to_medicamento", "medicamentos"
+)
+_mapper_benchmark(
+    "src.services.prescricao_service", "PrescricaoService", "_map_to_prescricao", "prescricoes"
+)
+
+
+@benchmark("model.consulta.to_dict", group="models")
+def bench_consulta_to_dict():
+    from src.services.consulta_service import ConsultaService
+
+    consulta = ConsultaService._map_to_consulta(ROWS["consultas"][0])
+    return consulta.to_dict
+
+
+@benchmark("model.paciente.to_dict", group="models")
+def bench_paciente_to_dict():
+    from src.services.paciente_service import PacienteService
+
+    paciente = PacienteService._map_to_paciente(ROWS["pacientes"][0])
+    return paciente.to_dict
+
+
+@benchmark("model.usuario.to_dict", group="models")
+def bench_usuario_to_dict():
+    from src.services.usuario_service import UsuarioService
+
+    usuario = UsuarioService._map_to_usuario(ROWS["usuarios"][0])
+    return usuario.to_dict
+
+
+def _formatter_benchmark(name: str, build):
+    """Register a ResponseFormatter benchmark running inside an app context."""
+
+    @benchmark(name, group="response")
+    def setup():
+        app = Flask(__name__)
+        context = app.app_context()
+        context.push()
+        return build()
+
+
+def _success_single():
+    from src.utils.response import ResponseFormatter
+
+    data = ROWS["consultas"][0]
+    return lambda: ResponseFormatter.success(data=data, message="Consulta retrieved successfully")
+
+
+def _success_list():
+    from src.utils.response import ResponseFormatter
+
+    data = sample_rows(100)["consultas"]
+    return lambda: ResponseFormatter.success(data=data, message="Consultas listed successfully")
+
+
+def _paginated_list():
+    from src.utils.response import ResponseFormatter
+
+    data = sample_rows(100)["pacientes"]
+    return lambda: ResponseFormatter.paginated(data=data, total=10_000, page=1, per_page=100)
+
+
+def _error():
+    from src.utils.response import ResponseFormatter
+
+    return lambda: ResponseFormatter.error(
+        message="Consulta not found", error_code="CONSULTA_ERROR", status_code=404
+    )
+
+
+_formatter_benchmark("response.success.single", _success_single)
+_formatter_benchmark("response.success.list_100", _success_list)
+_formatter_benchmark("response.paginated.list_100", _paginated_list)
+_formatter_benchmark("response.error", _error)
@@ -0,0 +1,48 @@
+"""Benchmarks for validators and password hashing."""
+
+from .harness import benchmark
+
+
+@benchmark("validator.required_fields", group="validators")
+def bench_required_fields():
+    from src.utils.validators import Validator
+
+    data = {"paciente_id": 1, "data": "2025-11-13 10:00:00", "motivo": "Rotina"}
+    required = ["paciente_id", "data", "motivo"]
+    return lambda: Validator.validate_required_fields(data, required)
+
+
+@benchmark("validator.email", group="validators")
+def bench_email():
+    from src.utils.validators import Validator
+
+    return lambda: Validator.validate_email("paciente.teste@example.com")
+
+
+@benchmark("validator.phone", group="validators")
+def bench_phone():
+    from src.utils.validators import Validator
+
+    return lambda: Validator.validate_phone("+5511987654321")
+
+
+@benchmark("validator.date_format", group="validators")
+def bench_date_format():
+    from src.utils.validators import Validator
+
+    return lambda: Validator.validate_date_format("2025-11-13 10:00:00", "%Y-%m-%d %H:%M:%S")
+
+
+@benchmark("password.hash", group="passwords")
+def bench_password_hash():
+    from werkzeug.security import generate_password_hash
+
+    return lambda: generate_password_hash("SenhaSegura123")
+
+
+@benchmark("password.check", group="passwords")
+def bench_password_check():
+    from werkzeug.security import check_password_hash, generate_password_hash
+
+    hashed = generate_password_hash("SenhaSegura123")
+    return lambda: check_password_hash(hashed, "SenhaSegura123")
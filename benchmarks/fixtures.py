@@ -0,0 +1,100 @@
+"""Canned rows used by the benchmarks."""
+
+from typing import Dict, List
+
+
+def sample_rows(count: int = 20) -> Dict[str, List[dict]]:
+    """
+    Build canned rows for every table queried by the services.
+
+    Args:
+        count: Number of rows per table.
+
+    Returns:
+        Mapping of table name to rows.
+    """
+    return {
+        "usuarios": [
+            {
+                "id": i,
+                "nome": f"Usuario {i}",
+                "email": f"usuario{i}@sghss.com",
+                "senha": "hash",
+                "tipo": "medico",
+            }
+            for i in range(1, count + 1)
+        ],
+        "pacientes": [
+            {
+                "id": i,
+                "nome": f"Paciente {i}",
+                "email": f"paciente{i}@example.com",
+                "telefone": "11987654321",
+                "cpf": f"{i:011d}",
+                "data_nascimento": "1990-05-15",
+                "endereco": "Avenida Paulista, 1000",
+            }
+            for i in range(1, count + 1)
+        ],
+        "profissionais": [
+            {
+                "id": i,
+                "nome": f"Dr. Profissional {i}",
+                "email": f"profissional{i}@sghss.com",
+                "telefone": "11987654321",
+                "especialidade": "Cardiologia",
+                "registro": f"{i:06d}/SP",
+            }
+            for i in range(1, count + 1)
+        ],
+        "consultas": [
+            {
+                "id": i,
+                "paciente_id": i,
+                "profissional_id": 1,
+                "data": "2025-11-13 10:00:00",
+                "motivo": "Consulta de rotina",
+                "observacoes": "Sem observacoes",
+                "tipo_consulta": "presencial",
+                "link_video": None,
+            }
+            for i in range(1, count + 1)
+        ],
+        "medicamentos": [
+            {"id": i, "nome": f"Medicamento {i}", "descricao": "Analgesico", "dosagem": "500mg"}
+            for i in range(1, count + 1)
+        ],
+        "prescricoes": [
+            {
+                "id": i,
+                "consulta_id": i,
+                "medicamento_id": 1,
+                "duracao": "7 dias",
+                "instrucoes": "Tomar a cada 8 horas",
+            }
+            for i in range(1, count + 1)
+        ],
+    }
+
+
+def load_rows(db_manager, rows: Dict[str, List[dict]]) -> None:
+    """
+    Insert canned rows through a DatabaseManager, parents before children.
+
+    Args:
+        db_manager: Database manager to write to.
+        rows: Mapping of table name to rows.
+    """
+    order = ["usuarios", "pacientes", "profissionais", "medicamentos", "consultas", "prescricoes"]
+    with db_manager.get_cursor() as (cursor, conn):
+        for table in order:
+            table_rows = rows.get(table, [])
+            if not table_rows:
+                continue
+            columns = list(table_rows[0])
+            cursor.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"VALUES ({', '.join(['%s'] * len(columns))})",
+                [tuple(row[column] for column in columns) for row in table_rows],
+            )
+        conn.commit()
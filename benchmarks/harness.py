@@ -0,0 +1,212 @@
+"""Benchmark registry, timing and result comparison."""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+DEFAULT_BASELINE = os.path.join(RESULTS_DIR, "baseline.json")
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark."""
+
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], object]]
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str) -> Callable:
+    """
+    Register a benchmark.
+
+    The decorated function performs the (untimed) setup and returns the
+    zero-argument callable that is actually timed.
+
+    Args:
+        name: Unique benchmark name.
+        group: Group used in reports.
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(setup: Callable[[], Callable[[], object]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name: {name}")
+        BENCHMARKS[name] = Benchmark(name=name, group=group, setup=setup)
+        return setup
+
+    return decorator
+
+
+def time_callable(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> dict:
+    """
+    Time a callable.
+
+    The number of calls per round is chosen so a round takes at least
+    ``min_time`` seconds; per-call statistics are computed over ``repeat`` rounds.
+
+    Args:
+        fn: Callable to time.
+        repeat: Number of rounds.
+        min_time: Minimum duration of one round in seconds.
+
+    Returns:
+        Dictionary with per-call timings in microseconds.
+    """
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number = min(
+            max(number * 2, int(number * min_time / max(elapsed, 1e-9))), 1_000_000
+        )
+
+    rounds = [elapsed / number] + [t / number for t in timer.repeat(repeat - 1, number)]
+    median = statistics.median(rounds)
+    return {
+        "calls_per_round": number,
+        "rounds": len(rounds),
+        "min_us": min(rounds) * 1e6,
+        "median_us": median * 1e6,
+        "mean_us": statistics.fmean(rounds) * 1e6,
+        "stdev_us": (statistics.stdev(rounds) if len(rounds) > 1 else 0.0) * 1e6,
+        "ops_per_sec": 1.0 / median if median else 0.0,
+    }
+
+
+def run_benchmarks(
+    selected: Optional[List[str]] = None, repeat: int = 5, min_time: float = 0.2
+) -> dict:
+    """
+    Run registered benchmarks.
+
+    Args:
+        selected: Substrings a benchmark name must contain; None runs all.
+        repeat: Number of rounds per benchmark.
+        min_time: Minimum duration of one round in seconds.
+
+    Returns:
+        Results document with metadata and per-benchmark timings.
+    """
+    results = {}
+    for name, bench in sorted(BENCHMARKS.items()):
+        if selected and not any(fragment in name for fragment in selected):
+            continue
+        fn = bench.setup()
+        timing = time_callable(fn, repeat=repeat, min_time=min_time)
+        timing["group"] = bench.group
+        results[name] = timing
+        print(
+            f"{name:<45} {timing['median_us']:>12.2f} us  "
+            f"({timing['ops_per_sec']:>12.1f} ops/s)",
+            flush=True,
+        )
+
+    return {"metadata": environment_metadata(), "results": results}
+
+
+def environment_metadata() -> dict:
+    """
+    Describe the environment the benchmarks ran in.
+
+    Returns:
+        Dictionary with interpreter, platform and git information.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(__file__),
+            timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+def save_results(document: dict, path: str) -> None:
+    """
+    Save a results document as JSON.
+
+    Args:
+        document: Results document.
+        path: Output file path.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2, sort_keys=True)
+
+
+def load_results(path: str) -> dict:
+    """
+    Load a results document.
+
+    Args:
+        path: Results file path.
+
+    Returns:
+        Results document.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.10) -> List[dict]:
+    """
+    Compare two results documents by median time per call.
+
+    Args:
+        baseline: Baseline results document.
+        current: Current results document.
+        threshold: Relative slowdown above which a benchmark is a regression.
+
+    Returns:
+        One entry per benchmark present in both documents.
+    """
+    rows = []
+    base_results = baseline.get("results", {})
+    for name, timing in sorted(current.get("results", {}).items()):
+        base = base_results.get(name)
+        if base is None or not base.get("median_us"):
+            continue
+        ratio = timing["median_us"] / base["median_us"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append(
+            {
+                "name": name,
+                "baseline_us": base["median_us"],
+                "current_us": timing["median_us"],
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
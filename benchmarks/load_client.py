@@ -0,0 +1,181 @@
+"""HTTP client and latency statistics shared by the load tools."""
+
+import http.client
+import json
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class HttpClient:
+    """
+    Minimal keep-alive HTTP client, one connection per thread.
+
+    Built on http.client so the load tools have no third-party dependencies.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: Target base URL, e.g. ``http://localhost:5000``.
+            timeout: Socket timeout in seconds.
+        """
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[dict] = None,
+        body: Optional[dict] = None,
+    ) -> Tuple[int, float, Optional[dict]]:
+        """
+        Issue a request.
+
+        Args:
+            method: HTTP method.
+            path: Path including the query string.
+            headers: Request headers.
+            body: JSON body.
+
+        Returns:
+            Tuple of (status, elapsed seconds, decoded JSON body or None).
+            Status is 0 when the request failed at the connection level.
+        """
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = dict(headers or {})
+        if payload is not None:
+            headers.setdefault("Content-Type", "application/json")
+
+        started = time.perf_counter()
+        for attempt in (1, 2):
+            conn = self._connection()
+            try:
+                conn.request(method, self.prefix + path, body=payload, headers=headers)
+                response = conn.getresponse()
+                raw = response.read()
+                break
+            except (OSError, http.client.HTTPException):
+                # A kept-alive connection may have been closed by the server
+                self._reset()
+                if attempt == 2:
+                    return 0, time.perf_counter() - started, None
+        elapsed = time.perf_counter() - started
+
+        try:
+            data = json.loads(raw) if raw else None
+        except ValueError:
+            data = None
+        return response.status, elapsed, data
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = (
+                http.client.HTTPSConnection
+                if self.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = cls(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def _reset(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+
+    Args:
+        sorted_values: Values in ascending order.
+        q: Percentile between 0 and 100.
+
+    Returns:
+        Percentile value, or 0.0 for an empty list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(samples: List[float], statuses: Dict[int, int], elapsed: float) -> dict:
+    """
+    Summarize latency samples of one endpoint.
+
+    Args:
+        samples: Latencies in seconds.
+        statuses: Count per HTTP status (0 for connection errors).
+        elapsed: Wall time of the run in seconds, for throughput.
+
+    Returns:
+        Dictionary with counts, throughput and latency percentiles in ms.
+    """
+    values = sorted(samples)
+    errors = sum(count for status, count in statuses.items() if status == 0 or status >= 500)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "rps": len(values) / elapsed if elapsed else 0.0,
+        "mean_ms": (sum(values) / len(values) * 1000) if values else 0.0,
+        "p50_ms": percentile(values, 50) * 1000,
+        "p95_ms": percentile(values, 95) * 1000,
+        "p99_ms": percentile(values, 99) * 1000,
+        "max_ms": (values[-1] * 1000) if values else 0.0,
+    }
+
+
+def compare_latency(
+    baseline: dict, current: dict, threshold: float = 0.10, metric: str = "p95_ms"
+) -> List[dict]:
+    """
+    Compare two load results documents by a latency percentile per endpoint.
+
+    Args:
+        baseline: Baseline results document.
+        current: Current results document.
+        threshold: Relative slowdown above which an endpoint is a regression.
+        metric: Latency field compared.
+
+    Returns:
+        One entry per endpoint present in both documents.
+    """
+    rows = []
+    base_results = baseline.get("results", {})
+    for name, summary in sorted(current.get("results", {}).items()):
+        base = base_results.get(name)
+        if base is None or not base.get(metric):
+            continue
+        ratio = summary[metric] / base[metric]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append(
+            {
+                "name": name,
+                "baseline": base[metric],
+                "current": summary[metric],
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
@@ -0,0 +1,328 @@
+"""Load test runner driven by the Postman collection."""
+
+import copy
+import itertools
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .harness import environment_metadata
+from .load_client import HttpClient, latency_summary
+
+DEFAULT_COLLECTION = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "SGHSS-API.postman_collection.json"
+)
+
+# Default scenario weights by kind: reads dominate real traffic
+DEFAULT_WEIGHTS = {"read": 8.0, "write": 1.0}
+
+UNIQUE_FIELDS = ("email", "cpf", "crm", "registro")
+
+_ID_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+_unique_counter = itertools.count(1)
+
+
+@dataclass
+class RequestTemplate:
+    """A request taken from the collection."""
+
+    name: str
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: Optional[dict] = None
+
+    @property
+    def route(self) -> str:
+        """Path without query string and with numeric ids replaced by <id>."""
+        return route_template(self.path)
+
+    @property
+    def endpoint(self) -> str:
+        """Key used to aggregate statistics."""
+        return f"{self.method} {self.route}"
+
+
+@dataclass
+class Scenario:
+    """A weighted sequence of requests executed in order."""
+
+    name: str
+    kind: str
+    steps: List[RequestTemplate] = field(default_factory=list)
+    weight: float = 1.0
+
+
+def route_template(path: str) -> str:
+    """
+    Normalize a request path to its route template.
+
+    Args:
+        path: Request path, optionally with a query string.
+
+    Returns:
+        Path without query string and with numeric segments replaced by <id>.
+    """
+    return _ID_SEGMENT_RE.sub("/<id>", path.split("?", 1)[0])
+
+
+def load_collection(path: str = DEFAULT_COLLECTION) -> List[RequestTemplate]:
+    """
+    Flatten a Postman collection into request templates.
+
+    Args:
+        path: Collection file path.
+
+    Returns:
+        Requests in collection order.
+    """
+    with open(path, "r", encoding="utf-8") as handle:
+        collection = json.load(handle)
+
+    templates = []
+
+    def walk(items):
+        for item in items:
+            if "item" in item:
+                walk(item["item"])
+                continue
+            request = item["request"]
+            url = request["url"]
+            raw = url if isinstance(url, str) else url.get("raw", "")
+            parts = urlsplit(raw)
+            body = None
+            raw_body = (request.get("body") or {}).get("raw")
+            if raw_body:
+                body = json.loads(raw_body)
+            templates.append(
+                RequestTemplate(
+                    name=item["name"],
+                    method=request["method"].upper(),
+                    path=parts.path + (f"?{parts.query}" if parts.query else ""),
+                    headers={h["key"]: h["value"] for h in request.get("header", [])},
+                    body=body,
+                )
+            )
+
+    walk(collection.get("item", []))
+    return templates
+
+
+def build_scenarios(
+    templates: List[RequestTemplate], weights: Optional[Dict[str, float]] = None
+) -> List[Scenario]:
+    """
+    Group requests into one read and one write scenario per resource.
+
+    The read scenario issues every GET of the resource. The write scenario
+    creates a record and runs the PUT and DELETE requests against the id
+    returned by the create call. Login is excluded: it is used to
+    authenticate the run.
+
+    Args:
+        templates: Requests from the collection.
+        weights: Weight overrides by scenario name (``usuarios:read``) or by
+            kind (``read``/``write``).
+
+    Returns:
+        Scenarios with at least one step.
+    """
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    scenarios: Dict[Tuple[str, str], Scenario] = {}
+
+    for template in templates:
+        if template.route.endswith("/auth/login"):
+            continue
+        segments = [s for s in template.route.split("/") if s and s != "api"]
+        resource = segments[0] if segments else "root"
+        kind = "read" if template.method == "GET" else "write"
+        name = f"{resource}:{kind}"
+        scenario = scenarios.setdefault((resource, kind), Scenario(name=name, kind=kind))
+        scenario.steps.append(template)
+
+    for scenario in scenarios.values():
+        if scenario.kind == "write":
+            # Create first so the other steps can target the new record
+            scenario.steps.sort(key=lambda step: step.method != "POST")
+        scenario.weight = weights.get(scenario.name, weights.get(scenario.kind, 1.0))
+
+    return [s for s in scenarios.values() if s.steps and s.weight > 0]
+
+
+def login_template(templates: List[RequestTemplate]) -> RequestTemplate:
+    """Find the login request of the collection."""
+    for template in templates:
+        if template.method == "POST" and template.route.endswith("/auth/login"):
+            return template
+    raise ValueError("Collection has no login request")
+
+
+def _uniquify(body: Optional[dict]) -> Optional[dict]:
+    """Make unique fields unique per request so creates do not conflict."""
+    if body is None:
+        return None
+    body = copy.deepcopy(body)
+    n = next(_unique_counter)
+    stamp = int(time.time()) % 100_000
+    for key in UNIQUE_FIELDS:
+        value = body.get(key)
+        if not isinstance(value, str):
+            continue
+        if key == "email":
+            body[key] = f"load{stamp}.{n}.{value}"
+        elif key == "cpf":
+            body[key] = f"{stamp:05d}{n:06d}"[-11:]
+        else:
+            body[key] = f"{n}{stamp}/{value.split('/')[-1]}"
+    return body
+
+
+class LoadTest:
+    """
+    Drives weighted scenarios concurrently against a running application.
+
+    Each worker thread picks a scenario by weight, runs its steps in order and
+    records latency per endpoint until the duration elapses.
+    """
+
+    def __init__(
+        self,
+        client: HttpClient,
+        scenarios: List[Scenario],
+        token: Optional[str] = None,
+        concurrency: int = 8,
+        duration: float = 30.0,
+        seed: int = 42,
+    ):
+        """
+        Initialize the load test.
+
+        Args:
+            client: HTTP client for the target application.
+            scenarios: Weighted scenarios.
+            token: JWT substituted for ``{{token}}`` in headers.
+            concurrency: Number of worker threads.
+            duration: Run duration in seconds.
+            seed: Seed for scenario selection.
+        """
+        self.client = client
+        self.scenarios = scenarios
+        self.token = token or ""
+        self.concurrency = concurrency
+        self.duration = duration
+        self.seed = seed
+
+    def run(self) -> dict:
+        """
+        Run the load test.
+
+        Returns:
+            Results document with per-endpoint throughput and latency.
+        """
+        deadline = time.monotonic() + self.duration
+        partials = [None] * self.concurrency
+        threads = [
+            threading.Thread(target=self._worker, args=(index, deadline, partials))
+            for index in range(self.concurrency)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        samples: Dict[str, List[float]] = defaultdict(list)
+        statuses: Dict[str, Counter] = defaultdict(Counter)
+        executed = Counter()
+        for partial in partials:
+            for endpoint, values in partial["samples"].items():
+                samples[endpoint].extend(values)
+                statuses[endpoint].update(partial["statuses"][endpoint])
+            executed.update(partial["scenarios"])
+
+        results = {
+            endpoint: latency_summary(values, statuses[endpoint], elapsed)
+            for endpoint, values in samples.items()
+        }
+        total = latency_summary(
+            [v for values in samples.values() for v in values],
+            sum(statuses.values(), Counter()),
+            elapsed,
+        )
+        return {
+            "kind": "loadtest",
+            "metadata": {
+                **environment_metadata(),
+                "target": f"{self.client.scheme}://{self.client.host}:{self.client.port}",
+                "concurrency": self.concurrency,
+                "duration": elapsed,
+                "weights": {s.name: s.weight for s in self.scenarios},
+            },
+            "scenarios": dict(executed),
+            "results": results,
+            "total": total,
+        }
+
+    def _worker(self, index: int, deadline: float, partials: list) -> None:
+        rng = random.Random(f"{self.seed}:{index}")
+        weights = [s.weight for s in self.scenarios]
+        samples: Dict[str, List[float]] = defaultdict(list)
+        statuses: Dict[str, Counter] = defaultdict(Counter)
+        executed = Counter()
+
+        while time.monotonic() < deadline:
+            scenario = rng.choices(self.scenarios, weights)[0]
+            executed[scenario.name] += 1
+            created_id = None
+            for step in scenario.steps:
+                path = step.path
+                if scenario.kind == "write" and step.method != "POST":
+                    if created_id is None:
+                        break
+                    path = _ID_SEGMENT_RE.sub(f"/{created_id}", path, count=1)
+                headers = {
+                    key: value.replace("{{token}}", self.token)
+                    for key, value in step.headers.items()
+                }
+                body = _uniquify(step.body) if step.method == "POST" else step.body
+                status, elapsed, data = self.client.request(step.method, path, headers, body)
+                samples[step.endpoint].append(elapsed)
+                statuses[step.endpoint][status] += 1
+                if step.method == "POST" and 200 <= status < 300 and isinstance(data, dict):
+                    created_id = (data.get("data") or {}).get("id")
+
+        partials[index] = {"samples": samples, "statuses": statuses, "scenarios": executed}
+
+
+def authenticate(client: HttpClient, templates: List[RequestTemplate], email: str, senha: str) -> str:
+    """
+    Log in with the collection's login request.
+
+    Args:
+        client: HTTP client for the target application.
+        templates: Requests from the collection.
+        email: Login email.
+        senha: Login password.
+
+    Returns:
+        JWT access token.
+
+    Raises:
+        RuntimeError: If the login fails.
+    """
+    template = login_template(templates)
+    status, _, data = client.request(
+        template.method, template.path, template.headers, {"email": email, "senha": senha}
+    )
+    token = ((data or {}).get("data") or {}).get("token")
+    if status != 200 or not token:
+        raise RuntimeError(f"Login failed with status {status}")
+    return token
@@ -0,0 +1,229 @@
+"""Replay of sanitized access logs against a running application."""
+
+import json
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlencode
+
+from .harness import environment_metadata
+from .load_client import HttpClient, latency_summary, percentile
+
+READ_METHODS = ("GET", "HEAD")
+
+_RULE_VARIABLE_RE = re.compile(r"<(?:[^:<>]+:)?(\w+)>")
+
+
+def read_access_log(path: str, include_writes: bool = False, limit: Optional[int] = None) -> List[dict]:
+    """
+    Read access log records in arrival order.
+
+    Args:
+        path: NDJSON access log written by AccessLogger.
+        include_writes: Also keep non-read requests.
+        limit: Maximum number of records.
+
+    Returns:
+        Records sorted by arrival time.
+    """
+    records = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if include_writes or record["m"] in READ_METHODS:
+                records.append(record)
+    records.sort(key=lambda record: record["t"])
+    return records[:limit] if limit else records
+
+
+def build_path(record: dict) -> str:
+    """
+    Rebuild the request path of a record from its route template.
+
+    Args:
+        record: Access log record.
+
+    Returns:
+        Path with URL variables and query string filled in.
+    """
+    args = record.get("a") or {}
+    path = _RULE_VARIABLE_RE.sub(lambda match: str(args.get(match.group(1), "")), record["r"])
+    query = record.get("q") or {}
+    return f"{path}?{urlencode(query)}" if query else path
+
+
+class Replayer:
+    """
+    Re-issues recorded requests preserving their inter-arrival times.
+
+    Offsets from the first record are divided by ``speed``, so 2x replays the
+    same traffic shape in half the time. Requests are dispatched on schedule
+    to a thread pool; when the pool cannot keep up the dispatch lag grows and
+    is reported, which separates client saturation from server latency.
+    Bodies are not recorded, so writes are replayed without a body.
+    """
+
+    def __init__(
+        self,
+        client: HttpClient,
+        records: List[dict],
+        token: Optional[str] = None,
+        speed: float = 1.0,
+        concurrency: int = 64,
+        window: float = 10.0,
+    ):
+        """
+        Initialize the replayer.
+
+        Args:
+            client: HTTP client for the target application.
+            records: Access log records in arrival order.
+            token: JWT sent as Bearer token.
+            speed: Replay speed multiplier.
+            concurrency: Maximum in-flight requests.
+            window: Size of report windows in seconds of original time.
+        """
+        self.client = client
+        self.records = records
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.speed = speed
+        self.concurrency = concurrency
+        self.window = window
+        self._lock = threading.Lock()
+        self._results: List[tuple] = []
+
+    def run(self) -> dict:
+        """
+        Replay the records.
+
+        Returns:
+            Results document with per-route and per-window latency breakdowns.
+        """
+        if not self.records:
+            raise ValueError("No records to replay")
+
+        origin = self.records[0]["t"]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for index, record in enumerate(self.records):
+                due = started + (record["t"] - origin) / self.speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self._issue, index, record, due)
+        elapsed = time.perf_counter() - started
+
+        return {
+            "kind": "replay",
+            "metadata": {
+                **environment_metadata(),
+                "target": f"{self.client.scheme}://{self.client.host}:{self.client.port}",
+                "speed": self.speed,
+                "concurrency": self.concurrency,
+                "records": len(self.records),
+                "original_duration": self.records[-1]["t"] - origin,
+                "duration": elapsed,
+            },
+            "results": self._by_route(elapsed),
+            "windows": self._by_window(origin),
+            "total": latency_summary(
+                [result[2] for result in self._results],
+                Counter(result[1] for result in self._results),
+                elapsed,
+            ),
+        }
+
+    def _issue(self, index: int, record: dict, due: float) -> None:
+        lag = time.perf_counter() - due
+        status, elapsed, _ = self.client.request(record["m"], build_path(record), self.headers)
+        with self._lock:
+            self._results.append((index, status, elapsed, lag))
+
+    def _by_route(self, elapsed: float) -> Dict[str, dict]:
+        samples: Dict[str, List[float]] = defaultdict(list)
+        statuses: Dict[str, Counter] = defaultdict(Counter)
+        original: Dict[str, List[float]] = defaultdict(list)
+        for index, status, latency, _ in self._results:
+            record = self.records[index]
+            key = f"{record['m']} {record['r']}"
+            samples[key].append(latency)
+            statuses[key][status] += 1
+            original[key].append(record["d"] / 1000)
+
+        report = {}
+        for key, values in samples.items():
+            summary = latency_summary(values, statuses[key], elapsed)
+            recorded = sorted(original[key])
+            summary["original_p95_ms"] = percentile(recorded, 95) * 1000
+            summary["p95_ratio"] = (
+                summary["p95_ms"] / summary["original_p95_ms"] if summary["original_p95_ms"] else 0.0
+            )
+            report[key] = summary
+        return report
+
+    def _by_window(self, origin: float) -> List[dict]:
+        buckets: Dict[int, list] = defaultdict(list)
+        for result in self._results:
+            offset = self.records[result[0]]["t"] - origin
+            buckets[int(offset // self.window)].append(result)
+
+        windows = []
+        for bucket in sorted(buckets):
+            results = buckets[bucket]
+            latencies = sorted(result[2] for result in results)
+            lags = sorted(result[3] for result in results)
+            errors = sum(1 for result in results if result[1] == 0 or result[1] >= 500)
+            windows.append(
+                {
+                    "start": bucket * self.window,
+                    "requests": len(results),
+                    "offered_rps": len(results) * self.speed / self.window,
+                    "p50_ms": percentile(latencies, 50) * 1000,
+                    "p95_ms": percentile(latencies, 95) * 1000,
+                    "p99_ms": percentile(latencies, 99) * 1000,
+                    "errors": errors,
+                    "dispatch_lag_p95_ms": percentile(lags, 95) * 1000,
+                }
+            )
+        return windows
+
+
+def breakdown(document: dict, top: int = 5) -> Iterable[str]:
+    """
+    Describe where latency broke down in a replay.
+
+    Args:
+        document: Replay results document.
+        top: Number of routes and windows listed.
+
+    Returns:
+        Report lines.
+    """
+    routes = sorted(
+        document["results"].items(), key=lambda item: item[1]["p95_ratio"], reverse=True
+    )
+    yield "Routes with the largest p95 growth over recorded latency:"
+    for name, summary in routes[:top]:
+        yield (
+            f"  {name:<50} p95 {summary['original_p95_ms']:>8.2f} -> "
+            f"{summary['p95_ms']:>8.2f} ms ({summary['p95_ratio']:.1f}x), "
+            f"{summary['errors']} errors"
+        )
+
+    windows = sorted(document["windows"], key=lambda item: item["p95_ms"], reverse=True)
+    yield "Slowest windows:"
+    for window in windows[:top]:
+        yield (
+            f"  t+{window['start']:>6.0f}s  {window['offered_rps']:>7.1f} req/s offered  "
+            f"p95 {window['p95_ms']:>8.2f} ms  {window['errors']} errors  "
+            f"dispatch lag p95 {window['dispatch_lag_p95_ms']:.1f} ms"
+        )
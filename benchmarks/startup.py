@@ -0,0 +1,126 @@
+"""Import-time and cold-start measurements in fresh interpreters."""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from .harness import environment_metadata
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter; phases are timed from the first line of the script
+_CHILD = """
+import json, sys, time
+started = time.perf_counter()
+import src
+imported = time.perf_counter()
+app = src.create_app("testing")
+created = time.perf_counter()
+response = app.test_client().get("/api/auth/health")
+served = time.perf_counter()
+print(json.dumps({
+    "import_src": imported - started,
+    "create_app": created - imported,
+    "first_request": served - created,
+    "status": response.status_code,
+    "modules": len(sys.modules),
+}))
+"""
+
+
+def _child_env() -> dict:
+    env = dict(os.environ)
+    env.update({"FLASK_ENV": "testing", "LOG_LEVEL": "WARNING"})
+    return env
+
+
+def measure_cold_start(repeat: int = 5) -> dict:
+    """
+    Measure worker boot phases in fresh interpreters.
+
+    Args:
+        repeat: Number of interpreter launches.
+
+    Returns:
+        Results document compatible with ``python -m benchmarks compare``.
+    """
+    phases: Dict[str, List[float]] = {
+        "import_src": [],
+        "create_app": [],
+        "first_request": [],
+        "process_total": [],
+    }
+    modules = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", _CHILD],
+            cwd=ROOT,
+            env=_child_env(),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total = time.perf_counter() - started
+        timings = json.loads(completed.stdout.strip().splitlines()[-1])
+        if timings["status"] != 200:
+            raise RuntimeError(f"Health check returned {timings['status']}")
+        for phase in ("import_src", "create_app", "first_request"):
+            phases[phase].append(timings[phase])
+        phases["process_total"].append(total)
+        modules = timings["modules"]
+
+    results = {}
+    for phase, values in phases.items():
+        median = statistics.median(values)
+        results[f"startup.{phase}"] = {
+            "group": "startup",
+            "rounds": len(values),
+            "min_us": min(values) * 1e6,
+            "median_us": median * 1e6,
+            "mean_us": statistics.fmean(values) * 1e6,
+            "stdev_us": (statistics.stdev(values) if len(values) > 1 else 0.0) * 1e6,
+        }
+
+    metadata = environment_metadata()
+    metadata["modules_loaded"] = modules
+    return {"metadata": metadata, "results": results}
+
+
+def import_profile(module: str = "src", top: int = 15) -> List[dict]:
+    """
+    Profile module import times with ``-X importtime``.
+
+    Args:
+        module: Module imported in a fresh interpreter.
+        top: Number of modules returned.
+
+    Returns:
+        Slowest modules by self time, in microseconds.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    rows.sort(key=lambda row: row["self_us"], reverse=True)
+    return rows[:top]
@@ -0,0 +1,190 @@
+"""Client and server CPU of prepared versus plain statements (needs MySQL)."""
+
+import logging
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .harness import environment_metadata
+
+# Statement CPU of one server thread, in picoseconds; SUM_CPU_TIME needs MySQL 8.0.28+
+_SERVER_CPU_SQL = """
+    SELECT SUM(s.SUM_TIMER_WAIT), SUM(s.SUM_CPU_TIME)
+    FROM performance_schema.events_statements_summary_by_thread_by_event_name s
+    JOIN performance_schema.threads t ON t.THREAD_ID = s.THREAD_ID
+    WHERE t.PROCESSLIST_ID = %s
+"""
+_SERVER_TIME_SQL = """
+    SELECT SUM(s.SUM_TIMER_WAIT), NULL
+    FROM performance_schema.events_statements_summary_by_thread_by_event_name s
+    JOIN performance_schema.threads t ON t.THREAD_ID = s.THREAD_ID
+    WHERE t.PROCESSLIST_ID = %s
+"""
+
+# Case -> (service module:class, method, table whose first id is passed or None to list)
+CASES: Dict[str, Tuple[str, str, Optional[str]]] = {
+    "consultas.obter_por_id": (
+        "consulta_service:ConsultaService",
+        "obter_consulta_por_id",
+        "consultas",
+    ),
+    "pacientes.obter_por_id": (
+        "paciente_service:PacienteService",
+        "obter_paciente_por_id",
+        "pacientes",
+    ),
+    "usuarios.obter_por_id": ("usuario_service:UsuarioService", "obter_usuario_por_id", "usuarios"),
+    "medicamentos.obter_por_id": (
+        "medicamento_service:MedicamentoService",
+        "obter_medicamento_por_id",
+        "medicamentos",
+    ),
+    "consultas.listar": ("consulta_service:ConsultaService", "listar_consultas", None),
+    "pacientes.listar": ("paciente_service:PacienteService", "listar_pacientes", None),
+}
+
+VARIANTS = {"plain": 0, "prepared": 64}
+
+
+class _ServerCpu:
+    """Reads statement CPU of one server connection from performance_schema."""
+
+    def __init__(self, db_config: dict, connection_id: int):
+        import mysql.connector
+
+        self._connection = mysql.connector.connect(**dict(db_config, autocommit=True))
+        self._connection_id = connection_id
+        self._sql = _SERVER_CPU_SQL
+        self.has_cpu = True
+        try:
+            self.read()
+        except mysql.connector.Error:
+            self._sql, self.has_cpu = _SERVER_TIME_SQL, False
+
+    def read(self) -> float:
+        """Seconds of CPU (or statement time on older servers) used so far."""
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(self._sql, (self._connection_id,))
+            timer_wait, cpu_time = cursor.fetchone()
+        finally:
+            cursor.close()
+        value = cpu_time if self.has_cpu else timer_wait
+        return float(value or 0) / 1e12
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _service_call(manager, case: Tuple[str, str, Optional[str]]) -> Callable[[], object]:
+    from src.services.registry import _resolve_factory
+
+    path, method, table = case
+    service = _resolve_factory(f".{path}")()
+    service.db_manager = manager
+    fn = getattr(service, method)
+    if table is None:
+        return lambda: fn(limite=20)
+    with manager.get_cursor() as (cursor, conn):
+        cursor.execute(f"SELECT MIN(id) FROM {table}")
+        (first_id,) = cursor.fetchone()
+    if first_id is None:
+        raise LookupError(f"Table {table} is empty; seed it with `flask seed` first")
+    return lambda: fn(first_id)
+
+
+def measure_statement_cache(
+    db_config: dict, calls: int = 2000, repeat: int = 5, selected: Optional[List[str]] = None
+) -> dict:
+    """
+    Compare plain and prepared cursors through the real service methods.
+
+    Every variant runs on a single pooled connection so the server side can
+    be attributed to one performance_schema thread.
+
+    Args:
+        db_config: mysql.connector connection arguments.
+        calls: Service calls per round.
+        repeat: Rounds per case and variant.
+        selected: Substrings a case name must contain; None runs all.
+
+    Returns:
+        Results document compatible with ``python -m benchmarks compare``.
+    """
+    from src.config.backends import MySQLBackend
+    from src.config.database import DatabaseManager
+
+    logging.disable(logging.INFO)
+    results = {}
+    server_metric = "server_cpu"
+    for variant, cache_size in VARIANTS.items():
+        backend = MySQLBackend(db_config, pool_size=1, statement_cache_size=cache_size)
+        manager = DatabaseManager(db_config, backend=backend)
+        with manager.get_connection() as conn:
+            connection_id = conn.connection_id
+        server = _ServerCpu(db_config, connection_id)
+        if not server.has_cpu:
+            server_metric = "server_time"
+        try:
+            for name, case in CASES.items():
+                if selected and not any(fragment in name for fragment in selected):
+                    continue
+                call = _service_call(manager, case)
+                call()  # warm up: prepares the statements of the prepared variant
+                client_rounds, server_rounds = [], []
+                for _ in range(repeat):
+                    server_before, client_before = server.read(), time.process_time()
+                    for _ in range(calls):
+                        call()
+                    client_rounds.append((time.process_time() - client_before) / calls)
+                    server_rounds.append((server.read() - server_before) / calls)
+                measured = (("client_cpu", client_rounds), (server_metric, server_rounds))
+                for metric, rounds in measured:
+                    median = statistics.median(rounds)
+                    results[f"statements.{name}.{variant}.{metric}"] = {
+                        "group": "statements",
+                        "rounds": len(rounds),
+                        "min_us": min(rounds) * 1e6,
+                        "median_us": median * 1e6,
+                        "mean_us": statistics.fmean(rounds) * 1e6,
+                        "stdev_us": (statistics.stdev(rounds) if len(rounds) > 1 else 0.0) * 1e6,
+                    }
+        finally:
+            server.close()
+            manager.close()
+
+    metadata = environment_metadata()
+    metadata["calls_per_round"] = calls
+    return {"metadata": metadata, "results": results}
+
+
+def savings(document: dict) -> List[dict]:
+    """
+    Pair each prepared measurement with its plain counterpart.
+
+    Args:
+        document: Results of ``measure_statement_cache``.
+
+    Returns:
+        Rows with both medians and the relative saving.
+    """
+    rows = []
+    results = document["results"]
+    for name, timing in sorted(results.items()):
+        if ".plain." not in name:
+            continue
+        prepared = results.get(name.replace(".plain.", ".prepared."))
+        if prepared is None:
+            continue
+        case, metric = name[len("statements.") :].split(".plain.")
+        plain_us, prepared_us = timing["median_us"], prepared["median_us"]
+        rows.append(
+            {
+                "case": case,
+                "metric": metric,
+                "plain_us": plain_us,
+                "prepared_us": prepared_us,
+                "saving": 1 - prepared_us / plain_us if plain_us else 0.0,
+            }
+        )
+    return rows
@@ -0,0 +1,61 @@
+"""Gunicorn configuration for SGHSS Backend.
+
+Usage: gunicorn -c gunicorn.conf.py
+
+Every setting can be overridden with the GUNICORN_* environment variables
+below or on the gunicorn command line.
+"""
+
+import gc
+import multiprocessing
+import os
+
+wsgi_app = "wsgi:app"
+bind = os.getenv(
+    "GUNICORN_BIND", f"{os.getenv('APP_HOST', '0.0.0.0')}:{os.getenv('APP_PORT', 5000)}"
+)
+
+# Load the application once in the master so workers share its memory pages
+preload_app = True
+
+# gthread workers: one process per core, requests served by a thread pool.
+# Requests spend most of their time waiting on MySQL, so threads give the
+# concurrency while processes give CPU parallelism.
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+
+# One pooled connection per thread; must be set before the app is preloaded
+os.environ.setdefault("DB_POOL_SIZE", str(threads))
+
+# Recycle workers periodically to bound memory growth; the jitter keeps
+# workers from restarting at the same time
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def when_ready(server):
+    """Freeze objects created during preload so workers keep sharing them."""
+    # Without freezing, the first collection in each worker touches every
+    # preloaded object's GC header and copies the pages it lives in
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"Preloaded application frozen ({gc.get_freeze_count()} objects)")
+
+
+def worker_exit(server, worker):
+    """Drain the worker's database connections on graceful shutdown."""
+    from src.config.database import get_db_manager
+
+    try:
+        get_db_manager().close()
+    except Exception as err:
+        server.log.warning(f"Error draining database connections: {err}")
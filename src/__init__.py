@@ -1,15 +1,33 @@
 """SGHSS Backend Application Entry Point."""
 
+import json
 import logging
 import os
+
+import click
 from flask import Flask
-from flask_jwt_extended import JWTManager
+from flask_jwt_extended import JWTManager, create_access_token
 
 from .config import get_config
-from .config.database import initialize_db
+from .config.backends import create_backend
+from .config.database import get_db_manager, initialize_db
+from .config.replicas import create_replica_set
 from .utils.logging import setup_logging
 from .exceptions import SGHSSException
+from .services.registry import ServiceContainer
+from .utils.access_log import AccessLogger
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.connection_tracker import ConnectionTracker
+from .utils.admission import AdmissionController, parse_priorities
+from .utils.availability import AvailabilityCache
+from .utils.deadline import RequestDeadlines, parse_deadlines
+from .utils.memory import DEFAULT_FILTERS as DEFAULT_MEMORY_FILTERS, MemoryProfiler
+from .utils.profiling import RequestProfiler
+from .utils.query_stats import QueryStats
+from .utils.retry import RetryPolicy
+from .utils.sampler import SamplingProfiler
 from .utils.response import ResponseFormatter
+from .routes.admin import admin_bp
 from .routes.auth import auth_bp
 from .routes.usuarios import usuario_bp
 from .routes.pacientes import paciente_bp
@@ -23,12 +41,14 @@ setup_logging(log_level=os.getenv("LOG_LEVEL", "INFO"))
 logger = logging.getLogger(__name__)
 
 
-def create_app(config_env: str = None) -> Flask:
+def create_app(config_env: str = None, asynchronous: bool = False) -> Flask:
     """
     Create and configure the Flask application.
 
     Args:
         config_env: Environment name (development, production, testing).
+        asynchronous: Use async database drivers; the app must then be served
+            through src.asgi.create_asgi_app.
 
     Returns:
         Configured Flask application instance.
@@ -41,13 +61,132 @@ def create_app(config_env: str = None) -> Flask:
     app.config.from_object(config)
 
     # Initialize database
-    initialize_db(config.DB_CONFIG)
-    logger.info("Database initialized")
+    query_stats = None
+    if config.QUERY_STATS_ENABLED:
+        query_stats = QueryStats(
+            slow_threshold_ms=config.SLOW_QUERY_THRESHOLD_MS,
+            window=config.QUERY_STATS_WINDOW,
+        )
+    backend = create_backend(
+        config.DB_BACKEND,
+        config.DB_CONFIG,
+        config.SQLITE_PATH,
+        pool_size=config.DB_ASYNC_POOL_SIZE if asynchronous else config.DB_POOL_SIZE,
+        asynchronous=asynchronous,
+        statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    )
+    replicas = create_replica_set(
+        config.DB_BACKEND,
+        config.DB_CONFIG,
+        config.DB_REPLICAS,
+        pool_size=config.DB_ASYNC_POOL_SIZE if asynchronous else config.DB_POOL_SIZE,
+        asynchronous=asynchronous,
+        statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+        max_lag_seconds=config.DB_REPLICA_MAX_LAG_SECONDS,
+        check_interval=config.DB_REPLICA_CHECK_INTERVAL,
+    )
+    retry_policy = None
+    if config.DB_RETRY_ENABLED:
+        retry_policy = RetryPolicy(
+            max_attempts=config.DB_RETRY_MAX_ATTEMPTS,
+            base_delay_ms=config.DB_RETRY_BASE_DELAY_MS,
+            max_delay_ms=config.DB_RETRY_MAX_DELAY_MS,
+        )
+    circuit_breaker = None
+    if config.DB_CIRCUIT_ENABLED:
+        circuit_breaker = CircuitBreaker(
+            failure_threshold=config.DB_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=config.DB_CIRCUIT_RESET_SECONDS,
+            half_open_probes=config.DB_CIRCUIT_HALF_OPEN_PROBES,
+        )
+        circuit_breaker.init_app(app)
+    connection_tracker = None
+    if config.DB_TRACKING_ENABLED:
+        connection_tracker = ConnectionTracker(
+            hold_warning_seconds=config.DB_HOLD_WARNING_SECONDS,
+            idle_transaction_seconds=config.DB_IDLE_TRANSACTION_SECONDS,
+            stack_depth=config.DB_TRACKING_STACK_DEPTH,
+        )
+    db_manager = initialize_db(
+        config.DB_CONFIG,
+        query_stats=query_stats,
+        backend=backend,
+        replicas=replicas,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        connection_tracker=connection_tracker,
+    )
+    if replicas is not None:
+        replicas.init_app(app)
+        logger.info(f"Database initialized ({backend.name}, {len(replicas.status())} replicas)")
+    else:
+        logger.info(f"Database initialized ({backend.name})")
+
+    # Services are created on first use and bound to this app's database
+    availability = None
+    if config.AVAILABILITY_CACHE_ENABLED:
+        availability = AvailabilityCache(
+            ttl_seconds=config.AVAILABILITY_CACHE_TTL_SECONDS,
+            max_days=config.AVAILABILITY_CACHE_MAX_DAYS,
+        )
+    ServiceContainer(db_manager, availability=availability).init_app(app)
 
     # Initialize JWT
     jwt = JWTManager(app)
     logger.info("JWT initialized")
 
+    # Initialize admission control first so shed requests skip the other hooks
+    if config.ADMISSION_ENABLED:
+        AdmissionController(
+            endpoint_limit=config.ADMISSION_ENDPOINT_LIMIT,
+            blueprint_limit=config.ADMISSION_BLUEPRINT_LIMIT,
+            min_limit=config.ADMISSION_MIN_LIMIT,
+            max_limit=config.ADMISSION_MAX_LIMIT,
+            queue_size=config.ADMISSION_QUEUE_SIZE,
+            queue_timeout_ms=config.ADMISSION_QUEUE_TIMEOUT_MS,
+            tolerance=config.ADMISSION_LATENCY_TOLERANCE,
+            priorities=parse_priorities(config.ADMISSION_PRIORITIES),
+        ).init_app(app)
+        logger.info("Admission control initialized")
+
+    # Initialize request deadlines
+    if config.DEADLINES_ENABLED:
+        RequestDeadlines(
+            default_ms=config.DEADLINE_DEFAULT_MS,
+            deadlines=parse_deadlines(config.DEADLINE_ENDPOINTS),
+        ).init_app(app)
+        logger.info("Request deadlines initialized")
+
+    # Initialize request profiler
+    if config.PROFILER_ENABLED:
+        RequestProfiler(
+            output_dir=config.PROFILER_OUTPUT_DIR,
+            max_per_minute=config.PROFILER_MAX_PER_MINUTE,
+            sample_interval_ms=config.PROFILER_SAMPLE_INTERVAL_MS,
+        ).init_app(app)
+        logger.info("Request profiler initialized")
+
+    # Initialize always-on sampling profiler
+    if config.SAMPLING_PROFILER_ENABLED:
+        SamplingProfiler(
+            output_dir=config.SAMPLING_PROFILER_OUTPUT_DIR,
+            interval_ms=config.SAMPLING_PROFILER_INTERVAL_MS,
+            flush_interval=config.SAMPLING_PROFILER_FLUSH_SECONDS,
+            max_files=config.SAMPLING_PROFILER_MAX_FILES,
+            max_overhead=config.SAMPLING_PROFILER_MAX_OVERHEAD,
+        ).init_app(app)
+        logger.info("Sampling profiler initialized")
+
+    # Initialize memory profiler
+    if config.MEMORY_PROFILER_ENABLED:
+        MemoryProfiler(nframes=config.MEMORY_PROFILER_FRAMES).init_app(app)
+        logger.info("Memory profiler initialized")
+
+    # Initialize access log
+    if config.ACCESS_LOG_ENABLED:
+        AccessLogger(config.ACCESS_LOG_PATH).init_app(app)
+        logger.info(f"Access log enabled ({config.ACCESS_LOG_PATH})")
+
     # Register error handlers
     register_error_handlers(app)
 
@@ -72,11 +211,15 @@ def register_error_handlers(app: Flask) -> None:
     @app.errorhandler(SGHSSException)
     def handle_sghss_exception(error: SGHSSException):
         """Handle SGHSS custom exceptions."""
-        return ResponseFormatter.error(
+        response, status_code = ResponseFormatter.error(
             message=error.message,
             error_code="SGHSS_ERROR",
             status_code=error.status_code,
         )
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            response.headers["Retry-After"] = str(retry_after)
+        return response, status_code
 
     @app.errorhandler(404)
     def handle_not_found(error):
@@ -121,6 +264,7 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(consulta_bp)
     app.register_blueprint(medicamento_bp)
     app.register_blueprint(prescricao_bp)
+    app.register_blueprint(admin_bp)
     logger.info("Blueprints registered")
 
 
@@ -136,10 +280,82 @@ def register_cli_commands(app: Flask) -> None:
     def init_db():
         """Initialize database tables."""
         logger.info("Initializing database...")
-        # TODO: Implement database initialization script
+        try:
+            get_db_manager().bootstrap_schema()
+        except NotImplementedError as err:
+            raise click.ClickException(str(err))
         logger.info("Database initialized")
 
+    @app.cli.command("memory-profile")
+    @click.argument("path")
+    @click.option("--method", default="GET", help="HTTP method.")
+    @click.option("--requests", "count", default=100, help="Number of requests.")
+    @click.option("--data", default=None, help="JSON request body.")
+    @click.option("--limit", default=20, help="Number of allocation sites shown.")
+    @click.option("--all-modules", is_flag=True, help="Do not restrict to src/services and src/routes.")
+    def memory_profile(path, method, count, data, limit, all_modules):
+        """Issue PATH in-process under tracemalloc and report allocation growth."""
+        profiler = app.extensions.get("memory_profiler") or MemoryProfiler()
+        token = create_access_token(identity="0", additional_claims={"tipo": "admin"})
+        report = profiler.profile_requests(
+            app,
+            path,
+            method=method.upper(),
+            requests=count,
+            headers={"Authorization": f"Bearer {token}"},
+            json=json.loads(data) if data else None,
+            limit=limit,
+            filters=None if all_modules else DEFAULT_MEMORY_FILTERS,
+        )
+        click.echo(json.dumps(report, indent=2, default=str))
+
+    @app.cli.command("marcar-faltas")
+    @click.option("--ate", default=None, help="Mark consultas before this moment (default: now).")
+    @click.option("--lote", default=500, help="Consultas per batch.")
+    def marcar_faltas(ate, lote):
+        """Mark consultas still scheduled before a moment as no-shows."""
+        try:
+            marcadas = app.extensions["services"].get("consultas").marcar_nao_comparecimentos(
+                ate=ate, lote=lote
+            )
+        except SGHSSException as err:
+            raise click.ClickException(err.message)
+        click.echo(f"Marked {marcadas:,} consultas as no-shows")
+
+    @app.cli.command()
+    @click.option("--usuarios", default="0", help="Usuarios to generate (accepts k/M suffixes).")
+    @click.option("--pacientes", default="0", help="Pacientes to generate.")
+    @click.option("--profissionais", default="0", help="Profissionais to generate.")
+    @click.option("--medicamentos", default="0", help="Medicamentos to generate.")
+    @click.option("--consultas", default="0", help="Consultas to generate.")
+    @click.option("--prescricoes", default="0", help="Prescricoes to generate.")
+    @click.option("--seed", "seed_value", default=42, help="Seed for reproducible data.")
+    @click.option("--workers", default=os.cpu_count() or 1, help="Worker processes.")
+    @click.option("--batch-size", default=5000, help="Rows per INSERT batch.")
+    @click.option("--chunk-size", default=100000, help="Rows per worker task.")
+    def seed(seed_value, workers, batch_size, chunk_size, **counts):
+        """Generate synthetic, referentially consistent data for scale testing."""
+        from .utils.seeding import DataSeeder, parse_count
+
+        try:
+            counts = {table: parse_count(value) for table, value in counts.items()}
+            seeder = DataSeeder(
+                get_db_manager(),
+                seed=seed_value,
+                workers=workers,
+                batch_size=batch_size,
+                chunk_size=chunk_size,
+                db_config=app.config["DB_CONFIG"],
+                backend_name=app.config["DB_BACKEND"],
+                sqlite_path=app.config["SQLITE_PATH"],
+                echo=click.echo,
+            )
+            inserted = seeder.seed_tables(counts)
+        except ValueError as err:
+            raise click.ClickException(str(err))
+        click.echo(f"Seeded {sum(inserted.values()):,} rows")
+
 
 if __name__ == "__main__":
     app = create_app()
-    app.run(debug=True)
+    app.run(debug=app.config["DEBUG"])
@@ -0,0 +1,166 @@
+"""Optional asyncio serving mode.
+
+The Flask application is served over ASGI with every request running in its
+own greenlet on the event loop. Database round trips go through the aiomysql
+pool and yield to the loop, so a slow query no longer holds an OS thread and a
+few processes can keep thousands of requests in flight. Blueprints, services
+and extensions are the same objects the WSGI server uses.
+
+Requires requirements-async.txt. Run with: uvicorn asgi:app
+"""
+
+import io
+import logging
+import sys
+from typing import Callable, List, Optional
+
+from flask import Flask
+
+from . import create_app
+from .utils.async_bridge import await_only, greenlet_spawn
+
+logger = logging.getLogger(__name__)
+
+
+class GreenletWSGIMiddleware:
+    """
+    ASGI application running a WSGI application in greenlets.
+
+    Unlike a thread-pool bridge, the WSGI application runs on the event loop
+    thread itself; it only suspends where the code under it calls
+    ``await_only`` (database I/O, offloaded CPU work, sending response chunks).
+    """
+
+    def __init__(self, wsgi_app: Flask, on_shutdown: Optional[List[Callable[[], None]]] = None):
+        """
+        Initialize the middleware.
+
+        Args:
+            wsgi_app: WSGI application.
+            on_shutdown: Synchronous callables run in a greenlet at lifespan shutdown.
+        """
+        self.wsgi_app = wsgi_app
+        self.on_shutdown = on_shutdown or []
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            body = await self._read_body(receive)
+            await greenlet_spawn(self._run, self._environ(scope, body), send)
+        else:
+            raise NotImplementedError(f"Unsupported ASGI scope type: {scope['type']}")
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                for callback in self.on_shutdown:
+                    try:
+                        await greenlet_spawn(callback)
+                    except Exception as err:
+                        logger.error(f"Error during ASGI shutdown: {err}")
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    @staticmethod
+    async def _read_body(receive) -> bytes:
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    def _run(self, environ: dict, send) -> None:
+        """Call the WSGI application and stream its response through ``send``."""
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and response.get("started"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ]
+            return lambda data: send_chunk(data)
+
+        def send_chunk(data: bytes) -> None:
+            if not response.get("started"):
+                response["started"] = True
+                await_only(
+                    send(
+                        {
+                            "type": "http.response.start",
+                            "status": response["status"],
+                            "headers": response["headers"],
+                        }
+                    )
+                )
+            if data:
+                await_only(send({"type": "http.response.body", "body": data, "more_body": True}))
+
+        iterable = self.wsgi_app(environ, start_response)
+        try:
+            for chunk in iterable:
+                send_chunk(chunk)
+            send_chunk(b"")
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+        await_only(send({"type": "http.response.body", "body": b"", "more_body": False}))
+
+    @staticmethod
+    def _environ(scope: dict, body: bytes) -> dict:
+        """Build a PEP 3333 environ from an ASGI HTTP scope."""
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client") or ("", 0)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+            "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server[0],
+            "SERVER_PORT": str(server[1] or 80),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0],
+            "REMOTE_PORT": str(client[1]),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+            "CONTENT_LENGTH": str(len(body)),
+        }
+        for raw_name, raw_value in scope.get("headers", []):
+            name = raw_name.decode("latin-1").upper().replace("-", "_")
+            value = raw_value.decode("latin-1")
+            if name == "CONTENT_TYPE":
+                environ["CONTENT_TYPE"] = value
+                continue
+            if name == "CONTENT_LENGTH":
+                continue
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+        return environ
+
+
+def create_asgi_app(config_env: str = None) -> GreenletWSGIMiddleware:
+    """
+    Create the application for the asyncio serving mode.
+
+    Args:
+        config_env: Environment name (development, production, testing).
+
+    Returns:
+        ASGI application.
+    """
+    app = create_app(config_env, asynchronous=True)
+    db_manager = app.extensions["services"].db_manager
+    return GreenletWSGIMiddleware(app, on_shutdown=[db_manager.close])
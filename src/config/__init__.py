@@ -1,10 +1,17 @@
 """Configuration module for SGHSS application."""
 
-from .settings import Config, DevelopmentConfig, ProductionConfig, TestingConfig
+from .settings import (
+    Config,
+    DevelopmentConfig,
+    ProductionConfig,
+    TestingConfig,
+    get_config,
+)
 
 __all__ = [
     "Config",
     "DevelopmentConfig",
     "ProductionConfig",
     "TestingConfig",
+    "get_config",
 ]
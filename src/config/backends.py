@@ -0,0 +1,957 @@
+"""Pluggable database backends for DatabaseManager."""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+from ..utils.async_bridge import await_only
+
+logger = logging.getLogger(__name__)
+
+SQLITE_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "schema_sqlite.sql")
+
+# mysql.connector.pooling.CNX_POOL_MAXSIZE, kept here to avoid importing the driver
+MYSQL_POOL_MAXSIZE = 32
+
+# ER_QUERY_TIMEOUT (MAX_EXECUTION_TIME reached) and ER_QUERY_INTERRUPTED
+MYSQL_TIMEOUT_ERRNOS = (3024, 1317)
+
+# ER_LOCK_DEADLOCK and ER_LOCK_WAIT_TIMEOUT: the transaction can be run again
+MYSQL_TRANSIENT_ERRNOS = (1213, 1205)
+
+# SQLite virtual machine instructions between deadline checks
+SQLITE_PROGRESS_STEPS = 1000
+
+_SELECT_RE = re.compile(r"^\s*SELECT\b", re.I)
+
+# Attribute holding the statement cache on a driver connection
+_STATEMENT_CACHE_ATTR = "_sghss_statement_cache"
+
+# %s / %(name)s placeholders outside of quoted literals, plus escaped %%
+_PLACEHOLDER_RE = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"])*\"|%\((\w+)\)s|%s|%%")
+
+
+@lru_cache(maxsize=512)
+def translate_placeholders(sql: str) -> str:
+    """
+    Translate MySQL-style placeholders to SQLite ones.
+
+    Args:
+        sql: Statement using ``%s`` or ``%(name)s`` placeholders.
+
+    Returns:
+        Statement using ``?`` or ``:name`` placeholders.
+    """
+
+    def replace(match):
+        token = match.group(0)
+        if token == "%s":
+            return "?"
+        if token == "%%":
+            return "%"
+        if match.group(1):
+            return f":{match.group(1)}"
+        return token
+
+    return _PLACEHOLDER_RE.sub(replace, sql)
+
+
+class DatabaseBackend:
+    """Base class for database backends."""
+
+    name = "base"
+    explain_prefix = "EXPLAIN"
+    # Appended to a SELECT to lock the rows it reads until the transaction ends
+    for_update = ""
+
+    @property
+    def errors(self) -> Tuple[type, ...]:
+        """Driver exception classes raised by connections of this backend."""
+        return ()
+
+    def connect(self):
+        """
+        Open a new connection.
+
+        Returns:
+            A connection exposing the mysql.connector connection API subset
+            used by the services (cursor, commit, rollback, close, is_connected).
+        """
+        raise NotImplementedError
+
+    def bootstrap(self) -> None:
+        """Create the schema if the backend supports it."""
+        raise NotImplementedError(f"Schema bootstrap is not supported by {self.name}")
+
+    def close(self) -> None:
+        """Release connections held by the backend."""
+
+    def pool_status(self) -> dict:
+        """
+        Describe the connection pool without opening a connection.
+
+        Returns:
+            Pool size and usage; empty for backends without a pool.
+        """
+        return {}
+
+    def prepared_cursor(self, connection, dictionary: bool = False):
+        """
+        Create a cursor for fixed-shape statements.
+
+        Backends without server-side statement caching return a plain cursor.
+
+        Args:
+            connection: Connection from ``connect``.
+            dictionary: If True, rows are returned as dictionaries.
+
+        Returns:
+            A cursor.
+        """
+        return connection.cursor(dictionary=dictionary)
+
+    def release(self, connection) -> None:
+        """
+        Give back a connection obtained from ``connect``.
+
+        Args:
+            connection: Connection to close or return to its pool.
+        """
+        connection.close()
+
+    def replication_lag(self, connection) -> Optional[float]:
+        """
+        Measure how far a replica is behind its primary.
+
+        Args:
+            connection: Connection to the replica.
+
+        Returns:
+            Lag in seconds, or None if the server is not replicating.
+        """
+        return 0.0
+
+    def limit_statement(self, connection, sql: str, timeout_ms: int) -> str:
+        """
+        Bound the execution time of the next statement.
+
+        Args:
+            connection: Connection the statement runs on.
+            sql: Statement text.
+            timeout_ms: Milliseconds the statement may run.
+
+        Returns:
+            The statement to execute, possibly rewritten.
+        """
+        return sql
+
+    def clear_statement_limit(self, connection) -> None:
+        """
+        Remove a limit set by ``limit_statement``.
+
+        Args:
+            connection: Connection the limit was set on.
+        """
+
+    def is_timeout(self, err: Exception) -> bool:
+        """
+        Whether a driver error means a statement ran out of time.
+
+        Args:
+            err: Exception raised by the driver.
+
+        Returns:
+            True for execution timeouts and interruptions.
+        """
+        return False
+
+    def is_transient(self, err: Exception) -> bool:
+        """
+        Whether a driver error means the transaction may succeed if re-run.
+
+        Args:
+            err: Exception raised by the driver.
+
+        Returns:
+            True for deadlocks and lock wait timeouts.
+        """
+        return False
+
+
+class StatementCache:
+    """
+    LRU cache of prepared cursors belonging to one connection.
+
+    Each entry is a cursor holding one server-side prepared statement;
+    evicting it deallocates the statement on the server.
+    """
+
+    def __init__(self, capacity: int, connection_id: Optional[int] = None):
+        """
+        Initialize the statement cache.
+
+        Args:
+            capacity: Maximum number of prepared statements kept.
+            connection_id: Server connection id the statements belong to.
+        """
+        self.capacity = capacity
+        self.connection_id = connection_id
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple, factory: Callable[[], tuple]) -> tuple:
+        """
+        Get an entry, creating it on a miss and evicting the least recently used.
+
+        Args:
+            key: Cache key.
+            factory: Builds the ``(sql, cursor)`` entry on a miss.
+
+        Returns:
+            The ``(sql, cursor)`` entry.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = self._entries[key] = factory()
+        while len(self._entries) > self.capacity:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            try:
+                evicted.close()
+            except Exception as err:
+                logger.debug(f"Error closing evicted prepared statement: {err}")
+        return entry
+
+    def discard(self, key: tuple) -> None:
+        """
+        Drop an entry without talking to the server.
+
+        Args:
+            key: Cache key.
+        """
+        self._entries.pop(key, None)
+
+
+class PreparedCursor:
+    """
+    Cursor executing through its connection's cached prepared statements.
+
+    Statements are prepared once per connection and re-executed with new
+    parameters, so the server skips parsing and the client skips
+    interpolating and escaping parameters.
+    """
+
+    def __init__(self, connection, cache: StatementCache, dictionary: bool = False):
+        """
+        Initialize the prepared cursor.
+
+        Args:
+            connection: mysql.connector connection owning the statements.
+            cache: The connection's statement cache.
+            dictionary: If True, rows are returned as dictionaries.
+        """
+        self._connection = connection
+        self._cache = cache
+        self._dictionary = dictionary
+        self._cursor = None
+        self._rowcount: Optional[int] = None
+
+    def execute(self, operation: str, params: Any = None):
+        """Execute a statement, preparing it on first use on this connection."""
+        self._finish()
+        self._rowcount = None
+        key = (operation, self._dictionary)
+        sql, cursor = self._cache.get(key, lambda: (operation, self._new_cursor()))
+        self._cursor = cursor
+        # mysql.connector re-prepares unless it gets the very same string object
+        cursor.execute(sql, params)
+
+    def executemany(self, operation: str, seq_params):
+        """
+        Execute a statement for every parameter set.
+
+        The driver's prepared cursor only reports the last execution's
+        rowcount, so the total across all parameter sets is kept here.
+        """
+        total = 0
+        for params in seq_params:
+            self.execute(operation, params)
+            total += max(self._cursor.rowcount, 0)
+        self._rowcount = total
+
+    def fetchone(self):
+        """Fetch the next row."""
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size: int = 1):
+        """Fetch up to ``size`` rows."""
+        return self._cursor.fetchmany(size)
+
+    def fetchall(self):
+        """Fetch all remaining rows."""
+        return self._cursor.fetchall()
+
+    def close(self):
+        """Release the statement for the next execution; it stays prepared."""
+        self._finish()
+        self._cursor = None
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self) -> int:
+        if self._rowcount is not None:
+            return self._rowcount
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def with_rows(self) -> bool:
+        return self._cursor.with_rows
+
+    def _new_cursor(self):
+        return self._connection.cursor(prepared=True, dictionary=self._dictionary)
+
+    def _finish(self) -> None:
+        # Rows left unread would block the next statement on the connection
+        if self._cursor is not None and self._connection.unread_result:
+            self._cursor.fetchall()
+
+
+class MySQLBackend(DatabaseBackend):
+    """
+    Backend using mysql.connector.
+
+    With ``pool_size`` set, connections come from a per-process pool created
+    on first use, so a pool is never shared between a pre-fork master and its
+    workers. When the pool is exhausted a direct connection is opened instead
+    of failing the request. The driver is imported on first use, which keeps
+    it out of application import time.
+
+    With ``statement_cache_size`` set, prepared statements are kept per
+    connection. Pooled sessions are then not reset when returned to the pool,
+    since a reset deallocates them; open transactions are rolled back instead.
+    """
+
+    name = "mysql"
+    for_update = " FOR UPDATE"
+
+    def __init__(self, config: dict, pool_size: int = 0, statement_cache_size: int = 0):
+        """
+        Initialize the MySQL backend.
+
+        Args:
+            config: mysql.connector connection arguments.
+            pool_size: Connections kept per process; 0 disables pooling.
+            statement_cache_size: Prepared statements kept per connection;
+                0 disables prepared cursors.
+        """
+        self.config = config
+        self.pool_size = min(pool_size, MYSQL_POOL_MAXSIZE)
+        self.statement_cache_size = statement_cache_size
+        self._pool = None
+        self._pool_pid: Optional[int] = None
+        self._pool_lock = threading.Lock()
+        self._overflow = 0
+
+    @property
+    def errors(self) -> Tuple[type, ...]:
+        """mysql.connector base exception."""
+        from mysql.connector import Error
+
+        return (Error,)
+
+    def connect(self):
+        """Get a pooled connection, or open a new one if pooling is off."""
+        import mysql.connector
+        from mysql.connector import pooling
+
+        if not self.pool_size:
+            return mysql.connector.connect(**self.config)
+        try:
+            return self._get_pool().get_connection()
+        except pooling.PoolError:
+            logger.warning("MySQL connection pool exhausted, opening a direct connection")
+            self._overflow += 1
+            return mysql.connector.connect(**self.config)
+
+    def pool_status(self) -> dict:
+        """Size, idle connections and overflow of this process's pool."""
+        if not self.pool_size:
+            return {}
+        pool = self._pool if self._pool_pid == os.getpid() else None
+        idle = pool._cnx_queue.qsize() if pool is not None else None
+        return {
+            "size": self.pool_size,
+            "idle": idle,
+            "in_use": None if idle is None else self.pool_size - idle,
+            "overflow": self._overflow,
+        }
+
+    def prepared_cursor(self, connection, dictionary: bool = False):
+        """Create a cursor backed by the connection's prepared statement cache."""
+        if not self.statement_cache_size:
+            return connection.cursor(dictionary=dictionary)
+        # Pooled connections wrap the driver connection that outlives checkouts
+        raw = getattr(connection, "_cnx", None) or connection
+        cache = getattr(raw, _STATEMENT_CACHE_ATTR, None)
+        if cache is None or cache.connection_id != raw.connection_id:
+            # New connection, or reconnected by the pool: old statements are gone
+            cache = StatementCache(self.statement_cache_size, raw.connection_id)
+            setattr(raw, _STATEMENT_CACHE_ATTR, cache)
+        return PreparedCursor(raw, cache, dictionary=dictionary)
+
+    def release(self, connection) -> None:
+        """Roll back leftover work when sessions are not reset, then close."""
+        if self.statement_cache_size and self.pool_size and connection.in_transaction:
+            connection.rollback()
+        connection.close()
+
+    def replication_lag(self, connection) -> Optional[float]:
+        """Read Seconds_Behind_Source from the replica status."""
+        cursor = connection.cursor(dictionary=True)
+        try:
+            try:
+                cursor.execute("SHOW REPLICA STATUS")
+            except self.errors:
+                # Servers before 8.0.22 only know the old syntax
+                cursor.execute("SHOW SLAVE STATUS")
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        if not row:
+            return None
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return None if lag is None else float(lag)
+
+    def limit_statement(self, connection, sql: str, timeout_ms: int) -> str:
+        """Add a MAX_EXECUTION_TIME hint to SELECT statements."""
+        # Only SELECT honors MAX_EXECUTION_TIME; the optimizer hint avoids a
+        # SET round trip per statement and works with any driver
+        match = _SELECT_RE.match(sql)
+        if match is None:
+            return sql
+        # Round down to a power of two so each statement has only a handful
+        # of variants in the prepared statement cache
+        timeout_ms = 1 << (timeout_ms.bit_length() - 1)
+        return f"{match.group(0)} /*+ MAX_EXECUTION_TIME({timeout_ms}) */{sql[match.end():]}"
+
+    def is_timeout(self, err: Exception) -> bool:
+        """Whether the server stopped the statement at its execution time limit."""
+        return _errno(err) in MYSQL_TIMEOUT_ERRNOS
+
+    def is_transient(self, err: Exception) -> bool:
+        """Whether InnoDB chose the transaction as a deadlock victim or it waited too long."""
+        return _errno(err) in MYSQL_TRANSIENT_ERRNOS
+
+    def close(self) -> None:
+        """Close the idle connections of this process's pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+            if pool is None or self._pool_pid != os.getpid():
+                return
+        closed = pool._remove_connections()
+        logger.info(f"MySQL connection pool drained ({closed} connections closed)")
+
+    def _get_pool(self):
+        from mysql.connector import pooling
+
+        if self._pool is None or self._pool_pid != os.getpid():
+            with self._pool_lock:
+                if self._pool is None or self._pool_pid != os.getpid():
+                    # A pool inherited through fork shares sockets with the parent
+                    self._pool = pooling.MySQLConnectionPool(
+                        pool_name=f"sghss-{os.getpid()}",
+                        pool_size=self.pool_size,
+                        pool_reset_session=not self.statement_cache_size,
+                        **self.config,
+                    )
+                    self._pool_pid = os.getpid()
+        return self._pool
+
+    def bootstrap(self) -> None:
+        """MySQL schema is managed by DATABASE_INIT.sql."""
+        raise NotImplementedError(
+            "Run DATABASE_INIT.sql with the mysql client to create the MySQL schema"
+        )
+
+
+class AsyncMySQLCursor:
+    """Blocking-style cursor over an aiomysql cursor, for use under greenlet_spawn."""
+
+    def __init__(self, cursor):
+        """
+        Initialize the cursor adapter.
+
+        Args:
+            cursor: aiomysql cursor.
+        """
+        self._cursor = cursor
+
+    def execute(self, operation: str, params: Any = None):
+        """Execute a statement."""
+        await_only(self._cursor.execute(operation, params))
+
+    def executemany(self, operation: str, seq_params):
+        """Execute a statement for every parameter set."""
+        await_only(self._cursor.executemany(operation, list(seq_params)))
+
+    def fetchone(self):
+        """Fetch the next row."""
+        return await_only(self._cursor.fetchone())
+
+    def fetchmany(self, size: int = 1):
+        """Fetch up to ``size`` rows."""
+        return await_only(self._cursor.fetchmany(size))
+
+    def fetchall(self):
+        """Fetch all remaining rows."""
+        return await_only(self._cursor.fetchall())
+
+    def close(self):
+        """Close the cursor."""
+        await_only(self._cursor.close())
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def with_rows(self) -> bool:
+        return self._cursor.description is not None
+
+
+class AsyncMySQLConnection:
+    """Blocking-style connection over a pooled aiomysql connection."""
+
+    def __init__(self, connection, pool):
+        """
+        Initialize the connection adapter.
+
+        Args:
+            connection: aiomysql connection acquired from ``pool``.
+            pool: aiomysql pool the connection is released to.
+        """
+        self._connection = connection
+        self._pool = pool
+        self._open = True
+
+    def cursor(self, dictionary: bool = False, **kwargs) -> AsyncMySQLCursor:
+        """Create a cursor."""
+        import aiomysql
+
+        cursor_classes = (aiomysql.DictCursor,) if dictionary else ()
+        return AsyncMySQLCursor(await_only(self._connection.cursor(*cursor_classes)))
+
+    def commit(self):
+        """Commit the current transaction."""
+        await_only(self._connection.commit())
+
+    def rollback(self):
+        """Roll back the current transaction."""
+        await_only(self._connection.rollback())
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the server reports an open transaction."""
+        return not self._connection.closed and bool(self._connection.get_transaction_status())
+
+    def is_connected(self) -> bool:
+        """Whether this handle is still open."""
+        return self._open and not self._connection.closed
+
+    def close(self):
+        """Roll back uncommitted work and release the connection to the pool."""
+        if not self._open:
+            return
+        self._open = False
+        try:
+            if self.in_transaction:
+                await_only(self._connection.rollback())
+        finally:
+            self._pool.release(self._connection)
+
+
+class AsyncMySQLBackend(MySQLBackend):
+    """
+    Backend using the aiomysql async driver and pool.
+
+    Connections expose the same blocking interface as the other backends but
+    switch to the event loop on every round trip, so services run unchanged
+    under ``greenlet_spawn`` (see src/asgi.py). The pool is created on first
+    use in the running event loop.
+    """
+
+    name = "mysql"
+
+    def __init__(self, config: dict, pool_size: int = 10):
+        """
+        Initialize the async MySQL backend.
+
+        Args:
+            config: mysql.connector connection arguments, mapped to aiomysql.
+            pool_size: Maximum connections in the pool.
+        """
+        self.config = config
+        self.pool_size = max(1, pool_size)
+        self.statement_cache_size = 0  # aiomysql has no server-side prepared statements
+        self._pool_task = None
+
+    @property
+    def errors(self) -> Tuple[type, ...]:
+        """PyMySQL base exception, raised by aiomysql."""
+        from pymysql.err import MySQLError
+
+        return (MySQLError,)
+
+    def connect(self) -> AsyncMySQLConnection:
+        """Acquire a connection from the pool."""
+        pool = self._get_pool()
+        return AsyncMySQLConnection(await_only(pool.acquire()), pool)
+
+    def pool_status(self) -> dict:
+        """Size and free connections of the aiomysql pool."""
+        task, pool = self._pool_task, None
+        if task is not None and task.done() and not task.cancelled() and not task.exception():
+            pool = task.result()
+        return {
+            "size": self.pool_size,
+            "open": pool.size if pool is not None else None,
+            "idle": pool.freesize if pool is not None else None,
+            "in_use": pool.size - pool.freesize if pool is not None else None,
+        }
+
+    def close(self) -> None:
+        """Close the pool; must run under greenlet_spawn."""
+        task, self._pool_task = self._pool_task, None
+        if task is None:
+            return
+        pool = await_only(task)
+        pool.close()
+        await_only(pool.wait_closed())
+        logger.info("aiomysql pool closed")
+
+    def _get_pool(self):
+        import asyncio
+
+        import aiomysql
+
+        if self._pool_task is None:
+            # A shared task lets concurrent first requests wait for one pool
+            self._pool_task = asyncio.ensure_future(
+                aiomysql.create_pool(
+                    minsize=1,
+                    maxsize=self.pool_size,
+                    host=self.config.get("host", "localhost"),
+                    port=self.config.get("port", 3306),
+                    user=self.config.get("user"),
+                    password=self.config.get("password", ""),
+                    db=self.config.get("database"),
+                    autocommit=self.config.get("autocommit", False),
+                    connect_timeout=self.config.get("connection_timeout", 10),
+                )
+            )
+        return await_only(self._pool_task)
+
+
+class SQLiteCursor:
+    """Cursor adapter giving sqlite3 the mysql.connector cursor interface."""
+
+    def __init__(self, cursor: sqlite3.Cursor, dictionary: bool = False):
+        """
+        Initialize the cursor adapter.
+
+        Args:
+            cursor: sqlite3 cursor.
+            dictionary: If True, rows are returned as dictionaries.
+        """
+        self._cursor = cursor
+        self._dictionary = dictionary
+
+    def execute(self, operation: str, params: Any = None):
+        """Execute a statement written with MySQL placeholders."""
+        self._cursor.execute(translate_placeholders(operation), _params(params))
+
+    def executemany(self, operation: str, seq_params):
+        """Execute a statement for every parameter set."""
+        self._cursor.executemany(
+            translate_placeholders(operation), [_params(p) for p in seq_params]
+        )
+
+    def fetchone(self):
+        """Fetch the next row."""
+        return self._convert(self._cursor.fetchone())
+
+    def fetchmany(self, size: int = 1):
+        """Fetch up to ``size`` rows."""
+        return [self._convert(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        """Fetch all remaining rows."""
+        return [self._convert(row) for row in self._cursor.fetchall()]
+
+    def close(self):
+        """Close the cursor."""
+        self._cursor.close()
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def with_rows(self) -> bool:
+        return self._cursor.description is not None
+
+    def __iter__(self):
+        return (self._convert(row) for row in self._cursor)
+
+    def _convert(self, row):
+        if row is None:
+            return None
+        if self._dictionary:
+            return dict(zip((col[0] for col in self._cursor.description), row))
+        return tuple(row)
+
+
+class SQLiteConnection:
+    """Connection adapter giving sqlite3 the mysql.connector connection interface."""
+
+    def __init__(self, connection: sqlite3.Connection, lock: Optional[threading.RLock] = None):
+        """
+        Initialize the connection adapter.
+
+        Args:
+            connection: sqlite3 connection.
+            lock: Lock held while this handle is open, for shared connections.
+        """
+        self._connection = connection
+        self._lock = lock
+        self._open = True
+        if lock is not None:
+            lock.acquire()
+
+    def cursor(self, dictionary: bool = False, **kwargs) -> SQLiteCursor:
+        """Create a cursor."""
+        return SQLiteCursor(self._connection.cursor(), dictionary=dictionary)
+
+    def commit(self):
+        """Commit the current transaction."""
+        self._connection.commit()
+
+    def rollback(self):
+        """Roll back the current transaction."""
+        self._connection.rollback()
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether uncommitted changes are pending."""
+        return self._connection.in_transaction
+
+    def is_connected(self) -> bool:
+        """Whether this handle is still open."""
+        return self._open
+
+    def close(self):
+        """
+        Close the handle.
+
+        Uncommitted work is rolled back, as mysql.connector does on close.
+        Shared in-memory connections stay open and are only released.
+        """
+        if not self._open:
+            return
+        self._open = False
+        try:
+            if self._connection.in_transaction:
+                self._connection.rollback()
+            if self._lock is None:
+                self._connection.close()
+        finally:
+            if self._lock is not None:
+                self._lock.release()
+
+
+class SQLiteBackend(DatabaseBackend):
+    """
+    Backend using the standard library sqlite3 module.
+
+    ``:memory:`` databases use one shared connection serialized by a lock, so
+    every handle sees the same data. File databases open one connection per
+    handle in WAL mode. There are no row locks: writers are serialized, and a
+    transaction whose reads went stale fails with "database is locked",
+    which the retry policy treats as transient.
+    """
+
+    name = "sqlite"
+    explain_prefix = "EXPLAIN QUERY PLAN"
+    errors = (sqlite3.Error,)
+
+    def __init__(
+        self, path: str = ":memory:", bootstrap: bool = True, statement_cache_size: int = 128
+    ):
+        """
+        Initialize the SQLite backend.
+
+        Args:
+            path: Database file path or ``:memory:``.
+            bootstrap: Create the schema on initialization.
+            statement_cache_size: Compiled statements sqlite3 keeps per
+                connection (its own LRU cache, used by every cursor).
+        """
+        self.path = path
+        self.statement_cache_size = statement_cache_size
+        self._shared: Optional[sqlite3.Connection] = None
+        self._lock: Optional[threading.RLock] = None
+
+        if path == ":memory:":
+            self._shared = self._open()
+            self._lock = threading.RLock()
+        if bootstrap:
+            self.bootstrap()
+
+    def connect(self) -> SQLiteConnection:
+        """Open a connection handle."""
+        if self._shared is not None:
+            return SQLiteConnection(self._shared, lock=self._lock)
+        return SQLiteConnection(self._open())
+
+    def bootstrap(self) -> None:
+        """Create tables and indexes from schema_sqlite.sql."""
+        with open(SQLITE_SCHEMA_PATH, "r", encoding="utf-8") as handle:
+            script = handle.read()
+
+        conn = self.connect()
+        try:
+            conn._connection.executescript(script)
+            conn.commit()
+        finally:
+            conn.close()
+        logger.info(f"SQLite schema bootstrapped ({self.path})")
+
+    def limit_statement(self, connection, sql: str, timeout_ms: int) -> str:
+        """Interrupt the statement through a progress handler once time is up."""
+        deadline = time.monotonic() + timeout_ms / 1000
+        connection._connection.set_progress_handler(
+            lambda: time.monotonic() > deadline, SQLITE_PROGRESS_STEPS
+        )
+        return sql
+
+    def clear_statement_limit(self, connection) -> None:
+        """Remove the progress handler."""
+        connection._connection.set_progress_handler(None, 0)
+
+    def is_timeout(self, err: Exception) -> bool:
+        """Whether the statement was interrupted by its progress handler."""
+        return isinstance(err, sqlite3.OperationalError) and "interrupted" in str(err)
+
+    def is_transient(self, err: Exception) -> bool:
+        """Whether another connection held the database lock past the busy timeout."""
+        return isinstance(err, sqlite3.OperationalError) and "is locked" in str(err)
+
+    def close(self) -> None:
+        """Close the shared in-memory connection."""
+        if self._shared is not None:
+            with self._lock:
+                self._shared.close()
+                self._shared = None
+
+    def _open(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            timeout=10,
+            cached_statements=self.statement_cache_size,
+        )
+        connection.execute("PRAGMA foreign_keys = ON")
+        if self.path != ":memory:":
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+
+def _errno(err: Exception) -> Optional[int]:
+    """Get the server error number from a mysql.connector or PyMySQL error."""
+    errno = getattr(err, "errno", None)
+    if errno is None and err.args:
+        errno = err.args[0]  # PyMySQL keeps the error number in args
+    return errno
+
+
+def _params(params: Any):
+    """Normalize statement parameters for sqlite3."""
+    if params is None:
+        return ()
+    if isinstance(params, dict):
+        return params
+    return tuple(params)
+
+
+def create_backend(
+    name: str,
+    db_config: dict,
+    sqlite_path: str = ":memory:",
+    pool_size: int = 0,
+    asynchronous: bool = False,
+    statement_cache_size: int = 0,
+) -> DatabaseBackend:
+    """
+    Create a database backend by name.
+
+    Args:
+        name: Backend name (mysql or sqlite).
+        db_config: MySQL connection arguments.
+        sqlite_path: SQLite database path.
+        pool_size: MySQL connections pooled per process; 0 disables pooling.
+        asynchronous: Use the aiomysql driver for MySQL (asyncio serving mode).
+        statement_cache_size: Prepared statements cached per connection;
+            0 disables prepared cursors (SQLite keeps its default cache).
+
+    Returns:
+        DatabaseBackend instance.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name == "mysql" and asynchronous:
+        return AsyncMySQLBackend(db_config, pool_size=pool_size or 10)
+    if name == "mysql":
+        return MySQLBackend(
+            db_config, pool_size=pool_size, statement_cache_size=statement_cache_size
+        )
+    if name == "sqlite":
+        return SQLiteBackend(sqlite_path, statement_cache_size=statement_cache_size or 128)
+    raise ValueError(f"Unknown database backend: {name}")
@@ -1,43 +1,75 @@
 """Database connection manager."""
 
 import logging
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import contextmanager, suppress
+from typing import Any, Callable, Generator, List, Optional, Tuple, TypeVar
 
-import mysql.connector
-from mysql.connector import MySQLConnection, Error as MySQLError
+from .backends import DatabaseBackend, MySQLBackend
+from .replicas import ReplicaSet, replica_allowed
+from ..utils.circuit_breaker import CircuitBreaker
+from ..utils.connection_tracker import ConnectionTracker, TrackedCursor
+from ..utils.deadline import DeadlineCursor, check_deadline, remaining
+from ..utils.query_stats import InstrumentedCursor, QueryStats
+from ..utils.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class DatabaseManager:
     """Manages database connections and operations."""
 
-    def __init__(self, config: dict):
+    EXPLAINABLE_STATEMENTS = ("SELECT", "UPDATE", "DELETE", "INSERT", "REPLACE")
+
+    def __init__(
+        self,
+        config: dict,
+        query_stats: Optional[QueryStats] = None,
+        backend: Optional[DatabaseBackend] = None,
+        replicas: Optional[ReplicaSet] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        connection_tracker: Optional[ConnectionTracker] = None,
+    ):
         """
         Initialize the database manager.
 
         Args:
             config: Database configuration dictionary.
+            query_stats: Registry used to time statements, if enabled.
+            backend: Database backend; defaults to MySQL built from config.
+            replicas: Read replicas used by ``read_only`` service methods.
+            retry_policy: Policy re-running transactions that hit deadlocks
+                or lock wait timeouts, if enabled.
+            circuit_breaker: Breaker failing fast while the primary is
+                unreachable, if enabled.
+            connection_tracker: Registry of connection holders, if enabled.
         """
         self.config = config
+        self.query_stats = query_stats
+        self.backend = backend or MySQLBackend(config)
+        self.replicas = replicas
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.connection_tracker = connection_tracker
         self.connection = None
 
-    def connect(self) -> MySQLConnection:
+    def connect(self):
         """
         Establish a database connection.
 
         Returns:
-            MySQLConnection: The database connection.
+            The database connection.
 
         Raises:
-            MySQLError: If connection fails.
+            Exception: The backend's driver error if the connection fails.
         """
         try:
-            self.connection = mysql.connector.connect(**self.config)
+            self.connection = self.backend.connect()
             logger.info("Database connection established successfully")
             return self.connection
-        except MySQLError as err:
+        except self.backend.errors as err:
             logger.error(f"Database connection failed: {err}")
             raise
 
@@ -47,60 +79,238 @@ class DatabaseManager:
             self.connection.close()
             logger.info("Database connection closed")
 
-    @contextmanager
-    def get_connection(self) -> Generator[MySQLConnection, None, None]:
+    def close(self) -> None:
+        """Close the current connection and release the backends' pooled connections."""
+        self.disconnect()
+        self.backend.close()
+        if self.replicas is not None:
+            self.replicas.close()
+
+    def _connect(self) -> Tuple[Any, DatabaseBackend]:
         """
-        Context manager for database connections.
+        Open a connection on a replica for read-only work, else on the primary.
 
-        Yields:
-            MySQLConnection: A database connection.
+        Returns:
+            The connection and the backend that opened it, which is the one
+            it must be released to.
         """
+        replica = self.replicas.choose() if self.replicas and replica_allowed() else None
+        if replica is not None:
+            try:
+                return replica.connect(), replica
+            except replica.errors as err:
+                self.replicas.mark_failed(replica, err)
+        if self.circuit_breaker is None:
+            return self.backend.connect(), self.backend
+
+        self.circuit_breaker.before_connect()
         try:
-            conn = mysql.connector.connect(**self.config)
-            yield conn
-        except MySQLError as err:
+            conn = self.backend.connect()
+        except Exception as err:
+            self.circuit_breaker.record_failure(err)
+            raise
+        self.circuit_breaker.record_success()
+        return conn, self.backend
+
+    def health(self) -> dict:
+        """
+        Report pool and circuit state from memory, without connecting.
+
+        Returns:
+            Backend name, pool usage and circuit breaker state.
+        """
+        return {
+            "backend": self.backend.name,
+            "pool": self.backend.pool_status(),
+            "circuit": self.circuit_breaker.status() if self.circuit_breaker else None,
+        }
+
+    @contextmanager
+    def _checkout(self) -> Generator:
+        """Check out a connection, yielding it with its tracker record and owning backend."""
+        check_deadline()
+        conn = holder = None
+        backend = self.backend
+        try:
+            conn, backend = self._connect()
+            if self.connection_tracker is not None:
+                holder = self.connection_tracker.checkout(conn)
+            yield conn, holder, backend
+        except backend.errors as err:
             logger.error(f"Database error: {err}")
             raise
         finally:
+            if holder is not None:
+                self.connection_tracker.checkin(holder)
             if conn and conn.is_connected():
-                conn.close()
+                backend.release(conn)
 
     @contextmanager
-    def get_cursor(self, dictionary: bool = False) -> Generator:
+    def get_connection(self) -> Generator:
+        """
+        Context manager for database connections.
+
+        Yields:
+            A database connection.
+
+        Raises:
+            DeadlineExceededError: If the request deadline has already passed.
+            ServiceUnavailableError: If the circuit breaker is open.
+        """
+        with self._checkout() as (conn, holder, backend):
+            yield conn
+
+    @contextmanager
+    def get_cursor(self, dictionary: bool = False, prepared: bool = False) -> Generator:
         """
         Context manager for database cursors.
 
         Args:
             dictionary: If True, return results as dictionaries.
+            prepared: Run statements as prepared statements cached on the
+                connection; only for fixed-shape SQL, never for SQL built
+                per call.
 
         Yields:
-            Cursor: A database cursor.
+            Cursor: A database cursor, timed when query statistics are enabled,
+            time-limited when the request has a deadline and reporting to the
+            connection tracker when it is enabled.
         """
-        with self.get_connection() as conn:
+        with self._checkout() as (conn, holder, backend):
+            cursor = None
             try:
-                cursor = conn.cursor(dictionary=dictionary)
+                if prepared:
+                    cursor = backend.prepared_cursor(conn, dictionary=dictionary)
+                else:
+                    cursor = conn.cursor(dictionary=dictionary)
+                if remaining() is not None:
+                    cursor = DeadlineCursor(cursor, conn, backend)
+                if holder is not None:
+                    cursor = TrackedCursor(cursor, self.connection_tracker, holder)
+                if self.query_stats is not None:
+                    cursor = InstrumentedCursor(cursor, self.query_stats)
                 yield cursor, conn
             finally:
                 if cursor:
                     cursor.close()
 
+    def run_in_transaction(
+        self,
+        name: str,
+        unit: Callable[..., T],
+        dictionary: bool = False,
+        prepared: bool = True,
+    ) -> T:
+        """
+        Run a unit of work in its own transaction and commit it.
+
+        The unit receives ``(cursor, conn)`` and must not commit. If it fails
+        on a deadlock or lock wait timeout, the transaction is rolled back
+        and the whole unit runs again under the retry policy, so it must not
+        have side effects outside the database.
+
+        Args:
+            name: Unit of work name used in the retry metrics.
+            unit: Callable running the transaction's statements.
+            dictionary: If True, the cursor returns rows as dictionaries.
+            prepared: Use a prepared cursor; pass False for SQL built per call.
+
+        Returns:
+            Whatever the unit returns.
+
+        Raises:
+            Exception: The backend's driver error once retrying stops.
+        """
+
+        def attempt():
+            with self.get_cursor(dictionary=dictionary, prepared=prepared) as (cursor, conn):
+                try:
+                    result = unit(cursor, conn)
+                    conn.commit()
+                except BaseException:
+                    with suppress(*self.backend.errors):
+                        conn.rollback()
+                    raise
+                return result
+
+        if self.retry_policy is None:
+            return attempt()
+        return self.retry_policy.run(name, attempt, self.backend.is_transient)
+
+    def explain(self, sql: str, params=None) -> List[dict]:
+        """
+        Run EXPLAIN for a statement without recording it in query statistics.
+
+        Args:
+            sql: SQL statement to explain.
+            params: Statement parameters.
+
+        Returns:
+            EXPLAIN output rows.
+
+        Raises:
+            ValueError: If the statement cannot be explained.
+        """
+        statement_type = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else ""
+        if statement_type not in self.EXPLAINABLE_STATEMENTS:
+            raise ValueError(f"Cannot explain {statement_type or 'empty'} statement")
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                cursor.execute(f"{self.backend.explain_prefix} {sql}", params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def bootstrap_schema(self) -> None:
+        """
+        Create the database schema through the backend.
+
+        Raises:
+            NotImplementedError: If the backend manages its schema externally.
+        """
+        self.backend.bootstrap()
+
 
 # Global database manager instance
 _db_manager = None
 
 
-def initialize_db(config: dict) -> DatabaseManager:
+def initialize_db(
+    config: dict,
+    query_stats: Optional[QueryStats] = None,
+    backend: Optional[DatabaseBackend] = None,
+    replicas: Optional[ReplicaSet] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    connection_tracker: Optional[ConnectionTracker] = None,
+) -> DatabaseManager:
     """
     Initialize the global database manager.
 
     Args:
         config: Database configuration dictionary.
+        query_stats: Registry used to time statements, if enabled.
+        backend: Database backend; defaults to MySQL built from config.
+        replicas: Read replicas used by ``read_only`` service methods.
+        retry_policy: Policy re-running transactions on transient errors.
+        circuit_breaker: Breaker failing fast while the primary is unreachable.
+        connection_tracker: Registry of connection holders, if enabled.
 
     Returns:
         DatabaseManager: The initialized database manager.
     """
     global _db_manager
-    _db_manager = DatabaseManager(config)
+    _db_manager = DatabaseManager(
+        config,
+        query_stats=query_stats,
+        backend=backend,
+        replicas=replicas,
+        retry_policy=retry_policy,
+        circuit_breaker=circuit_breaker,
+        connection_tracker=connection_tracker,
+    )
     return _db_manager
 
 
@@ -0,0 +1,324 @@
+"""Read-replica routing for DatabaseManager."""
+
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, Generator, List, Optional
+
+from flask import Flask, g, request
+
+from .backends import DatabaseBackend, create_backend
+
+logger = logging.getLogger(__name__)
+
+# Requests with these methods may read from replicas; any other request stays
+# on the primary from its first statement
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_read_only: ContextVar[bool] = ContextVar("sghss_read_only", default=False)
+_session: ContextVar[Optional["RoutingSession"]] = ContextVar("sghss_routing", default=None)
+
+
+class RoutingSession:
+    """Read-your-writes state of one request."""
+
+    __slots__ = ("pinned",)
+
+    def __init__(self, pinned: bool = False):
+        """
+        Initialize the routing session.
+
+        Args:
+            pinned: Send every statement to the primary.
+        """
+        self.pinned = pinned
+
+
+def read_only(fn):
+    """
+    Mark a service method as safe to run on a replica.
+
+    Args:
+        fn: Service method that only reads.
+
+    Returns:
+        Wrapped method.
+    """
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def routing_session(pinned: bool = False) -> Generator[RoutingSession, None, None]:
+    """
+    Allow replica reads in a block, outside of a request.
+
+    Args:
+        pinned: Start pinned to the primary.
+
+    Yields:
+        The routing session.
+    """
+    session = RoutingSession(pinned)
+    token = _session.set(session)
+    try:
+        yield session
+    finally:
+        _session.reset(token)
+
+
+def replica_allowed() -> bool:
+    """
+    Decide whether the current statement may go to a replica.
+
+    Replica reads need a routing session and a ``read_only`` method. Anything
+    else pins the session to the primary, so reads that follow a write in the
+    same request see it.
+
+    Returns:
+        True if a replica may serve the statement.
+    """
+    session = _session.get()
+    if session is None or session.pinned:
+        return False
+    if not _read_only.get():
+        session.pinned = True
+        return False
+    return True
+
+
+class _Replica:
+    """Health state of one replica."""
+
+    __slots__ = ("name", "backend", "healthy", "lag", "checked_at", "error")
+
+    def __init__(self, name: str, backend: DatabaseBackend):
+        self.name = name
+        self.backend = backend
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class ReplicaSet:
+    """
+    Read replicas with lag-aware health checks.
+
+    Replicas are checked at most every ``check_interval`` seconds. The first
+    request that finds the state stale starts the check in a background
+    thread and, like every other request, keeps using the last known state,
+    so an unreachable replica never stalls a request on its connect timeout
+    and checks never pile up. A replica is healthy when it accepts
+    connections and lags at most ``max_lag_seconds`` behind the primary.
+    Healthy replicas are used round-robin.
+    """
+
+    def __init__(
+        self,
+        backends: Dict[str, DatabaseBackend],
+        max_lag_seconds: float = 5.0,
+        check_interval: float = 10.0,
+    ):
+        """
+        Initialize the replica set.
+
+        Args:
+            backends: Replica backends by name.
+            max_lag_seconds: Largest replication lag tolerated.
+            check_interval: Seconds between health checks.
+        """
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._replicas = [_Replica(name, backend) for name, backend in backends.items()]
+        self._counter = itertools.count()
+        self._check_lock = threading.Lock()
+        self._next_check = 0.0
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Open a routing session for every request.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["replicas"] = self
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    def choose(self) -> Optional[DatabaseBackend]:
+        """
+        Pick a healthy replica.
+
+        Returns:
+            Replica backend, or None if no replica is healthy.
+        """
+        if time.monotonic() >= self._next_check and self._check_lock.acquire(blocking=False):
+            try:
+                threading.Thread(
+                    target=self._check_all, name="sghss-replica-check", daemon=True
+                ).start()
+            except BaseException:
+                self._check_lock.release()
+                raise
+        healthy = [replica for replica in self._replicas if replica.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)].backend
+
+    def check(self, blocking: bool = True) -> None:
+        """
+        Check the health and lag of every replica.
+
+        Args:
+            blocking: Wait for a check already running in another thread;
+                otherwise return immediately.
+        """
+        if self._check_lock.acquire(blocking=blocking):
+            self._check_all()
+
+    def mark_failed(self, backend: DatabaseBackend, err: Exception) -> None:
+        """
+        Take a replica out of rotation until its next health check.
+
+        Args:
+            backend: Replica backend that failed.
+            err: Error raised by the replica.
+        """
+        for replica in self._replicas:
+            if replica.backend is backend:
+                replica.healthy = False
+                replica.error = str(err)
+                logger.warning(f"Replica {replica.name} marked unhealthy: {err}")
+
+    def status(self) -> List[dict]:
+        """
+        Summarize replica health.
+
+        Returns:
+            One dictionary per replica.
+        """
+        now = time.monotonic()
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag,
+                "checked_seconds_ago": (
+                    None if replica.checked_at is None else round(now - replica.checked_at, 1)
+                ),
+                "error": replica.error,
+            }
+            for replica in self._replicas
+        ]
+
+    def close(self) -> None:
+        """Release the connections held by every replica backend."""
+        for replica in self._replicas:
+            replica.backend.close()
+
+    def _check_all(self) -> None:
+        """Check every replica; the caller must hold the check lock."""
+        try:
+            for replica in self._replicas:
+                self._check(replica)
+            self._next_check = time.monotonic() + self.check_interval
+        finally:
+            self._check_lock.release()
+
+    def _check(self, replica: _Replica) -> None:
+        try:
+            conn = replica.backend.connect()
+            try:
+                lag = replica.backend.replication_lag(conn)
+            finally:
+                conn.close()
+        except Exception as err:
+            healthy, lag, error = False, None, str(err)
+        else:
+            if lag is None:
+                healthy, error = False, "Replication is not running"
+            elif lag > self.max_lag_seconds:
+                healthy, error = False, f"Lag of {lag:.0f}s exceeds {self.max_lag_seconds:.0f}s"
+            else:
+                healthy, error = True, None
+
+        if healthy != replica.healthy:
+            log = logger.info if healthy else logger.warning
+            state = "healthy" if healthy else "unhealthy"
+            log(f"Replica {replica.name} is {state}: {error or 'ok'}")
+        replica.healthy, replica.lag, replica.error = healthy, lag, error
+        replica.checked_at = time.monotonic()
+
+    def _before_request(self) -> None:
+        g._routing_token = _session.set(RoutingSession(pinned=request.method not in READ_METHODS))
+
+    def _teardown_request(self, exc=None) -> None:
+        token = g.pop("_routing_token", None)
+        if token is not None:
+            _session.reset(token)
+
+
+def create_replica_set(
+    backend_name: str,
+    db_config: dict,
+    replicas: str,
+    pool_size: int = 0,
+    asynchronous: bool = False,
+    statement_cache_size: int = 0,
+    max_lag_seconds: float = 5.0,
+    check_interval: float = 10.0,
+) -> Optional[ReplicaSet]:
+    """
+    Build a replica set from a comma-separated list.
+
+    Args:
+        backend_name: Backend name (mysql or sqlite).
+        db_config: Primary MySQL connection arguments; replicas share
+            everything but host and port.
+        replicas: ``host[:port]`` entries for MySQL, file paths for SQLite.
+        pool_size: Connections pooled per replica.
+        asynchronous: Use the async MySQL driver.
+        statement_cache_size: Prepared statements cached per connection.
+        max_lag_seconds: Largest replication lag tolerated.
+        check_interval: Seconds between health checks.
+
+    Returns:
+        ReplicaSet, or None if no replica is configured.
+    """
+    entries = [entry.strip() for entry in replicas.split(",") if entry.strip()]
+    if not entries:
+        return None
+
+    backends = {}
+    for entry in entries:
+        if backend_name == "sqlite":
+            backends[entry] = create_backend(
+                backend_name,
+                db_config,
+                sqlite_path=entry,
+                statement_cache_size=statement_cache_size,
+            )
+            continue
+        host, _, port = entry.partition(":")
+        config = dict(db_config, host=host, port=int(port or db_config.get("port", 3306)))
+        backends[entry] = create_backend(
+            backend_name,
+            config,
+            pool_size=pool_size,
+            asynchronous=asynchronous,
+            statement_cache_size=statement_cache_size,
+        )
+    return ReplicaSet(backends, max_lag_seconds=max_lag_seconds, check_interval=check_interval)
@@ -0,0 +1,120 @@
+-- ============================================================================
+-- SCHEMA SQLITE DO SGHSS
+-- Usado pelo backend SQLite (testes, benchmarks e execução local).
+-- As colunas seguem as queries dos services em src/services.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS usuarios (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    senha VARCHAR(255) NOT NULL,
+    tipo VARCHAR(20) NOT NULL DEFAULT 'paciente',
+    ativo BOOLEAN DEFAULT 1,
+    versao INTEGER NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_usuarios_tipo ON usuarios (tipo);
+
+CREATE TABLE IF NOT EXISTS pacientes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome VARCHAR(255) NOT NULL,
+    email VARCHAR(255),
+    telefone VARCHAR(20),
+    cpf VARCHAR(14) NOT NULL UNIQUE,
+    data_nascimento DATE,
+    endereco VARCHAR(500),
+    versao INTEGER NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS profissionais (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome VARCHAR(255) NOT NULL,
+    email VARCHAR(255),
+    telefone VARCHAR(20),
+    especialidade VARCHAR(100) NOT NULL,
+    registro VARCHAR(20) NOT NULL UNIQUE,
+    horario_inicio TIME,
+    horario_fim TIME,
+    dias_atendimento VARCHAR(100),
+    versao INTEGER NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_profissionais_especialidade ON profissionais (especialidade);
+
+CREATE TABLE IF NOT EXISTS medicamentos (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome VARCHAR(255) NOT NULL,
+    descricao TEXT,
+    dosagem VARCHAR(100),
+    versao INTEGER NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_medicamentos_nome ON medicamentos (nome);
+
+CREATE TABLE IF NOT EXISTS consulta_series (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    paciente_id INTEGER NOT NULL REFERENCES pacientes (id) ON DELETE CASCADE,
+    profissional_id INTEGER REFERENCES profissionais (id) ON DELETE CASCADE,
+    inicio DATETIME NOT NULL,
+    frequencia VARCHAR(10) NOT NULL DEFAULT 'semanal',
+    intervalo INTEGER NOT NULL DEFAULT 1,
+    dias_semana VARCHAR(100),
+    ocorrencias INTEGER NOT NULL,
+    duracao_minutos INTEGER DEFAULT 30,
+    motivo VARCHAR(500),
+    observacoes TEXT,
+    tipo_consulta VARCHAR(20) NOT NULL DEFAULT 'presencial',
+    link_video VARCHAR(500),
+    versao INTEGER NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_consulta_series_paciente_id ON consulta_series (paciente_id);
+
+CREATE TABLE IF NOT EXISTS consultas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    paciente_id INTEGER NOT NULL REFERENCES pacientes (id) ON DELETE CASCADE,
+    profissional_id INTEGER REFERENCES profissionais (id) ON DELETE CASCADE,
+    data DATETIME NOT NULL,
+    duracao_minutos INTEGER DEFAULT 30,
+    motivo VARCHAR(500),
+    observacoes TEXT,
+    tipo_consulta VARCHAR(20) NOT NULL DEFAULT 'presencial',
+    link_video VARCHAR(500),
+    status VARCHAR(20) NOT NULL DEFAULT 'agendada',
+    serie_id INTEGER REFERENCES consulta_series (id) ON DELETE SET NULL,
+    versao INTEGER NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_consultas_paciente_id ON consultas (paciente_id);
+-- Agenda e checagem de conflitos: faixa de datas de um profissional
+CREATE INDEX IF NOT EXISTS idx_consultas_profissional_data ON consultas (profissional_id, data);
+CREATE INDEX IF NOT EXISTS idx_consultas_data ON consultas (data);
+CREATE INDEX IF NOT EXISTS idx_consultas_status ON consultas (status);
+CREATE INDEX IF NOT EXISTS idx_consultas_serie_id ON consultas (serie_id);
+
+CREATE TABLE IF NOT EXISTS prescricoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    consulta_id INTEGER NOT NULL REFERENCES consultas (id) ON DELETE CASCADE,
+    medicamento_id INTEGER NOT NULL REFERENCES medicamentos (id) ON DELETE RESTRICT,
+    duracao VARCHAR(100),
+    instrucoes TEXT,
+    versao INTEGER NOT NULL DEFAULT 1,
+    criado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    atualizado_em TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_prescricoes_consulta_id ON prescricoes (consulta_id);
+CREATE INDEX IF NOT EXISTS idx_prescricoes_medicamento_id ON prescricoes (medicamento_id);
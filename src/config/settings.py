@@ -23,6 +23,30 @@ class Config:
     )
 
     # Database Configuration
+    DB_BACKEND = os.getenv("DB_BACKEND", "mysql")  # mysql or sqlite
+    SQLITE_PATH = os.getenv("SQLITE_PATH", ":memory:")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))  # per worker process, 0 disables
+    DB_ASYNC_POOL_SIZE = int(os.getenv("DB_ASYNC_POOL_SIZE", 20))  # asyncio serving mode
+    DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 64))  # per connection
+    # host[:port],... sharing the primary's credentials (file paths for sqlite)
+    DB_REPLICAS = os.getenv("DB_REPLICAS", "")
+    DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", 5))
+    DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", 10))
+    # Re-run write transactions that hit deadlocks or lock wait timeouts
+    DB_RETRY_ENABLED = os.getenv("DB_RETRY_ENABLED", "True").lower() == "true"
+    DB_RETRY_MAX_ATTEMPTS = int(os.getenv("DB_RETRY_MAX_ATTEMPTS", 4))
+    DB_RETRY_BASE_DELAY_MS = float(os.getenv("DB_RETRY_BASE_DELAY_MS", 20))
+    DB_RETRY_MAX_DELAY_MS = float(os.getenv("DB_RETRY_MAX_DELAY_MS", 1000))
+    # Fail fast instead of waiting on connect timeouts while MySQL is down
+    DB_CIRCUIT_ENABLED = os.getenv("DB_CIRCUIT_ENABLED", "True").lower() == "true"
+    DB_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("DB_CIRCUIT_FAILURE_THRESHOLD", 5))
+    DB_CIRCUIT_RESET_SECONDS = float(os.getenv("DB_CIRCUIT_RESET_SECONDS", 5))
+    DB_CIRCUIT_HALF_OPEN_PROBES = int(os.getenv("DB_CIRCUIT_HALF_OPEN_PROBES", 1))
+    # Record who holds each connection; warn on long holds and idle transactions
+    DB_TRACKING_ENABLED = os.getenv("DB_TRACKING_ENABLED", "True").lower() == "true"
+    DB_HOLD_WARNING_SECONDS = float(os.getenv("DB_HOLD_WARNING_SECONDS", 5))
+    DB_IDLE_TRANSACTION_SECONDS = float(os.getenv("DB_IDLE_TRANSACTION_SECONDS", 1))
+    DB_TRACKING_STACK_DEPTH = int(os.getenv("DB_TRACKING_STACK_DEPTH", 12))
     DB_CONFIG = {
         "host": os.getenv("DB_HOST", "localhost"),
         "user": os.getenv("DB_USER", "root"),
@@ -33,6 +57,58 @@ class Config:
         "connection_timeout": 10,
     }
 
+    # Availability Cache Configuration (busy-time bitsets per professional and day)
+    AVAILABILITY_CACHE_ENABLED = (
+        os.getenv("AVAILABILITY_CACHE_ENABLED", "True").lower() == "true"
+    )
+    AVAILABILITY_CACHE_TTL_SECONDS = float(os.getenv("AVAILABILITY_CACHE_TTL_SECONDS", 60))
+    AVAILABILITY_CACHE_MAX_DAYS = int(os.getenv("AVAILABILITY_CACHE_MAX_DAYS", 50000))
+
+    # Query Statistics Configuration
+    QUERY_STATS_ENABLED = os.getenv("QUERY_STATS_ENABLED", "True").lower() == "true"
+    QUERY_STATS_WINDOW = int(os.getenv("QUERY_STATS_WINDOW", 1024))
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+
+    # Request Profiler Configuration
+    PROFILER_ENABLED = False
+    PROFILER_MAX_PER_MINUTE = int(os.getenv("PROFILER_MAX_PER_MINUTE", 5))
+    PROFILER_OUTPUT_DIR = os.getenv("PROFILER_OUTPUT_DIR", "profiles")
+    PROFILER_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILER_SAMPLE_INTERVAL_MS", 5))
+
+    # Sampling Profiler Configuration
+    SAMPLING_PROFILER_ENABLED = False
+    SAMPLING_PROFILER_INTERVAL_MS = float(os.getenv("SAMPLING_PROFILER_INTERVAL_MS", 50))
+    SAMPLING_PROFILER_FLUSH_SECONDS = float(os.getenv("SAMPLING_PROFILER_FLUSH_SECONDS", 300))
+    SAMPLING_PROFILER_MAX_FILES = int(os.getenv("SAMPLING_PROFILER_MAX_FILES", 48))
+    SAMPLING_PROFILER_MAX_OVERHEAD = float(os.getenv("SAMPLING_PROFILER_MAX_OVERHEAD", 0.01))
+    SAMPLING_PROFILER_OUTPUT_DIR = os.getenv(
+        "SAMPLING_PROFILER_OUTPUT_DIR", "profiles/continuous"
+    )
+
+    # Memory Profiler Configuration
+    MEMORY_PROFILER_ENABLED = False
+    MEMORY_PROFILER_FRAMES = int(os.getenv("MEMORY_PROFILER_FRAMES", 10))
+
+    # Access Log Configuration
+    ACCESS_LOG_ENABLED = os.getenv("ACCESS_LOG_ENABLED", "False").lower() == "true"
+    ACCESS_LOG_PATH = os.getenv("ACCESS_LOG_PATH", "logs/access.ndjson")
+
+    # Admission Control Configuration
+    ADMISSION_ENABLED = False
+    ADMISSION_ENDPOINT_LIMIT = int(os.getenv("ADMISSION_ENDPOINT_LIMIT", 16))
+    ADMISSION_BLUEPRINT_LIMIT = int(os.getenv("ADMISSION_BLUEPRINT_LIMIT", 32))
+    ADMISSION_MIN_LIMIT = int(os.getenv("ADMISSION_MIN_LIMIT", 1))
+    ADMISSION_MAX_LIMIT = int(os.getenv("ADMISSION_MAX_LIMIT", 128))
+    ADMISSION_QUEUE_SIZE = int(os.getenv("ADMISSION_QUEUE_SIZE", 32))
+    ADMISSION_QUEUE_TIMEOUT_MS = float(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", 500))
+    ADMISSION_LATENCY_TOLERANCE = float(os.getenv("ADMISSION_LATENCY_TOLERANCE", 2.0))
+    ADMISSION_PRIORITIES = os.getenv("ADMISSION_PRIORITIES", "")  # endpoint=priority,...
+
+    # Request Deadline Configuration
+    DEADLINES_ENABLED = os.getenv("DEADLINES_ENABLED", "True").lower() == "true"
+    DEADLINE_DEFAULT_MS = float(os.getenv("DEADLINE_DEFAULT_MS", 10000))
+    DEADLINE_ENDPOINTS = os.getenv("DEADLINE_ENDPOINTS", "")  # endpoint_or_blueprint=ms,...
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -46,6 +122,12 @@ class ProductionConfig(Config):
 
     DEBUG = False
     TESTING = False
+    PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "True").lower() == "true"
+    SAMPLING_PROFILER_ENABLED = (
+        os.getenv("SAMPLING_PROFILER_ENABLED", "True").lower() == "true"
+    )
+    MEMORY_PROFILER_ENABLED = os.getenv("MEMORY_PROFILER_ENABLED", "True").lower() == "true"
+    ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "True").lower() == "true"
 
 
 class TestingConfig(Config):
@@ -53,6 +135,11 @@ class TestingConfig(Config):
 
     DEBUG = True
     TESTING = True
+    PROFILER_ENABLED = True
+    MEMORY_PROFILER_ENABLED = True
+    DB_BACKEND = os.getenv("TEST_DB_BACKEND", "sqlite")
+    SQLITE_PATH = os.getenv("TEST_SQLITE_PATH", ":memory:")
+    DB_REPLICAS = ""
     DB_CONFIG = {
         "host": "localhost",
         "user": "root",
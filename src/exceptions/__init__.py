@@ -82,6 +82,19 @@ class ConflictError(SGHSSException):
         super().__init__(message, status_code=409)
 
 
+class PreconditionFailedError(SGHSSException):
+    """Raised when a resource changed since the version the client sent."""
+
+    def __init__(self, message: str = "Resource was modified by another request"):
+        """
+        Initialize the precondition failed error.
+
+        Args:
+            message: Error message.
+        """
+        super().__init__(message, status_code=412)
+
+
 class DatabaseError(SGHSSException):
     """Raised when a database error occurs."""
 
@@ -93,3 +106,31 @@ class DatabaseError(SGHSSException):
             message: Error message.
         """
         super().__init__(message, status_code=500)
+
+
+class ServiceUnavailableError(SGHSSException):
+    """Raised when the server is overloaded or the database is unreachable."""
+
+    def __init__(self, message: str = "Service temporarily unavailable", retry_after: int = 1):
+        """
+        Initialize the service unavailable error.
+
+        Args:
+            message: Error message.
+            retry_after: Seconds the client should wait before retrying.
+        """
+        self.retry_after = retry_after
+        super().__init__(message, status_code=503)
+
+
+class DeadlineExceededError(SGHSSException):
+    """Raised when a request runs out of its time budget."""
+
+    def __init__(self, message: str = "Request deadline exceeded"):
+        """
+        Initialize the deadline exceeded error.
+
+        Args:
+            message: Error message.
+        """
+        super().__init__(message, status_code=504)
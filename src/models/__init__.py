@@ -1,7 +1,7 @@
 """Models for SGHSS application."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -14,6 +14,7 @@ class Usuario:
     email: str = ""
     senha: str = ""
     tipo: str = ""  # admin, medico, paciente, etc
+    versao: int = 1
     criado_em: Optional[datetime] = None
     atualizado_em: Optional[datetime] = None
 
@@ -32,6 +33,7 @@ class Usuario:
             "nome": self.nome,
             "email": self.email,
             "tipo": self.tipo,
+            "versao": self.versao,
             "criado_em": self.criado_em,
             "atualizado_em": self.atualizado_em,
         }
@@ -51,6 +53,7 @@ class Paciente:
     cpf: str = ""
     data_nascimento: Optional[str] = None
     endereco: str = ""
+    versao: int = 1
     criado_em: Optional[datetime] = None
     atualizado_em: Optional[datetime] = None
 
@@ -69,6 +72,7 @@ class Paciente:
             "cpf": self.cpf,
             "data_nascimento": self.data_nascimento,
             "endereco": self.endereco,
+            "versao": self.versao,
             "criado_em": self.criado_em,
             "atualizado_em": self.atualizado_em,
         }
@@ -84,6 +88,10 @@ class Profissional:
     telefone: str = ""
     especialidade: str = ""
     registro: str = ""  # Medical registration number
+    horario_inicio: Optional[str] = None  # HH:MM
+    horario_fim: Optional[str] = None  # HH:MM
+    dias_atendimento: Optional[str] = None  # ex.: "Segunda a Sexta"
+    versao: int = 1
     criado_em: Optional[datetime] = None
     atualizado_em: Optional[datetime] = None
 
@@ -101,6 +109,10 @@ class Profissional:
             "telefone": self.telefone,
             "especialidade": self.especialidade,
             "registro": self.registro,
+            "horario_inicio": self.horario_inicio,
+            "horario_fim": self.horario_fim,
+            "dias_atendimento": self.dias_atendimento,
+            "versao": self.versao,
             "criado_em": self.criado_em,
             "atualizado_em": self.atualizado_em,
         }
@@ -114,10 +126,14 @@ class Consulta:
     paciente_id: int = 0
     profissional_id: Optional[int] = None
     data: str = ""
+    duracao_minutos: int = 30
     motivo: str = ""
     observacoes: str = ""
     tipo_consulta: str = "presencial"  # presencial ou telemedicina
     link_video: Optional[str] = None
+    status: str = "agendada"  # agendada, realizada, cancelada, nao_compareceu
+    serie_id: Optional[int] = None
+    versao: int = 1
     criado_em: Optional[datetime] = None
     atualizado_em: Optional[datetime] = None
 
@@ -133,10 +149,64 @@ class Consulta:
             "paciente_id": self.paciente_id,
             "profissional_id": self.profissional_id,
             "data": self.data,
+            "duracao_minutos": self.duracao_minutos,
             "motivo": self.motivo,
             "observacoes": self.observacoes,
             "tipo_consulta": self.tipo_consulta,
             "link_video": self.link_video,
+            "status": self.status,
+            "serie_id": self.serie_id,
+            "versao": self.versao,
+            "criado_em": self.criado_em,
+            "atualizado_em": self.atualizado_em,
+        }
+
+
+@dataclass
+class SerieConsulta:
+    """Recurring consultation series model."""
+
+    id: Optional[int] = None
+    paciente_id: int = 0
+    profissional_id: Optional[int] = None
+    inicio: str = ""
+    frequencia: str = "semanal"  # diaria ou semanal
+    intervalo: int = 1
+    dias_semana: Optional[str] = None  # ex.: "Segunda e Quarta"
+    ocorrencias: int = 0
+    duracao_minutos: int = 30
+    motivo: str = ""
+    observacoes: str = ""
+    tipo_consulta: str = "presencial"
+    link_video: Optional[str] = None
+    consultas: List[Consulta] = field(default_factory=list)
+    versao: int = 1
+    criado_em: Optional[datetime] = None
+    atualizado_em: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        """
+        Convert model to dictionary.
+
+        Returns:
+            Dictionary representation of the model.
+        """
+        return {
+            "id": self.id,
+            "paciente_id": self.paciente_id,
+            "profissional_id": self.profissional_id,
+            "inicio": self.inicio,
+            "frequencia": self.frequencia,
+            "intervalo": self.intervalo,
+            "dias_semana": self.dias_semana,
+            "ocorrencias": self.ocorrencias,
+            "duracao_minutos": self.duracao_minutos,
+            "motivo": self.motivo,
+            "observacoes": self.observacoes,
+            "tipo_consulta": self.tipo_consulta,
+            "link_video": self.link_video,
+            "consultas": [consulta.to_dict() for consulta in self.consultas],
+            "versao": self.versao,
             "criado_em": self.criado_em,
             "atualizado_em": self.atualizado_em,
         }
@@ -150,6 +220,7 @@ class Medicamento:
     nome: str = ""
     descricao: str = ""
     dosagem: str = ""
+    versao: int = 1
     criado_em: Optional[datetime] = None
     atualizado_em: Optional[datetime] = None
 
@@ -165,6 +236,7 @@ class Medicamento:
             "nome": self.nome,
             "descricao": self.descricao,
             "dosagem": self.dosagem,
+            "versao": self.versao,
             "criado_em": self.criado_em,
             "atualizado_em": self.atualizado_em,
         }
@@ -179,6 +251,7 @@ class Prescricao:
     medicamento_id: int = 0
     duracao: str = ""
     instrucoes: str = ""
+    versao: int = 1
     criado_em: Optional[datetime] = None
     atualizado_em: Optional[datetime] = None
 
@@ -195,6 +268,7 @@ class Prescricao:
             "medicamento_id": self.medicamento_id,
             "duracao": self.duracao,
             "instrucoes": self.instrucoes,
+            "versao": self.versao,
             "criado_em": self.criado_em,
             "atualizado_em": self.atualizado_em,
         }
@@ -0,0 +1,682 @@
+"""Admin routes blueprint."""
+
+import logging
+
+from flask import Blueprint, current_app, request, send_file
+
+from ..exceptions import NotFoundError, SGHSSException, ValidationError
+from ..utils.auth import admin_required
+from ..utils.memory import DEFAULT_FILTERS as DEFAULT_MEMORY_FILTERS, peak_rss_bytes
+from ..utils.response import ResponseFormatter
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint
+admin_bp = Blueprint("admin", __name__, url_prefix="/api/admin")
+
+
+def _get_db_manager():
+    """Get the database manager serving this application's services."""
+    return current_app.extensions["services"].db_manager
+
+
+def _get_query_stats():
+    """Get the query statistics registry or fail if it is disabled."""
+    query_stats = _get_db_manager().query_stats
+    if query_stats is None:
+        raise NotFoundError("Query statistics are disabled")
+    return query_stats
+
+
+def _get_retry_policy():
+    """Get the database retry policy or fail if it is disabled."""
+    retry_policy = _get_db_manager().retry_policy
+    if retry_policy is None:
+        raise NotFoundError("Database retries are disabled")
+    return retry_policy
+
+
+def _get_connection_tracker():
+    """Get the connection tracker or fail if it is disabled."""
+    connection_tracker = _get_db_manager().connection_tracker
+    if connection_tracker is None:
+        raise NotFoundError("Connection tracking is disabled")
+    return connection_tracker
+
+
+def _get_availability_cache():
+    """Get the availability cache or fail if it is disabled."""
+    availability = current_app.extensions["services"].availability
+    if availability is None:
+        raise NotFoundError("Availability cache is disabled")
+    return availability
+
+
+def _get_extension(name: str, label: str):
+    """Get an application extension or fail if it is disabled."""
+    extension = current_app.extensions.get(name)
+    if extension is None:
+        raise NotFoundError(f"{label} is disabled")
+    return extension
+
+
+@admin_bp.route("/queries", methods=["GET"])
+@admin_required
+def listar_queries():
+    """List the top statement fingerprints with latency percentiles."""
+    try:
+        limite = request.args.get("limit", 20, type=int)
+        sort = request.args.get("sort", "total_ms")
+        statement_type = request.args.get("type")
+
+        query_stats = _get_query_stats()
+        report = query_stats.top(limit=limite, sort=sort, statement_type=statement_type)
+
+        return ResponseFormatter.success(
+            data={
+                "slow_threshold_ms": query_stats.slow_threshold_ms,
+                "dropped": query_stats.dropped,
+                "queries": report,
+            },
+            message="Query statistics retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error listing query statistics: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/queries/<fingerprint_id>/explain", methods=["GET"])
+@admin_required
+def explicar_query(fingerprint_id: str):
+    """Capture EXPLAIN output for the last slow sample of a fingerprint."""
+    try:
+        stats = _get_query_stats().get(fingerprint_id)
+        if stats is None:
+            raise NotFoundError("Query fingerprint not found")
+        if stats.slow_sample is None:
+            raise ValidationError("No slow sample recorded for this fingerprint")
+
+        sql, params = stats.slow_sample
+        try:
+            plan = _get_db_manager().explain(sql, params)
+        except ValueError as err:
+            raise ValidationError(str(err))
+
+        data = stats.to_dict()
+        data["explain"] = plan
+        return ResponseFormatter.success(
+            data=data,
+            message="Query plan captured successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error explaining query: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/queries", methods=["DELETE"])
+@admin_required
+def resetar_queries():
+    """Reset query statistics."""
+    try:
+        _get_query_stats().reset()
+
+        return ResponseFormatter.success(
+            message="Query statistics reset successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error resetting query statistics: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/profiles", methods=["GET"])
+@admin_required
+def listar_profiles():
+    """List stored request profiles."""
+    try:
+        profiler = _get_extension("request_profiler", "Request profiler")
+
+        return ResponseFormatter.success(
+            data=profiler.list_profiles(),
+            message="Profiles listed successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error listing profiles: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/profiles/<profile_id>", methods=["GET"])
+@admin_required
+def baixar_profile(profile_id: str):
+    """Download a stored request profile."""
+    try:
+        profiler = _get_extension("request_profiler", "Request profiler")
+        path = profiler.get_profile_path(profile_id)
+        if path is None:
+            raise NotFoundError("Profile not found")
+
+        return send_file(path, as_attachment=True, download_name=profile_id)
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error downloading profile: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/sampler", methods=["GET"])
+@admin_required
+def status_sampler():
+    """Get sampling profiler status and the list of flamegraph files."""
+    try:
+        sampler = _get_extension("sampling_profiler", "Sampling profiler")
+
+        data = sampler.status()
+        data["files"] = sampler.list_files()
+        return ResponseFormatter.success(
+            data=data,
+            message="Sampling profiler status retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting sampler status: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/sampler/<file_id>", methods=["GET"])
+@admin_required
+def baixar_sampler_file(file_id: str):
+    """Download a collapsed stack file written by the sampling profiler."""
+    try:
+        sampler = _get_extension("sampling_profiler", "Sampling profiler")
+        path = sampler.get_file_path(file_id)
+        if path is None:
+            raise NotFoundError("Sample file not found")
+
+        return send_file(path, as_attachment=True, download_name=file_id)
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error downloading sample file: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/memory/start", methods=["POST"])
+@admin_required
+def iniciar_tracemalloc():
+    """Start tracing allocations with tracemalloc."""
+    try:
+        profiler = _get_extension("memory_profiler", "Memory profiler")
+        profiler.start()
+
+        return ResponseFormatter.success(
+            data={"tracing": profiler.tracing},
+            message="Memory tracing started",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error starting memory tracing: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/memory/stop", methods=["POST"])
+@admin_required
+def parar_tracemalloc():
+    """Stop tracing allocations and drop snapshots."""
+    try:
+        profiler = _get_extension("memory_profiler", "Memory profiler")
+        profiler.stop()
+
+        return ResponseFormatter.success(
+            data={"tracing": profiler.tracing},
+            message="Memory tracing stopped",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error stopping memory tracing: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/memory/snapshots", methods=["POST"])
+@admin_required
+def criar_snapshot():
+    """Take a tracemalloc snapshot."""
+    try:
+        profiler = _get_extension("memory_profiler", "Memory profiler")
+        if not profiler.tracing:
+            raise ValidationError("Memory tracing is not running")
+
+        return ResponseFormatter.success(
+            data=profiler.take_snapshot(),
+            message="Snapshot taken successfully",
+            status_code=201,
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error taking snapshot: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/memory/snapshots", methods=["GET"])
+@admin_required
+def listar_snapshots():
+    """List stored tracemalloc snapshots."""
+    try:
+        profiler = _get_extension("memory_profiler", "Memory profiler")
+
+        return ResponseFormatter.success(
+            data={
+                "tracing": profiler.tracing,
+                "peak_rss_bytes": peak_rss_bytes(),
+                "snapshots": profiler.list_snapshots(),
+            },
+            message="Snapshots listed successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error listing snapshots: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/memory/snapshots/<int:snapshot_id>", methods=["GET"])
+@admin_required
+def obter_snapshot(snapshot_id: int):
+    """List the top allocation sites of a snapshot."""
+    try:
+        profiler = _get_extension("memory_profiler", "Memory profiler")
+        limite = request.args.get("limit", 20, type=int)
+        filters = None if request.args.get("all") else DEFAULT_MEMORY_FILTERS
+
+        try:
+            allocations = profiler.top(snapshot_id, limit=limite, filters=filters)
+        except KeyError:
+            raise NotFoundError("Snapshot not found")
+
+        return ResponseFormatter.success(
+            data=allocations,
+            message="Snapshot retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting snapshot: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/memory/diff", methods=["GET"])
+@admin_required
+def diff_snapshots():
+    """Diff two snapshots grouped by file and line."""
+    try:
+        profiler = _get_extension("memory_profiler", "Memory profiler")
+        from_id = request.args.get("from", type=int)
+        to_id = request.args.get("to", type=int)
+        limite = request.args.get("limit", 20, type=int)
+        filters = None if request.args.get("all") else DEFAULT_MEMORY_FILTERS
+
+        if from_id is None or to_id is None:
+            raise ValidationError("Query parameters 'from' and 'to' are required")
+
+        try:
+            allocations = profiler.diff(from_id, to_id, limit=limite, filters=filters)
+        except KeyError:
+            raise NotFoundError("Snapshot not found")
+
+        return ResponseFormatter.success(
+            data=allocations,
+            message="Snapshot diff computed successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error diffing snapshots: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/memory/endpoints", methods=["GET"])
+@admin_required
+def memoria_por_endpoint():
+    """Get RSS observed per endpoint."""
+    try:
+        profiler = _get_extension("memory_profiler", "Memory profiler")
+
+        return ResponseFormatter.success(
+            data={
+                "peak_rss_bytes": peak_rss_bytes(),
+                "endpoints": profiler.endpoint_report(),
+            },
+            message="Memory per endpoint retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting memory per endpoint: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/admission", methods=["GET"])
+@admin_required
+def status_admission():
+    """Get adaptive limits and load per blueprint and endpoint."""
+    try:
+        controller = _get_extension("admission", "Admission control")
+
+        return ResponseFormatter.success(
+            data=controller.status(),
+            message="Admission control status retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting admission status: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/replicas", methods=["GET"])
+@admin_required
+def status_replicas():
+    """Get health and replication lag of the read replicas."""
+    try:
+        replicas = _get_extension("replicas", "Replica routing")
+        if request.args.get("refresh"):
+            replicas.check()
+
+        return ResponseFormatter.success(
+            data={
+                "max_lag_seconds": replicas.max_lag_seconds,
+                "replicas": replicas.status(),
+            },
+            message="Replica status retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting replica status: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/retries", methods=["GET"])
+@admin_required
+def status_retries():
+    """Get retry counters per unit of work."""
+    try:
+        return ResponseFormatter.success(
+            data=_get_retry_policy().status(),
+            message="Retry statistics retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting retry statistics: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/retries", methods=["DELETE"])
+@admin_required
+def resetar_retries():
+    """Reset retry counters."""
+    try:
+        _get_retry_policy().reset()
+
+        return ResponseFormatter.success(
+            message="Retry statistics reset successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error resetting retry statistics: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/connections", methods=["GET"])
+@admin_required
+def listar_conexoes():
+    """List checked-out database connections with their holders' stacks."""
+    try:
+        min_seconds = request.args.get("min_seconds", 0.0, type=float)
+        connection_tracker = _get_connection_tracker()
+        connection_tracker.scan()
+
+        return ResponseFormatter.success(
+            data=connection_tracker.status(min_seconds),
+            message="Connection holders retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error listing connection holders: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/availability", methods=["GET"])
+@admin_required
+def status_availability():
+    """Get availability cache size and hit rate."""
+    try:
+        return ResponseFormatter.success(
+            data=_get_availability_cache().status(),
+            message="Availability cache status retrieved successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting availability cache status: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@admin_bp.route("/availability", methods=["DELETE"])
+@admin_required
+def limpar_availability():
+    """Drop cached availability, for one professional or all of them."""
+    try:
+        profissional_id = request.args.get("profissional_id", type=int)
+        _get_availability_cache().invalidate(profissional_id)
+
+        return ResponseFormatter.success(
+            message="Availability cache cleared successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="ADMIN_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error clearing availability cache: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
@@ -2,10 +2,10 @@
 
 import logging
 
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request
 
 from ..exceptions import SGHSSException
-from ..services.usuario_service import UsuarioService
+from ..services.registry import service_proxy
 from ..utils.response import ResponseFormatter
 
 logger = logging.getLogger(__name__)
@@ -13,8 +13,8 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
-# Initialize service
-usuario_service = UsuarioService()
+# Service resolved on first use from the application container
+usuario_service = service_proxy("usuarios")
 
 
 @auth_bp.route("/login", methods=["POST"])
@@ -60,8 +60,11 @@ def login():
 
 @auth_bp.route("/health", methods=["GET"])
 def health_check():
-    """Health check endpoint."""
+    """Health check endpoint, reporting database state without connecting."""
+    database = current_app.extensions["services"].db_manager.health()
+    circuit = database["circuit"]
+    healthy = circuit is None or circuit["state"] == "closed"
     return ResponseFormatter.success(
-        data={"status": "healthy"},
+        data={"status": "healthy" if healthy else "degraded", "database": database},
         message="Server is running",
     )
@@ -5,7 +5,9 @@ import logging
 from flask import Blueprint, request
 
 from ..exceptions import SGHSSException
-from ..services.consulta_service import ConsultaService
+from ..services.registry import service_proxy
+from ..utils.auth import admin_required
+from ..utils.preconditions import if_match_version
 from ..utils.response import ResponseFormatter
 from flask_jwt_extended import jwt_required
 
@@ -14,8 +16,8 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 consulta_bp = Blueprint("consultas", __name__, url_prefix="/api/consultas")
 
-# Initialize service
-consulta_service = ConsultaService()
+# Service resolved on first use from the application container
+consulta_service = service_proxy("consultas")
 
 
 @consulta_bp.route("", methods=["POST"])
@@ -33,12 +35,14 @@ def criar_consulta():
             profissional_id=data.get("profissional_id"),
             tipo_consulta=data.get("tipo_consulta", "presencial"),
             link_video=data.get("link_video"),
+            duracao_minutos=data.get("duracao_minutos", 30),
         )
 
         return ResponseFormatter.success(
             data=consulta.to_dict(),
             message="Consulta created successfully",
             status_code=201,
+            versao=consulta.versao,
         )
 
     except SGHSSException as e:
@@ -101,6 +105,7 @@ def obter_consulta(consulta_id: int):
         return ResponseFormatter.success(
             data=consulta.to_dict(),
             message="Consulta retrieved successfully",
+            versao=consulta.versao,
         )
 
     except SGHSSException as e:
@@ -131,11 +136,14 @@ def atualizar_consulta(consulta_id: int):
             motivo=data.get("motivo"),
             observacoes=data.get("observacoes"),
             link_video=data.get("link_video"),
+            duracao_minutos=data.get("duracao_minutos"),
+            versao=if_match_version(),
         )
 
         return ResponseFormatter.success(
             data=consulta.to_dict(),
             message="Consulta updated successfully",
+            versao=consulta.versao,
         )
 
     except SGHSSException as e:
@@ -177,3 +185,203 @@ def deletar_consulta(consulta_id: int):
             error_code="INTERNAL_ERROR",
             status_code=500,
         )
+
+
+@consulta_bp.route(
+    "<int:consulta_id>/<any('check-in', complete, cancel, 'no-show'):acao>", methods=["POST"]
+)
+@jwt_required()
+def alterar_status(consulta_id: int, acao: str):
+    """Check in, complete, cancel or mark a consultation as a no-show."""
+    try:
+        consulta = consulta_service.alterar_status(consulta_id, acao, versao=if_match_version())
+
+        return ResponseFormatter.success(
+            data=consulta.to_dict(),
+            message="Consulta status updated successfully",
+            versao=consulta.versao,
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="CONSULTA_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error updating consulta status: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@consulta_bp.route("no-show", methods=["POST"])
+@admin_required
+def marcar_nao_comparecimentos():
+    """Mark every consultation still scheduled before a moment as a no-show."""
+    try:
+        data = request.get_json(silent=True) or {}
+
+        marcadas = consulta_service.marcar_nao_comparecimentos(ate=data.get("ate"))
+
+        return ResponseFormatter.success(
+            data={"marcadas": marcadas},
+            message="No-shows marked successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="CONSULTA_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error marking no-shows: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@consulta_bp.route("series", methods=["POST"])
+@jwt_required()
+def criar_serie():
+    """Create a recurring series of consultations."""
+    try:
+        data = request.get_json()
+
+        serie = consulta_service.criar_serie(
+            paciente_id=data.get("paciente_id"),
+            inicio=data.get("inicio"),
+            motivo=data.get("motivo"),
+            profissional_id=data.get("profissional_id"),
+            frequencia=data.get("frequencia", "semanal"),
+            intervalo=data.get("intervalo", 1),
+            ocorrencias=data.get("ocorrencias"),
+            ate=data.get("ate"),
+            dias_semana=data.get("dias_semana"),
+            duracao_minutos=data.get("duracao_minutos", 30),
+            observacoes=data.get("observacoes"),
+            tipo_consulta=data.get("tipo_consulta", "presencial"),
+            link_video=data.get("link_video"),
+        )
+
+        return ResponseFormatter.success(
+            data=serie.to_dict(),
+            message="Serie created successfully",
+            status_code=201,
+            versao=serie.versao,
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="CONSULTA_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error creating serie: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@consulta_bp.route("series/<int:serie_id>", methods=["GET"])
+@jwt_required()
+def obter_serie(serie_id: int):
+    """Get a recurring series with its consultations."""
+    try:
+        serie = consulta_service.obter_serie(serie_id)
+
+        return ResponseFormatter.success(
+            data=serie.to_dict(),
+            message="Serie retrieved successfully",
+            versao=serie.versao,
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="CONSULTA_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error getting serie: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@consulta_bp.route("series/<int:serie_id>", methods=["PUT"])
+@jwt_required()
+def atualizar_serie(serie_id: int):
+    """Update the scheduled consultations of a series."""
+    try:
+        data = request.get_json()
+
+        serie = consulta_service.atualizar_serie(
+            serie_id=serie_id,
+            motivo=data.get("motivo"),
+            observacoes=data.get("observacoes"),
+            link_video=data.get("link_video"),
+            duracao_minutos=data.get("duracao_minutos"),
+            horario=data.get("horario"),
+            a_partir_de=data.get("a_partir_de"),
+            versao=if_match_version(),
+        )
+
+        return ResponseFormatter.success(
+            data=serie.to_dict(),
+            message="Serie updated successfully",
+            versao=serie.versao,
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="CONSULTA_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error updating serie: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@consulta_bp.route("series/<int:serie_id>", methods=["DELETE"])
+@jwt_required()
+def cancelar_serie(serie_id: int):
+    """Cancel the scheduled consultations of a series."""
+    try:
+        canceladas = consulta_service.cancelar_serie(
+            serie_id, a_partir_de=request.args.get("a_partir_de")
+        )
+
+        return ResponseFormatter.success(
+            data={"canceladas": canceladas},
+            message="Serie cancelled successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="CONSULTA_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error cancelling serie: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
@@ -5,7 +5,8 @@ import logging
 from flask import Blueprint, request
 
 from ..exceptions import SGHSSException
-from ..services.medicamento_service import MedicamentoService
+from ..services.registry import service_proxy
+from ..utils.preconditions import if_match_version
 from ..utils.response import ResponseFormatter
 from flask_jwt_extended import jwt_required
 
@@ -14,8 +15,8 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 medicamento_bp = Blueprint("medicamentos", __name__, url_prefix="/api/medicamentos")
 
-# Initialize service
-medicamento_service = MedicamentoService()
+# Service resolved on first use from the application container
+medicamento_service = service_proxy("medicamentos")
 
 
 @medicamento_bp.route("", methods=["POST"])
@@ -35,6 +36,7 @@ def criar_medicamento():
             data=medicamento.to_dict(),
             message="Medicamento created successfully",
             status_code=201,
+            versao=medicamento.versao,
         )
 
     except SGHSSException as e:
@@ -102,6 +104,7 @@ def obter_medicamento(medicamento_id: int):
         return ResponseFormatter.success(
             data=medicamento.to_dict(),
             message="Medicamento retrieved successfully",
+            versao=medicamento.versao,
         )
 
     except SGHSSException as e:
@@ -131,11 +134,13 @@ def atualizar_medicamento(medicamento_id: int):
             nome=data.get("nome"),
             descricao=data.get("descricao"),
             dosagem=data.get("dosagem"),
+            versao=if_match_version(),
         )
 
         return ResponseFormatter.success(
             data=medicamento.to_dict(),
             message="Medicamento updated successfully",
+            versao=medicamento.versao,
         )
 
     except SGHSSException as e:
@@ -5,7 +5,8 @@ import logging
 from flask import Blueprint, request
 
 from ..exceptions import SGHSSException
-from ..services.paciente_service import PacienteService
+from ..services.registry import service_proxy
+from ..utils.preconditions import if_match_version
 from ..utils.response import ResponseFormatter
 from flask_jwt_extended import jwt_required
 
@@ -14,8 +15,8 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 paciente_bp = Blueprint("pacientes", __name__, url_prefix="/api/pacientes")
 
-# Initialize service
-paciente_service = PacienteService()
+# Service resolved on first use from the application container
+paciente_service = service_proxy("pacientes")
 
 
 @paciente_bp.route("", methods=["POST"])
@@ -38,6 +39,7 @@ def criar_paciente():
             data=paciente.to_dict(),
             message="Paciente created successfully",
             status_code=201,
+            versao=paciente.versao,
         )
 
     except SGHSSException as e:
@@ -97,6 +99,7 @@ def obter_paciente(paciente_id: int):
         return ResponseFormatter.success(
             data=paciente.to_dict(),
             message="Paciente retrieved successfully",
+            versao=paciente.versao,
         )
 
     except SGHSSException as e:
@@ -127,11 +130,13 @@ def atualizar_paciente(paciente_id: int):
             email=data.get("email"),
             telefone=data.get("telefone"),
             endereco=data.get("endereco"),
+            versao=if_match_version(),
         )
 
         return ResponseFormatter.success(
             data=paciente.to_dict(),
             message="Paciente updated successfully",
+            versao=paciente.versao,
         )
 
     except SGHSSException as e:
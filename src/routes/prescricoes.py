@@ -5,7 +5,8 @@ import logging
 from flask import Blueprint, request
 
 from ..exceptions import SGHSSException
-from ..services.prescricao_service import PrescricaoService
+from ..services.registry import service_proxy
+from ..utils.preconditions import if_match_version
 from ..utils.response import ResponseFormatter
 from flask_jwt_extended import jwt_required
 
@@ -14,8 +15,8 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 prescricao_bp = Blueprint("prescricoes", __name__, url_prefix="/api/prescricoes")
 
-# Initialize service
-prescricao_service = PrescricaoService()
+# Service resolved on first use from the application container
+prescricao_service = service_proxy("prescricoes")
 
 
 @prescricao_bp.route("", methods=["POST"])
@@ -36,6 +37,7 @@ def criar_prescricao():
             data=prescricao.to_dict(),
             message="Prescricao created successfully",
             status_code=201,
+            versao=prescricao.versao,
         )
 
     except SGHSSException as e:
@@ -97,6 +99,7 @@ def obter_prescricao(prescricao_id: int):
         return ResponseFormatter.success(
             data=prescricao.to_dict(),
             message="Prescricao retrieved successfully",
+            versao=prescricao.versao,
         )
 
     except SGHSSException as e:
@@ -159,11 +162,13 @@ def atualizar_prescricao(prescricao_id: int):
             prescricao_id=prescricao_id,
             duracao=data.get("duracao"),
             instrucoes=data.get("instrucoes"),
+            versao=if_match_version(),
         )
 
         return ResponseFormatter.success(
             data=prescricao.to_dict(),
             message="Prescricao updated successfully",
+            versao=prescricao.versao,
         )
 
     except SGHSSException as e:
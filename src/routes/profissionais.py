@@ -2,10 +2,11 @@
 
 import logging
 
-from flask import Blueprint, request
+from flask import Blueprint, Response, current_app, request, stream_with_context
 
 from ..exceptions import SGHSSException
-from ..services.profissional_service import ProfissionalService
+from ..services.registry import service_proxy
+from ..utils.preconditions import if_match_version
 from ..utils.response import ResponseFormatter
 from flask_jwt_extended import jwt_required
 
@@ -14,8 +15,9 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 profissional_bp = Blueprint("profissionais", __name__, url_prefix="/api/profissionais")
 
-# Initialize service
-profissional_service = ProfissionalService()
+# Services resolved on first use from the application container
+profissional_service = service_proxy("profissionais")
+consulta_service = service_proxy("consultas")
 
 
 @profissional_bp.route("", methods=["POST"])
@@ -31,12 +33,16 @@ def criar_profissional():
             telefone=data.get("telefone"),
             especialidade=data.get("especialidade"),
             registro=data.get("registro"),
+            horario_inicio=data.get("horario_inicio"),
+            horario_fim=data.get("horario_fim"),
+            dias_atendimento=data.get("dias_atendimento"),
         )
 
         return ResponseFormatter.success(
             data=profissional.to_dict(),
             message="Profissional created successfully",
             status_code=201,
+            versao=profissional.versao,
         )
 
     except SGHSSException as e:
@@ -88,6 +94,82 @@ def listar_profissionais():
         )
 
 
+@profissional_bp.route("<int:profissional_id>/agenda", methods=["GET"])
+@jwt_required()
+def listar_agenda(profissional_id: int):
+    """List a professional's consultas between two days, grouped by day."""
+    try:
+        inicio = request.args.get("from")
+        fim = request.args.get("to")
+        status = [
+            valor
+            for parametro in request.args.getlist("status")
+            for valor in parametro.split(",")
+            if valor
+        ]
+
+        if request.args.get("stream", "").lower() in ("1", "true"):
+            # One JSON document per day, written as rows are fetched
+            dias = consulta_service.iterar_agenda(profissional_id, inicio, fim, status)
+            return Response(
+                stream_with_context(current_app.json.dumps(dia) + "\n" for dia in dias),
+                mimetype="application/x-ndjson",
+            )
+
+        agenda = consulta_service.listar_agenda(profissional_id, inicio, fim, status)
+
+        return ResponseFormatter.success(
+            data=agenda,
+            message="Agenda listed successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="PROFISSIONAL_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error listing agenda: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
+@profissional_bp.route("slots/first", methods=["GET"])
+@jwt_required()
+def primeiro_horario_livre():
+    """Find the earliest free slot among the professionals of a specialty."""
+    try:
+        slot = profissional_service.primeiro_horario_livre(
+            especialidade=request.args.get("especialidade"),
+            inicio=request.args.get("from"),
+            fim=request.args.get("to"),
+            duracao_minutos=request.args.get("duration", 30, type=int),
+        )
+
+        return ResponseFormatter.success(
+            data=slot,
+            message="Free slot found" if slot else "No free slot in the period",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="PROFISSIONAL_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error finding free slot: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
 @profissional_bp.route("<int:profissional_id>", methods=["GET"])
 @jwt_required()
 def obter_profissional(profissional_id: int):
@@ -98,6 +180,7 @@ def obter_profissional(profissional_id: int):
         return ResponseFormatter.success(
             data=profissional.to_dict(),
             message="Profissional retrieved successfully",
+            versao=profissional.versao,
         )
 
     except SGHSSException as e:
@@ -115,6 +198,38 @@ def obter_profissional(profissional_id: int):
         )
 
 
+@profissional_bp.route("<int:profissional_id>/slots", methods=["GET"])
+@jwt_required()
+def listar_horarios_livres(profissional_id: int):
+    """List a professional's free slots between two dates."""
+    try:
+        slots = profissional_service.listar_horarios_livres(
+            profissional_id,
+            inicio=request.args.get("from"),
+            fim=request.args.get("to"),
+            duracao_minutos=request.args.get("duration", 30, type=int),
+        )
+
+        return ResponseFormatter.success(
+            data=slots,
+            message="Free slots listed successfully",
+        )
+
+    except SGHSSException as e:
+        return ResponseFormatter.error(
+            message=e.message,
+            error_code="PROFISSIONAL_ERROR",
+            status_code=e.status_code,
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error listing free slots: {e}")
+        return ResponseFormatter.error(
+            message="Internal server error",
+            error_code="INTERNAL_ERROR",
+            status_code=500,
+        )
+
+
 @profissional_bp.route("<int:profissional_id>", methods=["PUT"])
 @jwt_required()
 def atualizar_profissional(profissional_id: int):
@@ -128,11 +243,16 @@ def atualizar_profissional(profissional_id: int):
             email=data.get("email"),
             telefone=data.get("telefone"),
             especialidade=data.get("especialidade"),
+            horario_inicio=data.get("horario_inicio"),
+            horario_fim=data.get("horario_fim"),
+            dias_atendimento=data.get("dias_atendimento"),
+            versao=if_match_version(),
         )
 
         return ResponseFormatter.success(
             data=profissional.to_dict(),
             message="Profissional updated successfully",
+            versao=profissional.versao,
         )
 
     except SGHSSException as e:
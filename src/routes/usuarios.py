@@ -5,8 +5,11 @@ from typing import Optional
 
 from flask import Blueprint, request, jsonify
 
-from ..exceptions import SGHSSException
-from ..services.usuario_service import UsuarioService
+from ..exceptions import AuthorizationError, SGHSSException
+from ..services.registry import service_proxy
+from ..services.usuario_service import TIPO_PADRAO
+from ..utils.auth import is_admin_request
+from ..utils.preconditions import if_match_version
 from ..utils.response import ResponseFormatter
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
@@ -15,8 +18,23 @@ logger = logging.getLogger(__name__)
 # Create blueprint
 usuario_bp = Blueprint("usuarios", __name__, url_prefix="/api/usuarios")
 
-# Initialize service
-usuario_service = UsuarioService()
+# Service resolved on first use from the application container
+usuario_service = service_proxy("usuarios")
+
+
+def _exigir_admin_para_tipo(tipo: Optional[str], permitido: Optional[str] = None) -> None:
+    """
+    Reject role assignment by anyone but an authenticated admin.
+
+    Args:
+        tipo: Role sent by the client, if any.
+        permitido: Role anyone may send (the self-registration default).
+
+    Raises:
+        AuthorizationError: If a non-admin tries to assign a role.
+    """
+    if tipo is not None and tipo != permitido and not is_admin_request():
+        raise AuthorizationError("Only admins can assign user roles")
 
 
 @usuario_bp.route("", methods=["POST"])
@@ -24,18 +42,20 @@ def criar_usuario():
     """Create a new user."""
     try:
         data = request.get_json()
+        _exigir_admin_para_tipo(data.get("tipo"), permitido=TIPO_PADRAO)
 
         usuario = usuario_service.criar_usuario(
             nome=data.get("nome"),
             email=data.get("email"),
             senha=data.get("senha"),
-            tipo=data.get("tipo"),
+            tipo=data.get("tipo") or TIPO_PADRAO,
         )
 
         return ResponseFormatter.success(
             data=usuario.to_dict(),
             message="Usuario created successfully",
             status_code=201,
+            versao=usuario.versao,
         )
 
     except SGHSSException as e:
@@ -95,6 +115,7 @@ def obter_usuario(usuario_id: int):
         return ResponseFormatter.success(
             data=usuario.to_dict(),
             message="Usuario retrieved successfully",
+            versao=usuario.versao,
         )
 
     except SGHSSException as e:
@@ -118,17 +139,20 @@ def atualizar_usuario(usuario_id: int):
     """Update a user."""
     try:
         data = request.get_json()
+        _exigir_admin_para_tipo(data.get("tipo"))
 
         usuario = usuario_service.atualizar_usuario(
             usuario_id=usuario_id,
             nome=data.get("nome"),
             email=data.get("email"),
             tipo=data.get("tipo"),
+            versao=if_match_version(),
         )
 
         return ResponseFormatter.success(
             data=usuario.to_dict(),
             message="Usuario updated successfully",
+            versao=usuario.versao,
         )
 
     except SGHSSException as e:
@@ -0,0 +1,82 @@
+"""Base class for SGHSS services."""
+
+from typing import Any, Dict, Optional
+
+from ..config.database import DatabaseManager, get_db_manager
+from ..exceptions import NotFoundError, PreconditionFailedError
+from ..utils.availability import AvailabilityCache
+
+
+class BaseService:
+    """Base class for services that use the global database manager."""
+
+    def __init__(self):
+        """Initialize base service."""
+        self._db_manager: Optional[DatabaseManager] = None
+        # Set by the service container when the availability cache is enabled
+        self.availability: Optional[AvailabilityCache] = None
+
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """
+        Database manager used by the service.
+
+        Resolved on each access unless explicitly set, so services can be
+        constructed before the database is initialized.
+
+        Returns:
+            DatabaseManager: The database manager instance.
+        """
+        if self._db_manager is not None:
+            return self._db_manager
+        return get_db_manager()
+
+    @db_manager.setter
+    def db_manager(self, db_manager: DatabaseManager) -> None:
+        self._db_manager = db_manager
+
+    @staticmethod
+    def _atualizar_versionado(
+        cursor,
+        tabela: str,
+        registro_id: int,
+        campos: Dict[str, Any],
+        versao: Optional[int],
+        recurso: str,
+    ) -> None:
+        """
+        Update one row in a single statement and bump its version.
+
+        With ``versao`` the statement only matches a row nobody changed since
+        the client read it, so concurrent edits cannot overwrite each other
+        and no lock is held between requests. Bumping ``versao`` also makes
+        MySQL count the row as changed when the new values equal the old
+        ones, so nothing matched always means the row is missing or stale;
+        only then is the row read again to tell the two apart.
+
+        Args:
+            cursor: Cursor of the caller's transaction.
+            tabela: Table name.
+            registro_id: Row ID.
+            campos: Columns to set and their new values.
+            versao: Version the client last saw, or None to skip the check.
+            recurso: Resource name used in error messages.
+
+        Raises:
+            NotFoundError: If the row does not exist.
+            PreconditionFailedError: If the row is no longer at ``versao``.
+        """
+        sets = [f"{coluna} = %s" for coluna in campos] + ["versao = versao + 1"]
+        query = f"UPDATE {tabela} SET {', '.join(sets)} WHERE id = %s"
+        params = [*campos.values(), registro_id]
+        if versao is not None:
+            query += " AND versao = %s"
+            params.append(versao)
+        cursor.execute(query, params)
+        if cursor.rowcount:
+            return
+
+        cursor.execute(f"SELECT versao FROM {tabela} WHERE id = %s", (registro_id,))
+        if cursor.fetchone() is None:
+            raise NotFoundError(f"{recurso} not found")
+        raise PreconditionFailedError(f"{recurso} was modified by another request")
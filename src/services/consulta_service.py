@@ -1,23 +1,57 @@
 """Consulta service for business logic."""
 
 import logging
-from typing import List, Optional
-from datetime import datetime
+from contextlib import ExitStack
+from dataclasses import replace
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
 
-from ..config.database import get_db_manager
-from ..exceptions import DatabaseError, NotFoundError, ValidationError
-from ..models import Consulta
+from ..config.replicas import read_only
+from ..exceptions import (
+    ConflictError,
+    DatabaseError,
+    NotFoundError,
+    PreconditionFailedError,
+    ValidationError,
+)
+from ..models import Consulta, SerieConsulta
+from ..utils.scheduling import (
+    DATETIME_FORMAT,
+    MAX_DURACAO_MINUTOS,
+    STATUS_AGENDADA,
+    STATUS_CANCELADA,
+    STATUS_CONSULTA,
+    STATUS_NAO_COMPARECEU,
+    TRANSICOES_STATUS,
+    IntervalSet,
+    expand_recorrencia,
+    parse_dias_atendimento,
+    parse_horario,
+    parse_periodo,
+    to_datetime,
+    validate_duracao,
+)
 from ..utils.validators import Validator
+from .base import BaseService
 
 logger = logging.getLogger(__name__)
 
+# Longest range of an agenda listing
+AGENDA_MAX_DAYS = 366
 
-class ConsultaService:
+# Rows fetched at a time when iterating an agenda
+AGENDA_BATCH_SIZE = 200
+
+# Consultas changed per statement by bulk status changes
+STATUS_BATCH_SIZE = 500
+
+
+class ConsultaService(BaseService):
     """Service for consulta-related operations."""
 
     def __init__(self):
         """Initialize consulta service."""
-        self.db_manager = get_db_manager()
+        super().__init__()
 
     def criar_consulta(
         self,
@@ -28,10 +62,14 @@ class ConsultaService:
         profissional_id: int = None,
         tipo_consulta: str = "presencial",
         link_video: str = None,
+        duracao_minutos: int = 30,
     ) -> Consulta:
         """
         Create a new consultation.
 
+        The professional's row is locked while checking for overlapping
+        consultas, so concurrent bookings of the same time cannot both pass.
+
         Args:
             paciente_id: Patient ID.
             data: Consultation date and time (ISO format).
@@ -40,12 +78,15 @@ class ConsultaService:
             profissional_id: Professional ID.
             tipo_consulta: Type (presencial or telemedicina).
             link_video: Video call link for telemedicine.
+            duracao_minutos: Duration in minutes.
 
         Returns:
             Created Consulta object.
 
         Raises:
             ValidationError: If validation fails.
+            NotFoundError: If the professional does not exist.
+            ConflictError: If the professional is already booked at that time.
             DatabaseError: If database operation fails.
         """
         # Validate inputs
@@ -58,39 +99,51 @@ class ConsultaService:
             ["paciente_id", "data", "motivo"],
         )
         Validator.validate_date_format(data, "%Y-%m-%d %H:%M:%S")
+        duracao_minutos = validate_duracao(duracao_minutos)
+        inicio = to_datetime(data)
+        fim = inicio + timedelta(minutes=duracao_minutos)
 
         # Validate telemedicina has link
         if tipo_consulta == "telemedicina" and not link_video:
             raise ValidationError("Video link is required for telemedicina")
 
+        def inserir(cursor, conn) -> int:
+            if profissional_id:
+                self._reservar_horarios(cursor, profissional_id, [(inicio, fim)])
+            cursor.execute(
+                """
+                INSERT INTO consultas 
+                (paciente_id, profissional_id, data, duracao_minutos, motivo, observacoes,
+                 tipo_consulta, link_video)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    paciente_id,
+                    profissional_id,
+                    data,
+                    duracao_minutos,
+                    motivo,
+                    observacoes,
+                    tipo_consulta,
+                    link_video,
+                ),
+            )
+            return cursor.lastrowid
+
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    """
-                    INSERT INTO consultas 
-                    (paciente_id, profissional_id, data, motivo, observacoes, tipo_consulta, link_video)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        paciente_id,
-                        profissional_id,
-                        data,
-                        motivo,
-                        observacoes,
-                        tipo_consulta,
-                        link_video,
-                    ),
-                )
-                conn.commit()
-                consulta_id = cursor.lastrowid
+            consulta_id = self.db_manager.run_in_transaction("consultas.criar", inserir)
+            self._ocupar_agenda(profissional_id, consulta_id, data, duracao_minutos)
 
             logger.info(f"Consulta created successfully: {consulta_id}")
             return self.obter_consulta_por_id(consulta_id)
 
+        except (ConflictError, NotFoundError):
+            raise
         except Exception as err:
             logger.error(f"Error creating consulta: {err}")
             raise DatabaseError(f"Failed to create consulta: {str(err)}")
 
+    @read_only
     def listar_consultas(
         self, limite: int = 100, offset: int = 0, paciente_id: int = None
     ) -> List[Consulta]:
@@ -111,8 +164,8 @@ class ConsultaService:
         try:
             if paciente_id:
                 query = """
-                    SELECT id, paciente_id, profissional_id, data, motivo, observacoes,
-                           tipo_consulta, link_video
+                    SELECT id, paciente_id, profissional_id, data, duracao_minutos, motivo,
+                           observacoes, tipo_consulta, link_video, status, serie_id, versao
                     FROM consultas
                     WHERE paciente_id = %s
                     ORDER BY data DESC
@@ -121,15 +174,15 @@ class ConsultaService:
                 params = (paciente_id, limite, offset)
             else:
                 query = """
-                    SELECT id, paciente_id, profissional_id, data, motivo, observacoes,
-                           tipo_consulta, link_video
+                    SELECT id, paciente_id, profissional_id, data, duracao_minutos, motivo,
+                           observacoes, tipo_consulta, link_video, status, serie_id, versao
                     FROM consultas
                     ORDER BY data DESC
                     LIMIT %s OFFSET %s
                 """
                 params = (limite, offset)
 
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(query, params)
                 consultas_data = cursor.fetchall()
 
@@ -141,6 +194,7 @@ class ConsultaService:
             logger.error(f"Error listing consultas: {err}")
             raise DatabaseError(f"Failed to list consultas: {str(err)}")
 
+    @read_only
     def obter_consulta_por_id(self, consulta_id: int) -> Consulta:
         """
         Get consultation by ID.
@@ -156,11 +210,11 @@ class ConsultaService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, paciente_id, profissional_id, data, motivo, observacoes,
-                           tipo_consulta, link_video
+                    SELECT id, paciente_id, profissional_id, data, duracao_minutos, motivo,
+                           observacoes, tipo_consulta, link_video, status, serie_id, versao
                     FROM consultas
                     WHERE id = %s
                     """,
@@ -186,16 +240,28 @@ class ConsultaService:
         motivo: str = None,
         observacoes: str = None,
         link_video: str = None,
+        duracao_minutos: int = None,
+        versao: int = None,
     ) -> Consulta:
         """
         Update consultation.
 
+        Editing the text fields is a single versioned ``UPDATE``. Moving a
+        consulta or changing its duration also reads its current time and
+        checks the professional's agenda again, under the same lock as
+        ``criar_consulta``; the update is then made conditional on the
+        version read, so a concurrent edit in between fails instead of being
+        overwritten.
+
         Args:
             consulta_id: Consultation ID.
             data: New date and time.
             motivo: New reason.
             observacoes: New observations.
             link_video: New video link.
+            duracao_minutos: New duration in minutes.
+            versao: Version the client last read; the update fails if the
+                consulta changed since.
 
         Returns:
             Updated Consulta object.
@@ -203,51 +269,91 @@ class ConsultaService:
         Raises:
             NotFoundError: If consultation not found.
             ValidationError: If validation fails.
+            ConflictError: If the new time overlaps another consulta.
+            PreconditionFailedError: If the consulta is no longer at versao.
             DatabaseError: If database operation fails.
         """
-        # Check if consultation exists
-        consulta = self.obter_consulta_por_id(consulta_id)
-
         # Validate date if provided
         if data:
             Validator.validate_date_format(data, "%Y-%m-%d %H:%M:%S")
+        if duracao_minutos is not None:
+            duracao_minutos = validate_duracao(duracao_minutos)
 
-        try:
-            updates = []
-            params = []
-
-            if data is not None:
-                updates.append("data = %s")
-                params.append(data)
-            if motivo is not None:
-                updates.append("motivo = %s")
-                params.append(motivo)
-            if observacoes is not None:
-                updates.append("observacoes = %s")
-                params.append(observacoes)
-            if link_video is not None:
-                updates.append("link_video = %s")
-                params.append(link_video)
-
-            if not updates:
-                return self.obter_consulta_por_id(consulta_id)
-
-            params.append(consulta_id)
-
-            with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    f"""
-                    UPDATE consultas
-                    SET {", ".join(updates)}
-                    WHERE id = %s
-                    """,
-                    params,
+        campos = {
+            "data": data,
+            "duracao_minutos": duracao_minutos,
+            "motivo": motivo,
+            "observacoes": observacoes,
+            "link_video": link_video,
+        }
+        campos = {coluna: valor for coluna, valor in campos.items() if valor is not None}
+        if not campos:
+            return self.obter_consulta_por_id(consulta_id)
+        remarcar = data is not None or duracao_minutos is not None
+
+        def atualizar(cursor, conn) -> Optional[Consulta]:
+            if not remarcar:
+                self._atualizar_versionado(
+                    cursor, "consultas", consulta_id, campos, versao, "Consulta"
                 )
-                conn.commit()
+                return None
+
+            # A locking read: a plain one would pin the InnoDB snapshot before
+            # the professional is locked, hiding bookings committed meanwhile
+            cursor.execute(
+                f"""
+                SELECT profissional_id, data, duracao_minutos, status, versao
+                FROM consultas
+                WHERE id = %s{self.db_manager.backend.for_update}
+                """,
+                (consulta_id,),
+            )
+            row = cursor.fetchone()
+            if row is None:
+                raise NotFoundError("Consulta not found")
+            anterior = Consulta(
+                id=consulta_id,
+                profissional_id=row[0],
+                data=row[1],
+                duracao_minutos=row[2] or 30,
+                status=row[3],
+                versao=row[4],
+            )
+            if versao is not None and versao != anterior.versao:
+                raise PreconditionFailedError("Consulta was modified by another request")
+
+            if anterior.profissional_id:
+                inicio = to_datetime(data or anterior.data)
+                fim = inicio + timedelta(minutes=duracao_minutos or anterior.duracao_minutos)
+                self._reservar_horarios(
+                    cursor, anterior.profissional_id, [(inicio, fim)], ignorar_ids=[consulta_id]
+                )
+            self._atualizar_versionado(
+                cursor, "consultas", consulta_id, campos, anterior.versao, "Consulta"
+            )
+            return anterior
+
+        try:
+            anterior = self.db_manager.run_in_transaction(
+                "consultas.atualizar", atualizar, prepared=False
+            )
+
+            consulta = self.obter_consulta_por_id(consulta_id)
+            if anterior is not None:
+                self._liberar_agenda(anterior)
+                if consulta.status != STATUS_CANCELADA:
+                    self._ocupar_agenda(
+                        consulta.profissional_id,
+                        consulta_id,
+                        consulta.data,
+                        consulta.duracao_minutos,
+                    )
 
             logger.info(f"Consulta {consulta_id} updated successfully")
-            return self.obter_consulta_por_id(consulta_id)
+            return consulta
 
+        except (ConflictError, NotFoundError, PreconditionFailedError):
+            raise
         except Exception as err:
             logger.error(f"Error updating consulta: {err}")
             raise DatabaseError(f"Failed to update consulta: {str(err)}")
@@ -264,12 +370,16 @@ class ConsultaService:
             DatabaseError: If database operation fails.
         """
         # Check if consultation exists
-        self.obter_consulta_por_id(consulta_id)
+        consulta = self.obter_consulta_por_id(consulta_id)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute("DELETE FROM consultas WHERE id = %s", (consulta_id,))
-                conn.commit()
+            self.db_manager.run_in_transaction(
+                "consultas.deletar",
+                lambda cursor, conn: cursor.execute(
+                    "DELETE FROM consultas WHERE id = %s", (consulta_id,)
+                ),
+            )
+            self._liberar_agenda(consulta)
 
             logger.info(f"Consulta {consulta_id} deleted successfully")
 
@@ -277,6 +387,144 @@ class ConsultaService:
             logger.error(f"Error deleting consulta: {err}")
             raise DatabaseError(f"Failed to delete consulta: {str(err)}")
 
+    def alterar_status(self, consulta_id: int, acao: str, versao: int = None) -> Consulta:
+        """
+        Move a consulta to another status.
+
+        The change is a single ``UPDATE ... WHERE id = %s AND status IN
+        (...)``, so it only applies if the consulta is still in a status the
+        action may start from; two clerks acting on the same consulta at once
+        cannot both succeed. The current status is only read when the update
+        matched nothing, to tell a missing consulta from a stale one.
+
+        Args:
+            consulta_id: Consultation ID.
+            acao: One of ``check-in``, ``complete``, ``cancel``, ``no-show``.
+            versao: Version the client last read; the change fails if the
+                consulta changed since.
+
+        Returns:
+            Updated Consulta object.
+
+        Raises:
+            ValidationError: If the action is unknown.
+            NotFoundError: If consultation not found.
+            ConflictError: If the consulta's status does not allow the action.
+            PreconditionFailedError: If the consulta is no longer at versao.
+            DatabaseError: If database operation fails.
+        """
+        if acao not in TRANSICOES_STATUS:
+            raise ValidationError(f"Invalid action: {acao}")
+        origens, destino = TRANSICOES_STATUS[acao]
+
+        def alterar(cursor, conn) -> None:
+            query = f"""
+                UPDATE consultas
+                SET status = %s, versao = versao + 1
+                WHERE id = %s AND status IN ({", ".join(["%s"] * len(origens))})
+            """
+            params = [destino, consulta_id, *origens]
+            if versao is not None:
+                query += " AND versao = %s"
+                params.append(versao)
+            cursor.execute(query, params)
+            if cursor.rowcount:
+                return
+            cursor.execute("SELECT status, versao FROM consultas WHERE id = %s", (consulta_id,))
+            row = cursor.fetchone()
+            if row is None:
+                raise NotFoundError("Consulta not found")
+            if versao is not None and row[1] != versao:
+                raise PreconditionFailedError("Consulta was modified by another request")
+            raise ConflictError(f"Cannot {acao} a consulta that is {row[0]}")
+
+        try:
+            self.db_manager.run_in_transaction(f"consultas.{acao}", alterar)
+
+            consulta = self.obter_consulta_por_id(consulta_id)
+            if destino == STATUS_CANCELADA:
+                self._liberar_agenda(replace(consulta, status=origens[0]))
+            logger.info(f"Consulta {consulta_id} moved to {destino}")
+            return consulta
+
+        except (ConflictError, NotFoundError, PreconditionFailedError):
+            raise
+        except Exception as err:
+            logger.error(f"Error changing consulta status: {err}")
+            raise DatabaseError(f"Failed to change consulta status: {str(err)}")
+
+    def marcar_nao_comparecimentos(self, ate: str = None, lote: int = STATUS_BATCH_SIZE) -> int:
+        """
+        Mark consultas still scheduled before a moment as no-shows.
+
+        Meant to run at the end of the day. Consultas are walked in id order
+        and each batch is one short transaction with one range ``UPDATE``,
+        so the sweep never holds locks on the whole table and a consulta
+        checked in meanwhile is left alone.
+
+        Args:
+            ate: Consultas starting before this moment (YYYY-MM-DD HH:MM:SS)
+                are marked; defaults to now.
+            lote: Consultas per batch.
+
+        Returns:
+            Number of consultas marked.
+
+        Raises:
+            ValidationError: If ate or lote is invalid.
+            DatabaseError: If database operation fails.
+        """
+        if ate:
+            Validator.validate_date_format(ate, DATETIME_FORMAT)
+        else:
+            ate = datetime.now().strftime(DATETIME_FORMAT)
+        if not isinstance(lote, int) or lote < 1:
+            raise ValidationError("Batch size must be a positive integer")
+
+        def marcar(ultimo_id: int):
+            def unit(cursor, conn) -> Tuple[int, int]:
+                cursor.execute(
+                    """
+                    SELECT id FROM consultas
+                    WHERE status = %s AND data < %s AND id > %s
+                    ORDER BY id
+                    LIMIT %s
+                    """,
+                    (STATUS_AGENDADA, ate, ultimo_id, lote),
+                )
+                ids = [row[0] for row in cursor.fetchall()]
+                if not ids:
+                    return 0, ultimo_id
+                cursor.execute(
+                    """
+                    UPDATE consultas
+                    SET status = %s, versao = versao + 1
+                    WHERE status = %s AND data < %s AND id > %s AND id <= %s
+                    """,
+                    (STATUS_NAO_COMPARECEU, STATUS_AGENDADA, ate, ultimo_id, ids[-1]),
+                )
+                return cursor.rowcount, ids[-1]
+
+            return unit
+
+        try:
+            total, ultimo_id = 0, 0
+            while True:
+                marcadas, proximo_id = self.db_manager.run_in_transaction(
+                    "consultas.marcar_nao_comparecimentos", marcar(ultimo_id)
+                )
+                if proximo_id == ultimo_id:
+                    break
+                total, ultimo_id = total + marcadas, proximo_id
+
+            logger.info(f"Marked {total} consultas before {ate} as no-shows")
+            return total
+
+        except Exception as err:
+            logger.error(f"Error marking no-shows: {err}")
+            raise DatabaseError(f"Failed to mark no-shows: {str(err)}")
+
+    @read_only
     def listar_consultas_por_paciente(
         self, paciente_id: int, limite: int = 100, offset: int = 0
     ) -> List[Consulta]:
@@ -298,6 +546,669 @@ class ConsultaService:
             limite=limite, offset=offset, paciente_id=paciente_id
         )
 
+    @read_only
+    def iterar_agenda(
+        self,
+        profissional_id: int,
+        inicio: str,
+        fim: str,
+        status: Optional[Sequence[str]] = None,
+        lote: int = AGENDA_BATCH_SIZE,
+    ) -> Iterator[dict]:
+        """
+        Iterate a professional's consultas over a range of days, one day at a time.
+
+        The query is a range scan of the ``(profissional_id, data)`` index
+        that already returns rows in order, so days are grouped while
+        fetching ``lote`` rows at a time and never held in memory all at
+        once. The query runs before this method returns, so errors surface
+        here; the connection is kept until the iterator is exhausted or
+        closed.
+
+        Args:
+            profissional_id: Professional ID.
+            inicio: First day (YYYY-MM-DD).
+            fim: Last day, inclusive (YYYY-MM-DD).
+            status: Only include consultas with these statuses.
+            lote: Rows fetched per round trip.
+
+        Returns:
+            Iterator of dictionaries with ``dia`` and its ``consultas``.
+
+        Raises:
+            ValidationError: If the range or a status is invalid.
+            NotFoundError: If professional not found.
+            DatabaseError: If database operation fails.
+        """
+        primeiro_dia, ultimo_dia = parse_periodo(inicio, fim, AGENDA_MAX_DAYS)
+        status = list(dict.fromkeys(status or ()))
+        invalidos = [valor for valor in status if valor not in STATUS_CONSULTA]
+        if invalidos:
+            raise ValidationError(f"Invalid status: {', '.join(invalidos)}")
+
+        query = """
+            SELECT id, paciente_id, profissional_id, data, duracao_minutos, motivo,
+                   observacoes, tipo_consulta, link_video, status, serie_id, versao
+            FROM consultas
+            WHERE profissional_id = %s AND data >= %s AND data < %s
+        """
+        desde = datetime.combine(primeiro_dia, datetime.min.time())
+        ate = datetime.combine(ultimo_dia, datetime.min.time()) + timedelta(days=1)
+        params = [profissional_id, desde.strftime(DATETIME_FORMAT), ate.strftime(DATETIME_FORMAT)]
+        if status:
+            query += f" AND status IN ({', '.join(['%s'] * len(status))})"
+            params.extend(status)
+        query += " ORDER BY data, id"
+
+        stack = ExitStack()
+        try:
+            # At most one shape per number of statuses, so it stays prepared
+            cursor, conn = stack.enter_context(
+                self.db_manager.get_cursor(dictionary=True, prepared=True)
+            )
+            cursor.execute("SELECT id FROM profissionais WHERE id = %s", (profissional_id,))
+            if cursor.fetchone() is None:
+                raise NotFoundError("Profissional not found")
+            cursor.execute(query, params)
+        except NotFoundError:
+            stack.close()
+            raise
+        except Exception as err:
+            stack.close()
+            logger.error(f"Error listing agenda: {err}")
+            raise DatabaseError(f"Failed to list agenda: {str(err)}")
+
+        return self._agrupar_por_dia(cursor, stack, lote)
+
+    @read_only
+    def listar_agenda(
+        self,
+        profissional_id: int,
+        inicio: str,
+        fim: str,
+        status: Optional[Sequence[str]] = None,
+    ) -> List[dict]:
+        """
+        List a professional's consultas over a range of days, grouped by day.
+
+        Args:
+            profissional_id: Professional ID.
+            inicio: First day (YYYY-MM-DD).
+            fim: Last day, inclusive (YYYY-MM-DD).
+            status: Only include consultas with these statuses.
+
+        Returns:
+            Days with consultas, each with ``dia`` and its ``consultas``.
+
+        Raises:
+            ValidationError: If the range or a status is invalid.
+            NotFoundError: If professional not found.
+            DatabaseError: If database operation fails.
+        """
+        agenda = list(self.iterar_agenda(profissional_id, inicio, fim, status))
+        logger.info(f"Listed agenda of profissional {profissional_id}: {len(agenda)} days")
+        return agenda
+
+    def _agrupar_por_dia(self, cursor, stack: ExitStack, lote: int) -> Iterator[dict]:
+        """
+        Group ordered consulta rows into days.
+
+        Args:
+            cursor: Cursor with the agenda query executed.
+            stack: Releases the cursor and connection when done.
+            lote: Rows fetched per round trip.
+
+        Yields:
+            Dictionaries with ``dia`` and its ``consultas``.
+        """
+        with stack:
+            dia, consultas = None, []
+            while True:
+                try:
+                    rows = cursor.fetchmany(lote)
+                except Exception as err:
+                    logger.error(f"Error fetching agenda: {err}")
+                    raise DatabaseError(f"Failed to list agenda: {str(err)}")
+                if not rows:
+                    break
+                for row in rows:
+                    consulta = self._map_to_consulta(row)
+                    dia_consulta = to_datetime(consulta.data).strftime("%Y-%m-%d")
+                    if dia_consulta != dia and consultas:
+                        yield {"dia": dia, "consultas": consultas}
+                        consultas = []
+                    dia = dia_consulta
+                    consultas.append(consulta.to_dict())
+            if consultas:
+                yield {"dia": dia, "consultas": consultas}
+
+    def criar_serie(
+        self,
+        paciente_id: int,
+        inicio: str,
+        motivo: str,
+        profissional_id: int = None,
+        frequencia: str = "semanal",
+        intervalo: int = 1,
+        ocorrencias: int = None,
+        ate: str = None,
+        dias_semana: str = None,
+        duracao_minutos: int = 30,
+        observacoes: str = None,
+        tipo_consulta: str = "presencial",
+        link_video: str = None,
+    ) -> SerieConsulta:
+        """
+        Create a recurring series and book all of its consultas.
+
+        The rule is expanded up front, every occurrence is checked against
+        the professional's agenda in one pass, and the series and its
+        consultas are inserted in one transaction, so either all sessions
+        are booked or none is.
+
+        Args:
+            paciente_id: Patient ID.
+            inicio: First occurrence (YYYY-MM-DD HH:MM:SS).
+            motivo: Reason for the consultas.
+            profissional_id: Professional ID.
+            frequencia: ``diaria`` or ``semanal``.
+            intervalo: Days or weeks between occurrences.
+            ocorrencias: Number of occurrences.
+            ate: Last day an occurrence may fall on (YYYY-MM-DD).
+            dias_semana: Weekdays of a weekly series, e.g. "Segunda e Quarta".
+            duracao_minutos: Duration of each consulta.
+            observacoes: Additional observations.
+            tipo_consulta: Type (presencial or telemedicina).
+            link_video: Video call link for telemedicine.
+
+        Returns:
+            Created SerieConsulta with its consultas.
+
+        Raises:
+            ValidationError: If validation fails.
+            NotFoundError: If the professional does not exist.
+            ConflictError: If any occurrence overlaps another consulta.
+            DatabaseError: If database operation fails.
+        """
+        Validator.validate_required_fields(
+            {"paciente_id": paciente_id, "inicio": inicio, "motivo": motivo},
+            ["paciente_id", "inicio", "motivo"],
+        )
+        Validator.validate_date_format(inicio, DATETIME_FORMAT)
+        if ate:
+            Validator.validate_date_format(ate)
+        duracao_minutos = validate_duracao(duracao_minutos)
+        if tipo_consulta == "telemedicina" and not link_video:
+            raise ValidationError("Video link is required for telemedicina")
+
+        datas = expand_recorrencia(
+            to_datetime(inicio),
+            frequencia,
+            intervalo,
+            ocorrencias,
+            datetime.strptime(ate, "%Y-%m-%d").date() if ate else None,
+            parse_dias_atendimento(dias_semana),
+        )
+        intervalos = [(data, data + timedelta(minutes=duracao_minutos)) for data in datas]
+
+        def inserir(cursor, conn) -> int:
+            if profissional_id:
+                self._reservar_horarios(cursor, profissional_id, intervalos)
+            cursor.execute(
+                """
+                INSERT INTO consulta_series
+                (paciente_id, profissional_id, inicio, frequencia, intervalo, dias_semana,
+                 ocorrencias, duracao_minutos, motivo, observacoes, tipo_consulta, link_video)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    paciente_id,
+                    profissional_id,
+                    inicio,
+                    frequencia,
+                    intervalo,
+                    dias_semana,
+                    len(datas),
+                    duracao_minutos,
+                    motivo,
+                    observacoes,
+                    tipo_consulta,
+                    link_video,
+                ),
+            )
+            serie_id = cursor.lastrowid
+            cursor.executemany(
+                """
+                INSERT INTO consultas
+                (paciente_id, profissional_id, data, duracao_minutos, motivo, observacoes,
+                 tipo_consulta, link_video, serie_id)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                [
+                    (
+                        paciente_id,
+                        profissional_id,
+                        data.strftime(DATETIME_FORMAT),
+                        duracao_minutos,
+                        motivo,
+                        observacoes,
+                        tipo_consulta,
+                        link_video,
+                        serie_id,
+                    )
+                    for data in datas
+                ],
+            )
+            return serie_id
+
+        try:
+            # A plain cursor lets mysql.connector send the consultas as one
+            # multi-row INSERT; a prepared one would run it once per row
+            serie_id = self.db_manager.run_in_transaction(
+                "consultas.criar_serie", inserir, prepared=False
+            )
+
+            serie = self.obter_serie(serie_id)
+            for consulta in serie.consultas:
+                self._ocupar_agenda(
+                    consulta.profissional_id, consulta.id, consulta.data, consulta.duracao_minutos
+                )
+            logger.info(f"Serie created successfully: {serie_id} ({len(datas)} consultas)")
+            return serie
+
+        except (ConflictError, NotFoundError):
+            raise
+        except Exception as err:
+            logger.error(f"Error creating serie: {err}")
+            raise DatabaseError(f"Failed to create serie: {str(err)}")
+
+    @read_only
+    def obter_serie(self, serie_id: int) -> SerieConsulta:
+        """
+        Get a series with its consultas.
+
+        Args:
+            serie_id: Series ID.
+
+        Returns:
+            SerieConsulta with its consultas in order.
+
+        Raises:
+            NotFoundError: If series not found.
+            DatabaseError: If database operation fails.
+        """
+        try:
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
+                cursor.execute(
+                    """
+                    SELECT id, paciente_id, profissional_id, inicio, frequencia, intervalo,
+                           dias_semana, ocorrencias, duracao_minutos, motivo, observacoes,
+                           tipo_consulta, link_video, versao
+                    FROM consulta_series
+                    WHERE id = %s
+                    """,
+                    (serie_id,),
+                )
+                serie_data = cursor.fetchone()
+                if not serie_data:
+                    raise NotFoundError("Serie not found")
+
+                cursor.execute(
+                    """
+                    SELECT id, paciente_id, profissional_id, data, duracao_minutos, motivo,
+                           observacoes, tipo_consulta, link_video, status, serie_id, versao
+                    FROM consultas
+                    WHERE serie_id = %s
+                    ORDER BY data, id
+                    """,
+                    (serie_id,),
+                )
+                consultas_data = cursor.fetchall()
+
+            serie = self._map_to_serie(serie_data)
+            serie.consultas = [self._map_to_consulta(data) for data in consultas_data]
+            return serie
+
+        except NotFoundError:
+            raise
+        except Exception as err:
+            logger.error(f"Error getting serie: {err}")
+            raise DatabaseError(f"Failed to get serie: {str(err)}")
+
+    def atualizar_serie(
+        self,
+        serie_id: int,
+        motivo: str = None,
+        observacoes: str = None,
+        link_video: str = None,
+        duracao_minutos: int = None,
+        horario: str = None,
+        a_partir_de: str = None,
+        versao: int = None,
+    ) -> SerieConsulta:
+        """
+        Update the scheduled consultas of a series together.
+
+        Only consultas still ``agendada`` from ``a_partir_de`` on are
+        changed. Moving them to another time of day or changing their
+        duration checks all of them against the professional's agenda in
+        one pass, ignoring the series' own consultas being moved. Every row
+        is updated only at the version read, so if the series or one of its
+        consultas changed in the meantime nothing is applied.
+
+        Args:
+            serie_id: Series ID.
+            motivo: New reason.
+            observacoes: New observations.
+            link_video: New video link.
+            duracao_minutos: New duration in minutes.
+            horario: New time of day (HH:MM).
+            a_partir_de: First moment affected (YYYY-MM-DD HH:MM:SS);
+                defaults to now.
+            versao: Version of the series the client last read.
+
+        Returns:
+            Updated SerieConsulta.
+
+        Raises:
+            NotFoundError: If series not found.
+            ValidationError: If validation fails.
+            ConflictError: If a moved consulta overlaps another consulta.
+            PreconditionFailedError: If the series or one of the consultas
+                changed since it was read.
+            DatabaseError: If database operation fails.
+        """
+        serie = self.obter_serie(serie_id)
+        if versao is not None and versao != serie.versao:
+            raise PreconditionFailedError("Serie was modified by another request")
+        if duracao_minutos is not None:
+            duracao_minutos = validate_duracao(duracao_minutos)
+        nova_hora = parse_horario(horario)
+        alvo = self._consultas_pendentes(serie, a_partir_de)
+
+        campos = {
+            "motivo": motivo,
+            "observacoes": observacoes,
+            "link_video": link_video,
+            "duracao_minutos": duracao_minutos,
+        }
+        campos = {coluna: valor for coluna, valor in campos.items() if valor is not None}
+        if not campos and nova_hora is None:
+            return serie
+
+        novos = []
+        for consulta in alvo:
+            inicio = to_datetime(consulta.data)
+            if nova_hora is not None:
+                inicio = datetime.combine(inicio.date(), nova_hora)
+            duracao = duracao_minutos or consulta.duracao_minutos
+            novos.append((consulta, inicio, duracao))
+        remarcar = bool(serie.profissional_id and alvo) and (
+            nova_hora is not None or duracao_minutos is not None
+        )
+
+        serie_campos = dict(campos)
+        if nova_hora is not None:
+            serie_campos["inicio"] = datetime.combine(
+                to_datetime(serie.inicio).date(), nova_hora
+            ).strftime(DATETIME_FORMAT)
+
+        def atualizar(cursor, conn) -> None:
+            if remarcar:
+                self._reservar_horarios(
+                    cursor,
+                    serie.profissional_id,
+                    [(inicio, inicio + timedelta(minutes=duracao)) for _, inicio, duracao in novos],
+                    ignorar_ids=[consulta.id for consulta in alvo],
+                )
+            if novos:
+                cursor.executemany(
+                    """
+                    UPDATE consultas
+                    SET data = %s, duracao_minutos = %s, motivo = %s, observacoes = %s,
+                        link_video = %s, versao = versao + 1
+                    WHERE id = %s AND versao = %s
+                    """,
+                    [
+                        (
+                            inicio.strftime(DATETIME_FORMAT),
+                            duracao,
+                            campos.get("motivo", consulta.motivo),
+                            campos.get("observacoes", consulta.observacoes),
+                            campos.get("link_video", consulta.link_video),
+                            consulta.id,
+                            consulta.versao,
+                        )
+                        for consulta, inicio, duracao in novos
+                    ],
+                )
+                if cursor.rowcount != len(novos):
+                    raise PreconditionFailedError("Serie was modified by another request")
+            self._atualizar_versionado(
+                cursor, "consulta_series", serie_id, serie_campos, serie.versao, "Serie"
+            )
+
+        try:
+            self.db_manager.run_in_transaction("consultas.atualizar_serie", atualizar)
+
+            if remarcar:
+                for consulta, inicio, duracao in novos:
+                    self._liberar_agenda(consulta)
+                    self._ocupar_agenda(serie.profissional_id, consulta.id, inicio, duracao)
+            logger.info(f"Serie {serie_id} updated successfully ({len(novos)} consultas)")
+            return self.obter_serie(serie_id)
+
+        except (ConflictError, NotFoundError, PreconditionFailedError):
+            raise
+        except Exception as err:
+            logger.error(f"Error updating serie: {err}")
+            raise DatabaseError(f"Failed to update serie: {str(err)}")
+
+    def cancelar_serie(self, serie_id: int, a_partir_de: str = None) -> int:
+        """
+        Cancel the scheduled consultas of a series.
+
+        Past and already attended consultas are kept as they are.
+
+        Args:
+            serie_id: Series ID.
+            a_partir_de: First moment affected (YYYY-MM-DD HH:MM:SS);
+                defaults to now.
+
+        Returns:
+            Number of consultas cancelled.
+
+        Raises:
+            NotFoundError: If series not found.
+            ValidationError: If a_partir_de is invalid.
+            DatabaseError: If database operation fails.
+        """
+        serie = self.obter_serie(serie_id)
+        alvo = self._consultas_pendentes(serie, a_partir_de)
+        desde = to_datetime(a_partir_de) if a_partir_de else datetime.now()
+
+        def cancelar(cursor, conn) -> int:
+            cursor.execute(
+                """
+                UPDATE consultas
+                SET status = %s, versao = versao + 1
+                WHERE serie_id = %s AND status = %s AND data >= %s
+                """,
+                (STATUS_CANCELADA, serie_id, STATUS_AGENDADA, desde.strftime(DATETIME_FORMAT)),
+            )
+            return cursor.rowcount
+
+        try:
+            canceladas = self.db_manager.run_in_transaction("consultas.cancelar_serie", cancelar)
+
+            for consulta in alvo:
+                self._liberar_agenda(consulta)
+            logger.info(f"Serie {serie_id} cancelled ({canceladas} consultas)")
+            return canceladas
+
+        except Exception as err:
+            logger.error(f"Error cancelling serie: {err}")
+            raise DatabaseError(f"Failed to cancel serie: {str(err)}")
+
+    @staticmethod
+    def _consultas_pendentes(serie: SerieConsulta, a_partir_de: Optional[str]) -> List[Consulta]:
+        """
+        Scheduled consultas of a series from a moment on.
+
+        Args:
+            serie: Series with its consultas.
+            a_partir_de: First moment (YYYY-MM-DD HH:MM:SS); defaults to now.
+
+        Returns:
+            Consultas still ``agendada`` starting at or after the moment.
+
+        Raises:
+            ValidationError: If a_partir_de is invalid.
+        """
+        if a_partir_de:
+            Validator.validate_date_format(a_partir_de, DATETIME_FORMAT)
+        desde = to_datetime(a_partir_de) if a_partir_de else datetime.now()
+        return [
+            consulta
+            for consulta in serie.consultas
+            if consulta.status == STATUS_AGENDADA and to_datetime(consulta.data) >= desde
+        ]
+
+    def _reservar_horarios(
+        self,
+        cursor,
+        profissional_id: int,
+        intervalos: Sequence[Tuple[datetime, datetime]],
+        ignorar_ids: Iterable[int] = (),
+    ) -> None:
+        """
+        Check a professional's agenda inside the booking transaction.
+
+        Locks the professional's row first, so concurrent bookings for the
+        same professional queue up here. The overlap query is a locking read
+        as well, so it sees the rows other bookings committed while this one
+        waited, whatever the transaction read before. All intervals are
+        checked against one range query, so a whole series costs the same
+        two statements as a single consulta.
+
+        Args:
+            cursor: Cursor of the booking transaction.
+            profissional_id: Professional ID.
+            intervalos: ``(start, end)`` of each consulta being booked.
+            ignorar_ids: Consultas being moved, excluded from the check.
+
+        Raises:
+            NotFoundError: If the professional does not exist.
+            ConflictError: If another consulta overlaps any interval.
+        """
+        cursor.execute(
+            f"SELECT id FROM profissionais WHERE id = %s{self.db_manager.backend.for_update}",
+            (profissional_id,),
+        )
+        if cursor.fetchone() is None:
+            raise NotFoundError("Profissional not found")
+
+        # Only consultas starting in this window can reach the new ones
+        desde = min(inicio for inicio, _ in intervalos) - timedelta(minutes=MAX_DURACAO_MINUTOS)
+        ate = max(fim for _, fim in intervalos)
+        cursor.execute(
+            f"""
+            SELECT id, data, duracao_minutos
+            FROM consultas
+            WHERE profissional_id = %s AND data > %s AND data < %s
+                AND status <> %s{self.db_manager.backend.for_update}
+            """,
+            (
+                profissional_id,
+                desde.strftime(DATETIME_FORMAT),
+                ate.strftime(DATETIME_FORMAT),
+                STATUS_CANCELADA,
+            ),
+        )
+        ignorar = set(ignorar_ids)
+        ocupados = IntervalSet(
+            (to_datetime(data), to_datetime(data) + timedelta(minutes=duracao or 30))
+            for outro_id, data, duracao in cursor.fetchall()
+            if outro_id not in ignorar
+        )
+        conflitos = [inicio for inicio, fim in intervalos if ocupados.overlaps(inicio, fim)]
+        if conflitos:
+            horarios = ", ".join(inicio.strftime(DATETIME_FORMAT) for inicio in conflitos[:10])
+            if len(intervalos) == 1:
+                raise ConflictError(f"Profissional already has a consulta at {horarios}")
+            raise ConflictError(
+                f"{len(conflitos)} of {len(intervalos)} occurrences conflict with the "
+                f"profissional's agenda: {horarios}"
+            )
+
+    def _ocupar_agenda(
+        self, profissional_id: Optional[int], consulta_id: int, data, duracao_minutos: int
+    ) -> None:
+        """
+        Mark a committed booking in the availability cache.
+
+        Args:
+            profissional_id: Professional ID, if any.
+            consulta_id: Consulta ID.
+            data: Start of the consulta.
+            duracao_minutos: Duration in minutes.
+        """
+        if self.availability is None or not profissional_id:
+            return
+        inicio = to_datetime(data)
+        self.availability.add(
+            profissional_id, consulta_id, inicio, inicio + timedelta(minutes=duracao_minutos)
+        )
+
+    def _liberar_agenda(self, consulta: Consulta) -> None:
+        """
+        Clear a consulta's previous time from the availability cache.
+
+        Args:
+            consulta: Consulta as it was before the change.
+        """
+        if (
+            self.availability is None
+            or not consulta.profissional_id
+            or consulta.status == STATUS_CANCELADA
+        ):
+            return
+        inicio = to_datetime(consulta.data)
+        self.availability.remove(
+            consulta.profissional_id,
+            consulta.id,
+            inicio,
+            inicio + timedelta(minutes=consulta.duracao_minutos),
+        )
+
+    @staticmethod
+    def _map_to_serie(data: dict) -> SerieConsulta:
+        """
+        Map database row to SerieConsulta model.
+
+        Args:
+            data: Database row as dictionary.
+
+        Returns:
+            SerieConsulta object without its consultas.
+        """
+        return SerieConsulta(
+            id=data.get("id"),
+            paciente_id=data.get("paciente_id", 0),
+            profissional_id=data.get("profissional_id"),
+            inicio=data.get("inicio", ""),
+            frequencia=data.get("frequencia") or "semanal",
+            intervalo=data.get("intervalo") or 1,
+            dias_semana=data.get("dias_semana"),
+            ocorrencias=data.get("ocorrencias", 0),
+            duracao_minutos=data.get("duracao_minutos") or 30,
+            motivo=data.get("motivo", ""),
+            observacoes=data.get("observacoes", ""),
+            tipo_consulta=data.get("tipo_consulta", "presencial"),
+            link_video=data.get("link_video"),
+            versao=data.get("versao", 1),
+        )
+
     @staticmethod
     def _map_to_consulta(data: dict) -> Consulta:
         """
@@ -314,8 +1225,12 @@ class ConsultaService:
             paciente_id=data.get("paciente_id", 0),
             profissional_id=data.get("profissional_id"),
             data=data.get("data", ""),
+            duracao_minutos=data.get("duracao_minutos") or 30,
             motivo=data.get("motivo", ""),
             observacoes=data.get("observacoes", ""),
             tipo_consulta=data.get("tipo_consulta", "presencial"),
             link_video=data.get("link_video"),
+            status=data.get("status") or "agendada",
+            serie_id=data.get("serie_id"),
+            versao=data.get("versao", 1),
         )
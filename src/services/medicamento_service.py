@@ -3,20 +3,26 @@
 import logging
 from typing import List
 
-from ..config.database import get_db_manager
-from ..exceptions import DatabaseError, NotFoundError, ValidationError
+from ..config.replicas import read_only
+from ..exceptions import (
+    DatabaseError,
+    NotFoundError,
+    PreconditionFailedError,
+    ValidationError,
+)
 from ..models import Medicamento
 from ..utils.validators import Validator
+from .base import BaseService
 
 logger = logging.getLogger(__name__)
 
 
-class MedicamentoService:
+class MedicamentoService(BaseService):
     """Service for medicamento-related operations."""
 
     def __init__(self):
         """Initialize medicamento service."""
-        self.db_manager = get_db_manager()
+        super().__init__()
 
     def criar_medicamento(
         self,
@@ -46,7 +52,7 @@ class MedicamentoService:
         )
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
                     INSERT INTO medicamentos (nome, descricao, dosagem)
@@ -64,6 +70,7 @@ class MedicamentoService:
             logger.error(f"Error creating medicamento: {err}")
             raise DatabaseError(f"Failed to create medicamento: {str(err)}")
 
+    @read_only
     def listar_medicamentos(self, limite: int = 100, offset: int = 0) -> List[Medicamento]:
         """
         List all medications with pagination.
@@ -79,10 +86,10 @@ class MedicamentoService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, descricao, dosagem
+                    SELECT id, nome, descricao, dosagem, versao
                     FROM medicamentos
                     ORDER BY nome
                     LIMIT %s OFFSET %s
@@ -101,6 +108,7 @@ class MedicamentoService:
             logger.error(f"Error listing medicamentos: {err}")
             raise DatabaseError(f"Failed to list medicamentos: {str(err)}")
 
+    @read_only
     def obter_medicamento_por_id(self, medicamento_id: int) -> Medicamento:
         """
         Get medication by ID.
@@ -116,10 +124,10 @@ class MedicamentoService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, descricao, dosagem
+                    SELECT id, nome, descricao, dosagem, versao
                     FROM medicamentos
                     WHERE id = %s
                     """,
@@ -138,6 +146,7 @@ class MedicamentoService:
             logger.error(f"Error getting medicamento: {err}")
             raise DatabaseError(f"Failed to get medicamento: {str(err)}")
 
+    @read_only
     def buscar_medicamentos_por_nome(
         self, nome: str, limite: int = 100, offset: int = 0
     ) -> List[Medicamento]:
@@ -156,10 +165,10 @@ class MedicamentoService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, descricao, dosagem
+                    SELECT id, nome, descricao, dosagem, versao
                     FROM medicamentos
                     WHERE nome LIKE %s
                     ORDER BY nome
@@ -185,6 +194,7 @@ class MedicamentoService:
         nome: str = None,
         descricao: str = None,
         dosagem: str = None,
+        versao: int = None,
     ) -> Medicamento:
         """
         Update medication.
@@ -194,50 +204,34 @@ class MedicamentoService:
             nome: New name.
             descricao: New description.
             dosagem: New dosage.
+            versao: Version the client last read; the update fails if the
+                medication changed since.
 
         Returns:
             Updated Medicamento object.
 
         Raises:
             NotFoundError: If medication not found.
+            PreconditionFailedError: If the medication is no longer at versao.
             DatabaseError: If database operation fails.
         """
-        # Check if medication exists
-        self.obter_medicamento_por_id(medicamento_id)
+        campos = {"nome": nome, "descricao": descricao, "dosagem": dosagem}
+        campos = {coluna: valor for coluna, valor in campos.items() if valor is not None}
+        if not campos:
+            return self.obter_medicamento_por_id(medicamento_id)
 
         try:
-            updates = []
-            params = []
-
-            if nome is not None:
-                updates.append("nome = %s")
-                params.append(nome)
-            if descricao is not None:
-                updates.append("descricao = %s")
-                params.append(descricao)
-            if dosagem is not None:
-                updates.append("dosagem = %s")
-                params.append(dosagem)
-
-            if not updates:
-                return self.obter_medicamento_por_id(medicamento_id)
-
-            params.append(medicamento_id)
-
             with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    f"""
-                    UPDATE medicamentos
-                    SET {", ".join(updates)}
-                    WHERE id = %s
-                    """,
-                    params,
+                self._atualizar_versionado(
+                    cursor, "medicamentos", medicamento_id, campos, versao, "Medicamento"
                 )
                 conn.commit()
 
             logger.info(f"Medicamento {medicamento_id} updated successfully")
             return self.obter_medicamento_por_id(medicamento_id)
 
+        except (NotFoundError, PreconditionFailedError):
+            raise
         except Exception as err:
             logger.error(f"Error updating medicamento: {err}")
             raise DatabaseError(f"Failed to update medicamento: {str(err)}")
@@ -257,7 +251,7 @@ class MedicamentoService:
         self.obter_medicamento_por_id(medicamento_id)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute(
                     "DELETE FROM medicamentos WHERE id = %s", (medicamento_id,)
                 )
@@ -285,4 +279,5 @@ class MedicamentoService:
             nome=data.get("nome", ""),
             descricao=data.get("descricao", ""),
             dosagem=data.get("dosagem", ""),
+            versao=data.get("versao", 1),
         )
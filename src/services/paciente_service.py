@@ -3,20 +3,26 @@
 import logging
 from typing import List
 
-from ..config.database import get_db_manager
-from ..exceptions import DatabaseError, NotFoundError, ValidationError
+from ..config.replicas import read_only
+from ..exceptions import (
+    DatabaseError,
+    NotFoundError,
+    PreconditionFailedError,
+    ValidationError,
+)
 from ..models import Paciente
 from ..utils.validators import Validator
+from .base import BaseService
 
 logger = logging.getLogger(__name__)
 
 
-class PacienteService:
+class PacienteService(BaseService):
     """Service for paciente-related operations."""
 
     def __init__(self):
         """Initialize paciente service."""
-        self.db_manager = get_db_manager()
+        super().__init__()
 
     def criar_paciente(
         self,
@@ -54,7 +60,7 @@ class PacienteService:
         Validator.validate_phone(telefone)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
                     INSERT INTO pacientes (nome, email, telefone, cpf, data_nascimento, endereco)
@@ -72,6 +78,7 @@ class PacienteService:
             logger.error(f"Error creating paciente: {err}")
             raise DatabaseError(f"Failed to create paciente: {str(err)}")
 
+    @read_only
     def listar_pacientes(self, limite: int = 100, offset: int = 0) -> List[Paciente]:
         """
         List all patients with pagination.
@@ -87,10 +94,10 @@ class PacienteService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, telefone, cpf, data_nascimento, endereco
+                    SELECT id, nome, email, telefone, cpf, data_nascimento, endereco, versao
                     FROM pacientes
                     LIMIT %s OFFSET %s
                     """,
@@ -106,6 +113,7 @@ class PacienteService:
             logger.error(f"Error listing pacientes: {err}")
             raise DatabaseError(f"Failed to list pacientes: {str(err)}")
 
+    @read_only
     def obter_paciente_por_id(self, paciente_id: int) -> Paciente:
         """
         Get patient by ID.
@@ -121,10 +129,10 @@ class PacienteService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, telefone, cpf, data_nascimento, endereco
+                    SELECT id, nome, email, telefone, cpf, data_nascimento, endereco, versao
                     FROM pacientes
                     WHERE id = %s
                     """,
@@ -150,6 +158,7 @@ class PacienteService:
         email: str = None,
         telefone: str = None,
         endereco: str = None,
+        versao: int = None,
     ) -> Paciente:
         """
         Update patient.
@@ -160,6 +169,8 @@ class PacienteService:
             email: New email.
             telefone: New phone.
             endereco: New address.
+            versao: Version the client last read; the update fails if the
+                patient changed since.
 
         Returns:
             Updated Paciente object.
@@ -167,53 +178,32 @@ class PacienteService:
         Raises:
             NotFoundError: If patient not found.
             ValidationError: If validation fails.
+            PreconditionFailedError: If the patient is no longer at versao.
             DatabaseError: If database operation fails.
         """
-        # Check if patient exists
-        self.obter_paciente_por_id(paciente_id)
-
         # Validate inputs if provided
         if email:
             Validator.validate_email(email)
         if telefone:
             Validator.validate_phone(telefone)
 
-        try:
-            updates = []
-            params = []
-
-            if nome is not None:
-                updates.append("nome = %s")
-                params.append(nome)
-            if email is not None:
-                updates.append("email = %s")
-                params.append(email)
-            if telefone is not None:
-                updates.append("telefone = %s")
-                params.append(telefone)
-            if endereco is not None:
-                updates.append("endereco = %s")
-                params.append(endereco)
-
-            if not updates:
-                return self.obter_paciente_por_id(paciente_id)
-
-            params.append(paciente_id)
+        campos = {"nome": nome, "email": email, "telefone": telefone, "endereco": endereco}
+        campos = {coluna: valor for coluna, valor in campos.items() if valor is not None}
+        if not campos:
+            return self.obter_paciente_por_id(paciente_id)
 
+        try:
             with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    f"""
-                    UPDATE pacientes
-                    SET {", ".join(updates)}
-                    WHERE id = %s
-                    """,
-                    params,
+                self._atualizar_versionado(
+                    cursor, "pacientes", paciente_id, campos, versao, "Paciente"
                 )
                 conn.commit()
 
             logger.info(f"Paciente {paciente_id} updated successfully")
             return self.obter_paciente_por_id(paciente_id)
 
+        except (NotFoundError, PreconditionFailedError):
+            raise
         except Exception as err:
             logger.error(f"Error updating paciente: {err}")
             raise DatabaseError(f"Failed to update paciente: {str(err)}")
@@ -233,7 +223,7 @@ class PacienteService:
         self.obter_paciente_por_id(paciente_id)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute("DELETE FROM pacientes WHERE id = %s", (paciente_id,))
                 conn.commit()
 
@@ -262,4 +252,5 @@ class PacienteService:
             cpf=data.get("cpf", ""),
             data_nascimento=data.get("data_nascimento"),
             endereco=data.get("endereco", ""),
+            versao=data.get("versao", 1),
         )
@@ -3,20 +3,26 @@
 import logging
 from typing import List
 
-from ..config.database import get_db_manager
-from ..exceptions import DatabaseError, NotFoundError, ValidationError
+from ..config.replicas import read_only
+from ..exceptions import (
+    DatabaseError,
+    NotFoundError,
+    PreconditionFailedError,
+    ValidationError,
+)
 from ..models import Prescricao
 from ..utils.validators import Validator
+from .base import BaseService
 
 logger = logging.getLogger(__name__)
 
 
-class PrescricaoService:
+class PrescricaoService(BaseService):
     """Service for prescricao-related operations."""
 
     def __init__(self):
         """Initialize prescricao service."""
-        self.db_manager = get_db_manager()
+        super().__init__()
 
     def criar_prescricao(
         self,
@@ -50,17 +56,18 @@ class PrescricaoService:
             ["consulta_id", "medicamento_id"],
         )
 
+        def inserir(cursor, conn) -> int:
+            cursor.execute(
+                """
+                INSERT INTO prescricoes (consulta_id, medicamento_id, duracao, instrucoes)
+                VALUES (%s, %s, %s, %s)
+                """,
+                (consulta_id, medicamento_id, duracao, instrucoes),
+            )
+            return cursor.lastrowid
+
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    """
-                    INSERT INTO prescricoes (consulta_id, medicamento_id, duracao, instrucoes)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (consulta_id, medicamento_id, duracao, instrucoes),
-                )
-                conn.commit()
-                prescricao_id = cursor.lastrowid
+            prescricao_id = self.db_manager.run_in_transaction("prescricoes.criar", inserir)
 
             logger.info(f"Prescricao created successfully: {prescricao_id}")
             return self.obter_prescricao_por_id(prescricao_id)
@@ -69,6 +76,7 @@ class PrescricaoService:
             logger.error(f"Error creating prescricao: {err}")
             raise DatabaseError(f"Failed to create prescricao: {str(err)}")
 
+    @read_only
     def listar_prescricoes(self, limite: int = 100, offset: int = 0) -> List[Prescricao]:
         """
         List all prescriptions with pagination.
@@ -84,10 +92,10 @@ class PrescricaoService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, consulta_id, medicamento_id, duracao, instrucoes
+                    SELECT id, consulta_id, medicamento_id, duracao, instrucoes, versao
                     FROM prescricoes
                     LIMIT %s OFFSET %s
                     """,
@@ -105,6 +113,7 @@ class PrescricaoService:
             logger.error(f"Error listing prescricoes: {err}")
             raise DatabaseError(f"Failed to list prescricoes: {str(err)}")
 
+    @read_only
     def obter_prescricao_por_id(self, prescricao_id: int) -> Prescricao:
         """
         Get prescription by ID.
@@ -120,10 +129,10 @@ class PrescricaoService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, consulta_id, medicamento_id, duracao, instrucoes
+                    SELECT id, consulta_id, medicamento_id, duracao, instrucoes, versao
                     FROM prescricoes
                     WHERE id = %s
                     """,
@@ -142,6 +151,7 @@ class PrescricaoService:
             logger.error(f"Error getting prescricao: {err}")
             raise DatabaseError(f"Failed to get prescricao: {str(err)}")
 
+    @read_only
     def listar_prescricoes_por_consulta(
         self, consulta_id: int, limite: int = 100, offset: int = 0
     ) -> List[Prescricao]:
@@ -160,10 +170,10 @@ class PrescricaoService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, consulta_id, medicamento_id, duracao, instrucoes
+                    SELECT id, consulta_id, medicamento_id, duracao, instrucoes, versao
                     FROM prescricoes
                     WHERE consulta_id = %s
                     LIMIT %s OFFSET %s
@@ -189,6 +199,7 @@ class PrescricaoService:
         prescricao_id: int,
         duracao: str = None,
         instrucoes: str = None,
+        versao: int = None,
     ) -> Prescricao:
         """
         Update prescription.
@@ -197,47 +208,35 @@ class PrescricaoService:
             prescricao_id: Prescription ID.
             duracao: New duration.
             instrucoes: New instructions.
+            versao: Version the client last read; the update fails if the
+                prescription changed since.
 
         Returns:
             Updated Prescricao object.
 
         Raises:
             NotFoundError: If prescription not found.
+            PreconditionFailedError: If the prescription is no longer at versao.
             DatabaseError: If database operation fails.
         """
-        # Check if prescription exists
-        self.obter_prescricao_por_id(prescricao_id)
-
-        try:
-            updates = []
-            params = []
-
-            if duracao is not None:
-                updates.append("duracao = %s")
-                params.append(duracao)
-            if instrucoes is not None:
-                updates.append("instrucoes = %s")
-                params.append(instrucoes)
-
-            if not updates:
-                return self.obter_prescricao_por_id(prescricao_id)
+        campos = {"duracao": duracao, "instrucoes": instrucoes}
+        campos = {coluna: valor for coluna, valor in campos.items() if valor is not None}
+        if not campos:
+            return self.obter_prescricao_por_id(prescricao_id)
 
-            params.append(prescricao_id)
+        def atualizar(cursor, conn) -> None:
+            self._atualizar_versionado(
+                cursor, "prescricoes", prescricao_id, campos, versao, "Prescricao"
+            )
 
-            with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    f"""
-                    UPDATE prescricoes
-                    SET {", ".join(updates)}
-                    WHERE id = %s
-                    """,
-                    params,
-                )
-                conn.commit()
+        try:
+            self.db_manager.run_in_transaction("prescricoes.atualizar", atualizar, prepared=False)
 
             logger.info(f"Prescricao {prescricao_id} updated successfully")
             return self.obter_prescricao_por_id(prescricao_id)
 
+        except (NotFoundError, PreconditionFailedError):
+            raise
         except Exception as err:
             logger.error(f"Error updating prescricao: {err}")
             raise DatabaseError(f"Failed to update prescricao: {str(err)}")
@@ -257,11 +256,12 @@ class PrescricaoService:
         self.obter_prescricao_por_id(prescricao_id)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
+            self.db_manager.run_in_transaction(
+                "prescricoes.deletar",
+                lambda cursor, conn: cursor.execute(
                     "DELETE FROM prescricoes WHERE id = %s", (prescricao_id,)
-                )
-                conn.commit()
+                ),
+            )
 
             logger.info(f"Prescricao {prescricao_id} deleted successfully")
 
@@ -286,4 +286,5 @@ class PrescricaoService:
             medicamento_id=data.get("medicamento_id", 0),
             duracao=data.get("duracao", ""),
             instrucoes=data.get("instrucoes", ""),
+            versao=data.get("versao", 1),
         )
@@ -1,22 +1,53 @@
 """Profissional service for business logic."""
 
 import logging
-from typing import List
-
-from ..config.database import get_db_manager
-from ..exceptions import DatabaseError, NotFoundError, ValidationError
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Sequence
+
+from ..config.replicas import read_only
+from ..exceptions import (
+    DatabaseError,
+    NotFoundError,
+    PreconditionFailedError,
+    ValidationError,
+)
 from ..models import Profissional
+from ..utils.availability import (
+    BLOCKS_PER_DAY,
+    block_start,
+    blocks_for,
+    day_masks,
+    free_mask,
+    runs_of,
+    slot_starts,
+    span_mask,
+)
+from ..utils.scheduling import (
+    DATETIME_FORMAT,
+    MAX_DURACAO_MINUTOS,
+    STATUS_CANCELADA,
+    IntervalSet,
+    format_horario,
+    free_slots,
+    parse_dias_atendimento,
+    parse_horario,
+    parse_periodo,
+    to_datetime,
+    validate_duracao,
+    working_windows,
+)
 from ..utils.validators import Validator
+from .base import BaseService
 
 logger = logging.getLogger(__name__)
 
 
-class ProfissionalService:
+class ProfissionalService(BaseService):
     """Service for profissional-related operations."""
 
     def __init__(self):
         """Initialize profissional service."""
-        self.db_manager = get_db_manager()
+        super().__init__()
 
     def criar_profissional(
         self,
@@ -25,6 +56,9 @@ class ProfissionalService:
         telefone: str,
         especialidade: str,
         registro: str,
+        horario_inicio: str = None,
+        horario_fim: str = None,
+        dias_atendimento: str = None,
     ) -> Profissional:
         """
         Create a new professional.
@@ -35,6 +69,9 @@ class ProfissionalService:
             telefone: Professional phone.
             especialidade: Medical specialty.
             registro: Medical registration number.
+            horario_inicio: Daily start of work (HH:MM).
+            horario_fim: Daily end of work (HH:MM).
+            dias_atendimento: Working days, e.g. "Segunda a Sexta".
 
         Returns:
             Created Profissional object.
@@ -56,15 +93,29 @@ class ProfissionalService:
         )
         Validator.validate_email(email)
         Validator.validate_phone(telefone)
+        horario_inicio = format_horario(horario_inicio)
+        horario_fim = format_horario(horario_fim)
+        parse_dias_atendimento(dias_atendimento)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    INSERT INTO profissionais (nome, email, telefone, especialidade, registro)
-                    VALUES (%s, %s, %s, %s, %s)
+                    INSERT INTO profissionais
+                    (nome, email, telefone, especialidade, registro,
+                     horario_inicio, horario_fim, dias_atendimento)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                     """,
-                    (nome, email, telefone, especialidade, registro),
+                    (
+                        nome,
+                        email,
+                        telefone,
+                        especialidade,
+                        registro,
+                        horario_inicio,
+                        horario_fim,
+                        dias_atendimento,
+                    ),
                 )
                 conn.commit()
                 profissional_id = cursor.lastrowid
@@ -76,6 +127,7 @@ class ProfissionalService:
             logger.error(f"Error creating profissional: {err}")
             raise DatabaseError(f"Failed to create profissional: {str(err)}")
 
+    @read_only
     def listar_profissionais(
         self, limite: int = 100, offset: int = 0
     ) -> List[Profissional]:
@@ -93,10 +145,11 @@ class ProfissionalService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, telefone, especialidade, registro
+                    SELECT id, nome, email, telefone, especialidade, registro,
+                           horario_inicio, horario_fim, dias_atendimento, versao
                     FROM profissionais
                     LIMIT %s OFFSET %s
                     """,
@@ -114,6 +167,7 @@ class ProfissionalService:
             logger.error(f"Error listing profissionais: {err}")
             raise DatabaseError(f"Failed to list profissionais: {str(err)}")
 
+    @read_only
     def obter_profissional_por_id(self, profissional_id: int) -> Profissional:
         """
         Get professional by ID.
@@ -129,10 +183,11 @@ class ProfissionalService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, telefone, especialidade, registro
+                    SELECT id, nome, email, telefone, especialidade, registro,
+                           horario_inicio, horario_fim, dias_atendimento, versao
                     FROM profissionais
                     WHERE id = %s
                     """,
@@ -151,6 +206,7 @@ class ProfissionalService:
             logger.error(f"Error getting profissional: {err}")
             raise DatabaseError(f"Failed to get profissional: {str(err)}")
 
+    @read_only
     def obter_profissional_por_registro(self, registro: str) -> Profissional:
         """
         Get professional by registration number.
@@ -166,10 +222,11 @@ class ProfissionalService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, telefone, especialidade, registro
+                    SELECT id, nome, email, telefone, especialidade, registro,
+                           horario_inicio, horario_fim, dias_atendimento, versao
                     FROM profissionais
                     WHERE registro = %s
                     """,
@@ -195,6 +252,10 @@ class ProfissionalService:
         email: str = None,
         telefone: str = None,
         especialidade: str = None,
+        horario_inicio: str = None,
+        horario_fim: str = None,
+        dias_atendimento: str = None,
+        versao: int = None,
     ) -> Profissional:
         """
         Update professional.
@@ -205,6 +266,11 @@ class ProfissionalService:
             email: New email.
             telefone: New phone.
             especialidade: New specialty.
+            horario_inicio: New daily start of work (HH:MM).
+            horario_fim: New daily end of work (HH:MM).
+            dias_atendimento: New working days.
+            versao: Version the client last read; the update fails if the
+                professional changed since.
 
         Returns:
             Updated Profissional object.
@@ -212,53 +278,46 @@ class ProfissionalService:
         Raises:
             NotFoundError: If professional not found.
             ValidationError: If validation fails.
+            PreconditionFailedError: If the professional is no longer at versao.
             DatabaseError: If database operation fails.
         """
-        # Check if professional exists
-        self.obter_profissional_por_id(profissional_id)
-
         # Validate inputs if provided
         if email:
             Validator.validate_email(email)
         if telefone:
             Validator.validate_phone(telefone)
+        if horario_inicio is not None:
+            horario_inicio = format_horario(horario_inicio)
+        if horario_fim is not None:
+            horario_fim = format_horario(horario_fim)
+        if dias_atendimento is not None:
+            parse_dias_atendimento(dias_atendimento)
+
+        campos = {
+            "nome": nome,
+            "email": email,
+            "telefone": telefone,
+            "especialidade": especialidade,
+            "horario_inicio": horario_inicio,
+            "horario_fim": horario_fim,
+            "dias_atendimento": dias_atendimento,
+        }
+        campos = {coluna: valor for coluna, valor in campos.items() if valor is not None}
+        if not campos:
+            return self.obter_profissional_por_id(profissional_id)
 
         try:
-            updates = []
-            params = []
-
-            if nome is not None:
-                updates.append("nome = %s")
-                params.append(nome)
-            if email is not None:
-                updates.append("email = %s")
-                params.append(email)
-            if telefone is not None:
-                updates.append("telefone = %s")
-                params.append(telefone)
-            if especialidade is not None:
-                updates.append("especialidade = %s")
-                params.append(especialidade)
-
-            if not updates:
-                return self.obter_profissional_por_id(profissional_id)
-
-            params.append(profissional_id)
-
             with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    f"""
-                    UPDATE profissionais
-                    SET {", ".join(updates)}
-                    WHERE id = %s
-                    """,
-                    params,
+                self._atualizar_versionado(
+                    cursor, "profissionais", profissional_id, campos, versao, "Profissional"
                 )
                 conn.commit()
 
             logger.info(f"Profissional {profissional_id} updated successfully")
             return self.obter_profissional_por_id(profissional_id)
 
+        except (NotFoundError, PreconditionFailedError):
+            raise
         except Exception as err:
             logger.error(f"Error updating profissional: {err}")
             raise DatabaseError(f"Failed to update profissional: {str(err)}")
@@ -278,18 +337,255 @@ class ProfissionalService:
         self.obter_profissional_por_id(profissional_id)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute(
                     "DELETE FROM profissionais WHERE id = %s", (profissional_id,)
                 )
                 conn.commit()
 
+            if self.availability is not None:
+                self.availability.invalidate(profissional_id)
             logger.info(f"Profissional {profissional_id} deleted successfully")
 
         except Exception as err:
             logger.error(f"Error deleting profissional: {err}")
             raise DatabaseError(f"Failed to delete profissional: {str(err)}")
 
+    @read_only
+    def listar_horarios_livres(
+        self,
+        profissional_id: int,
+        inicio: str,
+        fim: str,
+        duracao_minutos: int = 30,
+        agora: Optional[datetime] = None,
+    ) -> List[dict]:
+        """
+        Find a professional's free slots between two dates.
+
+        Working hours come from ``horario_inicio``, ``horario_fim`` and
+        ``dias_atendimento``. Booked time comes from the availability cache
+        when it is enabled, and otherwise from one query merged into an
+        interval set; either way it is subtracted in a single pass.
+
+        Args:
+            profissional_id: Professional ID.
+            inicio: First day (YYYY-MM-DD).
+            fim: Last day, inclusive (YYYY-MM-DD).
+            duracao_minutos: Slot length.
+            agora: Slots starting before this moment are skipped; defaults
+                to the current time.
+
+        Returns:
+            Slots as dictionaries with ``inicio`` and ``fim``.
+
+        Raises:
+            ValidationError: If the range or duration is invalid.
+            NotFoundError: If professional not found.
+            DatabaseError: If database operation fails.
+        """
+        primeiro_dia, ultimo_dia = parse_periodo(inicio, fim)
+        duracao_minutos = validate_duracao(duracao_minutos)
+        profissional = self.obter_profissional_por_id(profissional_id)
+        agora = agora or datetime.now()
+        janelas = self._janelas(profissional, primeiro_dia, ultimo_dia)
+        # Overnight shifts of the last day end on the following day
+        dia_seguinte = ultimo_dia + timedelta(days=1)
+
+        if self.availability is None:
+            ocupados = IntervalSet(
+                (start, end)
+                for _, _, start, end in self._carregar_ocupados(
+                    [profissional_id], primeiro_dia, dia_seguinte
+                )
+            )
+            slots = free_slots(janelas, ocupados, duracao_minutos, not_before=agora)
+        else:
+            ocupados = self.availability.busy_masks(
+                [profissional_id], primeiro_dia, dia_seguinte, self._carregar_ocupados
+            )[profissional_id]
+            livres = free_mask(
+                janelas, ocupados, primeiro_dia, (dia_seguinte - primeiro_dia).days + 1, agora
+            )
+            duracao = timedelta(minutes=duracao_minutos)
+            slots = (
+                (block_start(primeiro_dia, block), block_start(primeiro_dia, block) + duracao)
+                for block in slot_starts(livres, blocks_for(duracao_minutos))
+            )
+
+        return [
+            {"inicio": start.strftime(DATETIME_FORMAT), "fim": end.strftime(DATETIME_FORMAT)}
+            for start, end in slots
+        ]
+
+    @read_only
+    def primeiro_horario_livre(
+        self,
+        especialidade: str,
+        inicio: str,
+        fim: str,
+        duracao_minutos: int = 30,
+        agora: Optional[datetime] = None,
+    ) -> Optional[dict]:
+        """
+        Find the earliest free slot among the professionals of a specialty.
+
+        Each professional's free time over the whole period is one integer
+        bitset, so finding where a slot fits is a few shifts and ANDs per
+        professional instead of a walk over their consultas.
+
+        Args:
+            especialidade: Medical specialty.
+            inicio: First day (YYYY-MM-DD).
+            fim: Last day, inclusive (YYYY-MM-DD).
+            duracao_minutos: Slot length.
+            agora: Slots starting before this moment are skipped; defaults
+                to the current time.
+
+        Returns:
+            Dictionary with ``profissional``, ``inicio`` and ``fim``, or None
+            if no professional has a free slot in the period.
+
+        Raises:
+            ValidationError: If the range, specialty or duration is invalid.
+            DatabaseError: If database operation fails.
+        """
+        Validator.validate_required_fields({"especialidade": especialidade}, ["especialidade"])
+        primeiro_dia, ultimo_dia = parse_periodo(inicio, fim)
+        duracao_minutos = validate_duracao(duracao_minutos)
+        agora = agora or datetime.now()
+
+        try:
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
+                cursor.execute(
+                    """
+                    SELECT id, nome, email, telefone, especialidade, registro,
+                           horario_inicio, horario_fim, dias_atendimento, versao
+                    FROM profissionais
+                    WHERE especialidade = %s
+                    ORDER BY id
+                    """,
+                    (especialidade,),
+                )
+                profissionais = [self._map_to_profissional(row) for row in cursor.fetchall()]
+
+        except Exception as err:
+            logger.error(f"Error listing profissionais by especialidade: {err}")
+            raise DatabaseError(f"Failed to find free slot: {str(err)}")
+
+        if not profissionais:
+            return None
+
+        dia_seguinte = ultimo_dia + timedelta(days=1)
+        dias = (dia_seguinte - primeiro_dia).days + 1
+        ids = [profissional.id for profissional in profissionais]
+        if self.availability is None:
+            ocupados = day_masks(
+                self._carregar_ocupados(ids, primeiro_dia, dia_seguinte),
+                primeiro_dia,
+                dia_seguinte,
+            )
+        else:
+            ocupados = self.availability.busy_masks(
+                ids, primeiro_dia, dia_seguinte, self._carregar_ocupados
+            )
+
+        # Slots must start inside the period, but may run into the next day
+        inicios_validos = span_mask(0, (dias - 1) * BLOCKS_PER_DAY, dias * BLOCKS_PER_DAY)
+        blocos = blocks_for(duracao_minutos)
+        melhor = None
+        for profissional in profissionais:
+            livres = free_mask(
+                self._janelas(profissional, primeiro_dia, ultimo_dia),
+                ocupados.get(profissional.id, {}),
+                primeiro_dia,
+                dias,
+                agora,
+            )
+            inicios = runs_of(livres, blocos) & inicios_validos
+            if inicios:
+                block = (inicios & -inicios).bit_length() - 1
+                if melhor is None or block < melhor[0]:
+                    melhor = (block, profissional)
+
+        if melhor is None:
+            return None
+        block, profissional = melhor
+        start = block_start(primeiro_dia, block)
+        return {
+            "profissional": profissional.to_dict(),
+            "inicio": start.strftime(DATETIME_FORMAT),
+            "fim": (start + timedelta(minutes=duracao_minutos)).strftime(DATETIME_FORMAT),
+        }
+
+    @staticmethod
+    def _janelas(profissional: Profissional, primeiro_dia: date, ultimo_dia: date) -> list:
+        """Working windows of a professional between two days."""
+        return list(
+            working_windows(
+                primeiro_dia,
+                ultimo_dia,
+                parse_horario(profissional.horario_inicio),
+                parse_horario(profissional.horario_fim),
+                parse_dias_atendimento(profissional.dias_atendimento),
+            )
+        )
+
+    def _carregar_ocupados(
+        self, profissional_ids: Sequence[int], primeiro_dia: date, ultimo_dia: date
+    ) -> list:
+        """
+        Load the booked consultas of some professionals that touch a range of days.
+
+        Args:
+            profissional_ids: Professional IDs.
+            primeiro_dia: First day.
+            ultimo_dia: Last day, inclusive.
+
+        Returns:
+            ``(profissional_id, consulta_id, inicio, fim)`` tuples.
+
+        Raises:
+            DatabaseError: If database operation fails.
+        """
+        desde = datetime.combine(primeiro_dia, datetime.min.time()) - timedelta(
+            minutes=MAX_DURACAO_MINUTOS
+        )
+        ate = datetime.combine(ultimo_dia, datetime.min.time()) + timedelta(days=1)
+        placeholders = ", ".join(["%s"] * len(profissional_ids))
+        try:
+            # The IN list changes size, so this one is not prepared
+            with self.db_manager.get_cursor() as (cursor, conn):
+                cursor.execute(
+                    f"""
+                    SELECT profissional_id, id, data, duracao_minutos
+                    FROM consultas
+                    WHERE profissional_id IN ({placeholders})
+                      AND data > %s AND data < %s AND status <> %s
+                    """,
+                    (
+                        *profissional_ids,
+                        desde.strftime(DATETIME_FORMAT),
+                        ate.strftime(DATETIME_FORMAT),
+                        STATUS_CANCELADA,
+                    ),
+                )
+                rows = cursor.fetchall()
+
+        except Exception as err:
+            logger.error(f"Error loading booked consultas: {err}")
+            raise DatabaseError(f"Failed to load booked consultas: {str(err)}")
+
+        return [
+            (
+                profissional_id,
+                consulta_id,
+                to_datetime(data),
+                to_datetime(data) + timedelta(minutes=duracao or 30),
+            )
+            for profissional_id, consulta_id, data, duracao in rows
+        ]
+
     @staticmethod
     def _map_to_profissional(data: dict) -> Profissional:
         """
@@ -308,4 +604,8 @@ class ProfissionalService:
             telefone=data.get("telefone", ""),
             especialidade=data.get("especialidade", ""),
             registro=data.get("registro", ""),
+            horario_inicio=format_horario(data.get("horario_inicio")),
+            horario_fim=format_horario(data.get("horario_fim")),
+            dias_atendimento=data.get("dias_atendimento"),
+            versao=data.get("versao", 1),
         )
@@ -0,0 +1,141 @@
+"""Lazy service registry bound to the Flask application."""
+
+import importlib
+import threading
+from typing import Any, Callable, Dict, Optional, Union
+
+from flask import Flask, current_app
+from werkzeug.local import LocalProxy
+
+# Service name -> "module:ClassName", imported on first use (relative to this package)
+DEFAULT_SERVICES = {
+    "usuarios": ".usuario_service:UsuarioService",
+    "pacientes": ".paciente_service:PacienteService",
+    "profissionais": ".profissional_service:ProfissionalService",
+    "consultas": ".consulta_service:ConsultaService",
+    "medicamentos": ".medicamento_service:MedicamentoService",
+    "prescricoes": ".prescricao_service:PrescricaoService",
+}
+
+Factory = Union[str, Callable[[], Any]]
+
+
+def _resolve_factory(factory: Factory) -> Callable[[], Any]:
+    if callable(factory):
+        return factory
+    module_name, _, attribute = factory.partition(":")
+    return getattr(importlib.import_module(module_name, package=__package__), attribute)
+
+
+class ServiceContainer:
+    """
+    Creates services on first use and keeps one instance per application.
+
+    Services are bound to the application's database manager when they are
+    created, so importing a blueprint never touches the database and two
+    applications in the same process do not share service state.
+    """
+
+    def __init__(
+        self,
+        db_manager=None,
+        factories: Optional[Dict[str, Factory]] = None,
+        availability=None,
+    ):
+        """
+        Initialize the service container.
+
+        Args:
+            db_manager: Database manager injected into created services.
+            factories: Service name to class, callable or "module:attr" path.
+            availability: Availability cache injected into created services.
+        """
+        self.db_manager = db_manager
+        self.availability = availability
+        self._factories: Dict[str, Factory] = dict(DEFAULT_SERVICES)
+        self._factories.update(factories or {})
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Bind the container to the application.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["services"] = self
+
+    def register(self, name: str, factory: Factory) -> None:
+        """
+        Register or replace a service factory.
+
+        Args:
+            name: Service name.
+            factory: Class, callable or "module:attr" path.
+        """
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """
+        Get a service, creating it on first use.
+
+        Args:
+            name: Service name.
+
+        Returns:
+            Service instance.
+
+        Raises:
+            KeyError: If no service is registered under the name.
+        """
+        service = self._instances.get(name)
+        if service is not None:
+            return service
+
+        with self._lock:
+            service = self._instances.get(name)
+            if service is None:
+                service = _resolve_factory(self._factories[name])()
+                if self.db_manager is not None and hasattr(service, "db_manager"):
+                    service.db_manager = self.db_manager
+                if self.availability is not None and hasattr(service, "availability"):
+                    service.availability = self.availability
+                self._instances[name] = service
+        return service
+
+    @property
+    def loaded(self) -> list:
+        """Names of the services created so far."""
+        return sorted(self._instances)
+
+
+def get_service(name: str) -> Any:
+    """
+    Get a service from the current application's container.
+
+    Args:
+        name: Service name.
+
+    Returns:
+        Service instance.
+    """
+    return current_app.extensions["services"].get(name)
+
+
+def service_proxy(name: str) -> Any:
+    """
+    Create a module-level proxy resolved per request.
+
+    Blueprints use it in place of a service instance so that nothing is
+    constructed at import time.
+
+    Args:
+        name: Service name.
+
+    Returns:
+        Proxy forwarding attribute access to the current application's service.
+    """
+    return LocalProxy(lambda: get_service(name))
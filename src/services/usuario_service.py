@@ -6,28 +6,36 @@ from typing import List, Optional
 from flask_jwt_extended import create_access_token
 from werkzeug.security import check_password_hash, generate_password_hash
 
-from ..config.database import get_db_manager
+from ..config.replicas import read_only
 from ..exceptions import (
     AuthenticationError,
     ConflictError,
     DatabaseError,
     NotFoundError,
+    PreconditionFailedError,
     ValidationError,
 )
 from ..models import Usuario
+from ..utils.async_bridge import run_blocking
 from ..utils.validators import Validator
+from .base import BaseService
 
 logger = logging.getLogger(__name__)
 
+# Role given to self-registered users; any other role is assigned by an admin
+TIPO_PADRAO = "paciente"
 
-class UsuarioService:
+
+class UsuarioService(BaseService):
     """Service for usuario-related operations."""
 
     def __init__(self):
         """Initialize usuario service."""
-        self.db_manager = get_db_manager()
+        super().__init__()
 
-    def criar_usuario(self, nome: str, email: str, senha: str, tipo: str) -> Usuario:
+    def criar_usuario(
+        self, nome: str, email: str, senha: str, tipo: str = TIPO_PADRAO
+    ) -> Usuario:
         """
         Create a new user.
 
@@ -58,10 +66,10 @@ class UsuarioService:
             raise ConflictError("Email already registered")
 
         # Hash password
-        senha_hash = generate_password_hash(senha)
+        senha_hash = run_blocking(generate_password_hash, senha)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
                     INSERT INTO usuarios (nome, email, senha, tipo)
@@ -79,6 +87,7 @@ class UsuarioService:
             logger.error(f"Error creating usuario: {err}")
             raise DatabaseError(f"Failed to create usuario: {str(err)}")
 
+    @read_only
     def listar_usuarios(self, limite: int = 100, offset: int = 0) -> List[Usuario]:
         """
         List all users with pagination.
@@ -94,10 +103,10 @@ class UsuarioService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, tipo FROM usuarios
+                    SELECT id, nome, email, tipo, versao FROM usuarios
                     LIMIT %s OFFSET %s
                     """,
                     (limite, offset),
@@ -112,6 +121,7 @@ class UsuarioService:
             logger.error(f"Error listing usuarios: {err}")
             raise DatabaseError(f"Failed to list usuarios: {str(err)}")
 
+    @read_only
     def obter_usuario_por_id(self, usuario_id: int) -> Usuario:
         """
         Get user by ID.
@@ -127,10 +137,10 @@ class UsuarioService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, tipo FROM usuarios
+                    SELECT id, nome, email, tipo, versao FROM usuarios
                     WHERE id = %s
                     """,
                     (usuario_id,),
@@ -148,6 +158,7 @@ class UsuarioService:
             logger.error(f"Error getting usuario: {err}")
             raise DatabaseError(f"Failed to get usuario: {str(err)}")
 
+    @read_only
     def obter_usuario_por_email(self, email: str) -> Usuario:
         """
         Get user by email.
@@ -163,10 +174,10 @@ class UsuarioService:
             DatabaseError: If database operation fails.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 cursor.execute(
                     """
-                    SELECT id, nome, email, tipo, senha FROM usuarios
+                    SELECT id, nome, email, tipo, senha, versao FROM usuarios
                     WHERE email = %s
                     """,
                     (email,),
@@ -185,7 +196,12 @@ class UsuarioService:
             raise DatabaseError(f"Failed to get usuario: {str(err)}")
 
     def atualizar_usuario(
-        self, usuario_id: int, nome: str = None, email: str = None, tipo: str = None
+        self,
+        usuario_id: int,
+        nome: str = None,
+        email: str = None,
+        tipo: str = None,
+        versao: int = None,
     ) -> Usuario:
         """
         Update user.
@@ -195,6 +211,8 @@ class UsuarioService:
             nome: New name.
             email: New email.
             tipo: New type.
+            versao: Version the client last read; the update fails if the
+                user changed since.
 
         Returns:
             Updated Usuario object.
@@ -202,50 +220,33 @@ class UsuarioService:
         Raises:
             NotFoundError: If user not found.
             ValidationError: If validation fails.
+            ConflictError: If the email is already in use.
+            PreconditionFailedError: If the user is no longer at versao.
             DatabaseError: If database operation fails.
         """
-        # Check if user exists
-        self.obter_usuario_por_id(usuario_id)
-
         # Validate email if provided
         if email:
             Validator.validate_email(email)
             if self._email_exists(email, exclude_id=usuario_id):
                 raise ConflictError("Email already in use")
 
-        try:
-            updates = []
-            params = []
-
-            if nome is not None:
-                updates.append("nome = %s")
-                params.append(nome)
-            if email is not None:
-                updates.append("email = %s")
-                params.append(email)
-            if tipo is not None:
-                updates.append("tipo = %s")
-                params.append(tipo)
-
-            if not updates:
-                return self.obter_usuario_por_id(usuario_id)
-
-            params.append(usuario_id)
+        campos = {"nome": nome, "email": email, "tipo": tipo}
+        campos = {coluna: valor for coluna, valor in campos.items() if valor is not None}
+        if not campos:
+            return self.obter_usuario_por_id(usuario_id)
 
+        try:
             with self.db_manager.get_cursor() as (cursor, conn):
-                cursor.execute(
-                    f"""
-                    UPDATE usuarios
-                    SET {", ".join(updates)}
-                    WHERE id = %s
-                    """,
-                    params,
+                self._atualizar_versionado(
+                    cursor, "usuarios", usuario_id, campos, versao, "Usuario"
                 )
                 conn.commit()
 
             logger.info(f"Usuario {usuario_id} updated successfully")
             return self.obter_usuario_por_id(usuario_id)
 
+        except (NotFoundError, PreconditionFailedError):
+            raise
         except Exception as err:
             logger.error(f"Error updating usuario: {err}")
             raise DatabaseError(f"Failed to update usuario: {str(err)}")
@@ -265,7 +266,7 @@ class UsuarioService:
         self.obter_usuario_por_id(usuario_id)
 
         try:
-            with self.db_manager.get_cursor() as (cursor, conn):
+            with self.db_manager.get_cursor(prepared=True) as (cursor, conn):
                 cursor.execute("DELETE FROM usuarios WHERE id = %s", (usuario_id,))
                 conn.commit()
 
@@ -292,11 +293,13 @@ class UsuarioService:
         """
         usuario = self.obter_usuario_por_email(email)
 
-        if not check_password_hash(usuario.senha, senha):
+        if not run_blocking(check_password_hash, usuario.senha, senha):
             raise AuthenticationError("Invalid credentials")
 
         # Create JWT token
-        access_token = create_access_token(identity=str(usuario.id))
+        access_token = create_access_token(
+            identity=str(usuario.id), additional_claims={"tipo": usuario.tipo}
+        )
         logger.info(f"User {usuario.id} authenticated successfully")
 
         return usuario, access_token
@@ -313,7 +316,7 @@ class UsuarioService:
             True if email exists, False otherwise.
         """
         try:
-            with self.db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            with self.db_manager.get_cursor(dictionary=True, prepared=True) as (cursor, conn):
                 if exclude_id:
                     cursor.execute(
                         "SELECT id FROM usuarios WHERE email = %s AND id != %s",
@@ -343,6 +346,7 @@ class UsuarioService:
             nome=data.get("nome", ""),
             email=data.get("email", ""),
             tipo=data.get("tipo", ""),
+            versao=data.get("versao", 1),
         )
         if include_password:
             usuario.senha = data.get("senha", "")
@@ -0,0 +1,117 @@
+"""Sanitized access log for traffic replay."""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from flask import Flask, g, request
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that carry no personal data and are kept for replay
+SAFE_QUERY_PARAMS = frozenset(
+    {
+        "page",
+        "per_page",
+        "paciente_id",
+        "profissional_id",
+        "consulta_id",
+        "medicamento_id",
+        "status",
+        "from",
+        "to",
+        "duration",
+        "limit",
+        "sort",
+        "type",
+        "all",
+        "busca",
+    }
+)
+
+MAX_VALUE_LENGTH = 64
+
+
+class AccessLogger:
+    """
+    Writes one compact JSON line per request.
+
+    Only the request shape is recorded: method, route template, URL variables,
+    allowlisted query parameters, status and duration. Headers, bodies, client
+    addresses and user identities are never written. Records look like::
+
+        {"t":1700000000.123,"m":"GET","r":"/api/consultas/<int:consulta_id>",
+         "a":{"consulta_id":42},"q":{},"s":200,"d":3.21}
+    """
+
+    def __init__(self, path: str = "logs/access.ndjson"):
+        """
+        Initialize the access logger.
+
+        Args:
+            path: NDJSON file records are appended to.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._handle = None
+        self._pid: Optional[int] = None
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register request hooks on the application.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["access_logger"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    def close(self) -> None:
+        """Close the log file."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _before_request(self) -> None:
+        g._access_log_started = (time.time(), time.perf_counter())
+
+    def _after_request(self, response):
+        started = g.pop("_access_log_started", None)
+        if started is None or request.url_rule is None:
+            return response
+
+        record = {
+            "t": round(started[0], 3),
+            "m": request.method,
+            "r": request.url_rule.rule,
+            "a": request.view_args or {},
+            "q": {
+                key: value[:MAX_VALUE_LENGTH]
+                for key, value in request.args.items()
+                if key in SAFE_QUERY_PARAMS
+            },
+            "s": response.status_code,
+            "d": round((time.perf_counter() - started[1]) * 1000, 2),
+        }
+        try:
+            self._write(json.dumps(record, separators=(",", ":"), default=str))
+        except OSError as err:
+            logger.error(f"Error writing access log: {err}")
+        return response
+
+    def _write(self, line: str) -> None:
+        with self._lock:
+            # Reopen after fork so each worker appends through its own handle;
+            # single-line O_APPEND writes do not interleave between processes
+            if self._handle is None or self._pid != os.getpid():
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._handle = open(self.path, "a", encoding="utf-8", buffering=1)
+                self._pid = os.getpid()
+            self._handle.write(line + "\n")
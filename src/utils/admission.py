@@ -0,0 +1,412 @@
+"""Admission control and load shedding for SGHSS application."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+from typing import Dict, List, Optional
+
+from flask import Flask, g, request
+
+from ..exceptions import ServiceUnavailableError
+from .async_bridge import await_only, in_bridge
+
+logger = logging.getLogger(__name__)
+
+# Request classes, most important first
+EXEMPT = "exempt"
+CRITICAL = "critical"
+NORMAL = "normal"
+LOW = "low"
+PRIORITIES = (CRITICAL, NORMAL, LOW)
+
+# Fraction of a limiter's concurrency each class may occupy; the rest is
+# headroom kept for more important requests
+PRIORITY_SHARES = {CRITICAL: 1.0, NORMAL: 0.8, LOW: 0.5}
+
+# Fraction of the queue timeout each class waits before being rejected
+PRIORITY_WAIT = {CRITICAL: 1.0, NORMAL: 0.5, LOW: 0.0}
+
+DEFAULT_PRIORITIES = {
+    "auth.health_check": EXEMPT,
+    "consultas.obter_consulta": CRITICAL,
+    "consultas.listar_consultas": CRITICAL,
+    "prescricoes.listar_prescricoes_por_consulta": CRITICAL,
+}
+
+_POLL_INTERVAL = 0.005
+
+
+def parse_priorities(value: str) -> Dict[str, str]:
+    """
+    Parse endpoint priority overrides.
+
+    Args:
+        value: Comma-separated ``endpoint=priority`` pairs, e.g.
+            ``"pacientes.listar_pacientes=normal,admin.listar_queries=exempt"``.
+
+    Returns:
+        Mapping of endpoint name to priority.
+
+    Raises:
+        ValueError: If a pair is malformed or names an unknown priority.
+    """
+    priorities = {}
+    for pair in filter(None, (item.strip() for item in value.split(","))):
+        endpoint, _, priority = pair.partition("=")
+        priority = priority.strip().lower()
+        if not endpoint.strip() or priority not in PRIORITIES + (EXEMPT,):
+            raise ValueError(f"Invalid admission priority: {pair!r}")
+        priorities[endpoint.strip()] = priority
+    return priorities
+
+
+class _Waiter:
+    """A queued request waiting for a permit."""
+
+    __slots__ = ("priority", "granted", "_event")
+
+    def __init__(self, priority: str):
+        self.priority = priority
+        self.granted = False
+        self._event = threading.Event()
+
+    def wake(self) -> None:
+        self.granted = True
+        self._event.set()
+
+    def wait(self, timeout: float) -> None:
+        if not in_bridge():
+            self._event.wait(timeout)
+            return
+        # On the event loop a blocking wait would stop the greenlet that
+        # releases the permit; poll through the loop instead
+        deadline = time.monotonic() + timeout
+        while not self._event.is_set() and time.monotonic() < deadline:
+            await_only(asyncio.sleep(_POLL_INTERVAL))
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limiter whose limit follows observed latency.
+
+    The limit moves with the ratio between a slowly rising latency baseline
+    and a smoothed recent latency (the gradient): while requests stay close
+    to the baseline and the limiter is busy it grows by ``sqrt(limit)``; when
+    latency climbs past ``tolerance`` times the baseline it shrinks
+    proportionally. Requests over the limit wait in a bounded priority queue
+    and are rejected once it is full or their wait times out.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        queue_size: int = 32,
+        tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Limiter name, reported in status.
+            limit: Initial concurrency limit.
+            min_limit: Lowest limit the adaptation may reach.
+            max_limit: Highest limit the adaptation may reach.
+            queue_size: Maximum number of waiting requests.
+            tolerance: Latency growth over the baseline tolerated before
+                the limit shrinks.
+            smoothing: Weight of each adjustment, between 0 and 1.
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.limit = float(min(max(limit, min_limit), max_limit))
+        self.inflight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._waiters: List[tuple] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def _capacity(self, priority: str) -> int:
+        return max(1, int(self.limit * PRIORITY_SHARES[priority]))
+
+    def acquire(self, priority: str = NORMAL, timeout: float = 0.0) -> bool:
+        """
+        Take a permit, waiting up to ``timeout`` seconds for one.
+
+        Args:
+            priority: Request class (critical, normal or low).
+            timeout: Maximum wait in seconds; 0 rejects immediately.
+
+        Returns:
+            True if a permit was taken and must be released.
+        """
+        rank = PRIORITIES.index(priority)
+        with self._lock:
+            # Newcomers never overtake queued requests of the same or higher class
+            queued_ahead = bool(self._waiters) and self._waiters[0][0] <= rank
+            if not queued_ahead and self.inflight < self._capacity(priority):
+                self.inflight += 1
+                self.admitted += 1
+                return True
+            if timeout <= 0 or len(self._waiters) >= self.queue_size:
+                self.rejected += 1
+                return False
+            waiter = _Waiter(priority)
+            entry = (rank, next(self._sequence), waiter)
+            heapq.heappush(self._waiters, entry)
+
+        waiter.wait(timeout)
+
+        with self._lock:
+            if waiter.granted:
+                self.admitted += 1
+                return True
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            self.rejected += 1
+            return False
+
+    def release(self, latency: Optional[float] = None) -> None:
+        """
+        Return a permit.
+
+        Args:
+            latency: Seconds the request held the permit, or None to skip
+                the latency observation.
+        """
+        with self._lock:
+            self.inflight -= 1
+            if latency is not None:
+                self._observe(latency)
+            while self._waiters:
+                waiter = self._waiters[0][2]
+                if self.inflight >= self._capacity(waiter.priority):
+                    break
+                heapq.heappop(self._waiters)
+                self.inflight += 1
+                waiter.wake()
+
+    def _observe(self, latency: float) -> None:
+        if self._latency is None:
+            self._latency = self._baseline = latency
+            return
+        self._latency += (latency - self._latency) * self.smoothing
+        if latency < self._baseline:
+            self._baseline = latency
+        else:
+            # Let the baseline drift up so a lasting change in request mix
+            # does not pin the limit at its minimum
+            self._baseline += (latency - self._baseline) * 0.01
+
+        gradient = max(0.5, min(1.0, self.tolerance * self._baseline / self._latency))
+        if gradient < 1.0:
+            target = self.limit * gradient
+        elif self.inflight + 1 >= self.limit / 2:
+            target = self.limit + math.sqrt(self.limit)
+        else:
+            return
+        limit = self.limit + (target - self.limit) * self.smoothing
+        self.limit = min(max(limit, self.min_limit), self.max_limit)
+
+    def retry_after(self) -> int:
+        """
+        Estimate seconds until queued work drains.
+
+        Returns:
+            Whole seconds, at least 1.
+        """
+        with self._lock:
+            latency = self._latency or 0.0
+            backlog = len(self._waiters) + self.inflight
+            return max(1, math.ceil(latency * backlog / max(self.limit, 1.0)))
+
+    def status(self) -> dict:
+        """
+        Summarize the limiter state.
+
+        Returns:
+            Dictionary with limit, load, counters and latencies.
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "limit": round(self.limit, 1),
+                "inflight": self.inflight,
+                "queued": len(self._waiters),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "latency_ms": round((self._latency or 0.0) * 1000, 2),
+                "baseline_ms": round((self._baseline or 0.0) * 1000, 2),
+            }
+
+
+class AdmissionController:
+    """
+    Sheds load per blueprint and per endpoint before a view runs.
+
+    Each request takes a permit from its blueprint's limiter and then from
+    its endpoint's limiter, so one slow endpoint cannot take every worker
+    thread and a slow blueprint is contained as a whole. When no permit is
+    available within the request class' wait budget the request fails fast
+    with 503 and a ``Retry-After`` header instead of holding a thread until
+    it times out. ``auth.health_check`` is never shed, consultas reads are
+    critical, list endpoints elsewhere and the admin blueprint are low
+    priority and everything else is normal.
+    """
+
+    def __init__(
+        self,
+        endpoint_limit: int = 16,
+        blueprint_limit: int = 32,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        queue_size: int = 32,
+        queue_timeout_ms: float = 500,
+        tolerance: float = 2.0,
+        priorities: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the admission controller.
+
+        Args:
+            endpoint_limit: Initial concurrency limit per endpoint.
+            blueprint_limit: Initial concurrency limit per blueprint.
+            min_limit: Lowest adaptive limit.
+            max_limit: Highest adaptive limit.
+            queue_size: Waiting requests allowed per limiter.
+            queue_timeout_ms: Longest wait for a permit (critical requests).
+            tolerance: Latency growth over the baseline tolerated before
+                limits shrink.
+            priorities: Endpoint priority overrides.
+        """
+        self.endpoint_limit = endpoint_limit
+        self.blueprint_limit = blueprint_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout_ms / 1000
+        self.tolerance = tolerance
+        self.priorities = {**DEFAULT_PRIORITIES, **(priorities or {})}
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register request hooks on the application.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["admission"] = self
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+
+    def classify(self, endpoint: str, method: str) -> str:
+        """
+        Get the request class of an endpoint.
+
+        Args:
+            endpoint: Flask endpoint name (``blueprint.view``).
+            method: HTTP method.
+
+        Returns:
+            One of exempt, critical, normal or low.
+        """
+        if endpoint in self.priorities:
+            return self.priorities[endpoint]
+        blueprint, _, view = endpoint.rpartition(".")
+        if blueprint == "admin":
+            return LOW
+        if method == "GET" and blueprint == "consultas":
+            return CRITICAL
+        if method == "GET" and view.startswith("listar_"):
+            return LOW
+        return NORMAL
+
+    def limiter(self, name: str) -> AdaptiveLimiter:
+        """
+        Get or create a limiter.
+
+        Args:
+            name: ``blueprint:<name>`` or an endpoint name.
+
+        Returns:
+            The limiter.
+        """
+        limiter = self._limiters.get(name)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(name)
+                if limiter is None:
+                    limit = (
+                        self.blueprint_limit if name.startswith("blueprint:") else self.endpoint_limit
+                    )
+                    limiter = AdaptiveLimiter(
+                        name,
+                        limit=limit,
+                        min_limit=self.min_limit,
+                        max_limit=self.max_limit,
+                        queue_size=self.queue_size,
+                        tolerance=self.tolerance,
+                    )
+                    self._limiters[name] = limiter
+        return limiter
+
+    def status(self) -> List[dict]:
+        """
+        Summarize every limiter.
+
+        Returns:
+            Limiter states sorted by name.
+        """
+        return [self._limiters[name].status() for name in sorted(self._limiters)]
+
+    def _before_request(self) -> None:
+        endpoint = request.endpoint
+        if endpoint is None:
+            return
+        priority = self.classify(endpoint, request.method)
+        if priority == EXEMPT:
+            return
+
+        timeout = self.queue_timeout * PRIORITY_WAIT[priority]
+        names = [endpoint]
+        if request.blueprint:
+            names.insert(0, f"blueprint:{request.blueprint}")
+
+        acquired = []
+        for name in names:
+            limiter = self.limiter(name)
+            if not limiter.acquire(priority, timeout):
+                for held in acquired:
+                    held.release()
+                logger.warning(f"Shedding {request.method} {endpoint} ({priority}): {name} is full")
+                raise ServiceUnavailableError(
+                    "Server is busy, please retry later",
+                    retry_after=limiter.retry_after(),
+                )
+            acquired.append(limiter)
+        g._admission = (acquired, time.perf_counter())
+
+    def _teardown_request(self, exc=None) -> None:
+        admission = g.pop("_admission", None)
+        if admission is None:
+            return
+        acquired, started = admission
+        latency = time.perf_counter() - started
+        for limiter in acquired:
+            limiter.release(latency)
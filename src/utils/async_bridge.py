@@ -0,0 +1,108 @@
+"""Run synchronous code on an asyncio event loop through greenlets.
+
+Synchronous callers (Flask views, services, DatabaseManager) run inside a
+bridge greenlet. When they need an async result, such as a query on an async
+driver, ``await_only`` switches back to the event loop greenlet, which awaits
+it and resumes the caller with the result. The caller looks blocking, but the
+event loop serves other requests while the query is in flight.
+
+Requires the optional ``greenlet`` package (requirements-async.txt).
+"""
+
+import sys
+from typing import Any, Awaitable, Callable
+
+try:
+    import greenlet
+except ImportError:  # pragma: no cover - optional dependency
+    greenlet = None
+
+
+def _require_greenlet() -> None:
+    if greenlet is None:
+        raise ImportError(
+            "The asyncio serving mode needs greenlet: pip install -r requirements-async.txt"
+        )
+
+
+if greenlet is not None:
+
+    class _BridgeGreenlet(greenlet.greenlet):
+        """Greenlet running synchronous code on behalf of a coroutine."""
+
+
+def in_bridge() -> bool:
+    """
+    Whether the caller runs inside a bridge greenlet.
+
+    Returns:
+        True if ``await_only`` can be used.
+    """
+    return greenlet is not None and isinstance(greenlet.getcurrent(), _BridgeGreenlet)
+
+
+def await_only(awaitable: Awaitable) -> Any:
+    """
+    Await from synchronous code running under ``greenlet_spawn``.
+
+    Args:
+        awaitable: Coroutine or future to await on the event loop.
+
+    Returns:
+        The awaited result.
+
+    Raises:
+        RuntimeError: If called outside ``greenlet_spawn``.
+    """
+    if not in_bridge():
+        if hasattr(awaitable, "close"):
+            awaitable.close()
+        raise RuntimeError("await_only() called outside of greenlet_spawn()")
+    return greenlet.getcurrent().parent.switch(awaitable)
+
+
+async def greenlet_spawn(fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run a synchronous callable, awaiting whatever it passes to ``await_only``.
+
+    Args:
+        fn: Synchronous callable.
+        *args: Positional arguments.
+        **kwargs: Keyword arguments.
+
+    Returns:
+        The callable's return value.
+    """
+    _require_greenlet()
+    child = _BridgeGreenlet(fn, parent=greenlet.getcurrent())
+    result = child.switch(*args, **kwargs)
+    while not child.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = child.throw(*sys.exc_info())
+        else:
+            result = child.switch(value)
+    return result
+
+
+def run_blocking(fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run CPU-heavy or blocking work without stalling the event loop.
+
+    Inside a bridge greenlet the callable runs in the loop's default thread
+    pool; elsewhere it is simply called.
+
+    Args:
+        fn: Callable.
+        *args: Positional arguments.
+        **kwargs: Keyword arguments.
+
+    Returns:
+        The callable's return value.
+    """
+    if not in_bridge():
+        return fn(*args, **kwargs)
+    import asyncio
+
+    return await_only(asyncio.to_thread(fn, *args, **kwargs))
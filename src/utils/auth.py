@@ -0,0 +1,48 @@
+"""Authorization utilities for SGHSS application."""
+
+from functools import wraps
+
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+
+from .response import ResponseFormatter
+
+
+def is_admin_request() -> bool:
+    """
+    Check whether the current request carries a valid admin token.
+
+    Never raises: a missing or invalid token simply means "not admin".
+
+    Returns:
+        True if the request is authenticated as an admin user.
+    """
+    try:
+        verify_jwt_in_request(optional=True)
+        return get_jwt().get("tipo") == "admin"
+    except Exception:
+        return False
+
+
+def admin_required(fn):
+    """
+    Restrict a view to authenticated admin users.
+
+    Args:
+        fn: View function to protect.
+
+    Returns:
+        Wrapped view function.
+    """
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        verify_jwt_in_request()
+        if get_jwt().get("tipo") != "admin":
+            return ResponseFormatter.error(
+                message="Admin access required",
+                error_code="FORBIDDEN",
+                status_code=403,
+            )
+        return fn(*args, **kwargs)
+
+    return wrapper
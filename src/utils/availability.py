@@ -0,0 +1,409 @@
+"""Busy-time bitsets per professional and day for SGHSS scheduling."""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .scheduling import SLOT_GRANULARITY_MINUTES
+
+# Each bit is one block of SLOT_GRANULARITY_MINUTES; bit 0 starts at midnight
+BLOCK = timedelta(minutes=SLOT_GRANULARITY_MINUTES)
+BLOCKS_PER_DAY = 24 * 60 // SLOT_GRANULARITY_MINUTES
+
+# (profissional_id, consulta_id, inicio, fim) as returned by a loader
+BusyRow = Tuple[int, int, datetime, datetime]
+Loader = Callable[[Sequence[int], date, date], Iterable[BusyRow]]
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def _block_floor(moment: datetime, base: datetime) -> int:
+    return (moment - base) // BLOCK
+
+
+def _block_ceil(moment: datetime, base: datetime) -> int:
+    return -((base - moment) // BLOCK)
+
+
+def span_mask(first: int, last: int, size: int) -> int:
+    """
+    Bits ``first`` up to ``last`` (exclusive), clipped to ``[0, size)``.
+
+    Args:
+        first: First block.
+        last: Block after the last one.
+        size: Number of blocks in the mask.
+
+    Returns:
+        The mask.
+    """
+    first, last = max(first, 0), min(last, size)
+    if first >= last:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+def busy_mask(intervals: Iterable[Tuple[datetime, datetime]], base: datetime, size: int) -> int:
+    """
+    Mark every block an interval touches.
+
+    Args:
+        intervals: Booked ``(start, end)`` pairs.
+        base: Moment of bit 0.
+        size: Number of blocks in the mask.
+
+    Returns:
+        Mask of busy blocks.
+    """
+    mask = 0
+    for start, end in intervals:
+        mask |= span_mask(_block_floor(start, base), _block_ceil(end, base), size)
+    return mask
+
+
+def window_mask(windows: Iterable[Tuple[datetime, datetime]], base: datetime, size: int) -> int:
+    """
+    Mark the blocks that lie entirely inside working windows.
+
+    Args:
+        windows: Working ``(start, end)`` pairs.
+        base: Moment of bit 0.
+        size: Number of blocks in the mask.
+
+    Returns:
+        Mask of working blocks.
+    """
+    mask = 0
+    for start, end in windows:
+        mask |= span_mask(_block_ceil(start, base), _block_floor(end, base), size)
+    return mask
+
+
+def runs_of(mask: int, length: int) -> int:
+    """
+    Bits where ``length`` consecutive set bits start.
+
+    Uses O(log length) shifts instead of one per block.
+
+    Args:
+        mask: Free blocks.
+        length: Run length in blocks.
+
+    Returns:
+        Mask of run starts.
+    """
+    width = 1
+    while width * 2 <= length:
+        mask &= mask >> width
+        width *= 2
+    if width < length:
+        mask &= mask >> (length - width)
+    return mask
+
+
+def slot_starts(mask: int, length: int) -> Iterator[int]:
+    """
+    Cut each run of free blocks into back-to-back slots.
+
+    Args:
+        mask: Free blocks.
+        length: Slot length in blocks.
+
+    Yields:
+        Start block of each slot, in order.
+    """
+    while mask:
+        start = (mask & -mask).bit_length() - 1
+        end = start + ((mask >> start) ^ ((mask >> start) + 1)).bit_length() - 1
+        for slot in range(start, end - length + 1, length):
+            yield slot
+        mask &= ~0 << end
+
+
+def blocks_for(duracao_minutos: int) -> int:
+    """Blocks needed to hold a consulta of this duration."""
+    return -(-duracao_minutos // SLOT_GRANULARITY_MINUTES)
+
+
+def day_masks(rows: Iterable[BusyRow], first: date, last: date) -> Dict[int, Dict[date, int]]:
+    """
+    Split booked intervals into one busy mask per professional and day.
+
+    Args:
+        rows: Booked consultas as ``(profissional_id, consulta_id, start, end)``.
+        first: First day.
+        last: Last day (inclusive).
+
+    Returns:
+        ``{profissional_id: {day: mask}}`` for days with bookings.
+    """
+    masks: Dict[int, Dict[date, int]] = {}
+    for profissional_id, _, start, end in rows:
+        day = max(start.date(), first)
+        while day <= min(end.date(), last):
+            mask = busy_mask([(start, end)], _midnight(day), BLOCKS_PER_DAY)
+            if mask:
+                per_day = masks.setdefault(profissional_id, {})
+                per_day[day] = per_day.get(day, 0) | mask
+            day += timedelta(days=1)
+    return masks
+
+
+def concat_days(per_day: Dict[date, int], first: date, days: int) -> int:
+    """
+    Join day masks into one mask starting at ``first``.
+
+    Args:
+        per_day: Busy mask per day.
+        first: Day of bit 0.
+        days: Number of days to join.
+
+    Returns:
+        The joined mask.
+    """
+    mask = 0
+    for offset in range(days):
+        mask |= per_day.get(first + timedelta(days=offset), 0) << (offset * BLOCKS_PER_DAY)
+    return mask
+
+
+def free_mask(
+    windows: Iterable[Tuple[datetime, datetime]],
+    per_day: Dict[date, int],
+    first: date,
+    days: int,
+    not_before: Optional[datetime] = None,
+) -> int:
+    """
+    Working blocks minus busy blocks over consecutive days.
+
+    Args:
+        windows: Working ``(start, end)`` pairs.
+        per_day: Busy mask per day.
+        first: Day of bit 0.
+        days: Number of days covered.
+        not_before: Blocks starting before this moment are left out.
+
+    Returns:
+        Mask of free blocks.
+    """
+    base = _midnight(first)
+    size = days * BLOCKS_PER_DAY
+    mask = window_mask(windows, base, size) & ~concat_days(per_day, first, days)
+    if not_before is not None:
+        mask &= ~span_mask(0, _block_ceil(not_before, base), size)
+    return mask
+
+
+def block_start(first: date, block: int) -> datetime:
+    """Moment a block of a mask starting at ``first`` begins."""
+    return _midnight(first) + block * BLOCK
+
+
+class _Day:
+    """Bookings of one professional on one day."""
+
+    __slots__ = ("day", "consultas", "mask", "loaded_at")
+
+    def __init__(
+        self, day: date, consultas: Dict[int, Tuple[datetime, datetime]], loaded_at: float
+    ):
+        self.day = day
+        self.consultas = consultas
+        self.loaded_at = loaded_at
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        self.mask = busy_mask(self.consultas.values(), _midnight(self.day), BLOCKS_PER_DAY)
+
+
+class AvailabilityCache:
+    """
+    Busy blocks per professional and day, kept as integer bitsets.
+
+    Days are loaded from the database on first use, one query for every
+    missing professional and day of a request, and then kept up to date by
+    ConsultaService as consultas are booked, moved, cancelled or deleted.
+    Each day also remembers its consultas so that removing one clears only
+    the blocks no other consulta still touches.
+
+    The cache is per process, so changes made by other workers only show
+    up after ``ttl_seconds``. It never decides whether a booking goes
+    through; ConsultaService always checks the database under a lock.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_days: int = 50000):
+        """
+        Initialize the availability cache.
+
+        Args:
+            ttl_seconds: Seconds a loaded day is trusted.
+            max_days: Professional-days kept before the least recently used
+                ones are dropped.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_days = max_days
+        self._days: "OrderedDict[Tuple[int, date], _Day]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+
+    def busy_masks(
+        self,
+        profissional_ids: Sequence[int],
+        first: date,
+        last: date,
+        loader: Loader,
+    ) -> Dict[int, Dict[date, int]]:
+        """
+        Get busy masks, loading missing days in one call to ``loader``.
+
+        Args:
+            profissional_ids: Professionals to look up.
+            first: First day.
+            last: Last day (inclusive).
+            loader: Returns booked consultas of the given professionals
+                that touch the given days.
+
+        Returns:
+            ``{profissional_id: {day: mask}}`` with every requested day.
+        """
+        days = [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+        now = time.monotonic()
+        result: Dict[int, Dict[date, int]] = {}
+        missing: Dict[int, List[date]] = {}
+        with self._lock:
+            for profissional_id in profissional_ids:
+                per_day = result.setdefault(profissional_id, {})
+                for day in days:
+                    entry = self._days.get((profissional_id, day))
+                    if entry is None or now - entry.loaded_at > self.ttl_seconds:
+                        missing.setdefault(profissional_id, []).append(day)
+                    else:
+                        self._days.move_to_end((profissional_id, day))
+                        per_day[day] = entry.mask
+            pending = sum(map(len, missing.values()))
+            self.hits += len(days) * len(profissional_ids) - pending
+            self.misses += pending
+            versions = {
+                profissional_id: self._versions.get(profissional_id, 0)
+                for profissional_id in missing
+            }
+
+        if not missing:
+            return result
+
+        load_first = min(min(pending) for pending in missing.values())
+        load_last = max(max(pending) for pending in missing.values())
+        loaded: Dict[Tuple[int, date], Dict[int, Tuple[datetime, datetime]]] = {
+            (profissional_id, day): {}
+            for profissional_id, pending in missing.items()
+            for day in pending
+        }
+        for profissional_id, consulta_id, start, end in loader(
+            list(missing), load_first, load_last
+        ):
+            for day in self._days_touched(start, end):
+                consultas = loaded.get((profissional_id, day))
+                if consultas is not None:
+                    consultas[consulta_id] = (start, end)
+
+        with self._lock:
+            for (profissional_id, day), consultas in loaded.items():
+                entry = _Day(day, consultas, now)
+                result[profissional_id][day] = entry.mask
+                # A booking committed while loading makes this snapshot stale
+                if self._versions.get(profissional_id, 0) == versions[profissional_id]:
+                    self._days[(profissional_id, day)] = entry
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+        return result
+
+    def add(self, profissional_id: int, consulta_id: int, start: datetime, end: datetime) -> None:
+        """
+        Record a booked consulta.
+
+        Args:
+            profissional_id: Professional ID.
+            consulta_id: Consulta ID.
+            start: Start of the consulta.
+            end: End of the consulta.
+        """
+        with self._lock:
+            self._bump(profissional_id)
+            for day in self._days_touched(start, end):
+                entry = self._days.get((profissional_id, day))
+                if entry is not None:
+                    entry.consultas[consulta_id] = (start, end)
+                    entry.mask |= busy_mask([(start, end)], _midnight(day), BLOCKS_PER_DAY)
+
+    def remove(
+        self, profissional_id: int, consulta_id: int, start: datetime, end: datetime
+    ) -> None:
+        """
+        Forget a consulta that was moved, cancelled or deleted.
+
+        Args:
+            profissional_id: Professional ID.
+            consulta_id: Consulta ID.
+            start: Previous start of the consulta.
+            end: Previous end of the consulta.
+        """
+        with self._lock:
+            self._bump(profissional_id)
+            for day in self._days_touched(start, end):
+                entry = self._days.get((profissional_id, day))
+                if entry is not None and entry.consultas.pop(consulta_id, None) is not None:
+                    entry.rebuild()
+
+    def invalidate(self, profissional_id: Optional[int] = None) -> None:
+        """
+        Drop cached days.
+
+        Args:
+            profissional_id: Only drop this professional's days; all if None.
+        """
+        with self._lock:
+            if profissional_id is None:
+                self._days.clear()
+                self._versions.clear()
+                return
+            self._bump(profissional_id)
+            for key in [key for key in self._days if key[0] == profissional_id]:
+                del self._days[key]
+
+    def status(self) -> dict:
+        """
+        Summarize cache usage.
+
+        Returns:
+            Size, limits and hit/miss/update counters.
+        """
+        with self._lock:
+            return {
+                "days": len(self._days),
+                "professionals": len({key[0] for key in self._days}),
+                "max_days": self.max_days,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "updates": self.updates,
+            }
+
+    def _bump(self, profissional_id: int) -> None:
+        self._versions[profissional_id] = self._versions.get(profissional_id, 0) + 1
+        self.updates += 1
+
+    @staticmethod
+    def _days_touched(start: datetime, end: datetime) -> Iterator[date]:
+        day = start.date()
+        last = (end - timedelta(microseconds=1)).date()
+        while day <= last:
+            yield day
+            day += timedelta(days=1)
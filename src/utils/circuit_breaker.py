@@ -0,0 +1,180 @@
+"""Circuit breaker for database connections in SGHSS application."""
+
+import logging
+import math
+import threading
+import time
+from typing import Optional
+
+from flask import Flask, g, has_request_context, request
+
+from ..exceptions import ServiceUnavailableError
+from .response import ResponseFormatter
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stops opening database connections while the server is unreachable.
+
+    After ``failure_threshold`` consecutive connect failures the circuit
+    opens and connections fail immediately with ServiceUnavailableError
+    instead of waiting for the driver's connect timeout. Once
+    ``reset_timeout`` seconds have passed the circuit is half-open: up to
+    ``half_open_probes`` connects go through, and the first success closes
+    the circuit while a failure opens it again.
+
+    Services wrap driver errors in DatabaseError, so a request that fails
+    with 500 after being rejected by the breaker is answered with 503 and a
+    ``Retry-After`` header instead.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 5.0,
+        half_open_probes: int = 1,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive connect failures that open the circuit.
+            reset_timeout: Seconds the circuit stays open before probing.
+            half_open_probes: Connects allowed at once while half-open.
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = max(1, half_open_probes)
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probes = 0
+        self._rejected = 0
+        self._last_error: Optional[str] = None
+        self._changed_at = time.time()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register the response hook on the application.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["circuit_breaker"] = self
+        app.after_request(self._after_request)
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the timeout passed."""
+        with self._lock:
+            return self._current_state()
+
+    def before_connect(self) -> None:
+        """
+        Reserve the right to open a connection.
+
+        Raises:
+            ServiceUnavailableError: If the circuit is open, or half-open with
+                every probe slot taken.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return
+            self._rejected += 1
+            retry_after = self._retry_after()
+        if has_request_context():
+            g._circuit_rejected = retry_after
+        raise ServiceUnavailableError("Database temporarily unavailable", retry_after=retry_after)
+
+    def record_success(self) -> None:
+        """Record a successful connect, closing the circuit if it was probing."""
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+                logger.info("Database circuit closed")
+
+    def record_failure(self, err: Exception) -> None:
+        """
+        Record a failed connect.
+
+        Args:
+            err: Error raised by the driver.
+        """
+        with self._lock:
+            self._failures += 1
+            self._last_error = str(err)
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                reopened = self._state != CLOSED
+                self._transition(OPEN)
+                self._opened_at = time.monotonic()
+                action = "reopened" if reopened else "opened"
+                logger.error(
+                    f"Database circuit {action} after {self._failures} failed connects: {err}"
+                )
+
+    def status(self) -> dict:
+        """
+        Summarize the breaker from its in-memory state.
+
+        Returns:
+            State, failure count, rejections and the last connect error.
+        """
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "rejected": self._rejected,
+                "retry_after": self._retry_after() if state == OPEN else None,
+                "last_error": self._last_error,
+                "since": self._changed_at,
+            }
+
+    def _current_state(self) -> str:
+        if (
+            self._state == OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str) -> None:
+        self._state = state
+        self._probes = 0
+        self._changed_at = time.time()
+        if state == CLOSED:
+            self._opened_at = None
+
+    def _retry_after(self) -> int:
+        if self._opened_at is None:
+            return 1
+        left = self.reset_timeout - (time.monotonic() - self._opened_at)
+        return max(1, math.ceil(left))
+
+    def _after_request(self, response):
+        retry_after = g.pop("_circuit_rejected", None)
+        if retry_after is None or response.status_code < 500:
+            return response
+        if response.status_code == 500:
+            logger.warning(f"{request.method} {request.path} rejected by the database circuit")
+            response, status_code = ResponseFormatter.error(
+                message="Database temporarily unavailable",
+                error_code="SERVICE_UNAVAILABLE",
+                status_code=503,
+            )
+            response.status_code = status_code
+        response.headers["Retry-After"] = str(retry_after)
+        return response
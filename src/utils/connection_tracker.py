@@ -0,0 +1,317 @@
+"""Connection checkout tracking for SGHSS application."""
+
+import contextlib
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, List, Optional
+
+from flask import has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+# Frames of the checkout machinery itself are left out of recorded stacks
+_SKIPPED_FILES = (
+    os.path.normcase(os.path.abspath(__file__)),
+    os.path.normcase(os.path.join(os.path.dirname(__file__), "..", "config", "database.py")),
+    os.path.normcase(contextlib.__file__),
+)
+
+# Current holders are checked for long holds at most this often
+SCAN_INTERVAL_SECONDS = 1.0
+
+
+def _capture_stack(depth: int) -> traceback.StackSummary:
+    frames = (
+        (frame, lineno)
+        for frame, lineno in traceback.walk_stack(sys._getframe(2))
+        if os.path.normcase(os.path.abspath(frame.f_code.co_filename)) not in _SKIPPED_FILES
+    )
+    # Source lines are only read when a stack is reported
+    return traceback.StackSummary.extract(frames, limit=depth, lookup_lines=False)
+
+
+class ConnectionHolder:
+    """One checked-out connection and who holds it."""
+
+    def __init__(self, holder_id: int, connection, stack: traceback.StackSummary):
+        """
+        Initialize the holder record.
+
+        Args:
+            holder_id: Checkout sequence number.
+            connection: Checked-out connection.
+            stack: Stack of the code that checked it out.
+        """
+        self.id = holder_id
+        self.connection = connection
+        self.stack = stack
+        self.thread = threading.current_thread().name
+        self.endpoint: Optional[str] = None
+        self.request: Optional[str] = None
+        if has_request_context():
+            self.endpoint = request.endpoint
+            self.request = f"{request.method} {request.path}"
+        self.checked_out_at = time.monotonic()
+        self.checked_out_wall = time.time()
+        self.last_statement_at: Optional[float] = None
+        self.statements = 0
+        self.warned = set()
+
+    def age(self, now: Optional[float] = None) -> float:
+        """Seconds since checkout."""
+        return (now or time.monotonic()) - self.checked_out_at
+
+    def in_transaction(self) -> bool:
+        """Whether the connection has an open transaction, if the driver can tell."""
+        try:
+            return bool(getattr(self.connection, "in_transaction", False))
+        except Exception:
+            return False
+
+    def idle_in_transaction(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds since the last statement while a transaction is open, else None."""
+        if self.last_statement_at is None or not self.in_transaction():
+            return None
+        return (now or time.monotonic()) - self.last_statement_at
+
+    def format_stack(self) -> List[str]:
+        """Checkout stack, innermost call last."""
+        return [
+            f"{frame.filename}:{frame.lineno} in {frame.name}" for frame in reversed(self.stack)
+        ]
+
+    def to_dict(self, now: Optional[float] = None) -> dict:
+        """Summarize the holder."""
+        now = now or time.monotonic()
+        idle = self.idle_in_transaction(now)
+        return {
+            "id": self.id,
+            "thread": self.thread,
+            "endpoint": self.endpoint,
+            "request": self.request,
+            "checked_out_at": self.checked_out_wall,
+            "held_seconds": round(self.age(now), 3),
+            "statements": self.statements,
+            "in_transaction": self.in_transaction(),
+            "idle_in_transaction_seconds": None if idle is None else round(idle, 3),
+            "stack": self.format_stack(),
+        }
+
+
+class ConnectionTracker:
+    """
+    Records who holds each database connection and for how long.
+
+    Every checkout keeps its stack (without source lines, so it stays
+    cheap), thread and endpoint. A warning with that stack is logged when a
+    connection is held longer than ``hold_warning_seconds`` or when a
+    transaction stays open for more than ``idle_transaction_seconds``
+    between statements, which means slow non-database work ran while it
+    kept its locks. Holders are checked when they return their connection,
+    on their next statement, and by a scan that later checkouts run at most
+    once a second, so leaked connections are reported too.
+    """
+
+    def __init__(
+        self,
+        hold_warning_seconds: float = 5.0,
+        idle_transaction_seconds: float = 1.0,
+        stack_depth: int = 12,
+    ):
+        """
+        Initialize the connection tracker.
+
+        Args:
+            hold_warning_seconds: Checkout duration that triggers a warning.
+            idle_transaction_seconds: Time a transaction may stay open
+                between statements before a warning.
+            stack_depth: Frames kept per checkout.
+        """
+        self.hold_warning_seconds = hold_warning_seconds
+        self.idle_transaction_seconds = idle_transaction_seconds
+        self.stack_depth = stack_depth
+        self._holders = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._next_scan = 0.0
+        self.checkouts = 0
+        self.long_holds = 0
+        self.idle_transactions = 0
+
+    def checkout(self, connection) -> ConnectionHolder:
+        """
+        Record a connection checkout.
+
+        Args:
+            connection: Connection handed to the caller.
+
+        Returns:
+            Holder record to pass to ``statement`` and ``checkin``.
+        """
+        holder = ConnectionHolder(next(self._ids), connection, _capture_stack(self.stack_depth))
+        with self._lock:
+            self._holders[holder.id] = holder
+            self.checkouts += 1
+        if holder.checked_out_at >= self._next_scan:
+            self._next_scan = holder.checked_out_at + SCAN_INTERVAL_SECONDS
+            self.scan()
+        return holder
+
+    def statement(self, holder: ConnectionHolder) -> None:
+        """
+        Record that a statement is about to run on a connection.
+
+        Args:
+            holder: Holder from ``checkout``.
+        """
+        now = time.monotonic()
+        idle = holder.idle_in_transaction(now)
+        if idle is not None and idle > self.idle_transaction_seconds:
+            self._warn(
+                holder,
+                "idle_transaction",
+                f"Transaction stayed open {idle:.2f}s between statements",
+                current_stack=_capture_stack(self.stack_depth),
+            )
+        holder.last_statement_at = now
+        holder.statements += 1
+
+    def statement_done(self, holder: ConnectionHolder) -> None:
+        """
+        Record that a statement finished.
+
+        Args:
+            holder: Holder from ``checkout``.
+        """
+        holder.last_statement_at = time.monotonic()
+
+    def checkin(self, holder: ConnectionHolder) -> None:
+        """
+        Record a connection being returned.
+
+        Args:
+            holder: Holder from ``checkout``.
+        """
+        with self._lock:
+            self._holders.pop(holder.id, None)
+        held = holder.age()
+        if held > self.hold_warning_seconds:
+            self._warn(holder, "long_hold", f"Connection held for {held:.2f}s")
+
+    def scan(self) -> None:
+        """Warn about current holders past their thresholds."""
+        now = time.monotonic()
+        with self._lock:
+            holders = list(self._holders.values())
+        for holder in holders:
+            held = holder.age(now)
+            if held > self.hold_warning_seconds:
+                self._warn(holder, "long_hold", f"Connection still held after {held:.2f}s")
+            idle = holder.idle_in_transaction(now)
+            if idle is not None and idle > self.idle_transaction_seconds:
+                self._warn(
+                    holder, "idle_transaction", f"Transaction idle for {idle:.2f}s"
+                )
+
+    def holders(self, min_seconds: float = 0.0) -> List[dict]:
+        """
+        List the connections currently checked out, longest held first.
+
+        Args:
+            min_seconds: Only include connections held at least this long.
+
+        Returns:
+            One dictionary per holder.
+        """
+        now = time.monotonic()
+        with self._lock:
+            holders = list(self._holders.values())
+        holders.sort(key=lambda holder: holder.checked_out_at)
+        return [holder.to_dict(now) for holder in holders if holder.age(now) >= min_seconds]
+
+    def status(self, min_seconds: float = 0.0) -> dict:
+        """
+        Summarize tracking counters and current holders.
+
+        Args:
+            min_seconds: Only include connections held at least this long.
+
+        Returns:
+            Thresholds, counters and holders.
+        """
+        holders = self.holders(min_seconds)
+        return {
+            "hold_warning_seconds": self.hold_warning_seconds,
+            "idle_transaction_seconds": self.idle_transaction_seconds,
+            "checkouts": self.checkouts,
+            "long_holds": self.long_holds,
+            "idle_transactions": self.idle_transactions,
+            "held": len(self._holders),
+            "holders": holders,
+        }
+
+    def _warn(
+        self,
+        holder: ConnectionHolder,
+        kind: str,
+        message: str,
+        current_stack: Optional[traceback.StackSummary] = None,
+    ) -> None:
+        if kind in holder.warned:
+            return
+        holder.warned.add(kind)
+        with self._lock:
+            if kind == "long_hold":
+                self.long_holds += 1
+            else:
+                self.idle_transactions += 1
+        where = f" by {holder.request}" if holder.request else f" in thread {holder.thread}"
+        stack = "".join(holder.stack.format()).rstrip()
+        details = f"{message} (connection #{holder.id}{where}); checked out at:\n{stack}"
+        if current_stack is not None:
+            details += "\nnext statement issued at:\n" + "".join(current_stack.format()).rstrip()
+        logger.warning(details)
+
+
+class TrackedCursor:
+    """Cursor wrapper reporting statement boundaries to a ConnectionTracker."""
+
+    def __init__(self, cursor, tracker: ConnectionTracker, holder: ConnectionHolder):
+        """
+        Initialize the tracked cursor.
+
+        Args:
+            cursor: Database cursor to wrap.
+            tracker: Connection tracker.
+            holder: Holder of the cursor's connection.
+        """
+        self._cursor = cursor
+        self._tracker = tracker
+        self._holder = holder
+
+    def execute(self, operation: str, params: Any = None, *args, **kwargs):
+        """Execute a statement."""
+        self._tracker.statement(self._holder)
+        try:
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            self._tracker.statement_done(self._holder)
+
+    def executemany(self, operation: str, seq_params: Any, *args, **kwargs):
+        """Execute a statement for every parameter set."""
+        self._tracker.statement(self._holder)
+        try:
+            return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        finally:
+            self._tracker.statement_done(self._holder)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
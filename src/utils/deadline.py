@@ -0,0 +1,250 @@
+"""Request deadlines and statement time limits for SGHSS application."""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Generator, Optional
+
+from flask import Flask, g, request
+
+from ..exceptions import DeadlineExceededError
+from .response import ResponseFormatter
+
+logger = logging.getLogger(__name__)
+
+# Callers may shorten (never extend) the endpoint's budget with this header
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+
+# Budgets in milliseconds by endpoint or blueprint name; 0 means no deadline
+DEFAULT_DEADLINES = {
+    "auth.health_check": 1000,
+    "admin": 60000,
+}
+
+# Below this budget a statement is not worth starting
+MIN_STATEMENT_BUDGET_MS = 1
+
+_deadline: ContextVar[Optional[float]] = ContextVar("sghss_deadline", default=None)
+
+
+def parse_deadlines(value: str) -> Dict[str, float]:
+    """
+    Parse per-endpoint deadline overrides.
+
+    Args:
+        value: Comma-separated ``name=milliseconds`` pairs, where name is an
+            endpoint (``consultas.listar_consultas``) or a blueprint (``admin``).
+
+    Returns:
+        Mapping of endpoint or blueprint name to milliseconds.
+
+    Raises:
+        ValueError: If a pair is malformed.
+    """
+    deadlines = {}
+    for pair in filter(None, (item.strip() for item in value.split(","))):
+        name, _, milliseconds = pair.partition("=")
+        try:
+            budget = float(milliseconds)
+        except ValueError:
+            budget = -1
+        if not name.strip() or budget < 0:
+            raise ValueError(f"Invalid deadline: {pair!r}")
+        deadlines[name.strip()] = budget
+    return deadlines
+
+
+def remaining() -> Optional[float]:
+    """
+    Get the time left before the current deadline.
+
+    Returns:
+        Seconds left (negative once expired), or None without a deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """
+    Whether the current deadline has passed.
+
+    Returns:
+        True if a deadline is set and has passed.
+    """
+    budget = remaining()
+    return budget is not None and budget <= 0
+
+
+def check_deadline() -> None:
+    """
+    Fail fast once the current deadline has passed.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed.
+    """
+    if expired():
+        raise DeadlineExceededError()
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Generator:
+    """
+    Run a block under a deadline.
+
+    An enclosing deadline that expires sooner is kept.
+
+    Args:
+        seconds: Budget for the block, or None for no new deadline.
+    """
+    current = _deadline.get()
+    if seconds is not None:
+        new_deadline = time.monotonic() + seconds
+        if current is None or new_deadline < current:
+            current = new_deadline
+    token = _deadline.set(current)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+class DeadlineCursor:
+    """
+    Cursor wrapper deriving each statement's time limit from the deadline.
+
+    The limit is applied through the backend (a MAX_EXECUTION_TIME hint on
+    MySQL, a progress handler on SQLite). Statements started after the
+    deadline fail without reaching the database, and driver timeouts are
+    raised as DeadlineExceededError.
+    """
+
+    def __init__(self, cursor, connection, backend):
+        """
+        Initialize the deadline cursor.
+
+        Args:
+            cursor: Database cursor to wrap.
+            connection: Connection the cursor belongs to.
+            backend: Backend applying the time limits.
+        """
+        self._cursor = cursor
+        self._connection = connection
+        self._backend = backend
+        self._limited = False
+
+    def execute(self, operation: str, params: Any = None, *args, **kwargs):
+        """Execute a statement within the remaining budget."""
+        return self._run(self._cursor.execute, operation, params, *args, **kwargs)
+
+    def executemany(self, operation: str, seq_params: Any, *args, **kwargs):
+        """Execute a statement for every parameter set within the remaining budget."""
+        return self._run(self._cursor.executemany, operation, seq_params, *args, **kwargs)
+
+    def close(self):
+        """Close the cursor and remove the connection's time limit."""
+        try:
+            return self._cursor.close()
+        finally:
+            if self._limited:
+                self._backend.clear_statement_limit(self._connection)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+    def _run(self, method, operation: str, *args, **kwargs):
+        budget = remaining()
+        if budget is not None:
+            timeout_ms = int(budget * 1000)
+            if timeout_ms < MIN_STATEMENT_BUDGET_MS:
+                raise DeadlineExceededError()
+            operation = self._backend.limit_statement(self._connection, operation, timeout_ms)
+            self._limited = True
+        try:
+            return method(operation, *args, **kwargs)
+        except self._backend.errors as err:
+            if budget is not None and self._backend.is_timeout(err):
+                logger.warning(f"Statement cancelled at request deadline: {err}")
+                raise DeadlineExceededError() from err
+            raise
+
+
+class RequestDeadlines:
+    """
+    Gives every request a time budget shared by all of its statements.
+
+    The budget comes from the endpoint, else its blueprint, else the default,
+    and a caller may shorten it with the ``X-Request-Timeout-Ms`` header.
+    Services wrap driver errors in DatabaseError, so a request that fails with
+    500 after its deadline passed is answered with 504 instead.
+    """
+
+    def __init__(self, default_ms: float = 10000, deadlines: Optional[Dict[str, float]] = None):
+        """
+        Initialize request deadlines.
+
+        Args:
+            default_ms: Budget for endpoints without their own; 0 disables it.
+            deadlines: Budgets by endpoint or blueprint name.
+        """
+        self.default_ms = default_ms
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register request hooks on the application.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["deadlines"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    def budget_ms(self, endpoint: str) -> float:
+        """
+        Get the budget of an endpoint.
+
+        Args:
+            endpoint: Flask endpoint name (``blueprint.view``).
+
+        Returns:
+            Milliseconds, 0 for no deadline.
+        """
+        if endpoint in self.deadlines:
+            return self.deadlines[endpoint]
+        blueprint = endpoint.rpartition(".")[0]
+        return self.deadlines.get(blueprint, self.default_ms)
+
+    def _before_request(self) -> None:
+        if request.endpoint is None:
+            return
+        budget = self.budget_ms(request.endpoint)
+        requested = request.headers.get(DEADLINE_HEADER, type=float)
+        if requested is not None and requested > 0:
+            budget = min(budget, requested) if budget else requested
+        if budget:
+            g._deadline_token = _deadline.set(time.monotonic() + budget / 1000)
+
+    def _after_request(self, response):
+        if response.status_code == 500 and expired():
+            logger.warning(f"{request.method} {request.path} exceeded its deadline")
+            response, status_code = ResponseFormatter.error(
+                message="Request deadline exceeded",
+                error_code="DEADLINE_EXCEEDED",
+                status_code=504,
+            )
+            response.status_code = status_code
+        return response
+
+    def _teardown_request(self, exc=None) -> None:
+        token = g.pop("_deadline_token", None)
+        if token is not None:
+            _deadline.reset(token)
@@ -0,0 +1,334 @@
+"""Memory profiling utilities for SGHSS application."""
+
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from flask import Flask, g, request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FILTERS = (
+    os.path.join("src", "services"),
+    os.path.join("src", "routes"),
+)
+
+
+def current_rss_bytes() -> int:
+    """
+    Get the current resident set size of the process.
+
+    Falls back to the peak RSS on platforms without /proc.
+
+    Returns:
+        Resident set size in bytes.
+    """
+    try:
+        with open("/proc/self/statm", "r") as handle:
+            return int(handle.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """
+    Get the peak resident set size of the process.
+
+    Returns:
+        Peak resident set size in bytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryProfiler:
+    """
+    Controls tracemalloc snapshots and tracks RSS per endpoint.
+
+    Snapshots are kept in memory by identifier so two of them can be diffed
+    and grouped by file and line, restricted to the application modules.
+    """
+
+    def __init__(self, nframes: int = 10, max_snapshots: int = 10):
+        """
+        Initialize the memory profiler.
+
+        Args:
+            nframes: Number of frames stored per traced allocation.
+            max_snapshots: Number of snapshots kept before the oldest is dropped.
+        """
+        self.nframes = nframes
+        self.max_snapshots = max_snapshots
+        self._snapshots: Dict[int, dict] = {}
+        self._next_id = 1
+        self._endpoints: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register request hooks that track RSS per endpoint.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["memory_profiler"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    @property
+    def tracing(self) -> bool:
+        """Whether tracemalloc is currently tracing allocations."""
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        """Start tracing allocations."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            logger.info(f"tracemalloc started ({self.nframes} frames)")
+
+    def stop(self) -> None:
+        """Stop tracing allocations and drop stored snapshots."""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc stopped")
+        with self._lock:
+            self._snapshots.clear()
+
+    def take_snapshot(self) -> dict:
+        """
+        Take a tracemalloc snapshot.
+
+        Returns:
+            Snapshot description.
+
+        Raises:
+            RuntimeError: If tracemalloc is not tracing.
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc is not running")
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            )
+        )
+        traced, peak = tracemalloc.get_traced_memory()
+
+        with self._lock:
+            snapshot_id = self._next_id
+            self._next_id += 1
+            self._snapshots[snapshot_id] = {
+                "snapshot": snapshot,
+                "taken_at": time.time(),
+                "traced_bytes": traced,
+                "traced_peak_bytes": peak,
+                "rss_bytes": current_rss_bytes(),
+            }
+            while len(self._snapshots) > self.max_snapshots:
+                del self._snapshots[min(self._snapshots)]
+
+        return self._describe(snapshot_id)
+
+    def list_snapshots(self) -> List[dict]:
+        """
+        List stored snapshots.
+
+        Returns:
+            List of snapshot descriptions.
+        """
+        with self._lock:
+            ids = sorted(self._snapshots)
+        return [self._describe(snapshot_id) for snapshot_id in ids]
+
+    def diff(
+        self,
+        from_id: int,
+        to_id: int,
+        limit: int = 20,
+        filters: Optional[tuple] = DEFAULT_FILTERS,
+    ) -> List[dict]:
+        """
+        Diff two snapshots grouped by file and line.
+
+        Args:
+            from_id: Identifier of the older snapshot.
+            to_id: Identifier of the newer snapshot.
+            limit: Number of allocation sites to return.
+            filters: Path fragments an allocation site must contain; None for all.
+
+        Returns:
+            Top allocation sites ordered by size growth.
+
+        Raises:
+            KeyError: If a snapshot identifier is unknown.
+        """
+        with self._lock:
+            older = self._snapshots[from_id]["snapshot"]
+            newer = self._snapshots[to_id]["snapshot"]
+
+        stats = newer.compare_to(older, "traceback")
+        return self._format_stats(stats, limit, filters, diff=True)
+
+    def top(
+        self,
+        snapshot_id: int,
+        limit: int = 20,
+        filters: Optional[tuple] = DEFAULT_FILTERS,
+    ) -> List[dict]:
+        """
+        List the top allocation sites of a single snapshot.
+
+        Args:
+            snapshot_id: Snapshot identifier.
+            limit: Number of allocation sites to return.
+            filters: Path fragments an allocation site must contain; None for all.
+
+        Returns:
+            Top allocation sites ordered by size.
+
+        Raises:
+            KeyError: If the snapshot identifier is unknown.
+        """
+        with self._lock:
+            snapshot = self._snapshots[snapshot_id]["snapshot"]
+        return self._format_stats(snapshot.statistics("traceback"), limit, filters)
+
+    def endpoint_report(self) -> List[dict]:
+        """
+        Get RSS observed around requests, per endpoint.
+
+        Growth is measured between the start and the end of each request, so
+        concurrent requests in the same worker can inflate it.
+
+        Returns:
+            Endpoints ordered by peak RSS.
+        """
+        with self._lock:
+            report = [dict(endpoint=name, **values) for name, values in self._endpoints.items()]
+        report.sort(key=lambda item: item["peak_rss_bytes"], reverse=True)
+        return report
+
+    def profile_requests(
+        self,
+        app: Flask,
+        path: str,
+        method: str = "GET",
+        requests: int = 100,
+        headers: Optional[dict] = None,
+        json: Optional[dict] = None,
+        limit: int = 20,
+        filters: Optional[tuple] = DEFAULT_FILTERS,
+    ) -> dict:
+        """
+        Replay a request in-process and diff allocations before and after.
+
+        Args:
+            app: Flask application instance.
+            path: Request path.
+            method: HTTP method.
+            requests: Number of times the request is issued.
+            headers: Request headers.
+            json: JSON request body.
+            limit: Number of allocation sites to return.
+            filters: Path fragments an allocation site must contain; None for all.
+
+        Returns:
+            Dictionary with snapshots, status codes and the allocation diff.
+        """
+        was_tracing = tracemalloc.is_tracing()
+        self.start()
+        try:
+            client = app.test_client()
+            # Warm up caches and lazy imports so they do not show up as growth
+            client.open(path, method=method, headers=headers, json=json)
+            before = self.take_snapshot()
+            status_codes: Dict[int, int] = {}
+            for _ in range(requests):
+                response = client.open(path, method=method, headers=headers, json=json)
+                status_codes[response.status_code] = status_codes.get(response.status_code, 0) + 1
+            after = self.take_snapshot()
+            return {
+                "before": before,
+                "after": after,
+                "status_codes": status_codes,
+                "allocations": self.diff(before["id"], after["id"], limit, filters),
+                "endpoints": self.endpoint_report(),
+            }
+        finally:
+            if not was_tracing:
+                self.stop()
+
+    def _before_request(self) -> None:
+        g._rss_before = current_rss_bytes()
+
+    def _after_request(self, response):
+        endpoint = request.endpoint or "unknown"
+        rss = current_rss_bytes()
+        growth = rss - g.pop("_rss_before", rss)
+        with self._lock:
+            entry = self._endpoints.setdefault(
+                endpoint,
+                {
+                    "requests": 0,
+                    "peak_rss_bytes": 0,
+                    "last_rss_bytes": 0,
+                    "max_growth_bytes": 0,
+                },
+            )
+            entry["requests"] += 1
+            entry["last_rss_bytes"] = rss
+            entry["peak_rss_bytes"] = max(entry["peak_rss_bytes"], rss)
+            entry["max_growth_bytes"] = max(entry["max_growth_bytes"], growth)
+        return response
+
+    def _describe(self, snapshot_id: int) -> dict:
+        """Build the public description of a stored snapshot."""
+        with self._lock:
+            data = self._snapshots[snapshot_id]
+        return {
+            "id": snapshot_id,
+            "taken_at": data["taken_at"],
+            "traced_bytes": data["traced_bytes"],
+            "traced_peak_bytes": data["traced_peak_bytes"],
+            "rss_bytes": data["rss_bytes"],
+        }
+
+    @staticmethod
+    def _format_stats(stats, limit: int, filters: Optional[tuple], diff: bool = False):
+        """
+        Group traceback statistics by the innermost frame matching the filters.
+
+        Allocations made inside libraries (mysql.connector rows, jsonify buffers)
+        are attributed to the service or route line that triggered them.
+        """
+        grouped: Dict[tuple, dict] = {}
+        for stat in stats:
+            site = None
+            for frame in reversed(stat.traceback):
+                if not filters or any(fragment in frame.filename for fragment in filters):
+                    site = (frame.filename, frame.lineno)
+                    break
+            if site is None:
+                continue
+
+            item = grouped.setdefault(
+                site,
+                {"file": site[0], "line": site[1], "size_bytes": 0, "count": 0},
+            )
+            item["size_bytes"] += stat.size
+            item["count"] += stat.count
+            if diff:
+                item["size_diff_bytes"] = item.get("size_diff_bytes", 0) + stat.size_diff
+                item["count_diff"] = item.get("count_diff", 0) + stat.count_diff
+
+        sort_key = "size_diff_bytes" if diff else "size_bytes"
+        report = sorted(grouped.values(), key=lambda item: abs(item[sort_key]), reverse=True)
+        return report[:limit]
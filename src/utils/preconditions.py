@@ -0,0 +1,34 @@
+"""Conditional request helpers for SGHSS application."""
+
+from typing import Optional
+
+from flask import request
+
+from ..exceptions import PreconditionFailedError, ValidationError
+
+
+def if_match_version() -> Optional[int]:
+    """
+    Read the row version a client expects from the ``If-Match`` header.
+
+    Responses carry the row version as a strong ``ETag`` (``"3"``), so
+    ``If-Match: "3"`` makes an update apply only while the row is still at
+    version 3. ``If-Match: *`` or no header leaves the update unconditional.
+
+    Returns:
+        The expected version, or None when the update is unconditional.
+
+    Raises:
+        ValidationError: If the header lists more than one ETag.
+        PreconditionFailedError: If the ETag cannot match any version.
+    """
+    etags = request.if_match
+    if not etags or etags.star_tag:
+        return None
+    if len(etags.as_set(include_weak=True)) > 1:
+        raise ValidationError("If-Match must hold a single ETag")
+    # Weak ETags never match under the strong comparison If-Match requires
+    (etag,) = etags.as_set() or ("",)
+    if not etag.isdigit():
+        raise PreconditionFailedError("If-Match does not match the current version")
+    return int(etag)
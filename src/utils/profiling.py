@@ -0,0 +1,284 @@
+"""On-demand request profiling for SGHSS application."""
+
+import cProfile
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from typing import List, Optional
+
+from flask import Flask, g, request
+
+from .auth import is_admin_request
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_ARG = "__profile"
+PROFILE_MODES = ("cprofile", "sample")
+
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def collapse_frame(frame) -> str:
+    """
+    Collapse a frame and its callers into a flamegraph stack line.
+
+    Args:
+        frame: Innermost Python frame.
+
+    Returns:
+        Semicolon-separated stack, outermost frame first.
+    """
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        parts.append(f"{module}:{code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    parts.reverse()
+    return ";".join(parts)
+
+
+def write_collapsed(path: str, stacks: Counter) -> None:
+    """
+    Write collapsed stacks in the format consumed by flamegraph.pl/speedscope.
+
+    Args:
+        path: Output file path.
+        stacks: Counter of collapsed stack lines.
+    """
+    with open(path, "w", encoding="utf-8") as handle:
+        for stack, count in stacks.most_common():
+            handle.write(f"{stack} {count}\n")
+
+
+class RateLimiter:
+    """Sliding-window limiter allowing at most N events per minute."""
+
+    def __init__(self, max_per_minute: int):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_per_minute: Maximum number of events accepted per minute.
+        """
+        self.max_per_minute = max_per_minute
+        self._events = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """
+        Record an event if the limit allows it.
+
+        Returns:
+            True if the event is allowed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._events and now - self._events[0] >= 60:
+                self._events.popleft()
+            if len(self._events) >= self.max_per_minute:
+                return False
+            self._events.append(now)
+            return True
+
+
+class ThreadSampler:
+    """Samples the stack of a single thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Initialize the thread sampler.
+
+        Args:
+            thread_id: Identifier of the thread to sample.
+            interval: Seconds between samples.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="sghss-request-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """
+        Stop sampling.
+
+        Returns:
+            Counter of collapsed stacks.
+        """
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_frame(frame)] += 1
+
+
+class RequestProfiler:
+    """
+    Profiles single requests on demand.
+
+    A request is profiled only when it asks for it (``X-Profile`` header or
+    ``__profile`` query argument), carries a valid admin JWT and the per-minute
+    budget is not exhausted. Anything else is served normally, without any hint
+    that profiling exists.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "profiles",
+        max_per_minute: int = 5,
+        sample_interval_ms: float = 5.0,
+    ):
+        """
+        Initialize the request profiler.
+
+        Args:
+            output_dir: Directory where profiles are stored.
+            max_per_minute: Maximum profiled requests per minute.
+            sample_interval_ms: Interval of the sampling mode.
+        """
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval_ms / 1000.0
+        self.rate_limiter = RateLimiter(max_per_minute)
+        # cProfile hooks are process-wide state; never run two at once
+        self._busy = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register request hooks on the application.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["request_profiler"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    def list_profiles(self) -> List[dict]:
+        """
+        List stored profiles, newest first.
+
+        Returns:
+            List of profile descriptions.
+        """
+        if not os.path.isdir(self.output_dir):
+            return []
+        profiles = []
+        for name in os.listdir(self.output_dir):
+            path = os.path.join(self.output_dir, name)
+            if os.path.isfile(path):
+                stat = os.stat(path)
+                profiles.append(
+                    {"id": name, "size": stat.st_size, "created_at": stat.st_mtime}
+                )
+        profiles.sort(key=lambda item: item["created_at"], reverse=True)
+        return profiles
+
+    def get_profile_path(self, profile_id: str) -> Optional[str]:
+        """
+        Resolve a stored profile identifier to a file path.
+
+        Args:
+            profile_id: Profile identifier (file name).
+
+        Returns:
+            Absolute file path or None if it does not exist.
+        """
+        if profile_id != os.path.basename(profile_id):
+            return None
+        path = os.path.abspath(os.path.join(self.output_dir, profile_id))
+        return path if os.path.isfile(path) else None
+
+    def _requested_mode(self) -> Optional[str]:
+        """Get the profiling mode requested by the current request."""
+        value = request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_QUERY_ARG)
+        if not value:
+            return None
+        value = value.lower()
+        return value if value in PROFILE_MODES else "cprofile"
+
+    def _before_request(self) -> None:
+        mode = self._requested_mode()
+        if mode is None or not is_admin_request():
+            return
+        if not self.rate_limiter.try_acquire():
+            logger.warning("Profiling request rejected: rate limit reached")
+            return
+        if not self._busy.acquire(blocking=False):
+            logger.warning("Profiling request rejected: another profile is running")
+            return
+
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = ThreadSampler(threading.get_ident(), self.sample_interval)
+            profiler.start()
+        g._request_profile = (mode, profiler, time.perf_counter())
+
+    def _after_request(self, response):
+        profile = g.pop("_request_profile", None)
+        if profile is None:
+            return response
+
+        try:
+            profile_id = self._finish(*profile)
+            response.headers["X-Profile-Id"] = profile_id
+        except Exception as err:
+            logger.error(f"Error storing request profile: {err}")
+        return response
+
+    def _teardown_request(self, error=None) -> None:
+        # Only reached with a live profile when the request failed before after_request
+        profile = g.pop("_request_profile", None)
+        if profile is not None:
+            try:
+                self._finish(*profile)
+            except Exception as err:
+                logger.error(f"Error storing request profile: {err}")
+
+    def _finish(self, mode: str, profiler, started: float) -> str:
+        """Stop a running profile and store it, returning its identifier."""
+        try:
+            if mode == "cprofile":
+                profiler.disable()
+            else:
+                stacks = profiler.stop()
+        finally:
+            self._busy.release()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        endpoint = _SAFE_NAME_RE.sub("_", request.endpoint or "unknown")
+        extension = "prof" if mode == "cprofile" else "collapsed"
+        profile_id = (
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{endpoint}-{uuid.uuid4().hex[:8]}.{extension}"
+        )
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, profile_id)
+        if mode == "cprofile":
+            profiler.dump_stats(path)
+        else:
+            write_collapsed(path, stacks)
+
+        logger.info(
+            f"Profiled {request.method} {request.path} ({elapsed_ms:.1f} ms) -> {profile_id}"
+        )
+        return profile_id
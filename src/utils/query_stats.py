@@ -0,0 +1,295 @@
+"""Query statistics and slow query logging for SGHSS application."""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/|--[^\n]*|#[^\n]*", re.S)
+_STRING_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s|\?")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_VALUES_RE = re.compile(r"(\bVALUES\s*\([^)]*\))(?:\s*,\s*\([^)]*\))+", re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_sql(sql: str) -> str:
+    """
+    Normalize a SQL statement into a fingerprint.
+
+    Literals and placeholders are replaced by ``?``, ``IN`` lists and
+    multi-row ``VALUES`` are collapsed and whitespace is squeezed, so every
+    execution of the same statement shape maps to the same fingerprint.
+
+    Args:
+        sql: SQL statement text.
+
+    Returns:
+        Normalized statement text.
+    """
+    normalized = _COMMENT_RE.sub(" ", sql)
+    normalized = _STRING_RE.sub("?", normalized)
+    normalized = _PLACEHOLDER_RE.sub("?", normalized)
+    normalized = _NUMBER_RE.sub("?", normalized)
+    normalized = _IN_LIST_RE.sub("IN (?+)", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip()
+    normalized = _VALUES_RE.sub(r"\1", normalized)
+    return normalized
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """
+    Build a short stable identifier for a fingerprint.
+
+    Args:
+        fingerprint: Normalized statement text.
+
+    Returns:
+        Hexadecimal identifier.
+    """
+    return hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:12]
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, int(round(percentile / 100.0 * len(sorted_values))) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class FingerprintStats:
+    """Aggregated timings for one statement fingerprint."""
+
+    def __init__(self, fingerprint: str, window: int):
+        """
+        Initialize fingerprint statistics.
+
+        Args:
+            fingerprint: Normalized statement text.
+            window: Number of recent samples kept for percentiles.
+        """
+        self.fingerprint = fingerprint
+        self.id = fingerprint_id(fingerprint)
+        self.statement_type = (fingerprint.split(" ", 1)[0] or "").upper()
+        self.count = 0
+        self.slow_count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples = deque(maxlen=window)
+        self.slow_sample: Optional[tuple] = None
+        self.last_seen: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """
+        Convert statistics to dictionary.
+
+        Returns:
+            Dictionary representation of the statistics.
+        """
+        ordered = sorted(self.samples)
+        return {
+            "id": self.id,
+            "fingerprint": self.fingerprint,
+            "statement_type": self.statement_type,
+            "count": self.count,
+            "slow_count": self.slow_count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": round(_percentile(ordered, 50), 3),
+            "p95_ms": round(_percentile(ordered, 95), 3),
+            "p99_ms": round(_percentile(ordered, 99), 3),
+            "last_seen": self.last_seen,
+        }
+
+
+class QueryStats:
+    """Thread-safe registry of per-fingerprint query timings."""
+
+    SORT_KEYS = ("total_ms", "count", "mean_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms")
+
+    def __init__(
+        self,
+        slow_threshold_ms: float = 200.0,
+        window: int = 1024,
+        max_fingerprints: int = 1000,
+    ):
+        """
+        Initialize query statistics.
+
+        Args:
+            slow_threshold_ms: Statements slower than this are logged.
+            window: Number of recent samples kept per fingerprint.
+            max_fingerprints: Maximum number of distinct fingerprints tracked.
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.window = window
+        self.max_fingerprints = max_fingerprints
+        self.dropped = 0
+        self._stats: Dict[str, FingerprintStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, params: Any, duration_ms: float) -> None:
+        """
+        Record one statement execution.
+
+        Args:
+            sql: Executed SQL statement.
+            params: Statement parameters.
+            duration_ms: Execution time in milliseconds.
+        """
+        fingerprint = fingerprint_sql(sql)
+        is_slow = duration_ms >= self.slow_threshold_ms
+
+        with self._lock:
+            stats = self._stats.get(fingerprint)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    self.dropped += 1
+                    return
+                stats = FingerprintStats(fingerprint, self.window)
+                self._stats[fingerprint] = stats
+
+            stats.count += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.samples.append(duration_ms)
+            stats.last_seen = time.time()
+            if is_slow:
+                stats.slow_count += 1
+                stats.slow_sample = (sql, params)
+
+        if is_slow:
+            logger.warning(
+                f"Slow query ({duration_ms:.1f} ms) [{stats.id}]: {fingerprint}"
+            )
+
+    def top(
+        self, limit: int = 20, sort: str = "total_ms", statement_type: str = None
+    ) -> List[dict]:
+        """
+        Get the top fingerprints ordered by a metric.
+
+        Args:
+            limit: Number of fingerprints to return.
+            sort: Metric to order by (one of SORT_KEYS).
+            statement_type: Only include statements of this type (SELECT, UPDATE...).
+
+        Returns:
+            List of fingerprint statistics dictionaries.
+        """
+        if sort not in self.SORT_KEYS:
+            sort = "total_ms"
+
+        with self._lock:
+            report = [
+                stats.to_dict()
+                for stats in self._stats.values()
+                if not statement_type or stats.statement_type == statement_type.upper()
+            ]
+
+        report.sort(key=lambda item: item[sort], reverse=True)
+        return report[:limit]
+
+    def get(self, stats_id: str) -> Optional[FingerprintStats]:
+        """
+        Get statistics by fingerprint identifier.
+
+        Args:
+            stats_id: Fingerprint identifier.
+
+        Returns:
+            FingerprintStats object or None.
+        """
+        with self._lock:
+            for stats in self._stats.values():
+                if stats.id == stats_id:
+                    return stats
+        return None
+
+    def reset(self) -> None:
+        """Clear all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+            self.dropped = 0
+
+
+class InstrumentedCursor:
+    """Cursor wrapper that times every statement and reports it to QueryStats."""
+
+    def __init__(self, cursor, stats: QueryStats):
+        """
+        Initialize the instrumented cursor.
+
+        Args:
+            cursor: Database cursor to wrap.
+            stats: Query statistics registry.
+        """
+        self._cursor = cursor
+        self._stats = stats
+        self._pending: Optional[list] = None
+
+    def execute(self, operation: str, params: Any = None, *args, **kwargs):
+        """Execute a statement and time it."""
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            self._pending = [operation, params, time.perf_counter() - start]
+
+    def executemany(self, operation: str, seq_params: Any, *args, **kwargs):
+        """Execute a statement for every parameter set and time it."""
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, *args, **kwargs)
+        finally:
+            self._pending = [operation, None, time.perf_counter() - start]
+
+    def fetchone(self):
+        """Fetch one row, adding the fetch time to the last statement."""
+        return self._timed(self._cursor.fetchone)
+
+    def fetchmany(self, *args, **kwargs):
+        """Fetch several rows, adding the fetch time to the last statement."""
+        return self._timed(self._cursor.fetchmany, *args, **kwargs)
+
+    def fetchall(self):
+        """Fetch all rows, adding the fetch time to the last statement."""
+        return self._timed(self._cursor.fetchall)
+
+    def close(self):
+        """Report the pending statement and close the cursor."""
+        self._flush()
+        return self._cursor.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+    def _timed(self, fetch, *args, **kwargs):
+        """Run a fetch call and account its time to the pending statement."""
+        start = time.perf_counter()
+        try:
+            return fetch(*args, **kwargs)
+        finally:
+            if self._pending is not None:
+                self._pending[2] += time.perf_counter() - start
+
+    def _flush(self) -> None:
+        """Report the pending statement, including its fetch time."""
+        if self._pending is None:
+            return
+        operation, params, elapsed = self._pending
+        self._pending = None
+        self._stats.record(operation, params, elapsed * 1000.0)
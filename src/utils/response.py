@@ -13,6 +13,7 @@ class ResponseFormatter:
         data: Any = None,
         message: str = "Success",
         status_code: int = 200,
+        versao: Optional[int] = None,
     ) -> tuple[Response, int]:
         """
         Create a success response.
@@ -21,6 +22,7 @@ class ResponseFormatter:
             data: Response data.
             message: Response message.
             status_code: HTTP status code.
+            versao: Row version sent back as the ``ETag`` header.
 
         Returns:
             Tuple of (Flask Response, HTTP status code).
@@ -30,7 +32,10 @@ class ResponseFormatter:
             "message": message,
             "data": data,
         }
-        return jsonify(response), status_code
+        response = jsonify(response)
+        if versao is not None:
+            response.set_etag(str(versao))
+        return response, status_code
 
     @staticmethod
     def error(
@@ -0,0 +1,183 @@
+"""Retry policy for transient database errors in SGHSS application."""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .async_bridge import await_only, in_bridge
+from .deadline import remaining
+
+logger = logging.getLogger(__name__)
+
+
+class _UnitStats:
+    """Retry counters of one unit of work."""
+
+    __slots__ = ("calls", "attempts", "recovered", "exhausted", "backoff_ms", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.attempts = 0
+        self.recovered = 0
+        self.exhausted = 0
+        self.backoff_ms = 0.0
+        self.errors: Dict[str, int] = {}
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.attempts - self.calls,
+            "recovered": self.recovered,
+            "exhausted": self.exhausted,
+            "backoff_ms": round(self.backoff_ms, 1),
+            "errors": dict(self.errors),
+        }
+
+
+class RetryPolicy:
+    """
+    Re-run units of work that failed on a transient database error.
+
+    A unit of work is a callable that runs one whole transaction; the caller
+    rolls it back before the unit is retried, so only units that are safe to
+    run again from the start (no side effects outside the transaction) may
+    be retried. Attempts are spaced by exponential backoff with full jitter
+    and stop early when the request deadline would pass while sleeping.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay_ms: float = 20,
+        max_delay_ms: float = 1000,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Attempts per unit of work, including the first.
+            base_delay_ms: Backoff ceiling before the first retry.
+            max_delay_ms: Largest backoff ceiling.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay_ms = base_delay_ms
+        self.max_delay_ms = max_delay_ms
+        self._lock = threading.Lock()
+        self._units: Dict[str, _UnitStats] = {}
+
+    def backoff(self, retry: int) -> float:
+        """
+        Pick the pause before a retry.
+
+        Args:
+            retry: Retry number, starting at 1.
+
+        Returns:
+            Seconds to sleep, uniformly drawn below the exponential ceiling.
+        """
+        ceiling = min(self.max_delay_ms, self.base_delay_ms * 2 ** (retry - 1))
+        return random.uniform(0, ceiling) / 1000
+
+    def run(
+        self,
+        name: str,
+        attempt: Callable[[], object],
+        is_transient: Callable[[Exception], bool],
+    ):
+        """
+        Run a unit of work, retrying it on transient errors.
+
+        Args:
+            name: Unit of work name used in the metrics.
+            attempt: Runs the unit once; must leave nothing behind when it raises.
+            is_transient: Tells whether an error is worth another attempt.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            Exception: The last error, once it is not transient, the attempts
+                are exhausted or the deadline leaves no time to retry.
+        """
+        stats = self._stats(name)
+        with self._lock:
+            stats.calls += 1
+
+        retry = 0
+        while True:
+            with self._lock:
+                stats.attempts += 1
+            try:
+                result = attempt()
+            except Exception as err:
+                if not is_transient(err):
+                    raise
+                retry += 1
+                delay = self.backoff(retry)
+                budget = remaining()
+                with self._lock:
+                    label = _error_label(err)
+                    stats.errors[label] = stats.errors.get(label, 0) + 1
+                    if retry >= self.max_attempts or (budget is not None and budget <= delay):
+                        stats.exhausted += 1
+                        give_up = True
+                    else:
+                        stats.backoff_ms += delay * 1000
+                        give_up = False
+                if give_up:
+                    logger.warning(f"Giving up on {name} after {retry} attempts: {err}")
+                    raise
+                logger.info(f"Retrying {name} in {delay * 1000:.0f}ms after: {err}")
+                _sleep(delay)
+                continue
+
+            if retry:
+                with self._lock:
+                    stats.recovered += 1
+            return result
+
+    def status(self) -> dict:
+        """
+        Summarize retries per unit of work.
+
+        Returns:
+            Policy settings and counters by unit name.
+        """
+        with self._lock:
+            units = {name: stats.to_dict() for name, stats in sorted(self._units.items())}
+        return {
+            "max_attempts": self.max_attempts,
+            "base_delay_ms": self.base_delay_ms,
+            "max_delay_ms": self.max_delay_ms,
+            "units": units,
+        }
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._units.clear()
+
+    def _stats(self, name: str) -> _UnitStats:
+        stats = self._units.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self._units.setdefault(name, _UnitStats())
+        return stats
+
+
+def _error_label(err: Exception) -> str:
+    errno = getattr(err, "errno", None)
+    if errno is None and err.args and isinstance(err.args[0], int):
+        errno = err.args[0]
+    return str(errno) if errno is not None else type(err).__name__
+
+
+def _sleep(seconds: float) -> None:
+    if in_bridge():
+        await_only(asyncio.sleep(seconds))
+    else:
+        time.sleep(seconds)
@@ -0,0 +1,228 @@
+"""Always-on sampling profiler for SGHSS application."""
+
+import atexit
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from flask import Flask, request
+
+from .profiling import collapse_frame, write_collapsed
+
+logger = logging.getLogger(__name__)
+
+FILE_PREFIX = "samples-"
+FILE_SUFFIX = ".collapsed"
+
+
+class SamplingProfiler:
+    """
+    Background thread that samples request threads at a low rate.
+
+    Stacks are aggregated in memory as collapsed stacks prefixed with the Flask
+    endpoint the thread is serving and flushed periodically to rotating
+    flamegraph-ready files. The sampling interval backs off automatically when
+    the time spent sampling exceeds ``max_overhead`` of wall time.
+    """
+
+    MAX_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        output_dir: str = "profiles/continuous",
+        interval_ms: float = 50.0,
+        flush_interval: float = 300.0,
+        max_files: int = 48,
+        max_overhead: float = 0.01,
+    ):
+        """
+        Initialize the sampling profiler.
+
+        Args:
+            output_dir: Directory where collapsed stack files are written.
+            interval_ms: Base interval between samples.
+            flush_interval: Seconds between file flushes.
+            max_files: Number of files kept before the oldest is removed.
+            max_overhead: Maximum fraction of wall time spent sampling.
+        """
+        self.output_dir = output_dir
+        self.base_interval = interval_ms / 1000.0
+        self.interval = self.base_interval
+        self.flush_interval = flush_interval
+        self.max_files = max_files
+        self.max_overhead = max_overhead
+        self.overhead = 0.0
+        self.samples = 0
+        self.stacks = Counter()
+        self._endpoints: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._sequence = 0
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Register request hooks on the application.
+
+        The sampling thread is started lazily on the first request so that it
+        runs in each worker process, not in a pre-fork master.
+
+        Args:
+            app: Flask application instance.
+        """
+        app.extensions["sampling_profiler"] = self
+        app.before_request(self._before_request)
+        app.teardown_request(self._teardown_request)
+        atexit.register(self.stop)
+
+    def start(self) -> None:
+        """Start the sampling thread in the current process."""
+        with self._lock:
+            if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._stop.clear()
+            self.stacks.clear()
+            self._endpoints.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="sghss-sampling-profiler", daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Sampling profiler started (interval {self.interval * 1000:.0f} ms)")
+
+    def stop(self) -> None:
+        """Stop the sampling thread and flush pending stacks."""
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        self.flush()
+
+    def flush(self) -> Optional[str]:
+        """
+        Write aggregated stacks to a new file and rotate old files.
+
+        Returns:
+            Path of the written file, or None if there was nothing to write.
+        """
+        with self._lock:
+            stacks, self.stacks = self.stacks, Counter()
+        if not stacks:
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._sequence += 1
+        name = (
+            f"{FILE_PREFIX}{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+            f"-{self._sequence}{FILE_SUFFIX}"
+        )
+        path = os.path.join(self.output_dir, name)
+        write_collapsed(path, stacks)
+        self._rotate()
+        return path
+
+    def list_files(self) -> List[dict]:
+        """
+        List written sample files, newest first.
+
+        Returns:
+            List of file descriptions.
+        """
+        if not os.path.isdir(self.output_dir):
+            return []
+        files = []
+        for name in os.listdir(self.output_dir):
+            if name.startswith(FILE_PREFIX) and name.endswith(FILE_SUFFIX):
+                stat = os.stat(os.path.join(self.output_dir, name))
+                files.append({"id": name, "size": stat.st_size, "created_at": stat.st_mtime})
+        files.sort(key=lambda item: item["created_at"], reverse=True)
+        return files
+
+    def get_file_path(self, file_id: str) -> Optional[str]:
+        """
+        Resolve a sample file identifier to a file path.
+
+        Args:
+            file_id: File identifier (file name).
+
+        Returns:
+            Absolute file path or None if it does not exist.
+        """
+        if file_id != os.path.basename(file_id) or not file_id.startswith(FILE_PREFIX):
+            return None
+        path = os.path.abspath(os.path.join(self.output_dir, file_id))
+        return path if os.path.isfile(path) else None
+
+    def status(self) -> dict:
+        """
+        Get the current profiler status.
+
+        Returns:
+            Dictionary with sampling rate, overhead and counters.
+        """
+        return {
+            "running": bool(self._thread and self._thread.is_alive()),
+            "interval_ms": round(self.interval * 1000, 3),
+            "base_interval_ms": round(self.base_interval * 1000, 3),
+            "overhead": round(self.overhead, 5),
+            "max_overhead": self.max_overhead,
+            "samples": self.samples,
+            "pending_stacks": len(self.stacks),
+        }
+
+    def _before_request(self) -> None:
+        if self._pid != os.getpid() or self._thread is None:
+            self.start()
+        self._endpoints[threading.get_ident()] = request.endpoint or "unknown"
+
+    def _teardown_request(self, error=None) -> None:
+        self._endpoints.pop(threading.get_ident(), None)
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        last_flush = time.monotonic()
+
+        while not self._stop.wait(self.interval):
+            started = time.perf_counter()
+            frames = sys._current_frames()
+            with self._lock:
+                for ident, endpoint in list(self._endpoints.items()):
+                    frame = frames.get(ident)
+                    if frame is not None and ident != own_ident:
+                        self.stacks[f"{endpoint};{collapse_frame(frame)}"] += 1
+                        self.samples += 1
+            del frames
+            self._adjust_interval(time.perf_counter() - started)
+
+            if time.monotonic() - last_flush >= self.flush_interval:
+                last_flush = time.monotonic()
+                try:
+                    self.flush()
+                except Exception as err:
+                    logger.error(f"Error flushing sampling profiler: {err}")
+
+    def _adjust_interval(self, cost: float) -> None:
+        """Back off or recover the sampling interval to respect max_overhead."""
+        fraction = cost / (self.interval + cost)
+        self.overhead = 0.9 * self.overhead + 0.1 * fraction
+        previous = self.interval
+        if self.overhead > self.max_overhead and self.interval < self.MAX_INTERVAL:
+            self.interval = min(self.interval * 2, self.MAX_INTERVAL)
+        elif self.overhead < self.max_overhead / 4 and self.interval > self.base_interval:
+            self.interval = max(self.interval / 2, self.base_interval)
+        # Rescale the estimate so one expensive tick does not trigger repeated backoffs
+        self.overhead *= previous / self.interval
+
+    def _rotate(self) -> None:
+        """Remove the oldest files beyond max_files."""
+        for stale in self.list_files()[self.max_files :]:
+            try:
+                os.remove(os.path.join(self.output_dir, stale["id"]))
+            except OSError as err:
+                logger.warning(f"Could not remove sample file {stale['id']}: {err}")
@@ -0,0 +1,448 @@
+"""Working hours, busy intervals and free slots for SGHSS scheduling."""
+
+import bisect
+import itertools
+import re
+import unicodedata
+from datetime import date, datetime, time, timedelta
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..exceptions import ValidationError
+from .validators import Validator
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Longest consulta accepted; bounds the range scanned for overlaps
+MAX_DURACAO_MINUTOS = 480
+
+# Slot starts are rounded up to this many minutes
+SLOT_GRANULARITY_MINUTES = 5
+
+# Longest range the slot finder accepts
+MAX_SLOT_RANGE_DAYS = 92
+
+# Cancelled consultas do not occupy the professional's time
+STATUS_AGENDADA = "agendada"
+STATUS_EM_ATENDIMENTO = "em_atendimento"
+STATUS_REALIZADA = "realizada"
+STATUS_CANCELADA = "cancelada"
+STATUS_NAO_COMPARECEU = "nao_compareceu"
+STATUS_CONSULTA = (
+    STATUS_AGENDADA,
+    STATUS_EM_ATENDIMENTO,
+    STATUS_REALIZADA,
+    STATUS_CANCELADA,
+    STATUS_NAO_COMPARECEU,
+)
+
+# Status changes: action -> (statuses it may start from, resulting status)
+TRANSICOES_STATUS = {
+    "check-in": ((STATUS_AGENDADA,), STATUS_EM_ATENDIMENTO),
+    "complete": ((STATUS_AGENDADA, STATUS_EM_ATENDIMENTO), STATUS_REALIZADA),
+    "cancel": ((STATUS_AGENDADA,), STATUS_CANCELADA),
+    "no-show": ((STATUS_AGENDADA,), STATUS_NAO_COMPARECEU),
+}
+
+# Recurrence rules of consulta series
+FREQUENCIAS = ("diaria", "semanal")
+MAX_OCORRENCIAS = 100
+
+_WEEKDAYS = {
+    "segunda": 0,
+    "seg": 0,
+    "terca": 1,
+    "ter": 1,
+    "quarta": 2,
+    "qua": 2,
+    "quinta": 3,
+    "qui": 3,
+    "sexta": 4,
+    "sex": 4,
+    "sabado": 5,
+    "sab": 5,
+    "domingo": 6,
+    "dom": 6,
+}
+_RANGE_RE = re.compile(r"^(\w+)(?:\s+(?:a|ate)\s+|\s*-\s*)(\w+)$")
+_SEPARATOR_RE = re.compile(r"\s*(?:,|;|/|\be\b)\s*")
+_TIME_RE = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")
+
+Interval = Tuple[datetime, datetime]
+
+
+def _weekday(name: str) -> int:
+    key = name.strip(" .")
+    if key not in _WEEKDAYS:
+        raise ValidationError(f"Unknown weekday: {name!r}")
+    return _WEEKDAYS[key]
+
+
+def parse_dias_atendimento(value: Optional[str]) -> FrozenSet[int]:
+    """
+    Parse working days written in Portuguese.
+
+    Accepts ranges and lists, with or without accents and ``-feira``:
+    ``"Segunda a Sexta"``, ``"Seg-Sex"``, ``"Segunda, Quarta e Sexta"``,
+    ``"Terça a Sábado"``.
+
+    Args:
+        value: Working days description.
+
+    Returns:
+        Weekday numbers (Monday is 0); empty if value is empty.
+
+    Raises:
+        ValidationError: If a day is not recognized.
+    """
+    if not value or not value.strip():
+        return frozenset()
+    text = unicodedata.normalize("NFKD", value.lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = re.sub(r"[\s-]*feiras?\b", "", text)
+
+    days = set()
+    for part in filter(None, _SEPARATOR_RE.split(text.strip())):
+        match = _RANGE_RE.match(part.strip())
+        if match is None:
+            days.add(_weekday(part))
+            continue
+        first, last = _weekday(match.group(1)), _weekday(match.group(2))
+        day = first
+        while True:
+            days.add(day)
+            if day == last:
+                break
+            day = (day + 1) % 7
+    return frozenset(days)
+
+
+def parse_horario(value: Union[str, time, timedelta, None]) -> Optional[time]:
+    """
+    Parse a time of day as stored by either backend.
+
+    Args:
+        value: ``HH:MM[:SS]`` text, a time, or a timedelta (MySQL TIME).
+
+    Returns:
+        Time of day, or None if value is empty.
+
+    Raises:
+        ValidationError: If the text is not a valid time.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, time):
+        return value
+    if isinstance(value, timedelta):
+        seconds = int(value.total_seconds())
+        return time(seconds // 3600 % 24, seconds // 60 % 60, seconds % 60)
+    match = _TIME_RE.match(str(value).strip())
+    if match is None or int(match.group(1)) > 23 or int(match.group(2)) > 59:
+        raise ValidationError(f"Invalid time: {value!r}, expected HH:MM")
+    return time(int(match.group(1)), int(match.group(2)), int(match.group(3) or 0))
+
+
+def format_horario(value: Union[str, time, timedelta, None]) -> Optional[str]:
+    """
+    Format a time of day as ``HH:MM``.
+
+    Args:
+        value: Time in any form accepted by ``parse_horario``.
+
+    Returns:
+        ``HH:MM`` text, or None if value is empty.
+    """
+    parsed = parse_horario(value)
+    return None if parsed is None else parsed.strftime("%H:%M")
+
+
+def to_datetime(value: Union[str, datetime]) -> datetime:
+    """
+    Convert a DATETIME column value.
+
+    Args:
+        value: datetime (MySQL) or ``YYYY-MM-DD HH:MM:SS`` text (SQLite).
+
+    Returns:
+        The datetime.
+    """
+    if isinstance(value, datetime):
+        return value
+    return datetime.strptime(str(value)[:19], DATETIME_FORMAT)
+
+
+def parse_periodo(inicio: str, fim: str, max_days: int = MAX_SLOT_RANGE_DAYS) -> Tuple[date, date]:
+    """
+    Validate a ``from``/``to`` pair of days.
+
+    Args:
+        inicio: First day (YYYY-MM-DD).
+        fim: Last day, inclusive (YYYY-MM-DD).
+        max_days: Longest range accepted.
+
+    Returns:
+        Both days.
+
+    Raises:
+        ValidationError: If a day is missing or invalid, or the range is
+            reversed or too long.
+    """
+    Validator.validate_required_fields({"from": inicio, "to": fim}, ["from", "to"])
+    Validator.validate_date_format(inicio)
+    Validator.validate_date_format(fim)
+    primeiro_dia = datetime.strptime(inicio, "%Y-%m-%d").date()
+    ultimo_dia = datetime.strptime(fim, "%Y-%m-%d").date()
+    if ultimo_dia < primeiro_dia:
+        raise ValidationError("'to' must not be before 'from'")
+    if (ultimo_dia - primeiro_dia).days >= max_days:
+        raise ValidationError(f"Range must be at most {max_days} days")
+    return primeiro_dia, ultimo_dia
+
+
+def validate_duracao(duracao_minutos: int) -> int:
+    """
+    Validate a consulta duration.
+
+    Args:
+        duracao_minutos: Duration in minutes.
+
+    Returns:
+        The duration as an int.
+
+    Raises:
+        ValidationError: If it is not between 1 and MAX_DURACAO_MINUTOS.
+    """
+    try:
+        duracao = int(duracao_minutos)
+    except (TypeError, ValueError):
+        raise ValidationError("duracao_minutos must be an integer")
+    if not 0 < duracao <= MAX_DURACAO_MINUTOS:
+        raise ValidationError(f"duracao_minutos must be between 1 and {MAX_DURACAO_MINUTOS}")
+    return duracao
+
+
+def expand_recorrencia(
+    inicio: datetime,
+    frequencia: str = "semanal",
+    intervalo: int = 1,
+    ocorrencias: Optional[int] = None,
+    ate: Optional[date] = None,
+    dias: FrozenSet[int] = frozenset(),
+) -> List[datetime]:
+    """
+    Expand a recurrence rule into the start of each occurrence.
+
+    Daily rules repeat every ``intervalo`` days. Weekly rules repeat every
+    ``intervalo`` weeks, on ``dias`` or on the weekday of ``inicio``.
+
+    Args:
+        inicio: First occurrence; later ones keep its time of day.
+        frequencia: ``diaria`` or ``semanal``.
+        intervalo: Days or weeks between repetitions.
+        ocorrencias: Number of occurrences.
+        ate: Last day an occurrence may fall on.
+        dias: Weekdays of a weekly rule (Monday is 0).
+
+    Returns:
+        Occurrence starts in order.
+
+    Raises:
+        ValidationError: If the rule is invalid or yields no occurrence or
+            more than MAX_OCORRENCIAS.
+    """
+    if frequencia not in FREQUENCIAS:
+        raise ValidationError(f"frequencia must be one of: {', '.join(FREQUENCIAS)}")
+    if not isinstance(intervalo, int) or intervalo < 1:
+        raise ValidationError("intervalo must be a positive integer")
+    if ocorrencias is None and ate is None:
+        raise ValidationError("Either ocorrencias or ate is required")
+    if ocorrencias is not None and (
+        not isinstance(ocorrencias, int) or not 0 < ocorrencias <= MAX_OCORRENCIAS
+    ):
+        raise ValidationError(f"ocorrencias must be between 1 and {MAX_OCORRENCIAS}")
+
+    if frequencia == "diaria":
+        passos = ((inicio.date() + timedelta(days=intervalo * n)) for n in itertools.count())
+    else:
+        semana = inicio.date() - timedelta(days=inicio.weekday())
+        dias_semana = sorted(dias or {inicio.weekday()})
+        passos = (
+            semana + timedelta(weeks=intervalo * n, days=dia)
+            for n in itertools.count()
+            for dia in dias_semana
+        )
+
+    datas: List[datetime] = []
+    for dia in passos:
+        if dia < inicio.date():
+            continue
+        if ate is not None and dia > ate:
+            break
+        if ocorrencias is not None and len(datas) == ocorrencias:
+            break
+        if len(datas) == MAX_OCORRENCIAS:
+            raise ValidationError(f"A series may have at most {MAX_OCORRENCIAS} occurrences")
+        datas.append(datetime.combine(dia, inicio.time()))
+    if not datas:
+        raise ValidationError("The recurrence rule yields no occurrence")
+    return datas
+
+
+class IntervalSet:
+    """
+    Sorted, non-overlapping half-open intervals.
+
+    Adding merges touching and overlapping intervals, so overlap queries
+    are a binary search and subtracting the set from working windows is a
+    single merge pass.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """
+        Initialize the set.
+
+        Args:
+            intervals: ``(start, end)`` pairs in any order.
+        """
+        self._starts: List[datetime] = []
+        self._ends: List[datetime] = []
+        merged: List[List[datetime]] = []
+        for start, end in sorted(interval for interval in intervals if interval[0] < interval[1]):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            self._starts.append(start)
+            self._ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self._starts, self._ends)
+
+    def add(self, start: datetime, end: datetime) -> None:
+        """
+        Add an interval, merging it with its neighbours.
+
+        Args:
+            start: Interval start.
+            end: Interval end (exclusive).
+        """
+        if start >= end:
+            return
+        low = bisect.bisect_left(self._ends, start)
+        high = bisect.bisect_right(self._starts, end)
+        if low < high:
+            start = min(start, self._starts[low])
+            end = max(end, self._ends[high - 1])
+        self._starts[low:high] = [start]
+        self._ends[low:high] = [end]
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """
+        Whether ``[start, end)`` intersects any interval.
+
+        Args:
+            start: Interval start.
+            end: Interval end (exclusive).
+
+        Returns:
+            True on overlap.
+        """
+        index = bisect.bisect_right(self._ends, start)
+        return index < len(self._starts) and self._starts[index] < end
+
+    def gaps(self, start: datetime, end: datetime) -> Iterator[Interval]:
+        """
+        Yield the parts of ``[start, end)`` not covered by the set.
+
+        Args:
+            start: Window start.
+            end: Window end (exclusive).
+
+        Yields:
+            Free ``(start, end)`` pairs in order.
+        """
+        cursor = start
+        index = bisect.bisect_right(self._ends, start)
+        while index < len(self._starts) and self._starts[index] < end:
+            if self._starts[index] > cursor:
+                yield cursor, self._starts[index]
+            cursor = max(cursor, self._ends[index])
+            index += 1
+        if cursor < end:
+            yield cursor, end
+
+
+def working_windows(
+    inicio: date,
+    fim: date,
+    horario_inicio: Optional[time],
+    horario_fim: Optional[time],
+    dias: FrozenSet[int],
+) -> Iterator[Interval]:
+    """
+    Yield the working hours of each day in a range.
+
+    Args:
+        inicio: First day.
+        fim: Last day (inclusive).
+        horario_inicio: Daily start.
+        horario_fim: Daily end.
+        dias: Working weekdays (Monday is 0).
+
+    Yields:
+        ``(start, end)`` of each working day.
+    """
+    if horario_inicio is None or horario_fim is None or not dias:
+        return
+    day = inicio
+    while day <= fim:
+        if day.weekday() in dias:
+            start = datetime.combine(day, horario_inicio)
+            end = datetime.combine(day, horario_fim)
+            if end <= start:
+                end += timedelta(days=1)  # overnight shift
+            yield start, end
+        day += timedelta(days=1)
+
+
+def _round_up(moment: datetime, minutes: int) -> datetime:
+    moment = moment.replace(second=0, microsecond=0) + (
+        timedelta(minutes=1) if moment.second or moment.microsecond else timedelta()
+    )
+    remainder = moment.minute % minutes
+    return moment + timedelta(minutes=(minutes - remainder) % minutes)
+
+
+def free_slots(
+    windows: Iterable[Interval],
+    busy: IntervalSet,
+    duracao_minutos: int,
+    not_before: Optional[datetime] = None,
+) -> Iterator[Interval]:
+    """
+    Cut the free time of the working windows into slots.
+
+    Args:
+        windows: Working ``(start, end)`` windows in order.
+        busy: Booked intervals.
+        duracao_minutos: Slot length.
+        not_before: Skip slots starting before this moment.
+
+    Yields:
+        ``(start, end)`` of each free slot, in order.
+    """
+    length = timedelta(minutes=duracao_minutos)
+    for window_start, window_end in windows:
+        if not_before is not None:
+            if window_end <= not_before:
+                continue
+            window_start = max(window_start, not_before)
+        for gap_start, gap_end in busy.gaps(window_start, window_end):
+            start = _round_up(gap_start, SLOT_GRANULARITY_MINUTES)
+            while start + length <= gap_end:
+                yield start, start + length
+                start = _round_up(start + length, SLOT_GRANULARITY_MINUTES)
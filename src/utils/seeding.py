@@ -0,0 +1,437 @@
+"""Synthetic data generator for scale testing."""
+
+import logging
+import multiprocessing
+import random
+import re
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from werkzeug.security import generate_password_hash
+
+logger = logging.getLogger(__name__)
+
+# Tables in dependency order: parents before children
+TABLE_ORDER = (
+    "usuarios",
+    "pacientes",
+    "profissionais",
+    "medicamentos",
+    "consultas",
+    "prescricoes",
+)
+
+SEED_PASSWORD = "sghss123"
+
+_COUNT_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kKmMbB]?)\s*$")
+_MULTIPLIERS = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
+_FIRST_NAMES = (
+    "Ana", "Maria", "Joao", "Jose", "Pedro", "Paulo", "Lucas", "Mariana", "Julia",
+    "Fernanda", "Carlos", "Rafael", "Beatriz", "Gabriel", "Camila", "Bruno",
+    "Larissa", "Felipe", "Patricia", "Ricardo", "Aline", "Gustavo", "Renata", "Diego",
+)
+_LAST_NAMES = (
+    "Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves",
+    "Pereira", "Lima", "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho",
+    "Almeida", "Lopes", "Soares", "Fernandes", "Vieira", "Barbosa",
+)
+_STREETS = (
+    "Rua das Flores", "Avenida Paulista", "Rua XV de Novembro", "Avenida Brasil",
+    "Rua da Consolacao", "Avenida Atlantica", "Rua Augusta", "Avenida Rio Branco",
+)
+_STATES = ("SP", "RJ", "MG", "RS", "PR", "BA", "PE", "SC", "GO", "DF")
+_ESPECIALIDADES = (
+    "Cardiologia", "Clinica Geral", "Dermatologia", "Pediatria", "Ortopedia",
+    "Ginecologia", "Psiquiatria", "Neurologia", "Fisioterapia", "Endocrinologia",
+)
+_MEDICAMENTOS = (
+    ("Dipirona", "Analgesico e antitermico"),
+    ("Amoxicilina", "Antibiotico"),
+    ("Omeprazol", "Inibidor de bomba de protons"),
+    ("Losartana", "Anti-hipertensivo"),
+    ("Metformina", "Antidiabetico"),
+    ("Sinvastatina", "Hipolipemiante"),
+    ("Ibuprofeno", "Anti-inflamatorio"),
+    ("Paracetamol", "Analgesico"),
+    ("Sertralina", "Antidepressivo"),
+    ("Levotiroxina", "Hormonio tireoidiano"),
+)
+_DOSAGENS = ("5mg", "10mg", "20mg", "50mg", "100mg", "250mg", "500mg", "850mg", "1g")
+_MOTIVOS = (
+    "Consulta de rotina", "Retorno", "Dor de cabeca", "Dor toracica", "Febre",
+    "Acompanhamento de exames", "Sessao de fisioterapia", "Renovacao de receita",
+)
+_INSTRUCOES = (
+    "Tomar 1 comprimido a cada 8 horas",
+    "Tomar 1 comprimido ao dia em jejum",
+    "Tomar 2 comprimidos a cada 12 horas com alimento",
+    "Aplicar na regiao afetada 2 vezes ao dia",
+)
+
+References = Union[range, List[int]]
+
+
+def parse_count(value: Union[str, int]) -> int:
+    """
+    Parse a row count such as ``5M``, ``50k`` or ``1.5m``.
+
+    Args:
+        value: Count as integer or string with an optional k/M/B suffix.
+
+    Returns:
+        Row count.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+    """
+    if isinstance(value, int):
+        return value
+    match = _COUNT_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid count: {value!r}")
+    number, suffix = match.groups()
+    return int(float(number) * _MULTIPLIERS[suffix.lower()])
+
+
+def cpf_from_number(number: int) -> str:
+    """
+    Build a valid CPF (with check digits) from a sequence number.
+
+    Args:
+        number: Sequence number, unique per patient (up to 999,999,999).
+
+    Returns:
+        11-digit CPF string.
+    """
+    digits = [int(d) for d in f"{number % 1_000_000_000:09d}"]
+    for length in (9, 10):
+        total = sum(d * w for d, w in zip(digits, range(length + 1, 1, -1)))
+        check = (total * 10) % 11
+        digits.append(0 if check == 10 else check)
+    return "".join(str(d) for d in digits)
+
+
+def _name(rng: random.Random) -> Tuple[str, str]:
+    first = rng.choice(_FIRST_NAMES)
+    last = f"{rng.choice(_LAST_NAMES)} {rng.choice(_LAST_NAMES)}"
+    return first, last
+
+
+def _phone(rng: random.Random) -> str:
+    return f"{rng.randint(11, 99)}9{rng.randint(10_000_000, 99_999_999)}"
+
+
+def _gen_usuarios(rng, start_id, count, refs, context) -> Iterator[tuple]:
+    for row_id in range(start_id, start_id + count):
+        first, last = _name(rng)
+        tipo = "paciente" if rng.random() < 0.85 else rng.choice(("medico", "secretaria"))
+        yield (
+            row_id,
+            f"{first} {last}",
+            f"{first.lower()}.{row_id}@seed.sghss.com",
+            context["senha_hash"],
+            tipo,
+        )
+
+
+def _gen_pacientes(rng, start_id, count, refs, context) -> Iterator[tuple]:
+    for row_id in range(start_id, start_id + count):
+        first, last = _name(rng)
+        nascimento = date(1940, 1, 1) + timedelta(days=rng.randint(0, 29_000))
+        yield (
+            row_id,
+            f"{first} {last}",
+            f"{first.lower()}.{row_id}@paciente.example.com",
+            _phone(rng),
+            cpf_from_number(row_id),
+            nascimento.isoformat(),
+            f"{rng.choice(_STREETS)}, {rng.randint(1, 3000)} - {rng.choice(_STATES)}",
+        )
+
+
+def _gen_profissionais(rng, start_id, count, refs, context) -> Iterator[tuple]:
+    for row_id in range(start_id, start_id + count):
+        first, last = _name(rng)
+        inicio = rng.choice((7, 8, 9, 10))
+        yield (
+            row_id,
+            f"Dr(a). {first} {last}",
+            f"{first.lower()}.{row_id}@profissional.sghss.com",
+            _phone(rng),
+            rng.choice(_ESPECIALIDADES),
+            f"{row_id:07d}/{rng.choice(_STATES)}",
+            f"{inicio:02d}:00:00",
+            f"{inicio + rng.choice((6, 8, 9)):02d}:00:00",
+            rng.choice(("Segunda a Sexta", "Segunda a Sabado", "Segunda, Quarta, Sexta")),
+        )
+
+
+def _gen_medicamentos(rng, start_id, count, refs, context) -> Iterator[tuple]:
+    for row_id in range(start_id, start_id + count):
+        nome, descricao = rng.choice(_MEDICAMENTOS)
+        yield (row_id, f"{nome} {row_id}", descricao, rng.choice(_DOSAGENS))
+
+
+def _gen_consultas(rng, start_id, count, refs, context) -> Iterator[tuple]:
+    pacientes, profissionais = refs["pacientes"], refs["profissionais"]
+    start_day = context["start_day"]
+    today = context["today"]
+    days = context["days"]
+    for row_id in range(start_id, start_id + count):
+        day = start_day + timedelta(days=rng.randrange(days))
+        when = datetime(day.year, day.month, day.day, rng.randint(8, 17), rng.choice((0, 30)))
+        telemedicina = rng.random() < 0.2
+        if day >= today:
+            status = "agendada"
+        else:
+            status = rng.choices(
+                ("realizada", "cancelada", "nao_compareceu"), weights=(85, 10, 5)
+            )[0]
+        yield (
+            row_id,
+            rng.choice(pacientes),
+            rng.choice(profissionais),
+            when.strftime("%Y-%m-%d %H:%M:%S"),
+            30,
+            rng.choice(_MOTIVOS),
+            "",
+            "telemedicina" if telemedicina else "presencial",
+            f"https://meet.sghss.com/{row_id:x}" if telemedicina else None,
+            status,
+        )
+
+
+def _gen_prescricoes(rng, start_id, count, refs, context) -> Iterator[tuple]:
+    consultas, medicamentos = refs["consultas"], refs["medicamentos"]
+    for row_id in range(start_id, start_id + count):
+        yield (
+            row_id,
+            rng.choice(consultas),
+            rng.choice(medicamentos),
+            f"{rng.choice((3, 5, 7, 10, 14, 30, 60, 90))} dias",
+            rng.choice(_INSTRUCOES),
+        )
+
+
+# table -> (columns, row generator, referenced tables)
+GENERATORS: Dict[str, Tuple[Sequence[str], Callable, Sequence[str]]] = {
+    "usuarios": (("id", "nome", "email", "senha", "tipo"), _gen_usuarios, ()),
+    "pacientes": (
+        ("id", "nome", "email", "telefone", "cpf", "data_nascimento", "endereco"),
+        _gen_pacientes,
+        (),
+    ),
+    "profissionais": (
+        (
+            "id", "nome", "email", "telefone", "especialidade", "registro",
+            "horario_inicio", "horario_fim", "dias_atendimento",
+        ),
+        _gen_profissionais,
+        (),
+    ),
+    "medicamentos": (("id", "nome", "descricao", "dosagem"), _gen_medicamentos, ()),
+    "consultas": (
+        (
+            "id", "paciente_id", "profissional_id", "data", "duracao_minutos", "motivo",
+            "observacoes", "tipo_consulta", "link_video", "status",
+        ),
+        _gen_consultas,
+        ("pacientes", "profissionais"),
+    ),
+    "prescricoes": (
+        ("id", "consulta_id", "medicamento_id", "duracao", "instrucoes"),
+        _gen_prescricoes,
+        ("consultas", "medicamentos"),
+    ),
+}
+
+
+def _insert_chunk(db_manager, task: dict) -> int:
+    """Generate one deterministic chunk of rows and bulk insert it."""
+    table = task["table"]
+    columns, generator, _ = GENERATORS[table]
+    # String seeds are hashed with SHA-512, so chunks are reproducible across runs
+    rng = random.Random(f"{task['seed']}:{table}:{task['chunk']}")
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+
+    rows = generator(rng, task["start_id"], task["count"], task["refs"], task["context"])
+    inserted = 0
+    with db_manager.get_cursor() as (cursor, conn):
+        while True:
+            batch = [row for _, row in zip(range(task["batch_size"]), rows)]
+            if not batch:
+                break
+            cursor.executemany(sql, batch)
+            conn.commit()
+            inserted += len(batch)
+    return inserted
+
+
+_worker_db_manager = None
+
+
+def _init_worker(backend_name: str, db_config: dict, sqlite_path: str) -> None:
+    """Open a dedicated database manager in each worker process."""
+    global _worker_db_manager
+    from ..config.backends import MySQLBackend, SQLiteBackend
+    from ..config.database import DatabaseManager
+
+    if backend_name == "sqlite":
+        backend = SQLiteBackend(sqlite_path, bootstrap=False)
+    else:
+        backend = MySQLBackend(db_config)
+    _worker_db_manager = DatabaseManager(db_config, backend=backend)
+
+
+def _worker_insert_chunk(task: dict) -> int:
+    return _insert_chunk(_worker_db_manager, task)
+
+
+class DataSeeder:
+    """
+    Generates referentially consistent data and bulk inserts it.
+
+    Rows get explicit ids following the current maximum of each table, so child
+    rows can reference parents generated in the same run without reading them
+    back. Each chunk is generated from its own seed, which makes the output
+    identical for the same seed regardless of the number of workers.
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        seed: int = 42,
+        workers: int = 1,
+        batch_size: int = 5_000,
+        chunk_size: int = 100_000,
+        db_config: Optional[dict] = None,
+        backend_name: Optional[str] = None,
+        sqlite_path: str = ":memory:",
+        echo: Callable[[str], None] = logger.info,
+    ):
+        """
+        Initialize the data seeder.
+
+        Args:
+            db_manager: Database manager of the current process.
+            seed: Seed for the deterministic generators.
+            workers: Number of worker processes (1 inserts in-process).
+            batch_size: Rows per INSERT batch and commit.
+            chunk_size: Rows generated per task handed to a worker.
+            db_config: MySQL configuration used to connect from workers.
+            backend_name: Backend workers connect to (mysql or sqlite).
+            sqlite_path: SQLite path used by workers.
+            echo: Progress output function.
+        """
+        self.db_manager = db_manager
+        self.seed = seed
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.db_config = db_config or {}
+        self.backend_name = backend_name or db_manager.backend.name
+        self.sqlite_path = sqlite_path
+        self.echo = echo
+
+        if self.backend_name == "sqlite" and (workers > 1 and sqlite_path == ":memory:"):
+            # Worker processes cannot see an in-memory database
+            workers = 1
+        self.workers = max(1, workers)
+
+    def seed_tables(self, counts: Dict[str, int]) -> Dict[str, int]:
+        """
+        Generate and insert rows for each table.
+
+        Args:
+            counts: Number of rows to generate per table.
+
+        Returns:
+            Number of rows inserted per table.
+        """
+        start_ids = {table: self._max_id(table) + 1 for table in TABLE_ORDER}
+        generated: Dict[str, range] = {}
+        context = self._context()
+        inserted = {}
+
+        pool = None
+        if self.workers > 1:
+            pool = multiprocessing.get_context("spawn").Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.backend_name, self.db_config, self.sqlite_path),
+            )
+
+        try:
+            for table in TABLE_ORDER:
+                count = counts.get(table, 0)
+                if count <= 0:
+                    continue
+                refs = {
+                    parent: generated.get(parent) or self._existing_ids(parent)
+                    for parent in GENERATORS[table][2]
+                }
+                started = time.perf_counter()
+                inserted[table] = self._seed_table(
+                    pool, table, start_ids[table], count, refs, context
+                )
+                generated[table] = range(start_ids[table], start_ids[table] + count)
+                elapsed = time.perf_counter() - started
+                self.echo(
+                    f"{table}: {inserted[table]:,} rows in {elapsed:.1f}s "
+                    f"({inserted[table] / max(elapsed, 1e-9):,.0f} rows/s)"
+                )
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        return inserted
+
+    def _seed_table(self, pool, table, start_id, count, refs, context) -> int:
+        tasks = []
+        for chunk, offset in enumerate(range(0, count, self.chunk_size)):
+            tasks.append(
+                {
+                    "table": table,
+                    "chunk": chunk,
+                    "start_id": start_id + offset,
+                    "count": min(self.chunk_size, count - offset),
+                    "refs": refs,
+                    "context": context,
+                    "seed": self.seed,
+                    "batch_size": self.batch_size,
+                }
+            )
+
+        if pool is None:
+            return sum(_insert_chunk(self.db_manager, task) for task in tasks)
+        return sum(pool.imap_unordered(_worker_insert_chunk, tasks))
+
+    def _context(self) -> dict:
+        """Values shared by every chunk, computed once."""
+        # Consultas span one year back and three months ahead of a fixed day,
+        # so a given seed always produces the same dates
+        today = date(2025, 1, 1)
+        return {
+            "senha_hash": generate_password_hash(SEED_PASSWORD),
+            "today": today,
+            "start_day": today - timedelta(days=365),
+            "days": 365 + 90,
+        }
+
+    def _max_id(self, table: str) -> int:
+        with self.db_manager.get_cursor() as (cursor, conn):
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            return int(cursor.fetchone()[0])
+
+    def _existing_ids(self, table: str, limit: int = 1_000_000) -> References:
+        with self.db_manager.get_cursor() as (cursor, conn):
+            cursor.execute(f"SELECT id FROM {table} ORDER BY id LIMIT %s", (limit,))
+            ids = [row[0] for row in cursor.fetchall()]
+        if not ids:
+            raise ValueError(f"Cannot seed rows referencing {table}: table is empty")
+        return ids
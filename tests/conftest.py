@@ -3,8 +3,53 @@
 import os
 import sys
 
+import pytest
+from flask import Flask
+
 # Add src to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Set testing environment
 os.environ["FLASK_ENV"] = "testing"
+
+
+@pytest.fixture(autouse=True)
+def app_context():
+    """Provide a Flask application context for helpers such as jsonify."""
+    app = Flask(__name__)
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture
+def sghss_app():
+    """Create the application on a fresh in-memory SQLite database."""
+    from src import create_app
+
+    return create_app("testing")
+
+
+@pytest.fixture
+def client(sghss_app):
+    """Test client for the application."""
+    return sghss_app.test_client()
+
+
+@pytest.fixture
+def admin_headers(sghss_app):
+    """Authorization headers carrying an admin token."""
+    from flask_jwt_extended import create_access_token
+
+    with sghss_app.app_context():
+        token = create_access_token(identity="1", additional_claims={"tipo": "admin"})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def user_headers(sghss_app):
+    """Authorization headers carrying a non-admin token."""
+    from flask_jwt_extended import create_access_token
+
+    with sghss_app.app_context():
+        token = create_access_token(identity="2", additional_claims={"tipo": "paciente"})
+    return {"Authorization": f"Bearer {token}"}
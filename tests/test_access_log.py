@@ -0,0 +1,42 @@
+"""Tests for the sanitized access log."""
+
+import json
+
+
+class TestAccessLogger:
+    """Tests for AccessLogger."""
+
+    def test_records_are_sanitized(self, sghss_app, admin_headers, tmp_path):
+        """Test that only the request shape is written."""
+        from src.utils.access_log import AccessLogger
+
+        path = tmp_path / "access.ndjson"
+        AccessLogger(str(path)).init_app(sghss_app)
+        client = sghss_app.test_client()
+
+        client.get("/api/consultas/7?page=2&nome=Maria+Silva", headers=admin_headers)
+        client.post("/api/auth/login", json={"email": "a@b.com", "senha": "segredo123"})
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(records) == 2
+
+        consulta, login = records
+        assert consulta["m"] == "GET"
+        assert consulta["r"] == "/api/consultas/<int:consulta_id>"
+        assert consulta["a"] == {"consulta_id": 7}
+        assert consulta["q"] == {"page": "2"}
+        assert consulta["s"] == 404
+        assert consulta["d"] >= 0
+        assert "segredo123" not in path.read_text()
+        assert login["r"] == "/api/auth/login"
+
+    def test_replay_rebuilds_paths(self):
+        """Test that replay fills URL variables and query parameters back in."""
+        from benchmarks.replay import build_path
+
+        record = {
+            "r": "/api/prescricoes/consulta/<int:consulta_id>",
+            "a": {"consulta_id": 3},
+            "q": {"page": "1"},
+        }
+        assert build_path(record) == "/api/prescricoes/consulta/3?page=1"
@@ -0,0 +1,137 @@
+"""Tests for admission control."""
+
+import threading
+
+import pytest
+
+
+class TestAdaptiveLimiter:
+    """Tests for AdaptiveLimiter."""
+
+    def test_rejects_when_queue_is_full(self):
+        """Test that requests over the limit are rejected without a queue slot."""
+        from src.utils.admission import CRITICAL, AdaptiveLimiter
+
+        limiter = AdaptiveLimiter("test", limit=2, queue_size=0)
+
+        assert limiter.acquire(CRITICAL)
+        assert limiter.acquire(CRITICAL)
+        assert not limiter.acquire(CRITICAL, timeout=1)
+        limiter.release()
+        assert limiter.acquire(CRITICAL)
+        assert limiter.status()["rejected"] == 1
+
+    def test_low_priority_keeps_headroom(self):
+        """Test that low priority requests cannot take the whole limit."""
+        from src.utils.admission import CRITICAL, LOW, AdaptiveLimiter
+
+        limiter = AdaptiveLimiter("test", limit=4)
+
+        assert limiter.acquire(LOW)
+        assert limiter.acquire(LOW)
+        assert not limiter.acquire(LOW)
+        assert limiter.acquire(CRITICAL)
+
+    def test_waiters_are_served_by_priority(self):
+        """Test that a released permit goes to the most important waiter."""
+        from src.utils.admission import CRITICAL, NORMAL, AdaptiveLimiter
+
+        limiter = AdaptiveLimiter("test", limit=1)
+        assert limiter.acquire(CRITICAL)
+
+        order = []
+
+        def wait(priority):
+            if limiter.acquire(priority, timeout=5):
+                order.append(priority)
+                limiter.release()
+
+        threads = [threading.Thread(target=wait, args=(NORMAL,))]
+        threads[0].start()
+        while limiter.status()["queued"] < 1:
+            pass
+        threads.append(threading.Thread(target=wait, args=(CRITICAL,)))
+        threads[1].start()
+        while limiter.status()["queued"] < 2:
+            pass
+
+        limiter.release()
+        for thread in threads:
+            thread.join()
+
+        assert order == [CRITICAL, NORMAL]
+
+    def test_limit_follows_latency(self):
+        """Test that the limit shrinks when latency grows past the tolerance."""
+        from src.utils.admission import CRITICAL, AdaptiveLimiter
+
+        limiter = AdaptiveLimiter("test", limit=8, max_limit=16)
+        for _ in range(50):
+            for _ in range(8):
+                limiter.acquire(CRITICAL)
+            for _ in range(8):
+                limiter.release(0.01)
+        grown = limiter.limit
+        assert grown > 8
+
+        for _ in range(50):
+            limiter.acquire(CRITICAL)
+            limiter.release(0.2)
+        assert limiter.limit < grown / 2
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    def test_classification(self):
+        """Test the default request classes."""
+        from src.utils.admission import CRITICAL, EXEMPT, LOW, NORMAL, AdmissionController
+
+        controller = AdmissionController(priorities={"pacientes.listar_pacientes": NORMAL})
+
+        assert controller.classify("auth.health_check", "GET") == EXEMPT
+        assert controller.classify("consultas.listar_consultas", "GET") == CRITICAL
+        assert controller.classify("medicamentos.listar_medicamentos", "GET") == LOW
+        assert controller.classify("admin.listar_queries", "GET") == LOW
+        assert controller.classify("pacientes.listar_pacientes", "GET") == NORMAL
+        assert controller.classify("usuarios.criar_usuario", "POST") == NORMAL
+
+    def test_parse_priorities(self):
+        """Test parsing priority overrides."""
+        from src.utils.admission import parse_priorities
+
+        assert parse_priorities("") == {}
+        assert parse_priorities("a.b=LOW, c.d=exempt") == {"a.b": "low", "c.d": "exempt"}
+        with pytest.raises(ValueError):
+            parse_priorities("a.b=urgent")
+
+    def test_sheds_with_retry_after(self, sghss_app):
+        """Test that a full endpoint fails fast while health checks still pass."""
+        from src.utils.admission import AdmissionController
+
+        controller = AdmissionController(endpoint_limit=1, queue_size=0)
+        controller.init_app(sghss_app)
+        entered, finish = threading.Event(), threading.Event()
+
+        @sghss_app.route("/lento")
+        def lento():
+            entered.set()
+            finish.wait(5)
+            return {"ok": True}
+
+        holder = threading.Thread(target=lambda: sghss_app.test_client().get("/lento"))
+        holder.start()
+        entered.wait(5)
+        try:
+            client = sghss_app.test_client()
+            shed = client.get("/lento")
+            health = client.get("/api/auth/health")
+        finally:
+            finish.set()
+            holder.join()
+
+        assert shed.status_code == 503
+        assert int(shed.headers["Retry-After"]) >= 1
+        assert health.status_code == 200
+        assert sghss_app.test_client().get("/lento").status_code == 200
+        assert controller.limiter("lento").status()["inflight"] == 0
@@ -0,0 +1,107 @@
+"""Tests for professional agenda listings."""
+
+import json
+
+
+def _agenda(sghss_app):
+    services = sghss_app.extensions["services"]
+    paciente = services.get("pacientes").criar_paciente(
+        nome="Maria Santos", email="maria@example.com", telefone="11987654321", cpf="12345678901"
+    )
+    profissional = services.get("profissionais").criar_profissional(
+        nome="Dr. Silva",
+        email="silva@example.com",
+        telefone="11912345678",
+        especialidade="Cardiologia",
+        registro="CRM123",
+    )
+    consultas = services.get("consultas")
+    for data in ("2030-01-08 09:00:00", "2030-01-07 14:00:00", "2030-01-07 08:00:00"):
+        consultas.criar_consulta(paciente.id, data, "Retorno", profissional_id=profissional.id)
+    return consultas, profissional
+
+
+class TestAgenda:
+    """Tests for /api/profissionais/<id>/agenda."""
+
+    def test_consultas_are_grouped_by_day(self, sghss_app, client, admin_headers):
+        """Test ordering, grouping and the range bounds."""
+        _, profissional = _agenda(sghss_app)
+
+        response = client.get(
+            f"/api/profissionais/{profissional.id}/agenda?from=2030-01-07&to=2030-01-07",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        (dia,) = response.get_json()["data"]
+        assert dia["dia"] == "2030-01-07"
+        assert [consulta["data"] for consulta in dia["consultas"]] == [
+            "2030-01-07 08:00:00",
+            "2030-01-07 14:00:00",
+        ]
+
+    def test_status_filter_and_errors(self, sghss_app, client, admin_headers):
+        """Test filtering by status, invalid statuses and unknown professionals."""
+        _, profissional = _agenda(sghss_app)
+        url = f"/api/profissionais/{profissional.id}/agenda?from=2030-01-01&to=2030-01-31"
+
+        agendadas = client.get(f"{url}&status=agendada,realizada", headers=admin_headers)
+        realizadas = client.get(f"{url}&status=realizada", headers=admin_headers)
+        invalido = client.get(f"{url}&status=adiada", headers=admin_headers)
+        desconhecido = client.get(
+            "/api/profissionais/999/agenda?from=2030-01-01&to=2030-01-31", headers=admin_headers
+        )
+
+        assert [dia["dia"] for dia in agendadas.get_json()["data"]] == ["2030-01-07", "2030-01-08"]
+        assert realizadas.get_json()["data"] == []
+        assert invalido.status_code == 400
+        assert desconhecido.status_code == 404
+
+    def test_streaming_writes_one_line_per_day(self, sghss_app, client, admin_headers):
+        """Test the NDJSON response and that the connection is returned afterwards."""
+        _, profissional = _agenda(sghss_app)
+        tracker = sghss_app.extensions["services"].db_manager.connection_tracker
+
+        response = client.get(
+            f"/api/profissionais/{profissional.id}/agenda?from=2030-01-01&to=2030-01-31&stream=1",
+            headers=admin_headers,
+        )
+
+        assert response.mimetype == "application/x-ndjson"
+        dias = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [(dia["dia"], len(dia["consultas"])) for dia in dias] == [
+            ("2030-01-07", 2),
+            ("2030-01-08", 1),
+        ]
+        assert tracker.holders() == []
+
+    def test_closing_the_iterator_releases_the_connection(self, sghss_app):
+        """Test that a client going away mid-stream returns the connection."""
+        consultas, profissional = _agenda(sghss_app)
+        tracker = sghss_app.extensions["services"].db_manager.connection_tracker
+
+        dias = consultas.iterar_agenda(profissional.id, "2030-01-01", "2030-01-31", lote=1)
+        assert next(dias)["dia"] == "2030-01-07"
+        assert len(tracker.holders()) == 1
+        dias.close()
+
+        assert tracker.holders() == []
+
+    def test_range_scan_uses_the_composite_index(self, sghss_app):
+        """Test that SQLite plans the agenda query on (profissional_id, data)."""
+        db_manager = sghss_app.extensions["services"].db_manager
+
+        with db_manager.get_cursor() as (cursor, conn):
+            cursor.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT id FROM consultas
+                WHERE profissional_id = %s AND data >= %s AND data < %s
+                ORDER BY data, id
+                """,
+                (1, "2030-01-01 00:00:00", "2030-02-01 00:00:00"),
+            )
+            plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+
+        assert "idx_consultas_profissional_data" in plan
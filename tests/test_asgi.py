@@ -0,0 +1,112 @@
+"""Tests for the asyncio serving mode."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+pytest.importorskip("greenlet")
+
+
+def _call(asgi_app, path, query=b""):
+    """Issue one GET request through an ASGI application."""
+
+    async def run():
+        messages = []
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query,
+            "headers": [(b"host", b"testserver")],
+        }
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await asgi_app(scope, receive, send)
+        return messages
+
+    return run()
+
+
+def _decode(messages):
+    status = messages[0]["status"]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return status, json.loads(body) if body else None
+
+
+class TestAsyncBridge:
+    """Tests for greenlet_spawn and await_only."""
+
+    def test_await_only_requires_bridge(self):
+        """Test that await_only fails outside greenlet_spawn."""
+        from src.utils.async_bridge import await_only
+
+        with pytest.raises(RuntimeError):
+            await_only(asyncio.sleep(0))
+
+    def test_sync_code_awaits_through_bridge(self):
+        """Test that synchronous code can await and propagate exceptions."""
+        from src.utils.async_bridge import await_only, greenlet_spawn
+
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        def sync_caller():
+            return await_only(double(21))
+
+        def sync_failure():
+            await_only(asyncio.sleep(0))
+            raise ValueError("boom")
+
+        assert asyncio.run(greenlet_spawn(sync_caller)) == 42
+        with pytest.raises(ValueError):
+            asyncio.run(greenlet_spawn(sync_failure))
+
+
+class TestGreenletWSGIMiddleware:
+    """Tests serving the Flask app over ASGI."""
+
+    def test_health_check(self):
+        """Test that blueprints are served unchanged."""
+        from src.asgi import create_asgi_app
+
+        status, body = _decode(asyncio.run(_call(create_asgi_app("testing"), "/api/auth/health")))
+
+        assert status == 200
+        assert body["data"]["status"] == "healthy"
+
+    def test_requests_overlap_while_awaiting(self):
+        """Test that requests waiting on I/O do not block each other."""
+        from flask import request
+
+        from src import create_app
+        from src.asgi import GreenletWSGIMiddleware
+        from src.utils.async_bridge import await_only
+
+        app = create_app("testing")
+
+        @app.route("/slow")
+        def slow():
+            await_only(asyncio.sleep(0.2))
+            return {"n": request.args["n"]}
+
+        asgi_app = GreenletWSGIMiddleware(app)
+
+        async def run_all():
+            return await asyncio.gather(
+                *(_call(asgi_app, "/slow", f"n={n}".encode()) for n in range(10))
+            )
+
+        started = time.perf_counter()
+        results = asyncio.run(run_all())
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 1.0
+        assert [_decode(messages)[1]["n"] for messages in results] == [str(n) for n in range(10)]
@@ -0,0 +1,166 @@
+"""Tests for the availability cache."""
+
+from datetime import date, datetime
+
+AGORA = datetime(2030, 1, 1)
+
+
+def _agenda(sghss_app):
+    services = sghss_app.extensions["services"]
+    paciente = services.get("pacientes").criar_paciente(
+        nome="Maria Santos", email="maria@example.com", telefone="11987654321", cpf="12345678901"
+    )
+    profissionais = services.get("profissionais")
+    cardiologistas = [
+        profissionais.criar_profissional(
+            nome=f"Dr. {nome}",
+            email=f"{nome.lower()}@example.com",
+            telefone="11912345678",
+            especialidade="Cardiologia",
+            registro=f"CRM{indice}",
+            horario_inicio=inicio,
+            horario_fim=fim,
+            dias_atendimento="Segunda a Sexta",
+        )
+        for indice, (nome, inicio, fim) in enumerate(
+            [("Silva", "08:00", "12:00"), ("Souza", "22:00", "02:00")]
+        )
+    ]
+    return paciente, profissionais, services.get("consultas"), cardiologistas
+
+
+class TestAvailabilityBits:
+    """Tests for the bitset helpers."""
+
+    def test_runs_and_slots(self):
+        """Test finding runs of free blocks and cutting them into slots."""
+        from src.utils.availability import runs_of, slot_starts
+
+        assert runs_of(0b1110111, 3) == 0b10001
+        assert runs_of(0b1111, 5) == 0
+        assert list(slot_starts(0b1111011100, 2)) == [2, 6, 8]
+
+    def test_removing_keeps_blocks_shared_with_other_consultas(self):
+        """Test that freeing one consulta keeps a block another one still touches."""
+        from src.utils.availability import AvailabilityCache
+
+        cache = AvailabilityCache()
+        dia = date(2030, 1, 7)
+        cache.busy_masks([1], dia, dia, lambda ids, first, last: [])
+        cache.add(1, 10, datetime(2030, 1, 7, 10, 0), datetime(2030, 1, 7, 10, 32))
+        cache.add(1, 11, datetime(2030, 1, 7, 10, 32), datetime(2030, 1, 7, 11, 0))
+        cache.remove(1, 10, datetime(2030, 1, 7, 10, 0), datetime(2030, 1, 7, 10, 32))
+
+        mask = cache.busy_masks([1], dia, dia, None)[1][dia]
+
+        assert mask == ((1 << 6) - 1) << (10 * 12 + 6)
+        assert cache.status()["hits"] == 1
+
+    def test_snapshot_loaded_during_a_booking_is_not_kept(self):
+        """Test that a load racing with a booking is used once but not cached."""
+        from src.utils.availability import AvailabilityCache
+
+        cache = AvailabilityCache()
+        dia = date(2030, 1, 7)
+
+        def loader(ids, first, last):
+            cache.add(1, 10, datetime(2030, 1, 7, 10), datetime(2030, 1, 7, 11))
+            return []
+
+        cache.busy_masks([1], dia, dia, loader)
+
+        assert cache.status()["days"] == 0
+
+
+class TestAvailabilityService:
+    """Tests for the cache wired into the services."""
+
+    def test_cached_slots_match_uncached_slots(self, sghss_app):
+        """Test that both slot paths agree, overnight shifts included."""
+        paciente, profissionais, consultas, (silva, souza) = _agenda(sghss_app)
+        consultas.criar_consulta(
+            paciente.id, "2030-01-07 09:10:00", "Retorno", profissional_id=silva.id
+        )
+        consultas.criar_consulta(
+            paciente.id, "2030-01-07 23:40:00", "Plantão", profissional_id=souza.id
+        )
+
+        for profissional in (silva, souza):
+            cached = profissionais.listar_horarios_livres(
+                profissional.id, "2030-01-06", "2030-01-08", 30, agora=AGORA
+            )
+            cache, profissionais.availability = profissionais.availability, None
+            uncached = profissionais.listar_horarios_livres(
+                profissional.id, "2030-01-06", "2030-01-08", 30, agora=AGORA
+            )
+            profissionais.availability = cache
+
+            assert cached == uncached
+        assert {"inicio": "2030-01-08 00:10:00", "fim": "2030-01-08 00:40:00"} in cached
+
+    def test_bookings_update_cached_days_in_place(self, sghss_app):
+        """Test that create, move and delete update the cache without reloading."""
+        paciente, profissionais, consultas, (silva, _) = _agenda(sghss_app)
+        cache = profissionais.availability
+
+        def livres():
+            return [
+                slot["inicio"][11:16]
+                for slot in profissionais.listar_horarios_livres(
+                    silva.id, "2030-01-07", "2030-01-07", 60, agora=AGORA
+                )
+            ]
+
+        assert livres() == ["08:00", "09:00", "10:00", "11:00"]
+        misses = cache.status()["misses"]
+
+        consulta = consultas.criar_consulta(
+            paciente.id,
+            "2030-01-07 09:00:00",
+            "Retorno",
+            profissional_id=silva.id,
+            duracao_minutos=60,
+        )
+        assert livres() == ["08:00", "10:00", "11:00"]
+        consultas.atualizar_consulta(consulta.id, data="2030-01-07 10:00:00")
+        assert livres() == ["08:00", "09:00", "11:00"]
+        consultas.deletar_consulta(consulta.id)
+        assert livres() == ["08:00", "09:00", "10:00", "11:00"]
+
+        assert cache.status()["misses"] == misses
+
+    def test_first_free_slot_across_professionals(self, sghss_app, client, admin_headers):
+        """Test picking the earliest free slot of a specialty."""
+        paciente, profissionais, consultas, (silva, souza) = _agenda(sghss_app)
+        for hora in ("08:00", "09:00", "10:00", "11:00"):
+            consultas.criar_consulta(
+                paciente.id,
+                f"2030-01-07 {hora}:00",
+                "Retorno",
+                profissional_id=silva.id,
+                duracao_minutos=60,
+            )
+
+        slot = profissionais.primeiro_horario_livre(
+            "Cardiologia", "2030-01-05", "2030-01-11", 60, agora=AGORA
+        )
+        response = client.get(
+            "/api/profissionais/slots/first?especialidade=Pediatria&from=2030-01-05&to=2030-01-11",
+            headers=admin_headers,
+        )
+
+        assert (slot["profissional"]["id"], slot["inicio"]) == (souza.id, "2030-01-07 22:00:00")
+        assert response.status_code == 200
+        assert response.get_json()["data"] is None
+
+    def test_admin_endpoint(self, sghss_app, client, admin_headers):
+        """Test reading and clearing the cache through the admin API."""
+        _, profissionais, _, (silva, _) = _agenda(sghss_app)
+        profissionais.listar_horarios_livres(silva.id, "2030-01-07", "2030-01-07", agora=AGORA)
+
+        status = client.get("/api/admin/availability", headers=admin_headers)
+        cleared = client.delete("/api/admin/availability", headers=admin_headers)
+
+        assert status.get_json()["data"]["days"] == 2
+        assert cleared.status_code == 200
+        assert profissionais.availability.status()["days"] == 0
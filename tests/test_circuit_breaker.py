@@ -0,0 +1,103 @@
+"""Tests for the database circuit breaker."""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens at the threshold and then fails fast."""
+        from src.exceptions import ServiceUnavailableError
+        from src.utils.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        breaker.record_failure(OSError("refused"))
+        breaker.record_success()
+        for _ in range(3):
+            breaker.before_connect()
+            breaker.record_failure(OSError("refused"))
+
+        assert breaker.state == "open"
+        with pytest.raises(ServiceUnavailableError) as info:
+            breaker.before_connect()
+        assert info.value.retry_after == 30
+        assert breaker.status()["rejected"] == 1
+
+    def test_half_open_probe(self):
+        """Test that one probe goes through after the timeout and closes the circuit."""
+        from src.exceptions import ServiceUnavailableError
+        from src.utils.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure(OSError("refused"))
+
+        assert breaker.state == "half_open"
+        breaker.before_connect()
+        with pytest.raises(ServiceUnavailableError):
+            breaker.before_connect()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+        breaker.before_connect()
+
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the circuit again."""
+        from src.utils.circuit_breaker import CircuitBreaker
+
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0)
+        for _ in range(5):
+            breaker.record_failure(OSError("refused"))
+        breaker.before_connect()
+        breaker.reset_timeout = 30
+        breaker.record_failure(OSError("still refused"))
+
+        assert breaker.state == "open"
+        assert breaker.status()["last_error"] == "still refused"
+
+
+class TestDatabaseCircuit:
+    """Tests for the breaker wired into DatabaseManager and the app."""
+
+    def test_request_fails_fast_with_503(self, sghss_app, admin_headers):
+        """Test that requests answer 503 without connecting while the circuit is open."""
+        db_manager = sghss_app.extensions["services"].db_manager
+        db_manager.circuit_breaker.reset_timeout = 30
+        client = sghss_app.test_client()
+
+        with patch.object(
+            db_manager.backend, "connect", side_effect=sqlite3.OperationalError("unable to open")
+        ) as connect:
+            for _ in range(db_manager.circuit_breaker.failure_threshold):
+                response = client.get("/api/pacientes", headers=admin_headers)
+                assert response.status_code == 500
+            response = client.get("/api/pacientes", headers=admin_headers)
+
+        assert connect.call_count == db_manager.circuit_breaker.failure_threshold
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "30"
+        assert response.get_json()["error_code"] == "SERVICE_UNAVAILABLE"
+
+        health = client.get("/api/auth/health").get_json()["data"]
+        assert health["status"] == "degraded"
+        assert health["database"]["circuit"]["state"] == "open"
+
+    def test_health_reports_mysql_pool(self):
+        """Test that pool usage is read from the pool without connecting."""
+        from src.config.backends import MySQLBackend
+        from src.config.database import DatabaseManager
+
+        backend = MySQLBackend({"host": "db"}, pool_size=4)
+        assert backend.pool_status()["idle"] is None
+
+        pool = MagicMock()
+        pool._cnx_queue.qsize.return_value = 3
+        with patch("mysql.connector.pooling.MySQLConnectionPool", return_value=pool):
+            backend.connect()
+
+        health = DatabaseManager({}, backend=backend).health()
+        assert health["pool"] == {"size": 4, "idle": 3, "in_use": 1, "overflow": 0}
+        assert health["circuit"] is None
@@ -0,0 +1,83 @@
+"""Tests for connection checkout tracking."""
+
+import logging
+import sqlite3
+import time
+from unittest.mock import patch
+
+import pytest
+
+
+class TestConnectionTracker:
+    """Tests for ConnectionTracker wired into DatabaseManager."""
+
+    def test_failed_connect_raises_driver_error(self):
+        """Test that a failing connect surfaces the driver error."""
+        from src.config.backends import SQLiteBackend
+        from src.config.database import DatabaseManager
+
+        backend = SQLiteBackend(":memory:")
+        db_manager = DatabaseManager({}, backend=backend)
+
+        with patch.object(backend, "connect", side_effect=sqlite3.OperationalError("down")):
+            with pytest.raises(sqlite3.OperationalError):
+                with db_manager.get_cursor():
+                    pass
+        with patch.object(backend, "prepared_cursor", side_effect=sqlite3.OperationalError("x")):
+            with pytest.raises(sqlite3.OperationalError):
+                with db_manager.get_cursor(prepared=True):
+                    pass
+
+    def test_holders_are_listed_with_their_stack(self, sghss_app):
+        """Test that a checked-out connection shows who holds it."""
+        db_manager = sghss_app.extensions["services"].db_manager
+        tracker = db_manager.connection_tracker
+
+        with db_manager.get_connection():
+            (holder,) = tracker.holders()
+            assert any("test_holders_are_listed_with_their_stack" in f for f in holder["stack"])
+            assert not any("contextlib" in frame for frame in holder["stack"])
+
+        assert tracker.holders() == []
+
+    def test_long_hold_is_reported(self, sghss_app, caplog):
+        """Test that returning a connection after the threshold logs its stack."""
+        db_manager = sghss_app.extensions["services"].db_manager
+        db_manager.connection_tracker.hold_warning_seconds = 0.01
+
+        with caplog.at_level(logging.WARNING, logger="src.utils.connection_tracker"):
+            with db_manager.get_connection():
+                time.sleep(0.02)
+
+        assert "Connection held for" in caplog.text
+        assert "test_long_hold_is_reported" in caplog.text
+        assert db_manager.connection_tracker.long_holds == 1
+
+    def test_idle_transaction_is_reported(self, sghss_app, caplog):
+        """Test that slow work inside an open transaction is reported."""
+        db_manager = sghss_app.extensions["services"].db_manager
+        db_manager.connection_tracker.idle_transaction_seconds = 0.01
+
+        with caplog.at_level(logging.WARNING, logger="src.utils.connection_tracker"):
+            with db_manager.get_cursor() as (cursor, conn):
+                cursor.execute("INSERT INTO medicamentos (nome) VALUES (%s)", ("Dipirona",))
+                time.sleep(0.02)
+                cursor.execute("SELECT COUNT(*) FROM medicamentos")
+                conn.commit()
+
+        assert "Transaction stayed open" in caplog.text
+        assert db_manager.connection_tracker.idle_transactions == 1
+
+    def test_admin_endpoint(self, sghss_app, client, admin_headers):
+        """Test listing current holders through the admin API."""
+        db_manager = sghss_app.extensions["services"].db_manager
+
+        with db_manager.get_connection():
+            response = client.get("/api/admin/connections", headers=admin_headers)
+            held = client.get("/api/admin/connections?min_seconds=60", headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert data["held"] == 1
+        assert data["holders"][0]["thread"]
+        assert held.get_json()["data"]["holders"] == []
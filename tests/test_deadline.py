@@ -0,0 +1,106 @@
+"""Tests for request deadlines and statement time limits."""
+
+import time
+
+import pytest
+
+RUNAWAY_QUERY = (
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT COUNT(*) FROM c"
+)
+
+
+class TestStatementLimits:
+    """Tests for backend statement limits."""
+
+    def test_mysql_hint(self):
+        """Test that only SELECT statements get MAX_EXECUTION_TIME, rounded down."""
+        from src.config.backends import MySQLBackend
+
+        backend = MySQLBackend({})
+
+        assert backend.limit_statement(None, "  select * from x", 256) == (
+            "  select /*+ MAX_EXECUTION_TIME(256) */ * from x"
+        )
+        assert "MAX_EXECUTION_TIME(256)" in backend.limit_statement(None, "SELECT 1", 500)
+        assert backend.limit_statement(None, "UPDATE x SET y = 1", 250) == "UPDATE x SET y = 1"
+
+    def test_mysql_timeout_errors(self):
+        """Test recognizing server-side timeouts from either driver."""
+        from src.config.backends import MySQLBackend
+
+        class DriverError(Exception):
+            def __init__(self, *args, errno=None):
+                super().__init__(*args)
+                self.errno = errno
+
+        backend = MySQLBackend({})
+
+        assert backend.is_timeout(DriverError("timeout", errno=3024))
+        assert backend.is_timeout(Exception(3024, "timeout"))
+        assert not backend.is_timeout(DriverError("duplicate", errno=1062))
+
+    def test_runaway_query_is_cancelled(self, sghss_app):
+        """Test that a statement is interrupted when the deadline passes."""
+        from src.exceptions import DeadlineExceededError
+        from src.utils.deadline import deadline
+
+        db_manager = sghss_app.extensions["services"].db_manager
+
+        started = time.perf_counter()
+        with pytest.raises(DeadlineExceededError):
+            with deadline(0.05):
+                with db_manager.get_cursor() as (cursor, conn):
+                    cursor.execute(RUNAWAY_QUERY)
+        assert time.perf_counter() - started < 2
+
+        # The connection is usable again without a limit
+        with db_manager.get_cursor() as (cursor, conn):
+            cursor.execute("SELECT 1")
+            assert cursor.fetchone() == (1,)
+
+    def test_expired_deadline_skips_database(self, sghss_app):
+        """Test that no connection is taken once the deadline has passed."""
+        from src.exceptions import DeadlineExceededError
+        from src.utils.deadline import deadline
+
+        db_manager = sghss_app.extensions["services"].db_manager
+
+        with deadline(0):
+            with pytest.raises(DeadlineExceededError):
+                with db_manager.get_connection():
+                    pass
+
+
+class TestRequestDeadlines:
+    """Tests for RequestDeadlines."""
+
+    def test_budgets(self):
+        """Test endpoint, blueprint and default budgets."""
+        from src.utils.deadline import RequestDeadlines, parse_deadlines
+
+        deadlines = RequestDeadlines(
+            default_ms=5000, deadlines=parse_deadlines("consultas.listar_consultas=2000")
+        )
+
+        assert deadlines.budget_ms("consultas.listar_consultas") == 2000
+        assert deadlines.budget_ms("admin.listar_queries") == 60000
+        assert deadlines.budget_ms("pacientes.listar_pacientes") == 5000
+        with pytest.raises(ValueError):
+            parse_deadlines("admin=soon")
+
+    def test_failure_after_deadline_is_504(self, sghss_app):
+        """Test that a request failing after its deadline answers 504."""
+        from src.utils.deadline import DEADLINE_HEADER
+
+        @sghss_app.route("/lento")
+        def lento():
+            time.sleep(0.05)
+            sghss_app.extensions["services"].get("consultas").listar_consultas()
+            return {"ok": True}
+
+        client = sghss_app.test_client()
+        response = client.get("/lento", headers={DEADLINE_HEADER: "10"})
+        assert response.status_code == 504
+        assert response.get_json()["error_code"] == "DEADLINE_EXCEEDED"
+
+        assert client.get("/lento").status_code == 200
@@ -72,6 +72,7 @@ class TestUsuarioService:
         # Mock the database cursor
         mock_cursor = MagicMock()
         mock_cursor.lastrowid = 1
+        mock_cursor.fetchone.return_value = None
         mock_conn = MagicMock()
 
         usuario_service.db_manager.get_cursor.return_value.__enter__.return_value = (
@@ -0,0 +1,150 @@
+"""Tests for tracemalloc snapshots and RSS tracking per endpoint."""
+
+import json
+import tracemalloc
+
+import pytest
+
+
+@pytest.fixture
+def memory_profiler(sghss_app):
+    """The app's memory profiler, with tracing stopped afterwards."""
+    profiler = sghss_app.extensions["memory_profiler"]
+    yield profiler
+    profiler.stop()
+
+
+class TestMemoryProfiler:
+    """Tests for MemoryProfiler."""
+
+    def test_start_and_stop(self, memory_profiler):
+        """Test that stopping tracing also drops the stored snapshots."""
+        memory_profiler.start()
+        memory_profiler.start()
+        assert memory_profiler.tracing
+        memory_profiler.take_snapshot()
+
+        memory_profiler.stop()
+
+        assert not memory_profiler.tracing
+        assert memory_profiler.list_snapshots() == []
+        with pytest.raises(RuntimeError):
+            memory_profiler.take_snapshot()
+
+    def test_diff_reports_growth_by_line(self, memory_profiler):
+        """Test that allocations between two snapshots show up in the diff."""
+        memory_profiler.start()
+        before = memory_profiler.take_snapshot()
+        retained = [bytearray(1024) for _ in range(1000)]
+        after = memory_profiler.take_snapshot()
+
+        allocations = memory_profiler.diff(before["id"], after["id"], filters=None)
+
+        assert after["id"] == before["id"] + 1
+        assert after["traced_bytes"] > before["traced_bytes"]
+        assert any(
+            item["file"].endswith("test_memory.py")
+            and item["size_diff_bytes"] >= len(retained) * 1024
+            for item in allocations
+        )
+        with pytest.raises(KeyError):
+            memory_profiler.diff(before["id"], 999)
+
+    def test_oldest_snapshots_are_dropped(self, memory_profiler):
+        """Test that only max_snapshots snapshots are kept."""
+        memory_profiler.max_snapshots = 2
+        memory_profiler.start()
+
+        ids = [memory_profiler.take_snapshot()["id"] for _ in range(3)]
+
+        assert [item["id"] for item in memory_profiler.list_snapshots()] == ids[1:]
+
+    def test_rss_is_tracked_per_endpoint(self, memory_profiler, client, admin_headers):
+        """Test that requests are counted per endpoint with their RSS."""
+        for _ in range(2):
+            client.get("/api/pacientes", headers=admin_headers)
+
+        entry = next(
+            item
+            for item in memory_profiler.endpoint_report()
+            if item["endpoint"].startswith("pacientes.")
+        )
+        assert entry["requests"] == 2
+        assert entry["peak_rss_bytes"] >= entry["last_rss_bytes"] > 0
+
+
+class TestMemoryEndpoints:
+    """Tests for the admin memory endpoints and CLI."""
+
+    def test_snapshot_and_diff_through_the_api(self, memory_profiler, client, admin_headers):
+        """Test the start, snapshot, diff and stop endpoints."""
+        not_running = client.post("/api/admin/memory/snapshots", headers=admin_headers)
+        started = client.post("/api/admin/memory/start", headers=admin_headers)
+        first = client.post("/api/admin/memory/snapshots", headers=admin_headers)
+        client.get("/api/pacientes", headers=admin_headers)
+        second = client.post("/api/admin/memory/snapshots", headers=admin_headers)
+        first_id, second_id = first.get_json()["data"]["id"], second.get_json()["data"]["id"]
+
+        listed = client.get("/api/admin/memory/snapshots", headers=admin_headers)
+        top = client.get(f"/api/admin/memory/snapshots/{first_id}?all=1", headers=admin_headers)
+        diff = client.get(
+            f"/api/admin/memory/diff?from={first_id}&to={second_id}&limit=5",
+            headers=admin_headers,
+        )
+        missing = client.get(
+            f"/api/admin/memory/diff?from={first_id}&to=999", headers=admin_headers
+        )
+        incomplete = client.get(f"/api/admin/memory/diff?from={first_id}", headers=admin_headers)
+        stopped = client.post("/api/admin/memory/stop", headers=admin_headers)
+
+        assert not_running.status_code == 400
+        assert started.get_json()["data"] == {"tracing": True}
+        assert first.status_code == second.status_code == 201
+        assert [item["id"] for item in listed.get_json()["data"]["snapshots"]] == [
+            first_id,
+            second_id,
+        ]
+        assert top.get_json()["data"]
+        assert diff.status_code == 200
+        assert len(diff.get_json()["data"]) <= 5
+        assert missing.status_code == 404
+        assert incomplete.status_code == 400
+        assert stopped.get_json()["data"] == {"tracing": False}
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.parametrize(
+        "method,path",
+        [
+            ("post", "/api/admin/memory/start"),
+            ("post", "/api/admin/memory/stop"),
+            ("post", "/api/admin/memory/snapshots"),
+            ("get", "/api/admin/memory/snapshots"),
+            ("get", "/api/admin/memory/snapshots/1"),
+            ("get", "/api/admin/memory/diff?from=1&to=2"),
+            ("get", "/api/admin/memory/endpoints"),
+        ],
+    )
+    def test_endpoints_require_admin(self, memory_profiler, client, user_headers, method, path):
+        """Test that non-admin tokens are rejected without touching tracemalloc."""
+        response = getattr(client, method)(path, headers=user_headers)
+
+        assert response.status_code == 403
+        assert not tracemalloc.is_tracing()
+
+    def test_cli_command(self, sghss_app, memory_profiler):
+        """Test the flask memory-profile command."""
+        # The autouse app_context fixture pushes a bare app; the command needs this one
+        with sghss_app.app_context():
+            result = sghss_app.test_cli_runner().invoke(
+                args=["memory-profile", "/api/pacientes", "--requests", "3", "--all-modules"]
+            )
+
+        report = json.loads(result.output)
+        assert report["status_codes"] == {"200": 3}
+        assert report["after"]["id"] == report["before"]["id"] + 1
+        assert isinstance(report["allocations"], list)
+        assert not tracemalloc.is_tracing()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,51 @@
+"""Tests for the MySQL backend connection pool."""
+
+from unittest.mock import MagicMock, patch
+
+from mysql.connector import pooling
+
+
+class TestMySQLBackendPool:
+    """Tests for MySQLBackend pooling, without a MySQL server."""
+
+    @patch("mysql.connector.pooling.MySQLConnectionPool")
+    def test_pool_is_created_per_process(self, mock_pool_cls):
+        """Test that a pool inherited through fork is not reused."""
+        from src.config.backends import MySQLBackend
+
+        backend = MySQLBackend({"host": "db"}, pool_size=4)
+        backend.connect()
+        backend.connect()
+        assert mock_pool_cls.call_count == 1
+
+        with patch("src.config.backends.os.getpid", return_value=-1):
+            backend.connect()
+        assert mock_pool_cls.call_count == 2
+
+    @patch("mysql.connector.connect")
+    @patch("mysql.connector.pooling.MySQLConnectionPool")
+    def test_exhausted_pool_falls_back_to_direct_connection(self, mock_pool_cls, mock_connect):
+        """Test that pool exhaustion opens a direct connection."""
+        from src.config.backends import MySQLBackend
+
+        mock_pool_cls.return_value.get_connection.side_effect = pooling.PoolError("exhausted")
+        backend = MySQLBackend({"host": "db"}, pool_size=2)
+
+        assert backend.connect() is mock_connect.return_value
+
+    @patch("mysql.connector.pooling.MySQLConnectionPool")
+    def test_close_drains_pool(self, mock_pool_cls):
+        """Test that closing the backend closes idle pooled connections."""
+        from src.config.backends import MySQLBackend
+
+        pool = MagicMock()
+        pool._remove_connections.return_value = 2
+        mock_pool_cls.return_value = pool
+        backend = MySQLBackend({"host": "db"}, pool_size=2)
+        backend.connect()
+
+        backend.close()
+
+        pool._remove_connections.assert_called_once()
+        backend.connect()
+        assert mock_pool_cls.call_count == 2
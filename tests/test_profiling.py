@@ -0,0 +1,172 @@
+"""Tests for on-demand request profiling."""
+
+import pytest
+from flask import Flask
+
+
+def _app(tmp_path, max_per_minute=5):
+    """Build a minimal JWT-enabled app with the request profiler installed."""
+    from flask_jwt_extended import JWTManager
+
+    from src.utils.profiling import RequestProfiler
+
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "profiling-test-secret-key-of-32-bytes"
+    JWTManager(app)
+    RequestProfiler(output_dir=str(tmp_path), max_per_minute=max_per_minute).init_app(app)
+
+    @app.route("/ping")
+    def ping():
+        return "pong"
+
+    return app
+
+
+def _headers(app, tipo):
+    """Authorization headers for a token carrying the given role."""
+    from flask_jwt_extended import create_access_token
+
+    with app.app_context():
+        token = create_access_token(identity="1", additional_claims={"tipo": tipo})
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_events_beyond_the_limit_are_rejected(self):
+        """Test that only max_per_minute events are accepted per window."""
+        from src.utils.profiling import RateLimiter
+
+        limiter = RateLimiter(2)
+
+        assert [limiter.try_acquire() for _ in range(3)] == [True, True, False]
+
+    def test_window_slides_after_a_minute(self, monkeypatch):
+        """Test that events older than a minute free their slot."""
+        from src.utils import profiling
+
+        now = [1000.0]
+        monkeypatch.setattr(profiling.time, "monotonic", lambda: now[0])
+        limiter = profiling.RateLimiter(1)
+
+        assert limiter.try_acquire()
+        now[0] += 59
+        assert not limiter.try_acquire()
+        now[0] += 1
+        assert limiter.try_acquire()
+
+
+class TestRequestProfiler:
+    """Tests for RequestProfiler."""
+
+    def test_admin_request_is_profiled(self, tmp_path):
+        """Test that an admin request asking for a profile gets one stored."""
+        app = _app(tmp_path)
+        profiler = app.extensions["request_profiler"]
+
+        response = app.test_client().get(
+            "/ping", headers={**_headers(app, "admin"), "X-Profile": "1"}
+        )
+
+        profile_id = response.headers["X-Profile-Id"]
+        assert response.status_code == 200
+        assert profile_id.endswith(".prof")
+        assert [item["id"] for item in profiler.list_profiles()] == [profile_id]
+        assert profiler.get_profile_path(profile_id) == str(tmp_path / profile_id)
+
+    def test_sample_mode_writes_collapsed_stacks(self, tmp_path):
+        """Test that the query argument selects the sampling mode."""
+        app = _app(tmp_path)
+
+        response = app.test_client().get("/ping?__profile=sample", headers=_headers(app, "admin"))
+
+        assert response.headers["X-Profile-Id"].endswith(".collapsed")
+
+    @pytest.mark.parametrize("tipo", ["paciente", None])
+    def test_non_admin_request_is_served_without_profiling(self, tmp_path, tipo):
+        """Test that the header and query argument are ignored for non-admins."""
+        app = _app(tmp_path)
+        client = app.test_client()
+        auth = _headers(app, tipo) if tipo else {}
+
+        with_header = client.get("/ping", headers={**auth, "X-Profile": "1"})
+        with_argument = client.get("/ping?__profile=sample", headers=auth)
+
+        for response in (with_header, with_argument):
+            assert response.status_code == 200
+            assert "X-Profile-Id" not in response.headers
+        assert list(tmp_path.iterdir()) == []
+
+    def test_profiles_are_rate_limited(self, tmp_path):
+        """Test that requests beyond the per-minute budget are served unprofiled."""
+        app = _app(tmp_path, max_per_minute=2)
+        client = app.test_client()
+        headers = {**_headers(app, "admin"), "X-Profile": "cprofile"}
+
+        responses = [client.get("/ping", headers=headers) for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert ["X-Profile-Id" in response.headers for response in responses] == [
+            True,
+            True,
+            False,
+        ]
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_profile_id_cannot_escape_output_dir(self, tmp_path):
+        """Test that only plain file names inside the output dir are resolved."""
+        from src.utils.profiling import RequestProfiler
+
+        profiler = RequestProfiler(output_dir=str(tmp_path))
+        (tmp_path / "a.prof").write_text("x")
+
+        assert profiler.get_profile_path("a.prof") == str(tmp_path / "a.prof")
+        assert profiler.get_profile_path("../a.prof") is None
+        assert profiler.get_profile_path("missing.prof") is None
+
+
+class TestProfilingAccess:
+    """Tests for who may trigger profiling on the SGHSS app."""
+
+    def test_self_registered_user_cannot_profile(self, sghss_app, client, tmp_path):
+        """Test that signing up and asking for a profile never profiles the request."""
+        sghss_app.extensions["request_profiler"].output_dir = str(tmp_path)
+        credentials = {"email": "maria@example.com", "senha": "SecurePass123"}
+
+        signup = client.post(
+            "/api/usuarios", json={"nome": "Maria", "tipo": "admin", **credentials}
+        )
+        client.post("/api/usuarios", json={"nome": "Maria", **credentials})
+        token = client.post("/api/auth/login", json=credentials).get_json()["data"]["token"]
+        response = client.get(
+            "/api/pacientes",
+            headers={"Authorization": f"Bearer {token}", "X-Profile": "1"},
+        )
+
+        assert signup.status_code == 403
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response.headers
+        assert list(tmp_path.iterdir()) == []
+
+    def test_profile_endpoints_require_admin(self, client, user_headers, admin_headers):
+        """Test that listing and downloading profiles is admin-only."""
+        listed = client.get("/api/admin/profiles", headers=user_headers)
+        downloaded = client.get("/api/admin/profiles/x.prof", headers=user_headers)
+        missing = client.get("/api/admin/profiles/x.prof", headers=admin_headers)
+
+        assert listed.status_code == downloaded.status_code == 403
+        assert missing.status_code == 404
+
+    def test_per_request_profilers_are_off_by_default(self):
+        """Test that only production and tests install the per-request hooks."""
+        from src.config.settings import Config, DevelopmentConfig, TestingConfig
+
+        for config in (Config, DevelopmentConfig):
+            assert not config.PROFILER_ENABLED
+            assert not config.MEMORY_PROFILER_ENABLED
+        assert TestingConfig.PROFILER_ENABLED and TestingConfig.MEMORY_PROFILER_ENABLED
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
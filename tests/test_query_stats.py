@@ -0,0 +1,96 @@
+"""Tests for query statistics and statement fingerprinting."""
+
+import pytest
+from unittest.mock import MagicMock
+
+
+class TestFingerprint:
+    """Tests for fingerprint_sql."""
+
+    def test_literals_and_placeholders_are_normalized(self):
+        """Test that literals and placeholders map to the same fingerprint."""
+        from src.utils.query_stats import fingerprint_sql
+
+        with_literal = fingerprint_sql("SELECT id FROM consultas WHERE id = 42")
+        with_placeholder = fingerprint_sql(
+            """
+            SELECT id
+            FROM consultas
+            WHERE id = %s
+            """
+        )
+
+        assert with_literal == with_placeholder == "SELECT id FROM consultas WHERE id = ?"
+
+    def test_in_lists_and_values_are_collapsed(self):
+        """Test that IN lists and multi-row VALUES are collapsed."""
+        from src.utils.query_stats import fingerprint_sql
+
+        assert fingerprint_sql("DELETE FROM t WHERE id IN (1, 2, 3)") == fingerprint_sql(
+            "DELETE FROM t WHERE id IN (%s)"
+        )
+        assert fingerprint_sql("INSERT INTO t (a, b) VALUES (1, 'x'), (2, 'y')") == (
+            "INSERT INTO t (a, b) VALUES (?, ?)"
+        )
+
+    def test_dynamic_updates_keep_distinct_shapes(self):
+        """Test that different SET lists produce different fingerprints."""
+        from src.utils.query_stats import fingerprint_sql
+
+        assert fingerprint_sql(
+            "UPDATE consultas SET data = %s WHERE id = %s"
+        ) != fingerprint_sql("UPDATE consultas SET data = %s, motivo = %s WHERE id = %s")
+
+
+class TestQueryStats:
+    """Tests for QueryStats."""
+
+    def test_percentiles_and_slow_samples(self):
+        """Test percentile aggregation and slow sample capture."""
+        from src.utils.query_stats import QueryStats
+
+        stats = QueryStats(slow_threshold_ms=50)
+        for duration in range(1, 101):
+            stats.record("SELECT * FROM pacientes WHERE id = %s", (duration,), duration)
+
+        report = stats.top(limit=1)[0]
+        assert report["count"] == 100
+        assert report["p50_ms"] == 50
+        assert report["p95_ms"] == 95
+        assert report["p99_ms"] == 99
+        assert report["slow_count"] == 51
+        assert stats.get(report["id"]).slow_sample == (
+            "SELECT * FROM pacientes WHERE id = %s",
+            (100,),
+        )
+
+    def test_top_filters_by_statement_type(self):
+        """Test filtering the report by statement type."""
+        from src.utils.query_stats import QueryStats
+
+        stats = QueryStats()
+        stats.record("SELECT 1", None, 1)
+        stats.record("UPDATE consultas SET motivo = %s WHERE id = %s", ("x", 1), 2)
+
+        report = stats.top(statement_type="update")
+        assert [item["statement_type"] for item in report] == ["UPDATE"]
+
+    def test_instrumented_cursor_records_execute_and_fetch(self):
+        """Test that the cursor wrapper reports statements on close."""
+        from src.utils.query_stats import InstrumentedCursor, QueryStats
+
+        stats = QueryStats()
+        raw_cursor = MagicMock()
+        raw_cursor.fetchall.return_value = [{"id": 1}]
+
+        cursor = InstrumentedCursor(raw_cursor, stats)
+        cursor.execute("SELECT id FROM medicamentos WHERE nome LIKE %s", ("%a%",))
+        assert cursor.fetchall() == [{"id": 1}]
+        cursor.close()
+
+        raw_cursor.close.assert_called_once()
+        assert stats.top()[0]["count"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
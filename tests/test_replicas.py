@@ -0,0 +1,159 @@
+"""Tests for read-replica routing."""
+
+import pytest
+
+
+@pytest.fixture
+def replicated(tmp_path):
+    """A medicamento service on a SQLite primary with one SQLite replica."""
+    from src.config.backends import SQLiteBackend
+    from src.config.database import DatabaseManager
+    from src.config.replicas import ReplicaSet
+    from src.services.medicamento_service import MedicamentoService
+
+    primary = SQLiteBackend(str(tmp_path / "primary.db"))
+    replica = SQLiteBackend(str(tmp_path / "replica.db"))
+    for backend, nome in ((primary, "Primario"), (replica, "Replica")):
+        conn = backend.connect()
+        conn._connection.execute("INSERT INTO medicamentos (nome) VALUES (?)", (nome,))
+        conn.commit()
+        conn.close()
+
+    replicas = ReplicaSet({"replica": replica}, max_lag_seconds=5)
+    replicas.check()
+    service = MedicamentoService()
+    service.db_manager = DatabaseManager({}, backend=primary, replicas=replicas)
+    return service, replica, replicas
+
+
+def _nomes(service):
+    return [medicamento.nome for medicamento in service.listar_medicamentos()]
+
+
+class TestReplicaRouting:
+    """Tests for DatabaseManager replica routing."""
+
+    def test_read_only_methods_use_replica(self, replicated):
+        """Test that reads in a routing session go to the replica."""
+        from src.config.replicas import routing_session
+
+        service, _, _ = replicated
+
+        assert _nomes(service) == ["Primario"]
+        with routing_session():
+            assert _nomes(service) == ["Replica"]
+        with routing_session(pinned=True):
+            assert _nomes(service) == ["Primario"]
+
+    def test_reads_after_write_stay_on_primary(self, replicated):
+        """Test read-your-writes within a session."""
+        from src.config.replicas import routing_session
+
+        service, _, _ = replicated
+
+        with routing_session() as session:
+            criado = service.criar_medicamento("Novo")
+            assert criado.nome == "Novo"
+            assert session.pinned
+            assert "Novo" in _nomes(service)
+
+    def test_lagging_replica_is_skipped(self, replicated):
+        """Test that a replica over the lag threshold is not used."""
+        from src.config.replicas import routing_session
+
+        service, replica, replicas = replicated
+        replica.replication_lag = lambda connection: 30.0
+        replicas.check()
+
+        with routing_session():
+            assert _nomes(service) == ["Primario"]
+        assert replicas.status()[0]["healthy"] is False
+        assert "30s" in replicas.status()[0]["error"]
+
+    def test_failover_to_primary(self, replicated):
+        """Test that a failing replica is taken out of rotation."""
+        import sqlite3
+
+        from src.config.replicas import routing_session
+
+        service, replica, replicas = replicated
+        replicas.check()
+
+        def broken():
+            raise sqlite3.OperationalError("unable to open database file")
+
+        replica.connect = broken
+        with routing_session():
+            assert _nomes(service) == ["Primario"]
+        assert replicas.status()[0]["healthy"] is False
+
+    def test_health_check_runs_off_the_request_path(self, replicated):
+        """Test that a stale state is refreshed in the background, not by the caller."""
+        import threading
+        import time
+
+        from src.config.replicas import routing_session
+
+        service, replica, replicas = replicated
+        connect, unblocked = replica.connect, threading.Event()
+
+        def slow_connect():
+            unblocked.wait(timeout=5)
+            return connect()
+
+        replica.connect = slow_connect
+        replica.replication_lag = lambda connection: 30.0
+        replicas._next_check = 0.0
+
+        started = time.monotonic()
+        with routing_session():
+            # The last known state still routes to the replica while the check hangs
+            assert replicas.choose() is replica
+        assert time.monotonic() - started < 1
+        assert replicas.status()[0]["healthy"] is True
+
+        unblocked.set()
+        replicas.check()
+        assert replicas.status()[0]["healthy"] is False
+
+    def test_connections_are_released_to_their_backend(self, replicated):
+        """Test that replica connections go back to the replica, not the primary."""
+        from src.config.replicas import routing_session
+
+        service, replica, _ = replicated
+        primary = service.db_manager.backend
+        released = []
+        for backend in (primary, replica):
+            release = backend.release
+            backend.release = lambda conn, backend=backend, release=release: (
+                released.append(backend),
+                release(conn),
+            )
+
+        _nomes(service)
+        with routing_session():
+            _nomes(service)
+
+        assert released == [primary, replica]
+
+    def test_requests_route_by_method(self, sghss_app, tmp_path, admin_headers):
+        """Test that only safe-method requests open an unpinned session."""
+        from src.config.backends import SQLiteBackend
+        from src.config.replicas import ReplicaSet, _session
+
+        ReplicaSet({"replica": SQLiteBackend(str(tmp_path / "r.db"))}).init_app(sghss_app)
+        seen = {}
+
+        @sghss_app.route("/sessao", methods=["GET", "POST"])
+        def sessao():
+            seen["pinned"] = _session.get().pinned
+            return {}
+
+        client = sghss_app.test_client()
+        client.get("/sessao")
+        assert seen["pinned"] is False
+        client.post("/sessao")
+        assert seen["pinned"] is True
+
+        response = client.get("/api/admin/replicas?refresh=1", headers=admin_headers)
+        assert response.get_json()["data"]["replicas"][0]["healthy"] is True
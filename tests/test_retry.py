@@ -0,0 +1,137 @@
+"""Tests for retrying transactions on transient database errors."""
+
+import sqlite3
+
+import pytest
+
+
+class LockError(Exception):
+    """Driver error carrying a MySQL error number."""
+
+    def __init__(self, errno):
+        super().__init__(f"Error {errno}")
+        self.errno = errno
+
+
+def _flaky(failures, result="ok", errno=1213):
+    calls = []
+
+    def attempt():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise LockError(errno)
+        return result
+
+    return attempt, calls
+
+
+def _is_lock_error(err):
+    return isinstance(err, LockError) and err.errno in (1213, 1205)
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_recovers_from_transient_errors(self):
+        """Test that a unit is re-run until it succeeds."""
+        from src.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(max_attempts=4, base_delay_ms=0)
+        attempt, calls = _flaky(2)
+
+        assert policy.run("consultas.criar", attempt, _is_lock_error) == "ok"
+        assert len(calls) == 3
+        stats = policy.status()["units"]["consultas.criar"]
+        assert stats["retries"] == 2
+        assert stats["recovered"] == 1
+        assert stats["errors"] == {"1213": 2}
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that the last error is raised once attempts run out."""
+        from src.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(max_attempts=3, base_delay_ms=0)
+        attempt, calls = _flaky(5, errno=1205)
+
+        with pytest.raises(LockError):
+            policy.run("prescricoes.criar", attempt, _is_lock_error)
+        assert len(calls) == 3
+        assert policy.status()["units"]["prescricoes.criar"]["exhausted"] == 1
+
+    def test_other_errors_are_not_retried(self):
+        """Test that non-transient errors surface on the first attempt."""
+        from src.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(base_delay_ms=0)
+        attempt, calls = _flaky(1, errno=1062)
+
+        with pytest.raises(LockError):
+            policy.run("consultas.criar", attempt, _is_lock_error)
+        assert len(calls) == 1
+
+    def test_deadline_stops_retries(self):
+        """Test that no retry is attempted when the backoff would outlive the deadline."""
+        from src.utils.deadline import deadline
+        from src.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(max_attempts=10, base_delay_ms=1000, max_delay_ms=1000)
+        policy.backoff = lambda retry: 1.0
+        attempt, calls = _flaky(5)
+
+        with deadline(0.5):
+            with pytest.raises(LockError):
+                policy.run("consultas.criar", attempt, _is_lock_error)
+        assert len(calls) == 1
+
+    def test_backoff_is_bounded(self):
+        """Test that the jittered backoff stays under the exponential ceiling."""
+        from src.utils.retry import RetryPolicy
+
+        policy = RetryPolicy(base_delay_ms=10, max_delay_ms=50)
+
+        assert all(0 <= policy.backoff(1) <= 0.01 for _ in range(100))
+        assert all(0 <= policy.backoff(8) <= 0.05 for _ in range(100))
+
+
+class TestRunInTransaction:
+    """Tests for DatabaseManager.run_in_transaction."""
+
+    def test_failed_attempt_is_rolled_back(self, sghss_app):
+        """Test that a retried unit does not leave rows from the failed attempt."""
+        db_manager = sghss_app.extensions["services"].db_manager
+        db_manager.retry_policy.base_delay_ms = 0
+        attempts = []
+
+        def inserir(cursor, conn):
+            cursor.execute("INSERT INTO medicamentos (nome) VALUES (%s)", ("Dipirona",))
+            attempts.append(cursor.lastrowid)
+            if len(attempts) == 1:
+                raise sqlite3.OperationalError("database is locked")
+            return cursor.lastrowid
+
+        db_manager.run_in_transaction("medicamentos.criar", inserir)
+
+        with db_manager.get_cursor() as (cursor, conn):
+            cursor.execute("SELECT COUNT(*) FROM medicamentos")
+            assert cursor.fetchone() == (1,)
+        assert len(attempts) == 2
+
+    def test_admin_endpoint(self, sghss_app, client, admin_headers):
+        """Test that retry counters are exposed and can be reset."""
+        db_manager = sghss_app.extensions["services"].db_manager
+        db_manager.run_in_transaction(
+            "medicamentos.criar",
+            lambda cursor, conn: cursor.execute(
+                "INSERT INTO medicamentos (nome) VALUES (%s)", ("Dipirona",)
+            ),
+        )
+
+        response = client.get("/api/admin/retries", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert data["max_attempts"] == 4
+        assert data["units"]["medicamentos.criar"]["calls"] == 1
+
+        assert client.delete("/api/admin/retries", headers=admin_headers).status_code == 200
+        response = client.get("/api/admin/retries", headers=admin_headers)
+        assert response.get_json()["data"]["units"] == {}
@@ -0,0 +1,121 @@
+"""Tests for the always-on sampling profiler."""
+
+import os
+import threading
+import time
+
+import pytest
+
+
+def _busy_request(sghss_app, profiler, ready, done):
+    """Serve a request that spins until told to stop."""
+    with sghss_app.test_request_context("/api/pacientes"):
+        profiler._before_request()
+        ready.set()
+        try:
+            while not done.is_set():
+                sum(range(1000))
+        finally:
+            profiler._teardown_request()
+
+
+class TestSamplingProfiler:
+    """Tests for SamplingProfiler."""
+
+    def test_start_and_stop(self, tmp_path):
+        """Test the sampling thread lifecycle."""
+        from src.utils.sampler import SamplingProfiler
+
+        profiler = SamplingProfiler(output_dir=str(tmp_path), interval_ms=1)
+        profiler.stop()
+        assert not profiler.status()["running"]
+
+        profiler.start()
+        thread = profiler._thread
+        profiler.start()
+        assert profiler._thread is thread
+        assert profiler.status()["running"]
+
+        profiler.stop()
+        assert not profiler.status()["running"]
+        assert not thread.is_alive()
+        # Nothing was sampled, so nothing is written
+        assert profiler.list_files() == []
+
+        profiler.start()
+        assert profiler.status()["running"]
+        profiler.stop()
+
+    def test_busy_request_is_written_as_collapsed_stacks(self, sghss_app, tmp_path):
+        """Test that a busy request thread is sampled under its endpoint."""
+        from src.utils.sampler import SamplingProfiler
+
+        profiler = SamplingProfiler(
+            output_dir=str(tmp_path), interval_ms=1, flush_interval=3600, max_overhead=1
+        )
+        ready, done = threading.Event(), threading.Event()
+        worker = threading.Thread(target=_busy_request, args=(sghss_app, profiler, ready, done))
+
+        profiler.start()
+        worker.start()
+        ready.wait(timeout=5)
+        try:
+            for _ in range(500):
+                if profiler.samples >= 5:
+                    break
+                time.sleep(0.01)
+        finally:
+            done.set()
+            worker.join()
+            profiler.stop()
+
+        files = profiler.list_files()
+        assert len(files) == 1
+        assert profiler.samples >= 5
+        with open(profiler.get_file_path(files[0]["id"]), encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+        assert lines
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert any(
+            line.startswith("pacientes.") and "_busy_request" in line for line in lines
+        )
+
+    def test_old_files_are_rotated(self, tmp_path):
+        """Test that only the newest max_files flushes are kept."""
+        from src.utils.sampler import SamplingProfiler
+
+        profiler = SamplingProfiler(output_dir=str(tmp_path), max_files=2)
+        written = []
+        for second in range(4):
+            profiler.stacks["pacientes.listar;main"] += 1
+            path = profiler.flush()
+            # Distinct mtimes keep the newest-first ordering deterministic
+            os.utime(path, (1_000_000 + second, 1_000_000 + second))
+            written.append(os.path.basename(path))
+
+        assert profiler.flush() is None
+        assert [item["id"] for item in profiler.list_files()] == written[:1:-1]
+        assert sorted(os.listdir(tmp_path)) == sorted(written[2:])
+
+    def test_file_id_cannot_escape_output_dir(self, tmp_path):
+        """Test that only sample file names inside the output dir are resolved."""
+        from src.utils.sampler import SamplingProfiler
+
+        profiler = SamplingProfiler(output_dir=str(tmp_path))
+        (tmp_path / "samples-1.collapsed").write_text("main 1\n")
+
+        assert profiler.get_file_path("samples-1.collapsed")
+        assert profiler.get_file_path("../samples-1.collapsed") is None
+        assert profiler.get_file_path("other.collapsed") is None
+
+    def test_sampler_endpoints_require_admin(self, client, user_headers, admin_headers):
+        """Test that the admin endpoints are admin-only and report when disabled."""
+        forbidden = client.get("/api/admin/sampler", headers=user_headers)
+        disabled = client.get("/api/admin/sampler", headers=admin_headers)
+
+        assert forbidden.status_code == 403
+        assert disabled.status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
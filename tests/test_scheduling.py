@@ -0,0 +1,186 @@
+"""Tests for consulta conflict detection and free slots."""
+
+from datetime import date, datetime, time
+
+import pytest
+
+
+def _criar_profissional(sghss_app, **horario):
+    services = sghss_app.extensions["services"]
+    paciente = services.get("pacientes").criar_paciente(
+        nome="Maria Santos", email="maria@example.com", telefone="11987654321", cpf="12345678901"
+    )
+    profissional = services.get("profissionais").criar_profissional(
+        nome="Dr. Silva",
+        email="silva@example.com",
+        telefone="11912345678",
+        especialidade="Cardiologia",
+        registro="CRM123",
+        **horario,
+    )
+    return paciente, profissional
+
+
+class TestScheduling:
+    """Tests for the scheduling helpers."""
+
+    def test_parse_dias_atendimento(self):
+        """Test ranges, lists, accents and wrapping ranges."""
+        from src.exceptions import ValidationError
+        from src.utils.scheduling import parse_dias_atendimento
+
+        assert parse_dias_atendimento("Segunda a Sexta") == {0, 1, 2, 3, 4}
+        assert parse_dias_atendimento("Seg-Sex") == {0, 1, 2, 3, 4}
+        assert parse_dias_atendimento("Segunda-feira, Quarta e Sábado") == {0, 2, 5}
+        assert parse_dias_atendimento("Sexta a Segunda") == {4, 5, 6, 0}
+        assert parse_dias_atendimento("") == frozenset()
+        with pytest.raises(ValidationError):
+            parse_dias_atendimento("Feriados")
+
+    def test_interval_set_merges_and_finds_gaps(self):
+        """Test that intervals merge on insert and gaps are their complement."""
+        from src.utils.scheduling import IntervalSet
+
+        def at(hour, minute=0):
+            return datetime(2030, 1, 7, hour, minute)
+
+        busy = IntervalSet([(at(10), at(11)), (at(9), at(9, 30))])
+        busy.add(at(10, 30), at(12))
+        busy.add(at(9, 30), at(9, 45))
+
+        assert list(busy) == [(at(9), at(9, 45)), (at(10), at(12))]
+        assert busy.overlaps(at(9, 40), at(10))
+        assert not busy.overlaps(at(9, 45), at(10))
+        assert list(busy.gaps(at(8), at(13))) == [
+            (at(8), at(9)),
+            (at(9, 45), at(10)),
+            (at(12), at(13)),
+        ]
+
+    def test_free_slots_skip_busy_time_and_overnight_shifts(self):
+        """Test slot cutting around bookings and shifts ending after midnight."""
+        from src.utils.scheduling import IntervalSet, free_slots, working_windows
+
+        windows = list(working_windows(date(2030, 1, 7), date(2030, 1, 7), time(22), time(2), {0}))
+        busy = IntervalSet([(datetime(2030, 1, 7, 23, 10), datetime(2030, 1, 8, 0, 40))])
+
+        slots = list(free_slots(windows, busy, 60))
+
+        assert [(start.hour, start.minute) for start, _ in slots] == [(22, 0), (0, 40)]
+
+
+class TestConsultaConflicts:
+    """Tests for overlap checks when booking consultas."""
+
+    def test_overlapping_consulta_is_rejected(self, sghss_app, client, admin_headers):
+        """Test that a booking overlapping another answers 409."""
+        paciente, profissional = _criar_profissional(sghss_app)
+        consulta = {
+            "paciente_id": paciente.id,
+            "profissional_id": profissional.id,
+            "data": "2030-01-07 10:00:00",
+            "motivo": "Retorno",
+            "duracao_minutos": 45,
+        }
+
+        first = client.post("/api/consultas", json=consulta, headers=admin_headers)
+        overlap = client.post(
+            "/api/consultas", json={**consulta, "data": "2030-01-07 10:30:00"}, headers=admin_headers
+        )
+        after = client.post(
+            "/api/consultas", json={**consulta, "data": "2030-01-07 10:45:00"}, headers=admin_headers
+        )
+
+        assert first.status_code == 201
+        assert first.get_json()["data"]["duracao_minutos"] == 45
+        assert overlap.status_code == 409
+        assert after.status_code == 201
+
+    def test_moving_a_consulta_checks_the_new_time(self, sghss_app):
+        """Test that rescheduling ignores the consulta itself but not others."""
+        from src.exceptions import ConflictError
+
+        paciente, profissional = _criar_profissional(sghss_app)
+        consultas = sghss_app.extensions["services"].get("consultas")
+        primeira = consultas.criar_consulta(
+            paciente.id, "2030-01-07 10:00:00", "Retorno", profissional_id=profissional.id
+        )
+        consultas.criar_consulta(
+            paciente.id, "2030-01-07 11:00:00", "Exame", profissional_id=profissional.id
+        )
+
+        consultas.atualizar_consulta(primeira.id, data="2030-01-07 10:15:00")
+        with pytest.raises(ConflictError):
+            consultas.atualizar_consulta(primeira.id, duracao_minutos=60)
+
+    def test_rescheduling_only_uses_locking_reads(self, sghss_app, monkeypatch):
+        """Test that no plain read pins the InnoDB snapshot before the agenda check."""
+        paciente, profissional = _criar_profissional(sghss_app)
+        consultas = sghss_app.extensions["services"].get("consultas")
+        consulta = consultas.criar_consulta(
+            paciente.id, "2030-01-07 10:00:00", "Retorno", profissional_id=profissional.id
+        )
+        db_manager = consultas.db_manager
+        run_in_transaction = db_manager.run_in_transaction
+        selects = []
+
+        class RecordingCursor:
+            def __init__(self, cursor):
+                self._cursor = cursor
+
+            def execute(self, operation, params=None):
+                if operation.lstrip().startswith("SELECT"):
+                    selects.append(" ".join(operation.split()))
+                # SQLite has no FOR UPDATE; it serializes writers instead
+                self._cursor.execute(operation.replace(" FOR UPDATE", ""), params)
+
+            def __getattr__(self, name):
+                return getattr(self._cursor, name)
+
+        def recording(name, unit, **kwargs):
+            return run_in_transaction(
+                name, lambda cursor, conn: unit(RecordingCursor(cursor), conn), **kwargs
+            )
+
+        monkeypatch.setattr(db_manager.backend, "for_update", " FOR UPDATE")
+        monkeypatch.setattr(db_manager, "run_in_transaction", recording)
+        consultas.atualizar_consulta(consulta.id, data="2030-01-07 11:00:00")
+
+        assert len(selects) == 3
+        assert all(select.endswith("FOR UPDATE") for select in selects)
+
+
+class TestFreeSlots:
+    """Tests for the free slots endpoint."""
+
+    def test_slots_exclude_booked_consultas(self, sghss_app, client, admin_headers):
+        """Test that slots follow working days and skip booked time."""
+        paciente, profissional = _criar_profissional(
+            sghss_app, horario_inicio="08:00", horario_fim="10:00", dias_atendimento="Seg a Sex"
+        )
+        sghss_app.extensions["services"].get("consultas").criar_consulta(
+            paciente.id, "2030-01-07 08:30:00", "Retorno", profissional_id=profissional.id
+        )
+
+        response = client.get(
+            f"/api/profissionais/{profissional.id}/slots?from=2030-01-05&to=2030-01-07&duration=30",
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        assert [slot["inicio"] for slot in response.get_json()["data"]] == [
+            "2030-01-07 08:00:00",
+            "2030-01-07 09:00:00",
+            "2030-01-07 09:30:00",
+        ]
+
+    def test_invalid_range_is_rejected(self, sghss_app, client, admin_headers):
+        """Test that reversed or oversized ranges answer 400."""
+        _, profissional = _criar_profissional(sghss_app)
+        url = f"/api/profissionais/{profissional.id}/slots"
+
+        reversed_range = client.get(f"{url}?from=2030-01-07&to=2030-01-01", headers=admin_headers)
+        too_long = client.get(f"{url}?from=2030-01-01&to=2030-12-31", headers=admin_headers)
+
+        assert reversed_range.status_code == 400
+        assert too_long.status_code == 400
@@ -0,0 +1,175 @@
+"""Tests for recurring consulta series."""
+
+from datetime import date, datetime
+
+import pytest
+
+
+def _criar_profissional(sghss_app):
+    services = sghss_app.extensions["services"]
+    paciente = services.get("pacientes").criar_paciente(
+        nome="Maria Santos", email="maria@example.com", telefone="11987654321", cpf="12345678901"
+    )
+    profissional = services.get("profissionais").criar_profissional(
+        nome="Dr. Silva",
+        email="silva@example.com",
+        telefone="11912345678",
+        especialidade="Psicologia",
+        registro="CRP123",
+        horario_inicio="08:00",
+        horario_fim="12:00",
+        dias_atendimento="Segunda a Sexta",
+    )
+    return paciente, profissional, services.get("consultas")
+
+
+class TestRecorrencia:
+    """Tests for expanding recurrence rules."""
+
+    def test_weekly_rule_on_several_weekdays(self):
+        """Test weekly expansion on given weekdays, skipping days before the start."""
+        from src.utils.scheduling import expand_recorrencia
+
+        datas = expand_recorrencia(
+            datetime(2030, 1, 9, 10, 0), "semanal", 2, ocorrencias=4, dias=frozenset({0, 2})
+        )
+
+        assert datas == [
+            datetime(2030, 1, 9, 10, 0),
+            datetime(2030, 1, 21, 10, 0),
+            datetime(2030, 1, 23, 10, 0),
+            datetime(2030, 2, 4, 10, 0),
+        ]
+
+    def test_daily_rule_until_a_day_and_limits(self):
+        """Test daily expansion bounded by a last day and rejected rules."""
+        from src.exceptions import ValidationError
+        from src.utils.scheduling import expand_recorrencia
+
+        datas = expand_recorrencia(datetime(2030, 1, 7, 9), "diaria", 3, ate=date(2030, 1, 14))
+
+        assert [data.day for data in datas] == [7, 10, 13]
+        with pytest.raises(ValidationError):
+            expand_recorrencia(datetime(2030, 1, 7, 9), "diaria")
+        with pytest.raises(ValidationError):
+            expand_recorrencia(datetime(2030, 1, 7, 9), "diaria", ate=date(2031, 1, 7))
+        with pytest.raises(ValidationError):
+            expand_recorrencia(datetime(2030, 1, 7, 9), "mensal", ocorrencias=2)
+
+
+class TestSeries:
+    """Tests for /api/consultas/series."""
+
+    def test_series_is_booked_in_one_transaction(self, sghss_app, client, admin_headers):
+        """Test bulk creation and that one conflicting occurrence rejects the series."""
+        paciente, profissional, consultas = _criar_profissional(sghss_app)
+        consultas.criar_consulta(
+            paciente.id, "2030-01-21 10:15:00", "Exame", profissional_id=profissional.id
+        )
+        serie = {
+            "paciente_id": paciente.id,
+            "profissional_id": profissional.id,
+            "inicio": "2030-01-07 10:00:00",
+            "motivo": "Terapia",
+            "ocorrencias": 4,
+            "duracao_minutos": 50,
+        }
+
+        conflito = client.post("/api/consultas/series", json=serie, headers=admin_headers)
+        agendadas = len(consultas.listar_consultas())
+        criada = client.post(
+            "/api/consultas/series",
+            json={**serie, "inicio": "2030-01-07 11:00:00"},
+            headers=admin_headers,
+        )
+
+        assert conflito.status_code == 409
+        assert "1 of 4 occurrences" in conflito.get_json()["message"]
+        assert agendadas == 1
+        assert criada.status_code == 201
+        data = criada.get_json()["data"]
+        assert [consulta["data"][:10] for consulta in data["consultas"]] == [
+            "2030-01-07",
+            "2030-01-14",
+            "2030-01-21",
+            "2030-01-28",
+        ]
+        assert {consulta["serie_id"] for consulta in data["consultas"]} == {data["id"]}
+
+    def test_group_edit_moves_pending_occurrences(self, sghss_app, client, admin_headers):
+        """Test that editing a series changes only the occurrences from the cutoff on."""
+        paciente, profissional, consultas = _criar_profissional(sghss_app)
+        serie = consultas.criar_serie(
+            paciente.id,
+            "2030-01-07 10:00:00",
+            "Terapia",
+            profissional_id=profissional.id,
+            ocorrencias=3,
+        )
+
+        response = client.put(
+            f"/api/consultas/series/{serie.id}",
+            json={"horario": "09:00", "motivo": "Retorno", "a_partir_de": "2030-01-10 00:00:00"},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()["data"]
+        assert [(c["data"], c["motivo"]) for c in data["consultas"]] == [
+            ("2030-01-07 10:00:00", "Terapia"),
+            ("2030-01-14 09:00:00", "Retorno"),
+            ("2030-01-21 09:00:00", "Retorno"),
+        ]
+        assert data["inicio"] == "2030-01-07 09:00:00"
+
+    def test_cancelling_frees_the_cached_agenda(self, sghss_app, client, admin_headers):
+        """Test cancelling a series from a day on and the slots it frees."""
+        paciente, profissional, consultas = _criar_profissional(sghss_app)
+        profissionais = sghss_app.extensions["services"].get("profissionais")
+        serie = consultas.criar_serie(
+            paciente.id,
+            "2030-01-07 08:00:00",
+            "Fisioterapia",
+            profissional_id=profissional.id,
+            frequencia="diaria",
+            ocorrencias=2,
+            duracao_minutos=240,
+        )
+
+        def livres():
+            return profissionais.listar_horarios_livres(
+                profissional.id, "2030-01-07", "2030-01-08", 240, agora=datetime(2030, 1, 1)
+            )
+
+        assert livres() == []
+        response = client.delete(
+            f"/api/consultas/series/{serie.id}?a_partir_de=2030-01-08 00:00:00",
+            headers=admin_headers,
+        )
+
+        assert response.get_json()["data"] == {"canceladas": 1}
+        assert [slot["inicio"] for slot in livres()] == ["2030-01-08 08:00:00"]
+        assert [c.status for c in consultas.obter_serie(serie.id).consultas] == [
+            "agendada",
+            "cancelada",
+        ]
+
+    def test_series_is_inserted_through_a_plain_cursor(self, sghss_app, monkeypatch):
+        """Test the batched insert path and the ids it hands back."""
+        paciente, _, consultas = _criar_profissional(sghss_app)
+        db_manager = consultas.db_manager
+        run_in_transaction = db_manager.run_in_transaction
+        chamadas = []
+
+        def registrar(name, unit, **kwargs):
+            chamadas.append((name, kwargs.get("prepared", True)))
+            return run_in_transaction(name, unit, **kwargs)
+
+        monkeypatch.setattr(db_manager, "run_in_transaction", registrar)
+        serie = consultas.criar_serie(
+            paciente.id, "2030-01-07 10:00:00", "Terapia", frequencia="diaria", ocorrencias=3
+        )
+
+        assert ("consultas.criar_serie", False) in chamadas
+        assert serie.profissional_id is None
+        assert [consulta.serie_id for consulta in serie.consultas] == [serie.id] * 3
@@ -0,0 +1,77 @@
+"""Tests for the lazy service registry."""
+
+import importlib
+
+
+class TestServiceContainer:
+    """Tests for ServiceContainer and service proxies."""
+
+    def test_routes_import_without_app(self):
+        """Test that blueprints can be imported before create_app."""
+        module = importlib.import_module("src.routes.pacientes")
+
+        assert module.paciente_bp.name == "pacientes"
+
+    def test_services_created_on_first_use(self, sghss_app):
+        """Test that services are created lazily and bound to the app's database."""
+        from src.config.database import get_db_manager
+
+        container = sghss_app.extensions["services"]
+        assert container.loaded == []
+
+        response = sghss_app.test_client().get("/api/auth/health")
+        assert response.status_code == 200
+        assert container.loaded == []
+
+        service = container.get("pacientes")
+        assert container.get("pacientes") is service
+        assert service.db_manager is get_db_manager()
+        assert container.loaded == ["pacientes"]
+
+    def test_proxy_resolves_per_application(self):
+        """Test that each application gets its own service instances."""
+        from src import create_app
+        from src.routes.pacientes import paciente_service
+
+        first, second = create_app("testing"), create_app("testing")
+        with first.app_context():
+            first_service = paciente_service._get_current_object()
+        with second.app_context():
+            second_service = paciente_service._get_current_object()
+
+        assert first_service is not second_service
+        assert first_service.db_manager is not second_service.db_manager
+
+    def test_admin_endpoints_use_the_app_database(self, sghss_app, client, admin_headers):
+        """Test that admin reports and resets target this app's manager, not the last one."""
+        from src import create_app
+
+        db_manager = sghss_app.extensions["services"].db_manager
+        db_manager.run_in_transaction(
+            "medicamentos.criar",
+            lambda cursor, conn: cursor.execute(
+                "INSERT INTO medicamentos (nome) VALUES (%s)", ("Dipirona",)
+            ),
+        )
+        create_app("testing")
+
+        queries = client.get("/api/admin/queries", headers=admin_headers)
+        retries = client.get("/api/admin/retries", headers=admin_headers)
+        client.delete("/api/admin/queries", headers=admin_headers)
+
+        assert any(
+            item["fingerprint"].startswith("INSERT INTO medicamentos")
+            for item in queries.get_json()["data"]["queries"]
+        )
+        assert "medicamentos.criar" in retries.get_json()["data"]["units"]
+        assert db_manager.query_stats.top() == []
+
+    def test_register_overrides_factory(self):
+        """Test that a registered factory replaces the default service."""
+        from src.services.registry import ServiceContainer
+
+        container = ServiceContainer()
+        sentinel = object()
+        container.register("pacientes", lambda: sentinel)
+
+        assert container.get("pacientes") is sentinel
@@ -0,0 +1,94 @@
+"""Tests for the SQLite database backend."""
+
+import pytest
+
+
+class TestTranslatePlaceholders:
+    """Tests for translate_placeholders."""
+
+    def test_positional_and_named_placeholders(self):
+        """Test that MySQL placeholders become SQLite placeholders."""
+        from src.config.backends import translate_placeholders
+
+        assert translate_placeholders("SELECT * FROM t WHERE a = %s AND b = %s") == (
+            "SELECT * FROM t WHERE a = ? AND b = ?"
+        )
+        assert translate_placeholders("SELECT * FROM t WHERE a = %(a)s") == (
+            "SELECT * FROM t WHERE a = :a"
+        )
+
+    def test_literals_are_left_untouched(self):
+        """Test that quoted literals and escaped percent signs are preserved."""
+        from src.config.backends import translate_placeholders
+
+        assert translate_placeholders("SELECT '%s', 100%% FROM t WHERE a = %s") == (
+            "SELECT '%s', 100% FROM t WHERE a = ?"
+        )
+
+
+class TestSQLiteEndToEnd:
+    """Runs the real services and routes against in-memory SQLite."""
+
+    def test_usuario_login_and_paciente_crud(self, client):
+        """Test creating a user, logging in and managing a patient."""
+        response = client.post(
+            "/api/usuarios",
+            json={
+                "nome": "Recepcao",
+                "email": "recepcao@sghss.com",
+                "senha": "SenhaSegura123",
+            },
+        )
+        assert response.status_code == 201
+
+        response = client.post(
+            "/api/auth/login",
+            json={"email": "recepcao@sghss.com", "senha": "SenhaSegura123"},
+        )
+        assert response.status_code == 200
+        headers = {"Authorization": f"Bearer {response.get_json()['data']['token']}"}
+
+        response = client.post(
+            "/api/pacientes",
+            headers=headers,
+            json={
+                "nome": "Maria Santos",
+                "email": "maria@example.com",
+                "telefone": "11987654321",
+                "cpf": "12345678901",
+            },
+        )
+        assert response.status_code == 201
+        paciente_id = response.get_json()["data"]["id"]
+
+        response = client.put(
+            f"/api/pacientes/{paciente_id}", headers=headers, json={"nome": "Maria S."}
+        )
+        assert response.get_json()["data"]["nome"] == "Maria S."
+
+        response = client.get("/api/pacientes", headers=headers)
+        assert [p["id"] for p in response.get_json()["data"]] == [paciente_id]
+
+        assert client.delete(f"/api/pacientes/{paciente_id}", headers=headers).status_code == 200
+        assert client.get(f"/api/pacientes/{paciente_id}", headers=headers).status_code == 404
+
+    def test_failed_write_is_rolled_back(self, sghss_app):
+        """Test that uncommitted work is discarded when the handle closes."""
+        from src.config.database import get_db_manager
+
+        db_manager = get_db_manager()
+        with pytest.raises(RuntimeError):
+            with db_manager.get_cursor() as (cursor, conn):
+                cursor.execute(
+                    "INSERT INTO medicamentos (nome, descricao, dosagem) VALUES (%s, %s, %s)",
+                    ("Dipirona", "Analgesico", "500mg"),
+                )
+                raise RuntimeError("boom")
+
+        with db_manager.get_cursor(dictionary=True) as (cursor, conn):
+            cursor.execute("SELECT COUNT(*) AS total FROM medicamentos")
+            assert cursor.fetchone()["total"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
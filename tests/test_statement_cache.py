@@ -0,0 +1,136 @@
+"""Tests for the per-connection prepared statement cache."""
+
+
+class FakePreparedCursor:
+    """Mimics mysql.connector's prepared cursor: re-prepares unless given the same object."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self._executed = None
+        self.closed = False
+        self.lastrowid = None
+        self.rowcount = 1
+        self.description = ()
+        self.with_rows = True
+
+    def execute(self, operation, params=None):
+        if operation is not self._executed:
+            self._connection.prepares += 1
+            self._executed = operation
+        self._connection.unread_result = True
+
+    def fetchone(self):
+        return (1,)
+
+    def fetchall(self):
+        self._connection.unread_result = False
+        return [(1,)]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    """Driver connection counting statement preparations."""
+
+    def __init__(self, connection_id=1):
+        self.connection_id = connection_id
+        self.prepares = 0
+        self.unread_result = False
+        self.cursors = []
+
+    def cursor(self, prepared=False, dictionary=False):
+        cursor = FakePreparedCursor(self)
+        self.cursors.append(cursor)
+        return cursor
+
+
+def _sql(table):
+    # Built at runtime so every call passes a new, equal string object
+    return " ".join(["SELECT id FROM", table, "WHERE id = %s"])
+
+
+class TestPreparedCursor:
+    """Tests for MySQLBackend.prepared_cursor."""
+
+    def test_statements_are_prepared_once_per_connection(self):
+        """Test that repeated checkouts reuse the prepared statement."""
+        from src.config.backends import MySQLBackend
+
+        backend = MySQLBackend({}, statement_cache_size=8)
+        connection = FakeConnection()
+
+        for value in range(3):
+            cursor = backend.prepared_cursor(connection)
+            cursor.execute(_sql("consultas"), (value,))
+            assert cursor.fetchone() == (1,)
+            cursor.close()
+
+        assert connection.prepares == 1
+        assert not connection.unread_result
+
+    def test_least_recently_used_statement_is_evicted(self):
+        """Test that eviction closes the oldest prepared statement."""
+        from src.config.backends import MySQLBackend
+
+        backend = MySQLBackend({}, statement_cache_size=2)
+        connection = FakeConnection()
+        cursor = backend.prepared_cursor(connection)
+
+        for table in ("consultas", "pacientes", "consultas", "usuarios"):
+            cursor.execute(_sql(table), (1,))
+        cursor.close()
+
+        consultas, pacientes, usuarios = connection.cursors
+        assert pacientes.closed
+        assert not consultas.closed and not usuarios.closed
+        assert connection.prepares == 3
+
+    def test_executemany_reports_total_rowcount(self):
+        """Test that executemany sums the per-statement rowcount of the driver."""
+        from src.config.backends import MySQLBackend
+
+        backend = MySQLBackend({}, statement_cache_size=8)
+        connection = FakeConnection()
+        cursor = backend.prepared_cursor(connection)
+        update = "UPDATE consultas SET versao = versao + 1 WHERE id = %s AND versao = %s"
+
+        cursor.executemany(update, [(1, 1), (2, 1), (3, 1)])
+        assert cursor.rowcount == 3
+        assert connection.prepares == 1
+
+        cursor.executemany(update, [])
+        assert cursor.rowcount == 0
+
+        cursor.execute(update, (4, 1))
+        assert cursor.rowcount == 1
+
+    def test_reconnected_connection_gets_a_new_cache(self):
+        """Test that statements are prepared again after a reconnect."""
+        from src.config.backends import MySQLBackend
+
+        backend = MySQLBackend({}, statement_cache_size=8)
+        connection = FakeConnection()
+
+        backend.prepared_cursor(connection).execute(_sql("consultas"), (1,))
+        connection.connection_id = 2
+        backend.prepared_cursor(connection).execute(_sql("consultas"), (1,))
+
+        assert connection.prepares == 2
+
+    def test_disabled_cache_uses_plain_cursors(self):
+        """Test that a zero-sized cache falls back to the connection's cursors."""
+        from src.config.backends import MySQLBackend, PreparedCursor
+
+        cursor = MySQLBackend({}).prepared_cursor(FakeConnection())
+
+        assert not isinstance(cursor, PreparedCursor)
+
+    def test_services_run_prepared_on_sqlite(self, sghss_app):
+        """Test that prepared cursors fall back to sqlite3's statement cache."""
+        service = sghss_app.extensions["services"].get("medicamentos")
+
+        criado = service.criar_medicamento("Dipirona", dosagem="500mg")
+
+        assert service.obter_medicamento_por_id(criado.id).nome == "Dipirona"
+        assert [m.nome for m in service.listar_medicamentos()] == ["Dipirona"]
@@ -0,0 +1,113 @@
+"""Tests for consulta status transitions."""
+
+import pytest
+
+
+def _consultas(sghss_app, *datas):
+    services = sghss_app.extensions["services"]
+    paciente = services.get("pacientes").criar_paciente(
+        nome="Maria Santos", email="maria@example.com", telefone="11987654321", cpf="12345678901"
+    )
+    profissional = services.get("profissionais").criar_profissional(
+        nome="Dr. Silva",
+        email="silva@example.com",
+        telefone="11912345678",
+        especialidade="Cardiologia",
+        registro="CRM123",
+    )
+    consultas = services.get("consultas")
+    criadas = [
+        consultas.criar_consulta(paciente.id, data, "Retorno", profissional_id=profissional.id)
+        for data in datas
+    ]
+    return consultas, criadas
+
+
+class TestStatusTransitions:
+    """Tests for /api/consultas/<id>/<acao>."""
+
+    def test_check_in_then_complete(self, sghss_app, client, admin_headers):
+        """Test the happy path and that a finished consulta cannot move again."""
+        _, (consulta,) = _consultas(sghss_app, "2030-01-07 10:00:00")
+        url = f"/api/consultas/{consulta.id}"
+
+        check_in = client.post(f"{url}/check-in", headers=admin_headers)
+        complete = client.post(f"{url}/complete", headers=admin_headers)
+        cancel = client.post(f"{url}/cancel", headers=admin_headers)
+        missing = client.post("/api/consultas/999/no-show", headers=admin_headers)
+        unknown = client.post(f"{url}/reopen", headers=admin_headers)
+
+        assert check_in.get_json()["data"]["status"] == "em_atendimento"
+        assert complete.get_json()["data"]["status"] == "realizada"
+        assert cancel.status_code == 409
+        assert "realizada" in cancel.get_json()["message"]
+        assert missing.status_code == 404
+        assert unknown.status_code == 404
+
+    def test_second_of_two_racing_changes_loses(self, sghss_app):
+        """Test that the conditional update only lets one transition win."""
+        from src.exceptions import ConflictError
+
+        consultas, (consulta,) = _consultas(sghss_app, "2030-01-07 10:00:00")
+
+        consultas.alterar_status(consulta.id, "no-show")
+        with pytest.raises(ConflictError):
+            consultas.alterar_status(consulta.id, "check-in")
+
+        assert consultas.obter_consulta_por_id(consulta.id).status == "nao_compareceu"
+
+    def test_cancel_frees_the_time(self, sghss_app):
+        """Test that a cancelled consulta no longer blocks the professional."""
+        consultas, (consulta,) = _consultas(sghss_app, "2030-01-07 10:00:00")
+
+        consultas.alterar_status(consulta.id, "cancel")
+        outra = consultas.criar_consulta(
+            consulta.paciente_id,
+            "2030-01-07 10:00:00",
+            "Retorno",
+            profissional_id=consulta.profissional_id,
+        )
+
+        assert outra.status == "agendada"
+
+
+class TestNoShowSweep:
+    """Tests for marking no-shows in bulk."""
+
+    def test_sweep_marks_only_past_scheduled_consultas(self, sghss_app, client, admin_headers):
+        """Test batching, the cutoff and that checked-in consultas are kept."""
+        consultas, criadas = _consultas(
+            sghss_app,
+            "2030-01-07 08:00:00",
+            "2030-01-07 09:00:00",
+            "2030-01-07 10:00:00",
+            "2030-01-07 11:00:00",
+            "2030-01-08 08:00:00",
+        )
+        consultas.alterar_status(criadas[1].id, "check-in")
+
+        marcadas = consultas.marcar_nao_comparecimentos("2030-01-07 23:59:59", lote=2)
+        again = client.post(
+            "/api/consultas/no-show", json={"ate": "2030-01-07 23:59:59"}, headers=admin_headers
+        )
+
+        assert marcadas == 3
+        assert again.get_json()["data"] == {"marcadas": 0}
+        assert [consultas.obter_consulta_por_id(c.id).status for c in criadas] == [
+            "nao_compareceu",
+            "em_atendimento",
+            "nao_compareceu",
+            "nao_compareceu",
+            "agendada",
+        ]
+
+    def test_cli_command(self, sghss_app):
+        """Test the flask marcar-faltas command."""
+        consultas, (consulta,) = _consultas(sghss_app, "2030-01-07 08:00:00")
+
+        result = sghss_app.test_cli_runner().invoke(
+            args=["marcar-faltas", "--ate", "2030-01-08 00:00:00"]
+        )
+
+        assert "Marked 1 consultas" in result.output
+        assert consultas.obter_consulta_por_id(consulta.id).status == "nao_compareceu"
@@ -0,0 +1,61 @@
+"""Tests for user registration and role assignment."""
+
+import pytest
+
+
+def _registrar(client, email, headers=None, **extra):
+    """Register a user through the API."""
+    body = {"nome": "Maria Silva", "email": email, "senha": "SecurePass123", **extra}
+    return client.post("/api/usuarios", json=body, headers=headers or {})
+
+
+def _login(client, email):
+    """Log in and return authorization headers for the user."""
+    response = client.post("/api/auth/login", json={"email": email, "senha": "SecurePass123"})
+    return {"Authorization": f"Bearer {response.get_json()['data']['token']}"}
+
+
+class TestRoleAssignment:
+    """Tests for who may assign the tipo of a usuario."""
+
+    def test_self_registration_cannot_claim_admin(self, client):
+        """Test that an anonymous signup asking for admin is rejected."""
+        response = _registrar(client, "maria@example.com", tipo="admin")
+
+        assert response.status_code == 403
+        assert _registrar(client, "maria@example.com").status_code == 201
+
+    def test_self_registered_user_gets_403_on_admin_endpoints(self, client):
+        """Test that a self-registered user is a paciente and not an admin."""
+        created = _registrar(client, "maria@example.com")
+        headers = _login(client, "maria@example.com")
+
+        assert created.get_json()["data"]["tipo"] == "paciente"
+        for path in ("/api/admin/queries", "/api/admin/connections", "/api/admin/profiles"):
+            assert client.get(path, headers=headers).status_code == 403
+
+    def test_only_admins_change_tipo(self, client, admin_headers):
+        """Test that admins assign roles on creation and update, others cannot."""
+        medico = _registrar(client, "medico@example.com", admin_headers, tipo="medico")
+        paciente = _registrar(client, "maria@example.com").get_json()["data"]
+        headers = _login(client, "maria@example.com")
+
+        promoted_by_self = client.put(
+            f"/api/usuarios/{paciente['id']}", json={"tipo": "admin"}, headers=headers
+        )
+        renamed_by_self = client.put(
+            f"/api/usuarios/{paciente['id']}", json={"nome": "Maria S."}, headers=headers
+        )
+        promoted_by_admin = client.put(
+            f"/api/usuarios/{paciente['id']}", json={"tipo": "medico"}, headers=admin_headers
+        )
+
+        assert medico.status_code == 201
+        assert medico.get_json()["data"]["tipo"] == "medico"
+        assert promoted_by_self.status_code == 403
+        assert renamed_by_self.status_code == 200
+        assert promoted_by_admin.get_json()["data"]["tipo"] == "medico"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,119 @@
+"""Tests for optimistic concurrency on updates."""
+
+import pytest
+
+
+def _paciente(client, admin_headers):
+    response = client.post(
+        "/api/pacientes",
+        json={
+            "nome": "Maria Santos",
+            "email": "maria@example.com",
+            "telefone": "11987654321",
+            "cpf": "12345678901",
+        },
+        headers=admin_headers,
+    )
+    return response.get_json()["data"]["id"], response.headers["ETag"]
+
+
+class TestIfMatch:
+    """Tests for ETag / If-Match on the HTTP API."""
+
+    def test_stale_etag_is_rejected(self, client, admin_headers):
+        """Test that the second of two edits from the same version answers 412."""
+        paciente_id, etag = _paciente(client, admin_headers)
+        url = f"/api/pacientes/{paciente_id}"
+
+        first = client.put(url, json={"nome": "Maria"}, headers={**admin_headers, "If-Match": etag})
+        second = client.put(
+            url, json={"endereco": "Rua A"}, headers={**admin_headers, "If-Match": etag}
+        )
+        current = client.get(url, headers=admin_headers)
+
+        assert etag == '"1"'
+        assert first.status_code == 200
+        assert first.headers["ETag"] == '"2"'
+        assert second.status_code == 412
+        assert current.headers["ETag"] == '"2"'
+        assert current.get_json()["data"]["endereco"] in ("", None)
+
+    def test_header_forms(self, client, admin_headers):
+        """Test missing, wildcard, weak and malformed If-Match headers."""
+        paciente_id, _ = _paciente(client, admin_headers)
+        url = f"/api/pacientes/{paciente_id}"
+
+        def put(**headers):
+            return client.put(url, json={"nome": "Maria"}, headers={**admin_headers, **headers})
+
+        assert put().status_code == 200
+        assert put(**{"If-Match": "*"}).status_code == 200
+        assert put(**{"If-Match": 'W/"3"'}).status_code == 412
+        assert put(**{"If-Match": '"abc"'}).status_code == 412
+        assert put(**{"If-Match": '"3", "4"'}).status_code == 400
+        assert put(**{"If-Match": '"3"'}).headers["ETag"] == '"4"'
+
+    def test_missing_row_is_not_found(self, client, admin_headers):
+        """Test that a versioned update of a missing row answers 404, not 412."""
+        response = client.put(
+            "/api/medicamentos/999",
+            json={"nome": "Dipirona"},
+            headers={**admin_headers, "If-Match": '"1"'},
+        )
+
+        assert response.status_code == 404
+
+
+class TestVersionedServices:
+    """Tests for versions across services."""
+
+    def test_every_change_bumps_the_consulta_version(self, sghss_app):
+        """Test edits, moves and status changes, and stale versions on each."""
+        from src.exceptions import PreconditionFailedError
+
+        services = sghss_app.extensions["services"]
+        paciente = services.get("pacientes").criar_paciente(
+            nome="Maria Santos",
+            email="maria@example.com",
+            telefone="11987654321",
+            cpf="12345678901",
+        )
+        consultas = services.get("consultas")
+        consulta = consultas.criar_consulta(paciente.id, "2030-01-07 10:00:00", "Retorno")
+
+        editada = consultas.atualizar_consulta(consulta.id, motivo="Exame", versao=1)
+        movida = consultas.atualizar_consulta(consulta.id, data="2030-01-07 11:00:00", versao=2)
+        with pytest.raises(PreconditionFailedError):
+            consultas.atualizar_consulta(consulta.id, data="2030-01-07 12:00:00", versao=2)
+        with pytest.raises(PreconditionFailedError):
+            consultas.alterar_status(consulta.id, "check-in", versao=2)
+        atendida = consultas.alterar_status(consulta.id, "check-in", versao=3)
+
+        assert [editada.versao, movida.versao, atendida.versao] == [2, 3, 4]
+        assert consultas.obter_consulta_por_id(consulta.id).data == "2030-01-07 11:00:00"
+
+    def test_series_edit_fails_if_an_occurrence_changed(self, sghss_app, monkeypatch):
+        """Test that editing one consulta makes a series edit from an older read fail."""
+        from src.exceptions import PreconditionFailedError
+
+        services = sghss_app.extensions["services"]
+        paciente = services.get("pacientes").criar_paciente(
+            nome="Maria Santos",
+            email="maria@example.com",
+            telefone="11987654321",
+            cpf="12345678901",
+        )
+        consultas = services.get("consultas")
+        serie = consultas.criar_serie(paciente.id, "2030-01-07 10:00:00", "Terapia", ocorrencias=2)
+        stale = consultas.obter_serie(serie.id)
+        consultas.atualizar_consulta(serie.consultas[1].id, observacoes="Trazer exames")
+
+        # The series edit reads the series before the consulta was edited
+        monkeypatch.setattr(consultas, "obter_serie", lambda serie_id: stale)
+        with pytest.raises(PreconditionFailedError):
+            consultas.atualizar_serie(serie.id, motivo="Retorno", a_partir_de="2030-01-01 00:00:00")
+        monkeypatch.undo()
+
+        atual = consultas.obter_serie(serie.id)
+        assert [c.motivo for c in atual.consultas] == ["Terapia", "Terapia"]
+        assert atual.versao == 1
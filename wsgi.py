@@ -0,0 +1,10 @@
+"""Production WSGI entry point for SGHSS Backend.
+
+Run with: gunicorn -c gunicorn.conf.py
+"""
+
+import os
+
+from src import create_app
+
+app = create_app(os.getenv("FLASK_ENV", "production"))